@@ -0,0 +1,68 @@
+"""Application layer: AddPrompts use case."""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+from promptkit.app.project_context import ProjectContext
+from promptkit.domain.errors import ValidationError
+from promptkit.infra.config.config_editor import append_prompt_sources
+
+CONFIG_FILENAME = "promptkit.yaml"
+LOCAL_SOURCE_PREFIX = "local/"
+
+
+class AddPrompts:
+    """Use case for adding registry prompts to promptkit.yaml.
+
+    The sources are appended to the prompts list as text, so the rest of
+    the file, comments included, is left as it was. Sources already in the
+    config are not added twice. Locking the new prompts is left to the
+    caller (see LockPrompts' only parameter).
+    """
+
+    def __init__(self, *, project_context: ProjectContext) -> None:
+        self._project = project_context
+        self._fs = project_context.file_system
+
+    def execute(self, project_dir: Path, sources: Sequence[str], /) -> list[str]:
+        """Append the sources not yet configured and return them.
+
+        Raises:
+            ValidationError: If promptkit.yaml is missing or invalid, a source
+                is not of the form 'registry/name', or it names a registry
+                the config does not define.
+        """
+        config_path = project_dir / CONFIG_FILENAME
+        try:
+            config = self._project.load_config(project_dir)
+        except FileNotFoundError:
+            raise ValidationError(
+                f"{CONFIG_FILENAME} not found. Run 'promptkit init' to create a new project."
+            ) from None
+
+        registry_names = {r.name for r in config.registries}
+        configured = {s.source for s in config.prompt_specs}
+        added: list[str] = []
+        for source in sources:
+            self._check_source(source, registry_names)
+            if source not in configured and source not in added:
+                added.append(source)
+        if added:
+            content = self._fs.read_file(config_path)
+            self._fs.write_file(config_path, append_prompt_sources(content, added))
+        return added
+
+    def _check_source(self, source: str, registry_names: set[str], /) -> None:
+        registry, _, name = source.partition("/")
+        if not registry or not name:
+            raise ValidationError(
+                f"Invalid prompt source '{source}': expected 'registry/name'"
+            )
+        if source.startswith(LOCAL_SOURCE_PREFIX):
+            raise ValidationError(
+                f"'{source}' is a local prompt; prompts/ is included automatically"
+            )
+        if registry not in registry_names:
+            raise ValidationError(
+                f"Prompt '{source}' references undefined registry '{registry}'"
+            )
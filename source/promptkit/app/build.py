@@ -4,33 +4,102 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
-from promptkit.domain.errors import BuildError
+from promptkit.app.project_context import ProjectContext
+from promptkit.domain.errors import BuildError, SyncError
+from promptkit.domain.file_filter import FileFilter
 from promptkit.domain.file_system import FileSystem
 from promptkit.domain.lock_entry import LockEntry
 from promptkit.domain.platform_target import PlatformTarget
 from promptkit.domain.plugin import Plugin
 from promptkit.domain.prompt_spec import PromptSpec
-from promptkit.domain.protocols import ArtifactBuilder
+from promptkit.domain.protocols import ArtifactBuilder, PluginFetcher
 from promptkit.infra.config.lock_file import LockFile
 from promptkit.infra.config.yaml_loader import LoadedConfig, YamlLoader
+from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
+from promptkit.infra.run_stats import RunStats
+from promptkit.infra.storage.hash_cache import HashCache
 from promptkit.infra.storage.plugin_cache import PluginCache
 
 CONFIG_FILENAME = "promptkit.yaml"
-LOCK_FILENAME = "promptkit.lock"
 PROMPTS_DIR = "prompts"
 LOCAL_SOURCE_PREFIX = "local/"
+PROMPT_EXTENSION = ".md"
 
 
 @dataclass(frozen=True)
 class BuildResult:
-    """Statistics from a build operation."""
+    """Statistics from a build operation, and the artifact files it produced."""
 
     plugin_count: int
     platform_count: int
+    artifacts: tuple[Path, ...] = ()
+
+
+@dataclass(frozen=True)
+class BuildTargets:
+    """What a build needs from the registries, given the configured builders.
+
+    A prompt is built only if it targets a platform that has a builder, and
+    only files in the categories those builders route can reach an output.
+    Shared by BuildArtifacts and FetchPlugins so a prefetch warms exactly
+    the cache entries a build reads.
+    """
+
+    platforms: tuple[PlatformTarget, ...]
+    categories: frozenset[str]
+    specs_by_source: Mapping[str, PromptSpec]
+
+    @classmethod
+    def from_config(
+        cls,
+        config: LoadedConfig,
+        builders: Mapping[PlatformTarget, ArtifactBuilder],
+        /,
+    ) -> "BuildTargets":
+        platforms = tuple(
+            pc.platform_type
+            for pc in config.platform_configs
+            if pc.platform_type in builders
+        )
+        categories = frozenset[str]().union(
+            *(builders[platform].routable_categories for platform in platforms)
+        )
+        return cls(
+            platforms=platforms,
+            categories=categories,
+            specs_by_source={s.source: s for s in config.prompt_specs},
+        )
+
+    def spec_for(self, entry: LockEntry, /) -> PromptSpec:
+        """Return the configured spec of a locked entry, or a default one."""
+        return self.specs_by_source.get(
+            entry.source, PromptSpec(source=entry.source, name=entry.name)
+        )
+
+    def file_filter(self, spec: PromptSpec, /) -> FileFilter | None:
+        """Return the filter to fetch spec with, or None if nothing builds it."""
+        if not any(spec.targets_platform(p) for p in self.platforms):
+            return None
+        return FileFilter(
+            include=spec.include, exclude=spec.exclude, categories=self.categories
+        )
 
 
 class BuildArtifacts:
-    """Use case for generating platform-specific artifacts from locked plugins."""
+    """Use case for generating platform-specific artifacts from locked plugins.
+
+    Registry plugins are materialised on demand: only plugins targeted by a
+    configured builder are read, from the cache when present and otherwise
+    through the registry's fetcher at the locked commit. Each is fetched
+    through a FileFilter combining the prompt's include/exclude globs with
+    the categories the configured builders route, so files that can never
+    reach an output are not copied.
+
+    Local plugins are resolved from the file lists in the lock without
+    walking their directories: with a HashCache, the stamps lock recorded
+    for a plugin's listing are checked instead, a stat per directory and
+    ignore file. A plugin whose list is missing or stale is listed again.
+    """
 
     def __init__(
         self,
@@ -40,12 +109,20 @@ class BuildArtifacts:
         lock_file: LockFile,
         plugin_cache: PluginCache,
         builders: Mapping[PlatformTarget, ArtifactBuilder],
+        fetchers: Mapping[str, PluginFetcher] | None = None,
+        project_context: ProjectContext | None = None,
+        stats: RunStats | None = None,
+        hash_cache: HashCache | None = None,
     ) -> None:
         self._fs = file_system
-        self._yaml_loader = yaml_loader
-        self._lock_file = lock_file
+        self._project = project_context or ProjectContext(
+            file_system=file_system, yaml_loader=yaml_loader, lock_file=lock_file
+        )
         self._plugin_cache = plugin_cache
         self._builders = builders
+        self._fetchers = fetchers or {}
+        self._stats = stats or RunStats(command="build")
+        self._hash_cache = hash_cache
 
     def execute(self, project_dir: Path, /) -> BuildResult:
         """Load config and lock, resolve plugins, delegate to builders.
@@ -55,14 +132,23 @@ class BuildArtifacts:
         """
         config = self._load_config(project_dir)
         entries = self._load_lock(project_dir)
-        specs_by_source = {s.source: s for s in config.prompt_specs}
+        targets = BuildTargets.from_config(config, self._builders)
+        prompts_dir = project_dir / PROMPTS_DIR
+        local_fetcher = LocalPluginFetcher(self._fs, prompts_dir)
 
-        plugins = [
-            self._resolve_plugin(entry, project_dir, specs_by_source)
-            for entry in entries
-        ]
+        plugins: list[Plugin] = []
+        for entry in entries:
+            spec = targets.spec_for(entry)
+            file_filter = targets.file_filter(spec)
+            if file_filter is not None:
+                plugins.append(
+                    self._resolve_plugin(
+                        entry, spec, prompts_dir, local_fetcher, file_filter
+                    )
+                )
 
         platform_count = 0
+        artifacts: list[Path] = []
         for platform_config in config.platform_configs:
             builder = self._builders.get(platform_config.platform_type)
             if builder is None:
@@ -73,33 +159,39 @@ class BuildArtifacts:
                 if p.spec.targets_platform(platform_config.platform_type)
             ]
             output_dir = project_dir / platform_config.output_dir
-            builder.build(filtered, output_dir, project_dir)
+            try:
+                artifacts.extend(builder.build(filtered, output_dir, project_dir))
+            except FileNotFoundError as e:
+                # A trusted file list is only checked when its files are copied.
+                raise BuildError(
+                    f"Plugin file disappeared during build: {e.filename}. "
+                    "Run the build again."
+                ) from e
             platform_count += 1
 
         return BuildResult(
             plugin_count=len(plugins),
             platform_count=platform_count,
+            artifacts=tuple(artifacts),
         )
 
     def _resolve_plugin(
         self,
         entry: LockEntry,
-        project_dir: Path,
-        specs_by_source: dict[str, PromptSpec],
+        spec: PromptSpec,
+        prompts_dir: Path,
+        local_fetcher: LocalPluginFetcher,
+        file_filter: FileFilter,
         /,
     ) -> Plugin:
         """Resolve a lock entry to a Plugin manifest."""
-        spec = specs_by_source.get(
-            entry.source,
-            PromptSpec(source=entry.source, name=entry.name),
-        )
-
-        if entry.commit_sha is not None:
-            source_dir, files = self._resolve_registry_plugin(entry)
-        else:
-            source_dir = project_dir / PROMPTS_DIR
-            files = self._list_local_files(entry, project_dir)
+        if entry.commit_sha is None:
+            locked = self._locked_local_plugin(entry, spec, prompts_dir, local_fetcher)
+            if locked is not None:
+                return locked
+            return self._resolve_local_plugin(entry, spec, local_fetcher)
 
+        source_dir, files = self._resolve_registry_plugin(entry, spec, file_filter)
         return Plugin(
             spec=spec,
             files=tuple(files),
@@ -107,50 +199,116 @@ class BuildArtifacts:
             commit_sha=entry.commit_sha,
         )
 
-    def _resolve_registry_plugin(self, entry: LockEntry, /) -> tuple[Path, list[str]]:
-        """Resolve source directory and file list for a registry plugin."""
+    def _resolve_registry_plugin(
+        self, entry: LockEntry, spec: PromptSpec, file_filter: FileFilter, /
+    ) -> tuple[Path, list[str]]:
+        """Resolve source directory and file list, materialising if uncached."""
         assert entry.commit_sha is not None
         registry, plugin_name = entry.source.split("/", 1)
-        cache_dir = self._plugin_cache.plugin_dir(
-            registry, plugin_name, entry.commit_sha
-        )
-        if not cache_dir.is_dir():
-            raise BuildError(
-                f"Cached plugin missing for '{entry.name}' "
-                f"(sha: {entry.commit_sha}). Run 'promptkit lock' to re-fetch."
-            )
-        files = self._plugin_cache.list_files(registry, plugin_name, entry.commit_sha)
-        return cache_dir, files
+        key = self._cached_key(registry, plugin_name, entry.commit_sha, file_filter)
+        if key is None:
+            fetcher = self._fetchers.get(registry)
+            if fetcher is None:
+                raise BuildError(
+                    f"Cached plugin missing for '{entry.name}' "
+                    f"(sha: {entry.commit_sha}) and registry '{registry}' "
+                    "is not configured."
+                )
+            try:
+                plugin = fetcher.materialize(
+                    spec, entry.commit_sha, file_filter=file_filter
+                )
+            except SyncError as e:
+                raise BuildError(
+                    f"Failed to materialise '{entry.name}' "
+                    f"(sha: {entry.commit_sha}): {e}"
+                ) from e
+            return plugin.source_dir, list(plugin.files)
+        cache_dir = self._plugin_cache.unpacked_dir(registry, plugin_name, key)
+        files = self._plugin_cache.list_files(registry, plugin_name, key)
+        return cache_dir, [f for f in files if file_filter.matches(f)]
+
+    def _cached_key(
+        self, registry: str, plugin_name: str, sha: str, file_filter: FileFilter, /
+    ) -> str | None:
+        """Return the cache key holding the plugin, or None if it must be fetched.
 
-    def _list_local_files(self, entry: LockEntry, project_dir: Path, /) -> list[str]:
+        Prefers the entry fetched with this exact filter; an unfiltered entry
+        for the same commit is a superset and is used (filtered) as well.
+        Hits are recorded here; a miss is recorded by the fetcher that
+        materialises the plugin.
+        """
+        key = file_filter.cache_key(sha)
+        for candidate in (key, sha):
+            if self._plugin_cache.has_local(registry, plugin_name, candidate):
+                self._stats.record_hit(registry)
+                return candidate
+        if self._plugin_cache.has(registry, plugin_name, key):
+            self._stats.record_hit(registry, remote=True)
+            return key
+        return None
+
+    def _locked_local_plugin(
+        self,
+        entry: LockEntry,
+        spec: PromptSpec,
+        prompts_dir: Path,
+        local_fetcher: LocalPluginFetcher,
+        /,
+    ) -> Plugin | None:
+        """Build a local plugin's manifest from the lock, or None if it is stale.
+
+        A single-file plugin only needs its file to exist. A directory
+        plugin's list is trusted while the listing lock recorded for it has
+        the same files and none of its directories or ignore files has a new
+        mtime, so adding, removing or renaming a file (outside ignored
+        directories) or editing an ignore file makes the caller list it
+        again. Nothing is walked or read here; file contents are read, at
+        their current size, when the builders copy them.
+        """
+        if not entry.files:
+            return None
+        files = tuple(f.path for f in entry.files)
         relative = entry.source.removeprefix(LOCAL_SOURCE_PREFIX)
-        prompts_dir = project_dir / PROMPTS_DIR
-        md_path = prompts_dir / f"{relative}.md"
-        dir_path = prompts_dir / relative
-
-        if md_path.is_file():
-            return [f"{relative}.md"]
-        if dir_path.is_dir():
-            return sorted(
-                str(f.relative_to(prompts_dir))
-                for f in dir_path.rglob("*")
-                if f.is_file()
-            )
-        raise BuildError(f"Local plugin not found for '{entry.name}': {relative}")
+        if files == (f"{relative}{PROMPT_EXTENSION}",):
+            if not self._fs.file_exists(prompts_dir / files[0]):
+                return None
+        elif not self._is_listing_current(entry.source, files, local_fetcher):
+            return None
+        return Plugin(spec=spec, files=files, source_dir=prompts_dir)
+
+    def _is_listing_current(
+        self, source: str, files: tuple[str, ...], local_fetcher: LocalPluginFetcher, /
+    ) -> bool:
+        if self._hash_cache is None:
+            return False
+        listing = self._hash_cache.listing(source)
+        if listing is None or listing[0] != files:
+            return False
+        return local_fetcher.is_unchanged(listing[1])
+
+    def _resolve_local_plugin(
+        self, entry: LockEntry, spec: PromptSpec, local_fetcher: LocalPluginFetcher, /
+    ) -> Plugin:
+        """List a local plugin's files the same way lock does, honouring ignores."""
+        try:
+            return local_fetcher.fetch(spec)
+        except SyncError:
+            relative = entry.source.removeprefix(LOCAL_SOURCE_PREFIX)
+            raise BuildError(
+                f"Local plugin not found for '{entry.name}': {relative}"
+            ) from None
 
     def _load_config(self, project_dir: Path, /) -> LoadedConfig:
-        config_path = project_dir / CONFIG_FILENAME
         try:
-            yaml_content = self._fs.read_file(config_path)
+            return self._project.load_config(project_dir)
         except FileNotFoundError:
             raise BuildError(
                 f"{CONFIG_FILENAME} not found. Run 'promptkit init' to create a new project."
             ) from None
-        return self._yaml_loader.load(yaml_content)
 
     def _load_lock(self, project_dir: Path, /) -> list[LockEntry]:
-        lock_path = project_dir / LOCK_FILENAME
-        if not self._fs.file_exists(lock_path):
+        entries = self._project.load_lock(project_dir)
+        if entries is None:
             raise BuildError("Lock file not found. Run 'promptkit lock' first.")
-        lock_content = self._fs.read_file(lock_path)
-        return self._lock_file.deserialize(lock_content)
+        return entries
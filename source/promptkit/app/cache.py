@@ -0,0 +1,145 @@
+"""Application layer: ExportCache and ImportCache use cases."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from promptkit.domain.errors import SyncError
+from promptkit.domain.file_system import FileSystem
+from promptkit.domain.lock_entry import LockEntry
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.storage.cache_archive import (
+    EntryKey,
+    archive_name,
+    export_entries,
+    import_archive,
+)
+from promptkit.infra.storage.plugin_cache import TEMP_SUFFIX, PluginCache
+
+LOCK_FILENAME = "promptkit.lock"
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """Where a cache archive was written and how many entries it holds."""
+
+    archive_path: Path
+    entry_count: int
+
+
+@dataclass(frozen=True)
+class ImportResult:
+    """Outcome of restoring a cache archive."""
+
+    imported_count: int
+    missing: tuple[str, ...]
+
+
+class ExportCache:
+    """Use case for archiving exactly the cache entries promptkit.lock needs.
+
+    The archive is named after the lock file's content hash, so CI and Docker
+    layer caches can key on it directly.
+    """
+
+    def __init__(
+        self,
+        *,
+        file_system: FileSystem,
+        lock_file: LockFile,
+        plugin_cache: PluginCache,
+    ) -> None:
+        self._fs = file_system
+        self._lock_file = lock_file
+        self._plugin_cache = plugin_cache
+
+    def execute(self, project_dir: Path, output_dir: Path, /) -> ExportResult:
+        """Write promptkit-cache-<lock hash>.tar.gz into output_dir.
+
+        Raises:
+            SyncError: If the lock file is missing or a locked plugin is not cached.
+        """
+        lock_content = _read_lock(self._fs, project_dir)
+        entries = self._lock_file.deserialize(lock_content)
+        self._plugin_cache.reconcile()
+        keys = [
+            key
+            for entry in entries
+            if entry.commit_sha
+            for key in self._require_cached(entry)
+        ]
+
+        archive_path = output_dir / archive_name(lock_content)
+        temp_path = archive_path.with_name(archive_path.name + TEMP_SUFFIX)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("wb") as output:
+            export_entries(self._plugin_cache, keys, output, lock_content=lock_content)
+        os.replace(temp_path, archive_path)
+        return ExportResult(archive_path=archive_path, entry_count=len(keys))
+
+    def _require_cached(self, entry: LockEntry, /) -> list[EntryKey]:
+        """Return every cached variant (unfiltered or filtered) of a locked entry."""
+        keys = _cached_variants(self._plugin_cache, entry)
+        if not keys:
+            raise SyncError(
+                f"Cached plugin missing for '{entry.name}' "
+                f"(sha: {entry.commit_sha}). Run 'promptkit build' to fetch it."
+            )
+        return keys
+
+
+class ImportCache:
+    """Use case for restoring cache entries from an exported archive."""
+
+    def __init__(
+        self,
+        *,
+        file_system: FileSystem,
+        lock_file: LockFile,
+        plugin_cache: PluginCache,
+    ) -> None:
+        self._fs = file_system
+        self._lock_file = lock_file
+        self._plugin_cache = plugin_cache
+
+    def execute(self, project_dir: Path, archive_path: Path, /) -> ImportResult:
+        """Restore and verify the archive's entries.
+
+        Returns the number of entries restored and the names of any locked
+        registry plugins that are still not cached afterwards.
+
+        Raises:
+            SyncError: If the archive is missing, malformed or fails verification.
+        """
+        if not archive_path.is_file():
+            raise SyncError(f"Cache archive not found: {archive_path}")
+        with archive_path.open("rb") as source:
+            imported = import_archive(self._plugin_cache, source)
+
+        missing: list[str] = []
+        if self._fs.file_exists(project_dir / LOCK_FILENAME):
+            entries = self._lock_file.deserialize(_read_lock(self._fs, project_dir))
+            self._plugin_cache.reconcile()
+            for entry in entries:
+                if not entry.commit_sha:
+                    continue
+                if not _cached_variants(self._plugin_cache, entry):
+                    missing.append(entry.name)
+        return ImportResult(imported_count=len(imported), missing=tuple(missing))
+
+
+def _cached_variants(cache: PluginCache, entry: LockEntry, /) -> list[EntryKey]:
+    """Return the cache keys holding a locked entry; the catalog must be reconciled."""
+    assert entry.commit_sha is not None
+    registry, plugin_name = entry.source.split("/", 1)
+    variants = cache.catalog.variants(registry, plugin_name, entry.commit_sha)
+    if not variants and cache.has(registry, plugin_name, entry.commit_sha):
+        variants = [entry.commit_sha]
+    return [EntryKey(registry, plugin_name, key) for key in variants]
+
+
+def _read_lock(fs: FileSystem, project_dir: Path, /) -> str:
+    lock_path = project_dir / LOCK_FILENAME
+    if not fs.file_exists(lock_path):
+        raise SyncError("Lock file not found. Run 'promptkit lock' first.")
+    return fs.read_file(lock_path)
@@ -0,0 +1,145 @@
+"""Application layer: FetchPlugins use case."""
+
+from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from promptkit.app.build import BuildTargets
+from promptkit.app.project_context import ProjectContext
+from promptkit.domain.errors import SyncError
+from promptkit.domain.file_filter import FileFilter
+from promptkit.domain.file_system import FileSystem
+from promptkit.domain.lock_entry import LockEntry
+from promptkit.domain.platform_target import PlatformTarget
+from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.domain.protocols import ArtifactBuilder, PluginFetcher
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_loader import LoadedConfig, YamlLoader
+
+CONFIG_FILENAME = "promptkit.yaml"
+LOCK_FILENAME = "promptkit.lock"
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Statistics from a fetch operation."""
+
+    plugin_count: int
+    registry_count: int
+
+
+@dataclass(frozen=True)
+class _FetchTask:
+    """One registry plugin to fetch; commit_sha is None until resolved."""
+
+    spec: PromptSpec
+    commit_sha: str | None
+    file_filter: FileFilter | None
+
+
+class FetchPlugins:
+    """Use case for warming registry clones and the plugin cache.
+
+    Does all of the network work of lock and build and nothing else: no lock
+    file or artifact is written. Without locked, every configured registry
+    prompt is resolved to its registry's latest commit; with locked, the
+    commits in promptkit.lock are used as-is. Either way, the plugins a build
+    would read are materialised with the same file filters build uses, so a
+    following 'lock --offline' and 'build' run without network.
+
+    Registries are fetched in parallel, one worker per registry; plugins of
+    the same registry share a clone and are fetched in turn.
+    """
+
+    def __init__(
+        self,
+        *,
+        file_system: FileSystem,
+        yaml_loader: YamlLoader,
+        lock_file: LockFile,
+        builders: Mapping[PlatformTarget, ArtifactBuilder],
+        fetchers: Mapping[str, PluginFetcher],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        project_context: ProjectContext | None = None,
+    ) -> None:
+        self._project = project_context or ProjectContext(
+            file_system=file_system, yaml_loader=yaml_loader, lock_file=lock_file
+        )
+        self._builders = builders
+        self._fetchers = fetchers
+        self._max_workers = max_workers
+
+    def execute(self, project_dir: Path, /, *, locked: bool = False) -> FetchResult:
+        """Resolve and materialise registry plugins into the cache.
+
+        Returns:
+            Number of plugins materialised and registries contacted.
+
+        Raises:
+            SyncError: If config or lock is missing, a registry is not
+                configured, or any fetch fails.
+        """
+        config = self._load_config(project_dir)
+        targets = BuildTargets.from_config(config, self._builders)
+        tasks: list[_FetchTask] = []
+        if locked:
+            for entry in self._load_lock(project_dir):
+                if entry.commit_sha is not None:
+                    spec = targets.spec_for(entry)
+                    tasks.append(
+                        _FetchTask(spec, entry.commit_sha, targets.file_filter(spec))
+                    )
+        else:
+            for spec in config.prompt_specs:
+                tasks.append(_FetchTask(spec, None, targets.file_filter(spec)))
+
+        by_registry: dict[str, list[_FetchTask]] = defaultdict(list)
+        for task in tasks:
+            by_registry[task.spec.registry_name].append(task)
+        for registry_name in by_registry:
+            if registry_name not in self._fetchers:
+                raise SyncError(f"No fetcher registered for registry: {registry_name}")
+        if not by_registry:
+            return FetchResult(plugin_count=0, registry_count=0)
+
+        workers = min(self._max_workers, len(by_registry))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._fetch_registry, self._fetchers[name], registry_tasks)
+                for name, registry_tasks in by_registry.items()
+            ]
+            counts = [future.result() for future in futures]
+        return FetchResult(plugin_count=sum(counts), registry_count=len(by_registry))
+
+    @staticmethod
+    def _fetch_registry(fetcher: PluginFetcher, tasks: list[_FetchTask], /) -> int:
+        """Fetch one registry's plugins in order; return how many were materialised."""
+        count = 0
+        for task in tasks:
+            commit_sha = task.commit_sha or fetcher.resolve(task.spec).commit_sha
+            if task.file_filter is None:
+                continue
+            fetcher.materialize(task.spec, commit_sha, file_filter=task.file_filter)
+            count += 1
+        return count
+
+    def _load_config(self, project_dir: Path, /) -> LoadedConfig:
+        try:
+            return self._project.load_config(project_dir)
+        except FileNotFoundError:
+            raise SyncError(
+                f"{CONFIG_FILENAME} not found. "
+                "Run 'promptkit init' to create a new project."
+            ) from None
+
+    def _load_lock(self, project_dir: Path, /) -> list[LockEntry]:
+        entries = self._project.load_lock(project_dir)
+        if entries is None:
+            raise SyncError(
+                f"{LOCK_FILENAME} not found. Run 'promptkit lock' first, "
+                "or fetch without --locked."
+            )
+        return entries
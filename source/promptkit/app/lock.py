@@ -1,22 +1,30 @@
 """Application layer: LockPrompts use case."""
 
 import hashlib
-from collections.abc import Mapping
+import os
+from collections.abc import Collection, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+from promptkit.app.project_context import ProjectContext
 from promptkit.domain.errors import SyncError
 from promptkit.domain.file_system import FileSystem
-from promptkit.domain.lock_entry import LockEntry
+from promptkit.domain.lock_entry import LockedFile, LockEntry
 from promptkit.domain.plugin import Plugin
+from promptkit.domain.prompt_spec import PromptSpec
 from promptkit.domain.protocols import PluginFetcher
+from promptkit.domain.resolved_plugin import ResolvedPlugin
 from promptkit.infra.config.lock_file import LockFile
 from promptkit.infra.config.yaml_loader import LoadedConfig, YamlLoader
 from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
+from promptkit.infra.storage.hash_cache import HashCache
+from promptkit.infra.storage.lock_journal import LockJournal
 
 CONFIG_FILENAME = "promptkit.yaml"
-LOCK_FILENAME = "promptkit.lock"
 HASH_PREFIX = "sha256:"
+LOCAL_SOURCE_PREFIX = "local/"
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 def _now() -> datetime:
@@ -26,9 +34,29 @@ def _now() -> datetime:
 class LockPrompts:
     """Use case for fetching plugins and updating the lock file.
 
-    Single code path for both local and registry plugins:
-    - Local: content_hash computed from files, commit_sha=None
-    - Registry: content_hash="", commit_sha from fetcher
+    Locking only resolves versions; it never copies registry files:
+    - Local: content_hash computed from files, commit_sha=None, and the
+      files listed with their sizes and digests for BuildArtifacts
+    - Registry: content_hash="", commit_sha and tree_id from the fetcher's
+      resolve phase. Files are materialised on demand by BuildArtifacts.
+
+    With a HashCache, local files whose stat is unchanged are not re-read,
+    and each local plugin's listing is recorded with its stamps so
+    BuildArtifacts can reuse it.
+    Local plugins are walked and hashed on up to max_workers threads
+    (default: one per CPU); hashlib and file reads release the GIL.
+    Pass the command's ProjectContext to share parsed config and lock with
+    the stages that follow.
+
+    With a LockJournal, each registry entry is journaled as soon as it is
+    resolved. A rerun for the same config after a failure reuses journaled
+    entries of every registry whose first spec still resolves to the same
+    commit, so it gives the same lock as an uninterrupted run against that
+    snapshot. The journal is discarded once the lock is written.
+
+    Passing only locks just the named sources and carries every other entry
+    over from the existing lock untouched, so adding one prompt costs one
+    resolve instead of a full lock.
     """
 
     def __init__(
@@ -39,115 +67,249 @@ class LockPrompts:
         lock_file: LockFile,
         local_fetcher: LocalPluginFetcher,
         fetchers: Mapping[str, PluginFetcher],
+        hash_cache: HashCache | None = None,
+        max_workers: int | None = None,
+        project_context: ProjectContext | None = None,
+        journal: LockJournal | None = None,
     ) -> None:
         self._fs = file_system
-        self._yaml_loader = yaml_loader
-        self._lock_file = lock_file
+        self._project = project_context or ProjectContext(
+            file_system=file_system, yaml_loader=yaml_loader, lock_file=lock_file
+        )
         self._local_fetcher = local_fetcher
         self._fetchers = fetchers
+        self._hash_cache = hash_cache
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._journal = journal
+
+    def execute(
+        self, project_dir: Path, /, *, only: Collection[str] | None = None
+    ) -> int:
+        """Fetch all plugins, or just those in only, and write the lock file.
 
-    def execute(self, project_dir: Path, /) -> int:
-        """Fetch all plugins and write updated lock file.
+        Raises:
+            SyncError: If a source in only is neither configured in
+                promptkit.yaml nor a local plugin.
 
         Returns:
             Number of plugins locked.
         """
         config = self._load_config(project_dir)
         existing_entries = self._load_existing_lock(project_dir)
+        if only is not None:
+            return self._lock_only(project_dir, config, existing_entries, set(only))
         existing_by_source = {e.source: e for e in existing_entries}
 
+        journaled = self._start_journal(project_dir)
+        snapshots: dict[str, str] = {}
+
         entries: list[LockEntry] = []
 
         for spec in config.prompt_specs:
-            fetcher = self._resolve_fetcher(spec.registry_name)
-            plugin = fetcher.fetch(spec)
-            entries.append(self._lock_plugin(plugin, existing_by_source))
+            entry = journaled.get(spec.source)
+            snapshot = snapshots.get(spec.registry_name)
+            if entry is None or snapshot is None or entry.commit_sha != snapshot:
+                fetcher = self._resolve_fetcher(spec.registry_name)
+                resolved = fetcher.resolve(spec)
+                snapshots.setdefault(spec.registry_name, resolved.commit_sha)
+                entry = self._lock_registry_plugin(
+                    resolved, existing_by_source.get(resolved.source)
+                )
+                if self._journal is not None:
+                    self._journal.record(entry)
+            entries.append(entry)
 
-        for local_spec in self._local_fetcher.discover():
-            plugin = self._local_fetcher.fetch(local_spec)
-            entries.append(self._lock_plugin(plugin, existing_by_source))
+        entries.extend(self._lock_local_plugins(existing_by_source))
 
         entries.sort(key=lambda e: e.name)
-        lock_content = self._lock_file.serialize(entries)
-        self._fs.write_file(project_dir / LOCK_FILENAME, lock_content)
+        self._project.write_lock(project_dir, entries)
+        if self._journal is not None:
+            self._journal.discard()
+        if self._hash_cache is not None:
+            self._hash_cache.save()
         return len(entries)
 
+    def _lock_only(
+        self,
+        project_dir: Path,
+        config: LoadedConfig,
+        existing_entries: list[LockEntry],
+        only: set[str],
+        /,
+    ) -> int:
+        """Lock the sources in only, keeping every other existing entry."""
+        existing_by_source = {e.source: e for e in existing_entries}
+        registry_specs = [s for s in config.prompt_specs if s.source in only]
+        local_specs = [
+            PromptSpec(source=source)
+            for source in sorted(only)
+            if source.startswith(LOCAL_SOURCE_PREFIX)
+        ]
+        unknown = only.difference(s.source for s in registry_specs + local_specs)
+        if unknown:
+            raise SyncError(
+                f"Not configured in {CONFIG_FILENAME}: {', '.join(sorted(unknown))}"
+            )
+
+        locked: list[LockEntry] = []
+        for spec in registry_specs:
+            resolved = self._resolve_fetcher(spec.registry_name).resolve(spec)
+            locked.append(
+                self._lock_registry_plugin(
+                    resolved, existing_by_source.get(spec.source)
+                )
+            )
+        for spec in local_specs:
+            plugin = self._local_fetcher.fetch(spec)
+            locked.append(
+                self._lock_local_plugin(plugin, existing_by_source.get(spec.source))
+            )
+
+        entries = [e for e in existing_entries if e.source not in only] + locked
+        entries.sort(key=lambda e: e.name)
+        self._project.write_lock(project_dir, entries)
+        if self._hash_cache is not None:
+            self._hash_cache.save(keep_unseen=True)
+        return len(locked)
+
+    def _start_journal(self, project_dir: Path, /) -> dict[str, LockEntry]:
+        """Return the entries journaled by a failed run for this config."""
+        if self._journal is None:
+            return {}
+        return self._journal.start(self._project.config_digest(project_dir))
+
     def _resolve_fetcher(self, registry_name: str, /) -> PluginFetcher:
         if registry_name not in self._fetchers:
             raise SyncError(f"No fetcher registered for registry: {registry_name}")
         return self._fetchers[registry_name]
 
-    def _lock_plugin(
-        self,
-        plugin: Plugin,
-        existing_by_source: dict[str, LockEntry],
-    ) -> LockEntry:
-        """Create a lock entry for a plugin."""
-        existing = existing_by_source.get(plugin.source)
-
-        if plugin.is_registry:
-            return self._lock_registry_plugin(plugin, existing)
-        return self._lock_local_plugin(plugin, existing)
-
     def _lock_registry_plugin(
-        self, plugin: Plugin, existing: LockEntry | None, /
+        self, resolved: ResolvedPlugin, existing: LockEntry | None, /
     ) -> LockEntry:
-        assert plugin.commit_sha is not None
         fetched_at = (
             existing.fetched_at
-            if existing and not existing.has_commit_changed(plugin.commit_sha)
+            if existing and not existing.has_commit_changed(resolved.commit_sha)
             else _now()
         )
         return LockEntry(
-            name=plugin.name,
-            source=plugin.source,
+            name=resolved.name,
+            source=resolved.source,
             content_hash="",
             fetched_at=fetched_at,
-            commit_sha=plugin.commit_sha,
+            commit_sha=resolved.commit_sha,
+            tree_id=resolved.tree_id,
         )
 
+    def _lock_local_plugins(
+        self, existing_by_source: Mapping[str, LockEntry], /
+    ) -> list[LockEntry]:
+        """Walk and hash every local plugin, fanned out over a worker pool.
+
+        Results keep discovery order, so the outcome is identical to locking
+        the plugins one by one.
+        """
+        specs = self._local_fetcher.discover()
+
+        def lock_one(spec: PromptSpec) -> LockEntry:
+            plugin = self._local_fetcher.fetch(spec)
+            return self._lock_local_plugin(plugin, existing_by_source.get(spec.source))
+
+        if len(specs) <= 1 or self._max_workers <= 1:
+            return [lock_one(spec) for spec in specs]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            return list(pool.map(lock_one, specs))
+
     def _lock_local_plugin(
         self, plugin: Plugin, existing: LockEntry | None, /
     ) -> LockEntry:
-        content_hash = self._compute_content_hash(plugin)
-        fetched_at = (
-            existing.fetched_at
-            if existing and not existing.has_content_changed(content_hash)
-            else _now()
+        if self._hash_cache is not None:
+            stamps = self._local_fetcher.listing_stamps(plugin.source)
+            if stamps is not None:
+                self._hash_cache.record_listing(plugin.source, plugin.files, stamps)
+        content_hash, files = self._hash_plugin(plugin)
+        unchanged = existing is not None and (
+            not existing.has_content_changed(content_hash)
+            or (
+                existing.files is None
+                and existing.content_hash == self._legacy_content_hash(plugin)
+            )
         )
+        fetched_at = existing.fetched_at if existing and unchanged else _now()
         return LockEntry(
             name=plugin.name,
             source=plugin.source,
             content_hash=content_hash,
             fetched_at=fetched_at,
+            files=files,
         )
 
-    def _compute_content_hash(self, plugin: Plugin, /) -> str:
-        """Compute content hash for a local plugin.
+    def _hash_plugin(self, plugin: Plugin, /) -> tuple[str, tuple[LockedFile, ...]]:
+        """Compute content hash for a local plugin and describe its files.
 
-        For single files: sha256(content).
-        For directories: sort files by path, concatenate path + content, sha256.
+        Files are sorted by path; for each, the path and a newline are hashed,
+        then the file's raw bytes. For UTF-8 text with LF line endings this
+        equals the legacy text-based hash (see _legacy_content_hash).
+        """
+        if self._hash_cache is None:
+            return self._hash_contents(plugin)
+        files = tuple(
+            LockedFile(
+                file_path, *self._hash_cache.file_record(plugin.source_dir / file_path)
+            )
+            for file_path in sorted(plugin.files)
+        )
+        content_hash = self._hash_cache.plugin_hash(
+            plugin.source,
+            tuple((f.path, f.sha256) for f in files),
+            lambda: self._hash_contents(plugin)[0],
+        )
+        return content_hash, files
+
+    def _hash_contents(self, plugin: Plugin, /) -> tuple[str, tuple[LockedFile, ...]]:
+        """Stream every file's raw bytes through one hasher, chunk by chunk.
+
+        Each file's bytes also go through a hasher of their own, in the same
+        pass, to describe the file.
         """
         hasher = hashlib.sha256()
+        files: list[LockedFile] = []
         for file_path in sorted(plugin.files):
-            full_path = plugin.source_dir / file_path
-            content = self._fs.read_file(full_path)
-            hasher.update(f"{file_path}\n{content}".encode())
+            hasher.update(f"{file_path}\n".encode())
+            file_hasher = hashlib.sha256()
+            size = 0
+            with self._fs.open_binary(plugin.source_dir / file_path) as f:
+                while chunk := f.read(HASH_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    file_hasher.update(chunk)
+                    size += len(chunk)
+            files.append(LockedFile(file_path, size, file_hasher.hexdigest()))
+        return f"{HASH_PREFIX}{hasher.hexdigest()}", tuple(files)
+
+    def _legacy_content_hash(self, plugin: Plugin, /) -> str | None:
+        """Hash decoded text as older versions did, or None for non-text files.
+
+        Text reads translate CRLF line endings, so locks written before
+        hashing moved to raw bytes may hold a different hash for unchanged
+        files. A match here keeps such entries' fetched_at; the entry is
+        rewritten with the raw-bytes hash and its files. Entries that list
+        their files were hashed from raw bytes, so they never need this.
+        """
+        hasher = hashlib.sha256()
+        try:
+            for file_path in sorted(plugin.files):
+                content = self._fs.read_file(plugin.source_dir / file_path)
+                hasher.update(f"{file_path}\n{content}".encode())
+        except UnicodeDecodeError:
+            return None
         return f"{HASH_PREFIX}{hasher.hexdigest()}"
 
     def _load_config(self, project_dir: Path, /) -> LoadedConfig:
-        config_path = project_dir / CONFIG_FILENAME
         try:
-            yaml_content = self._fs.read_file(config_path)
+            return self._project.load_config(project_dir)
         except FileNotFoundError:
             raise SyncError(
                 f"{CONFIG_FILENAME} not found. Run 'promptkit init' to create a new project."
             ) from None
-        return self._yaml_loader.load(yaml_content)
 
     def _load_existing_lock(self, project_dir: Path, /) -> list[LockEntry]:
-        lock_path = project_dir / LOCK_FILENAME
-        if not self._fs.file_exists(lock_path):
-            return []
-        lock_content = self._fs.read_file(lock_path)
-        return self._lock_file.deserialize(lock_content)
+        return self._project.load_lock(project_dir) or []
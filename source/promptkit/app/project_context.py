@@ -0,0 +1,103 @@
+"""Application layer: ProjectContext, the per-command view of config and lock."""
+
+import hashlib
+from pathlib import Path
+
+from promptkit.domain.file_system import FileSystem
+from promptkit.domain.lock_entry import LockEntry
+from promptkit.infra.config.config_layers import ConfigLayers
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_loader import LoadedConfig, YamlLoader
+
+CONFIG_FILENAME = "promptkit.yaml"
+LOCK_FILENAME = "promptkit.lock"
+
+
+class ProjectContext:
+    """Loads promptkit.yaml and promptkit.lock at most once per content.
+
+    Parsed results are cached by the SHA-256 of the file content: a stage
+    reading a file another stage of the same command already parsed gets
+    the cached result, while a file changed on disk in between is parsed
+    again. write_lock() primes the cache with the entries it wrote, so a
+    build following a lock (as in sync) never re-parses the lock.
+
+    The config is loaded through config_layers, which resolves the configs
+    it extends; by default only local base configs can be read.
+
+    Create one per command and share it between the use cases it runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        file_system: FileSystem,
+        yaml_loader: YamlLoader,
+        lock_file: LockFile,
+        config_layers: ConfigLayers | None = None,
+    ) -> None:
+        self._fs = file_system
+        self._config_layers = config_layers or ConfigLayers(file_system, yaml_loader)
+        self._lock_file = lock_file
+        self._configs: dict[str, LoadedConfig] = {}
+        self._locks: dict[str, tuple[LockEntry, ...]] = {}
+
+    @property
+    def file_system(self) -> FileSystem:
+        return self._fs
+
+    def load_config(self, project_dir: Path, /) -> LoadedConfig:
+        """Return the parsed promptkit.yaml, merged with the configs it extends.
+
+        Raises:
+            FileNotFoundError: If promptkit.yaml does not exist.
+            ValidationError: If it is invalid.
+        """
+        config_path = project_dir / CONFIG_FILENAME
+        content = self._fs.read_file(config_path)
+        key = _digest(content)
+        config = self._configs.get(key)
+        if config is None:
+            config = self._configs[key] = self._config_layers.load(config_path, content)
+        return config
+
+    def config_digest(self, project_dir: Path, /) -> str:
+        """Return the SHA-256 of promptkit.yaml's content.
+
+        Raises:
+            FileNotFoundError: If promptkit.yaml does not exist.
+        """
+        return _digest(self._fs.read_file(project_dir / CONFIG_FILENAME))
+
+    def load_lock(self, project_dir: Path, /) -> list[LockEntry] | None:
+        """Return the entries of promptkit.lock, or None if there is none.
+
+        Raises:
+            ValidationError: If the lock file is invalid.
+        """
+        lock_path = project_dir / LOCK_FILENAME
+        if not self._fs.file_exists(lock_path):
+            return None
+        content = self._fs.read_file(lock_path)
+        key = _digest(content)
+        entries = self._locks.get(key)
+        if entries is None:
+            entries = self._locks[key] = tuple(self._lock_file.deserialize(content))
+        return list(entries)
+
+    def write_lock(self, project_dir: Path, entries: list[LockEntry], /) -> None:
+        """Serialize and write promptkit.lock, remembering the written entries.
+
+        A lock whose content is unchanged is not rewritten.
+        """
+        content = self._lock_file.serialize(entries)
+        lock_path = project_dir / LOCK_FILENAME
+        if not (
+            self._fs.file_exists(lock_path) and self._fs.read_file(lock_path) == content
+        ):
+            self._fs.write_file(lock_path, content)
+        self._locks[_digest(content)] = tuple(entries)
+
+
+def _digest(content: str, /) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
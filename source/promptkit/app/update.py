@@ -0,0 +1,67 @@
+"""Application layer: UpdatePrompts use case."""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+from promptkit.app.lock import LockPrompts
+from promptkit.app.project_context import ProjectContext
+from promptkit.domain.errors import SyncError
+
+CONFIG_FILENAME = "promptkit.yaml"
+
+
+class UpdatePrompts:
+    """Use case for moving chosen plugins to their registry's latest commit.
+
+    Plugins are named by source ('registry/name') or by name. Only they are
+    resolved again; every other entry keeps its locked commit_sha, so other
+    plugins from the same registry keep their cache entries and artifacts.
+    Fetchers export each plugin at its own commit from the one registry
+    clone, so plugins locked at different commits need no extra checkouts.
+    """
+
+    def __init__(
+        self, *, lock_prompts: LockPrompts, project_context: ProjectContext
+    ) -> None:
+        self._lock = lock_prompts
+        self._project = project_context
+
+    def execute(self, project_dir: Path, plugins: Sequence[str], /) -> int:
+        """Re-lock the named plugins and return how many were updated.
+
+        Raises:
+            SyncError: If there is no config or lock, or a plugin is unknown
+                or its name is shared by several sources.
+        """
+        try:
+            config = self._project.load_config(project_dir)
+        except FileNotFoundError:
+            raise SyncError(
+                f"{CONFIG_FILENAME} not found. Run 'promptkit init' to create a new project."
+            ) from None
+        entries = self._project.load_lock(project_dir)
+        if entries is None:
+            raise SyncError("Lock file not found. Run 'promptkit lock' first.")
+
+        sources_by_name: dict[str, set[str]] = {}
+        for spec in config.prompt_specs:
+            sources_by_name.setdefault(spec.name, set()).add(spec.source)
+        for entry in entries:
+            sources_by_name.setdefault(entry.name, set()).add(entry.source)
+        known = {s for group in sources_by_name.values() for s in group}
+
+        sources: list[str] = []
+        for plugin in plugins:
+            if plugin in known:
+                sources.append(plugin)
+                continue
+            matches = sources_by_name.get(plugin, set())
+            if not matches:
+                raise SyncError(f"Unknown plugin: {plugin}")
+            if len(matches) > 1:
+                raise SyncError(
+                    f"Plugin name '{plugin}' is ambiguous; use one of: "
+                    f"{', '.join(sorted(matches))}"
+                )
+            sources.extend(matches)
+        return self._lock.execute(project_dir, only=sources)
@@ -2,14 +2,16 @@
 
 from pathlib import Path
 
-from promptkit.domain.errors import ValidationError
+from promptkit.domain.errors import PromptError
 from promptkit.domain.file_system import FileSystem
 from promptkit.domain.validation import (
     LEVEL_ERROR,
+    LEVEL_INFO,
     LEVEL_WARNING,
     ValidationIssue,
     ValidationResult,
 )
+from promptkit.infra.config.config_layers import ConfigLayers
 from promptkit.infra.config.lock_file import LockFile
 from promptkit.infra.config.yaml_loader import LoadedConfig, YamlLoader
 
@@ -27,9 +29,10 @@ class ValidateConfig:
         file_system: FileSystem,
         yaml_loader: YamlLoader,
         lock_file: LockFile,
+        config_layers: ConfigLayers | None = None,
     ) -> None:
         self._fs = file_system
-        self._yaml_loader = yaml_loader
+        self._config_layers = config_layers or ConfigLayers(file_system, yaml_loader)
         self._lock_file = lock_file
 
     def execute(self, project_dir: Path, /) -> ValidationResult:
@@ -40,6 +43,7 @@ class ValidateConfig:
         if config is None:
             return ValidationResult(issues=tuple(issues))
 
+        self._report_layers(config, issues)
         self._check_registry_references(config, issues)
         self._check_lock_freshness(project_dir, config, issues)
 
@@ -52,11 +56,33 @@ class ValidateConfig:
         config_path = project_dir / CONFIG_FILENAME
         try:
             yaml_content = self._fs.read_file(config_path)
-            return self._yaml_loader.load(yaml_content)
-        except (ValidationError, FileNotFoundError) as e:
+            return self._config_layers.load(config_path, yaml_content)
+        except (PromptError, FileNotFoundError) as e:
+            # Includes SyncError from reading a registry's base config
             issues.append(ValidationIssue(level=LEVEL_ERROR, message=str(e)))
             return None
 
+    def _report_layers(
+        self, config: LoadedConfig, issues: list[ValidationIssue], /
+    ) -> None:
+        """Report which layer contributed each entry of an extended config."""
+        if not config.layers:
+            return
+        issues.append(
+            ValidationIssue(
+                level=LEVEL_INFO,
+                message=f"Config layers (base first): {', '.join(config.layers)}",
+            )
+        )
+        for key, label in sorted(config.origins.items()):
+            kind, _, name = key.partition(":")
+            issues.append(
+                ValidationIssue(
+                    level=LEVEL_INFO,
+                    message=f"{kind.capitalize()} '{name}' from {label}",
+                )
+            )
+
     def _check_registry_references(
         self, config: LoadedConfig, issues: list[ValidationIssue], /
     ) -> None:
@@ -1,44 +1,70 @@
-"""CLI interface for promptkit."""
+"""CLI interface for promptkit.
+
+Use cases and infrastructure are imported inside the functions that use
+them, so 'promptkit --help', shell completion and light commands only load
+typer and what they run. tests/test_cli.py checks that importing this
+module loads none of them; tests/benchmarks/test_cli_import_benchmark.py
+holds the import-time budget.
+"""
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from promptkit.app.build import BuildArtifacts
-from promptkit.app.clean import CleanArtifacts
-from promptkit.app.init import InitProject, InitProjectError
-from promptkit.app.lock import LockPrompts
-from promptkit.app.validate import ValidateConfig
-from promptkit.domain.errors import PromptError
-from promptkit.domain.platform_target import PlatformTarget
-from promptkit.domain.protocols import PluginFetcher
-from promptkit.domain.registry import Registry, RegistryType
-from promptkit.domain.validation import LEVEL_ERROR, ValidationIssue
-from promptkit.infra.builders.claude_builder import ClaudeBuilder
-from promptkit.infra.builders.cursor_builder import CursorBuilder
-from promptkit.infra.config.lock_file import LockFile
-from promptkit.infra.config.yaml_loader import YamlLoader
-from promptkit.infra.config_serializer import serialize_config_to_yaml
-from promptkit.infra.fetchers.claude_marketplace import ClaudeMarketplaceFetcher
-from promptkit.infra.fetchers.git_registry_clone import GitRegistryClone
-from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
-from promptkit.infra.file_system.local import FileSystem
-from promptkit.infra.storage.plugin_cache import PluginCache
+from promptkit.domain.errors import PromptError, ValidationError
+
+if TYPE_CHECKING:
+    from promptkit.app.build import BuildArtifacts
+    from promptkit.app.fetch import FetchPlugins
+    from promptkit.app.lock import LockPrompts
+    from promptkit.app.project_context import ProjectContext
+    from promptkit.app.validate import ValidateConfig
+    from promptkit.domain.file_system import FileSystem as FileSystemProtocol
+    from promptkit.domain.platform_target import PlatformTarget
+    from promptkit.domain.protocols import ArtifactBuilder, PluginFetcher
+    from promptkit.domain.registry import Registry
+    from promptkit.domain.validation import ValidationIssue
+    from promptkit.infra.config.config_layers import ConfigLayers, RegistryFiles
+    from promptkit.infra.run_stats import RunStats
+    from promptkit.infra.storage.plugin_cache import PluginCache
+    from promptkit.infra.storage.sync_state import SyncState
 
 app = typer.Typer(
     help="Package manager for AI prompts.\n\nRun 'promptkit init' to create a project, then 'promptkit sync' to fetch and build."
 )
+cache_app = typer.Typer(help="Inspect and manage the plugin cache.")
+app.add_typer(cache_app, name="cache")
 
 
-def _pluralize(count: int, singular: str) -> str:
+def _pluralize(count: int, singular: str, plural: str | None = None) -> str:
     """Return '1 plugin' or '3 plugins' based on count."""
     if count == 1:
         return f"{count} {singular}"
-    return f"{count} {singular}s"
+    return f"{count} {plural or singular + 's'}"
+
+
+def _format_size(size: int) -> str:
+    """Return a human-readable byte count (e.g. '1.5 MiB')."""
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
 
 PLUGIN_CACHE_DIR = ".promptkit/cache/plugins"
 REGISTRIES_DIR = ".promptkit/registries"
+HASH_CACHE_FILE = ".promptkit/hashes.json"
+SYNC_STATE_FILE = ".promptkit/sync-state.json"
+LOCK_JOURNAL_FILE = ".promptkit/lock-journal.jsonl"
+CONFIG_MEMO_FILE = ".promptkit/resolved-config.json"
+STATS_HISTORY_FILE = ".promptkit/stats.jsonl"
 PROMPTS_DIR = "prompts"
+STATS_OPTION_HELP = "Print cache hit rate and fetch costs for this run"
 
 SUCCESS_MESSAGE = """\
 ✓ Initialized promptkit project
@@ -54,10 +80,30 @@ Next steps:
 """
 
 
+def _make_plugin_cache(cwd: Path) -> "PluginCache":
+    """Create the project's PluginCache, backed by a remote cache if configured."""
+    from promptkit.infra.settings import Settings
+    from promptkit.infra.storage.plugin_cache import PluginCache
+    from promptkit.infra.storage.remote_cache import RemoteCache
+
+    remote_url = Settings().remote_cache_url
+    remote = RemoteCache(remote_url) if remote_url else None
+    return PluginCache(cwd / PLUGIN_CACHE_DIR, remote=remote)
+
+
 def _make_plugin_fetchers(
-    registries: list[Registry], cache: PluginCache, registries_dir: Path
-) -> dict[str, PluginFetcher]:
+    registries: "list[Registry]",
+    cache: "PluginCache",
+    registries_dir: Path,
+    stats: "RunStats | None" = None,
+    *,
+    offline: bool = False,
+) -> "dict[str, PluginFetcher]":
     """Map config registries to PluginFetcher instances."""
+    from promptkit.domain.registry import RegistryType
+    from promptkit.infra.fetchers.claude_marketplace import ClaudeMarketplaceFetcher
+    from promptkit.infra.fetchers.git_registry_clone import GitRegistryClone
+
     fetchers: dict[str, PluginFetcher] = {}
     for registry in registries:
         if registry.registry_type == RegistryType.CLAUDE_MARKETPLACE:
@@ -71,57 +117,242 @@ def _make_plugin_fetchers(
                 registry_name=registry.name,
                 cache=cache,
                 clone=clone,
+                stats=stats,
+                offline=offline,
             )
     return fetchers
 
 
-def _make_lock_use_case(cwd: Path, fs: FileSystem) -> LockPrompts:
-    """Create a LockPrompts use case with standard wiring."""
-    yaml_loader = YamlLoader()
-    config_path = cwd / "promptkit.yaml"
-    cache = PluginCache(cwd / PLUGIN_CACHE_DIR)
+def _make_builders(fs: "FileSystemProtocol") -> "dict[PlatformTarget, ArtifactBuilder]":
+    """Return the artifact builder for every supported platform."""
+    from promptkit.domain.platform_target import PlatformTarget
+    from promptkit.infra.builders.claude_builder import ClaudeBuilder
+    from promptkit.infra.builders.cursor_builder import CursorBuilder
+
+    return {
+        PlatformTarget.CURSOR: CursorBuilder(fs),
+        PlatformTarget.CLAUDE_CODE: ClaudeBuilder(fs),
+    }
+
+
+def _make_project_context(cwd: Path) -> "ProjectContext":
+    """Create the per-command ProjectContext over a metadata-caching file system."""
+    from promptkit.app.project_context import ProjectContext
+    from promptkit.infra.config.lock_file import LockFile
+    from promptkit.infra.config.yaml_loader import YamlLoader
+    from promptkit.infra.file_system.caching import CachingFileSystem
+    from promptkit.infra.file_system.local import FileSystem
+
+    fs = CachingFileSystem(FileSystem())
+    return ProjectContext(
+        file_system=fs,
+        yaml_loader=YamlLoader(),
+        lock_file=LockFile(),
+        config_layers=_make_config_layers(cwd, fs),
+    )
+
+
+def _make_config_layers(
+    cwd: Path, fs: "FileSystemProtocol", *, clone_missing: bool = True
+) -> "ConfigLayers":
+    """Create ConfigLayers memoised in .promptkit/ and reading registry clones."""
+    from promptkit.infra.config.config_layers import ConfigLayers
+    from promptkit.infra.config.yaml_loader import YamlLoader
+
+    return ConfigLayers(
+        fs,
+        YamlLoader(),
+        memo_path=cwd / CONFIG_MEMO_FILE,
+        registry_files=_registry_file_reader(cwd, clone_missing=clone_missing),
+    )
+
+
+def _registry_file_reader(cwd: Path, *, clone_missing: bool) -> "RegistryFiles":
+    """Read base configs from the registry clones, cloning a missing one.
 
-    registries: list[Registry] = []
-    if config_path.exists():
-        yaml_content = fs.read_file(config_path)
-        config = yaml_loader.load(yaml_content)
-        registries = config.registries
+    Without clone_missing, only existing clones are read and nothing goes
+    to the network; a missing clone is a ValidationError.
+    """
+    from promptkit.infra.fetchers.git_registry_clone import GitRegistryClone
+
+    def read(registry: "Registry", path: str) -> str | None:
+        clone_dir = cwd / REGISTRIES_DIR / registry.name
+        if not (clone_dir / ".git").is_dir():
+            if not clone_missing:
+                raise ValidationError(
+                    f"Registry '{registry.name}' is not cloned yet; "
+                    "run 'promptkit fetch' to read its base configs"
+                )
+            GitRegistryClone(
+                registry_name=registry.name,
+                registry_url=registry.url,
+                registries_dir=cwd / REGISTRIES_DIR,
+            ).ensure_up_to_date()
+        file_path = clone_dir / path
+        return file_path.read_text() if file_path.is_file() else None
 
+    return read
+
+
+def _make_lock_use_case(
+    cwd: Path,
+    project: "ProjectContext",
+    stats: "RunStats | None" = None,
+    *,
+    offline: bool = False,
+) -> "LockPrompts":
+    """Create a LockPrompts use case with standard wiring."""
+    from promptkit.app.lock import LockPrompts
+    from promptkit.infra.config.lock_file import LockFile
+    from promptkit.infra.config.yaml_loader import YamlLoader
+    from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
+    from promptkit.infra.storage.hash_cache import HashCache
+    from promptkit.infra.storage.lock_journal import LockJournal
+
+    fs = project.file_system
+    cache = _make_plugin_cache(cwd)
     return LockPrompts(
         file_system=fs,
-        yaml_loader=yaml_loader,
+        yaml_loader=YamlLoader(),
         lock_file=LockFile(),
         local_fetcher=LocalPluginFetcher(fs, cwd / PROMPTS_DIR),
-        fetchers=_make_plugin_fetchers(registries, cache, cwd / REGISTRIES_DIR),
+        fetchers=_make_plugin_fetchers(
+            _load_registries(cwd, project),
+            cache,
+            cwd / REGISTRIES_DIR,
+            stats,
+            offline=offline,
+        ),
+        hash_cache=HashCache(cwd / HASH_CACHE_FILE),
+        project_context=project,
+        journal=LockJournal(cwd / LOCK_JOURNAL_FILE),
     )
 
 
-def _make_build_use_case(cwd: Path, fs: FileSystem) -> BuildArtifacts:
+def _make_fetch_use_case(
+    cwd: Path, project: "ProjectContext", stats: "RunStats | None" = None
+) -> "FetchPlugins":
+    """Create a FetchPlugins use case with standard wiring."""
+    from promptkit.app.fetch import FetchPlugins
+    from promptkit.infra.config.lock_file import LockFile
+    from promptkit.infra.config.yaml_loader import YamlLoader
+
+    fs = project.file_system
+    cache = _make_plugin_cache(cwd)
+    return FetchPlugins(
+        file_system=fs,
+        yaml_loader=YamlLoader(),
+        lock_file=LockFile(),
+        builders=_make_builders(fs),
+        fetchers=_make_plugin_fetchers(
+            _load_registries(cwd, project), cache, cwd / REGISTRIES_DIR, stats
+        ),
+        project_context=project,
+    )
+
+
+def _make_build_use_case(
+    cwd: Path, project: "ProjectContext", stats: "RunStats | None" = None
+) -> "BuildArtifacts":
     """Create a BuildArtifacts use case with standard wiring."""
+    from promptkit.app.build import BuildArtifacts
+    from promptkit.infra.config.lock_file import LockFile
+    from promptkit.infra.config.yaml_loader import YamlLoader
+    from promptkit.infra.storage.hash_cache import HashCache
+
+    fs = project.file_system
+    cache = _make_plugin_cache(cwd)
     return BuildArtifacts(
         file_system=fs,
         yaml_loader=YamlLoader(),
         lock_file=LockFile(),
-        plugin_cache=PluginCache(cwd / PLUGIN_CACHE_DIR),
-        builders={
-            PlatformTarget.CURSOR: CursorBuilder(fs),
-            PlatformTarget.CLAUDE_CODE: ClaudeBuilder(fs),
-        },
+        plugin_cache=cache,
+        builders=_make_builders(fs),
+        fetchers=_make_plugin_fetchers(
+            _load_registries(cwd, project), cache, cwd / REGISTRIES_DIR, stats
+        ),
+        project_context=project,
+        stats=stats,
+        hash_cache=HashCache(cwd / HASH_CACHE_FILE),
+    )
+
+
+def _load_registries(cwd: Path, project: "ProjectContext") -> "list[Registry]":
+    """Return the registries configured in promptkit.yaml, if it exists."""
+    try:
+        return project.load_config(cwd).registries
+    except FileNotFoundError:
+        return []
+
+
+def _registry_heads(cwd: Path, project: "ProjectContext") -> dict[str, str]:
+    """Return the HEAD commit of each registry clone ("" if not cloned yet)."""
+    from promptkit.domain.registry import RegistryType
+    from promptkit.infra.fetchers.git_registry_clone import GitRegistryClone
+
+    try:
+        registries = _load_registries(cwd, project)
+    except PromptError:
+        return {}
+    heads: dict[str, str] = {}
+    for registry in registries:
+        heads[registry.name] = ""
+        if registry.registry_type != RegistryType.CLAUDE_MARKETPLACE:
+            continue
+        try:
+            clone = GitRegistryClone(
+                registry_name=registry.name,
+                registry_url=registry.url,
+                registries_dir=cwd / REGISTRIES_DIR,
+            )
+            if clone.clone_dir.is_dir():
+                heads[registry.name] = clone.get_commit_sha()
+        except PromptError:
+            pass
+    return heads
+
+
+def _make_sync_state(cwd: Path, project: "ProjectContext") -> "SyncState":
+    """Create the project's SyncState, fingerprinting its registry clones."""
+    from promptkit.infra.storage.sync_state import SyncState
+
+    return SyncState(
+        cwd / SYNC_STATE_FILE,
+        cwd,
+        registry_heads=lambda: _registry_heads(cwd, project),
+        base_configs=lambda: _base_configs(cwd, project),
     )
 
 
-def _make_validate_use_case(fs: FileSystem) -> ValidateConfig:
+def _base_configs(cwd: Path, project: "ProjectContext") -> tuple[Path, ...]:
+    """Return the local configs promptkit.yaml extends, if it loads."""
+    try:
+        return project.load_config(cwd).base_files
+    except (FileNotFoundError, PromptError):
+        return ()
+
+
+def _make_validate_use_case(cwd: Path, fs: "FileSystemProtocol") -> "ValidateConfig":
     """Create a ValidateConfig use case with standard wiring."""
+    from promptkit.app.validate import ValidateConfig
+    from promptkit.infra.config.lock_file import LockFile
+    from promptkit.infra.config.yaml_loader import YamlLoader
+
     return ValidateConfig(
         file_system=fs,
         yaml_loader=YamlLoader(),
         lock_file=LockFile(),
+        config_layers=_make_config_layers(cwd, fs, clone_missing=False),
     )
 
 
 @app.command()
 def init() -> None:
     """Initialize a new promptkit project."""
+    from promptkit.app.init import InitProject, InitProjectError
+    from promptkit.infra.config_serializer import serialize_config_to_yaml
+    from promptkit.infra.file_system.local import FileSystem
+
     try:
         use_case = InitProject(FileSystem(), serialize_config_to_yaml)
         use_case.execute(Path.cwd())
@@ -131,65 +362,272 @@ def init() -> None:
         raise typer.Exit(code=1)
 
 
+def _record_run(cwd: Path, stats: "RunStats", *, success: bool, show: bool) -> None:
+    """Append the run to the stats history and optionally print a summary."""
+    if (cwd / "promptkit.yaml").exists():
+        try:
+            stats.append_to(cwd / STATS_HISTORY_FILE, success=success)
+        except OSError:
+            pass
+    if show:
+        _echo_stats(stats)
+
+
+def _echo_stats(stats: "RunStats") -> None:
+    """Print cache hit rate, copy volume and time per registry."""
+    registries = stats.registries.values()
+    hits = sum(r.hits + r.remote_hits for r in registries)
+    remote = sum(r.remote_hits for r in registries)
+    misses = sum(r.misses for r in registries)
+    lookups = hits + misses
+    rate = f"{hits / lookups:.0%}" if lookups else "n/a"
+    typer.echo(
+        f"Cache: {_pluralize(hits, 'hit')} ({remote} remote), "
+        f"{_pluralize(misses, 'miss', 'misses')}, hit rate {rate}"
+    )
+    for name, r in sorted(stats.registries.items()):
+        typer.echo(
+            f"  {name}: {_pluralize(r.hits + r.remote_hits, 'hit')}, "
+            f"{_pluralize(r.misses, 'miss', 'misses')}; "
+            f"copied {_pluralize(r.files_copied, 'file')} "
+            f"({_format_size(r.bytes_copied)}); "
+            f"git {r.git_seconds:.2f}s, copy {r.copy_seconds:.2f}s"
+        )
+    for refetch in stats.refetches:
+        typer.echo(f"  Refetched {refetch.source}: {refetch.reason}")
+    typer.echo(f"Total time {stats.elapsed_seconds:.2f}s")
+
+
+@app.command()
+def fetch(
+    locked: bool = typer.Option(
+        False, "--locked", help="Fetch exactly the commits in promptkit.lock"
+    ),
+    show_stats: bool = typer.Option(False, "--stats", help=STATS_OPTION_HELP),
+) -> None:
+    """Download registries and cache plugins without writing lock or artifacts.
+
+    Run it in a separate step (a Docker layer, a first CI stage) so that
+    'promptkit lock --offline' and 'promptkit build' need no network.
+    """
+    from promptkit.infra.run_stats import RunStats
+
+    cwd = Path.cwd()
+    stats = RunStats(command="fetch")
+    try:
+        project = _make_project_context(cwd)
+        result = _make_fetch_use_case(cwd, project, stats).execute(cwd, locked=locked)
+        plugins = _pluralize(result.plugin_count, "plugin")
+        registries = _pluralize(result.registry_count, "registry", "registries")
+        typer.echo(f"Fetched {plugins} from {registries}")
+    except PromptError as e:
+        typer.echo(f"Error fetching prompts: {e}", err=True)
+        _record_run(cwd, stats, success=False, show=show_stats)
+        raise typer.Exit(code=1)
+    _record_run(cwd, stats, success=True, show=show_stats)
+
+
 @app.command()
-def lock() -> None:
-    """Fetch prompts and update lock file without generating artifacts."""
+def lock(
+    offline: bool = typer.Option(
+        False, "--offline", help="Lock to the fetched registry clones without pulling"
+    ),
+    only: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--only",
+            help="Lock only this source, keeping other entries as locked (repeatable)",
+        ),
+    ] = None,
+    show_stats: bool = typer.Option(False, "--stats", help=STATS_OPTION_HELP),
+) -> None:
+    """Resolve prompt versions and update the lock file without copying files."""
+    from promptkit.infra.run_stats import RunStats
+
+    cwd = Path.cwd()
+    stats = RunStats(command="lock")
     try:
-        cwd = Path.cwd()
-        fs = FileSystem()
-        count = _make_lock_use_case(cwd, fs).execute(cwd)
+        project = _make_project_context(cwd)
+        lock_use_case = _make_lock_use_case(cwd, project, stats, offline=offline)
+        count = lock_use_case.execute(cwd, only=only or None)
         typer.echo(f"Locked {_pluralize(count, 'plugin')}")
     except PromptError as e:
         typer.echo(f"Error locking prompts: {e}", err=True)
+        _record_run(cwd, stats, success=False, show=show_stats)
         raise typer.Exit(code=1)
+    _record_run(cwd, stats, success=True, show=show_stats)
 
 
 @app.command()
-def build() -> None:
-    """Generate platform-specific artifacts from cached prompts (no network)."""
+def add(
+    sources: Annotated[
+        list[str], typer.Argument(help="Prompt sources to add, as registry/name")
+    ],
+    show_stats: bool = typer.Option(False, "--stats", help=STATS_OPTION_HELP),
+) -> None:
+    """Add prompts to promptkit.yaml and lock just those.
+
+    Comments and formatting in promptkit.yaml are kept. Every other prompt
+    stays locked as it was; run 'promptkit build' to generate artifacts.
+    """
+    from promptkit.app.add import AddPrompts
+    from promptkit.infra.run_stats import RunStats
+
+    cwd = Path.cwd()
+    stats = RunStats(command="add")
     try:
-        cwd = Path.cwd()
-        fs = FileSystem()
-        result = _make_build_use_case(cwd, fs).execute(cwd)
+        project = _make_project_context(cwd)
+        added = AddPrompts(project_context=project).execute(cwd, sources)
+        count = _make_lock_use_case(cwd, project, stats).execute(cwd, only=sources)
+        typer.echo(f"Added {_pluralize(len(added), 'prompt')}")
+        typer.echo(f"Locked {_pluralize(count, 'plugin')}")
+    except PromptError as e:
+        typer.echo(f"Error adding prompts: {e}", err=True)
+        _record_run(cwd, stats, success=False, show=show_stats)
+        raise typer.Exit(code=1)
+    _record_run(cwd, stats, success=True, show=show_stats)
+
+
+@app.command()
+def update(
+    plugins: Annotated[
+        list[str],
+        typer.Argument(help="Plugins to update, by name or as registry/name"),
+    ],
+    show_stats: bool = typer.Option(False, "--stats", help=STATS_OPTION_HELP),
+) -> None:
+    """Move the named plugins to their registry's latest commit and rebuild.
+
+    Every other plugin stays at its locked commit, so only the updated
+    plugins' cache entries and artifacts change.
+    """
+    from promptkit.app.update import UpdatePrompts
+    from promptkit.infra.run_stats import RunStats
+
+    cwd = Path.cwd()
+    project = _make_project_context(cwd)
+    stats = RunStats(command="update")
+
+    try:
+        typer.echo("Updating prompts...")
+        lock_use_case = _make_lock_use_case(cwd, project, stats)
+        count = UpdatePrompts(
+            lock_prompts=lock_use_case, project_context=project
+        ).execute(cwd, plugins)
+        typer.echo(f"Updated {_pluralize(count, 'plugin')}")
+    except PromptError as e:
+        typer.echo(f"Error updating prompts: {e}", err=True)
+        _record_run(cwd, stats, success=False, show=show_stats)
+        raise typer.Exit(code=1)
+
+    try:
+        typer.echo("Building artifacts...")
+        result = _make_build_use_case(cwd, project, stats).execute(cwd)
+        plugins_built = _pluralize(result.plugin_count, "plugin")
+        platforms = _pluralize(result.platform_count, "platform")
+        typer.echo(f"Built {plugins_built} for {platforms}")
+    except PromptError as e:
+        typer.echo(f"Error building artifacts: {e}", err=True)
+        _record_run(cwd, stats, success=False, show=show_stats)
+        raise typer.Exit(code=1)
+    _record_run(cwd, stats, success=True, show=show_stats)
+
+
+@app.command()
+def build(
+    show_stats: bool = typer.Option(False, "--stats", help=STATS_OPTION_HELP),
+) -> None:
+    """Generate platform-specific artifacts from locked prompts.
+
+    Works offline when the locked plugins are cached; otherwise only the
+    plugins targeted by a configured platform are fetched.
+    """
+    from promptkit.infra.run_stats import RunStats
+
+    cwd = Path.cwd()
+    stats = RunStats(command="build")
+    try:
+        project = _make_project_context(cwd)
+        result = _make_build_use_case(cwd, project, stats).execute(cwd)
         plugins = _pluralize(result.plugin_count, "plugin")
         platforms = _pluralize(result.platform_count, "platform")
         typer.echo(f"Built {plugins} for {platforms}")
     except PromptError as e:
         typer.echo(f"Error building artifacts: {e}", err=True)
+        _record_run(cwd, stats, success=False, show=show_stats)
         raise typer.Exit(code=1)
+    _record_run(cwd, stats, success=True, show=show_stats)
 
 
 @app.command()
-def sync() -> None:
-    """Fetch, lock, and build in one step (all-in-one)."""
+def sync(
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Sync in full even if nothing changed since the last sync",
+    ),
+    show_stats: bool = typer.Option(False, "--stats", help=STATS_OPTION_HELP),
+) -> None:
+    """Fetch, lock, and build in one step (all-in-one).
+
+    Does nothing when promptkit.yaml, prompts/, the lock and the artifacts
+    are unchanged since the last successful sync and there are no registries
+    to pull. Setting PROMPTKIT_SYNC_REGISTRY_MAX_AGE also skips pulling
+    registries pulled less than that many seconds ago.
+    """
+    from promptkit.infra.run_stats import RunStats
+    from promptkit.infra.settings import Settings
+
     cwd = Path.cwd()
-    fs = FileSystem()
+    project = _make_project_context(cwd)
+    stats = RunStats(command="sync")
+    state = _make_sync_state(cwd, project)
+
+    max_registry_age = Settings().sync_registry_max_age
+    if not force and state.is_current(max_registry_age=max_registry_age):
+        if max_registry_age > 0:
+            typer.echo(
+                "Already up to date; registries not pulled "
+                "(PROMPTKIT_SYNC_REGISTRY_MAX_AGE is set, use --force to pull)"
+            )
+        else:
+            typer.echo("Already up to date")
+        _record_run(cwd, stats, success=True, show=show_stats)
+        return
+    state.clear()
 
     try:
         typer.echo("Locking prompts...")
-        count = _make_lock_use_case(cwd, fs).execute(cwd)
+        count = _make_lock_use_case(cwd, project, stats).execute(cwd)
         typer.echo(f"Locked {_pluralize(count, 'plugin')}")
     except PromptError as e:
         typer.echo(f"Error locking prompts: {e}", err=True)
+        _record_run(cwd, stats, success=False, show=show_stats)
         raise typer.Exit(code=1)
 
     try:
         typer.echo("Building artifacts...")
-        result = _make_build_use_case(cwd, fs).execute(cwd)
+        result = _make_build_use_case(cwd, project, stats).execute(cwd)
         plugins = _pluralize(result.plugin_count, "plugin")
         platforms = _pluralize(result.platform_count, "platform")
         typer.echo(f"Built {plugins} for {platforms}")
     except PromptError as e:
         typer.echo(f"Error building artifacts: {e}", err=True)
+        _record_run(cwd, stats, success=False, show=show_stats)
         raise typer.Exit(code=1)
+    state.record(result.artifacts)
+    _record_run(cwd, stats, success=True, show=show_stats)
 
 
 @app.command()
 def validate() -> None:
     """Verify config is well-formed and prompts exist."""
+    from promptkit.infra.file_system.caching import CachingFileSystem
+    from promptkit.infra.file_system.local import FileSystem
+
     cwd = Path.cwd()
-    fs = FileSystem()
-    result = _make_validate_use_case(fs).execute(cwd)
+    fs = CachingFileSystem(FileSystem())
+    result = _make_validate_use_case(cwd, fs).execute(cwd)
 
     for issue in result.issues:
         _echo_issue(issue)
@@ -205,6 +643,8 @@ def clean(
     cache: bool = typer.Option(False, "--cache", help="Also remove the plugin cache"),
 ) -> None:
     """Remove all promptkit-managed build artifacts."""
+    from promptkit.app.clean import CleanArtifacts
+
     try:
         cwd = Path.cwd()
         result = CleanArtifacts().execute(cwd, clean_cache=cache)
@@ -224,10 +664,164 @@ def clean(
         raise typer.Exit(code=1)
 
 
-def _echo_issue(issue: ValidationIssue) -> None:
+@cache_app.command("stats")
+def cache_stats() -> None:
+    """Show how many plugin versions the cache holds and their size."""
+    try:
+        plugin_cache = _make_plugin_cache(Path.cwd())
+        plugin_cache.reconcile()
+        stats = plugin_cache.stats()
+    except PromptError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(
+        f"{_pluralize(stats.entry_count, 'entry', 'entries')} "
+        f"({stats.packed_count} packed), "
+        f"{_pluralize(stats.file_count, 'file')}, "
+        f"{_format_size(stats.total_size)}"
+    )
+
+
+@cache_app.command("gc")
+def cache_gc(
+    max_age_days: float | None = typer.Option(
+        None, "--max-age-days", help="Evict entries unused for this many days"
+    ),
+    max_size_mb: float | None = typer.Option(
+        None, "--max-size-mb", help="Evict least recently used entries above this size"
+    ),
+) -> None:
+    """Evict least recently used plugin versions from the cache."""
+    try:
+        plugin_cache = _make_plugin_cache(Path.cwd())
+        plugin_cache.reconcile()
+        evicted = plugin_cache.gc(
+            max_age_seconds=None if max_age_days is None else max_age_days * 86400,
+            max_size=None if max_size_mb is None else int(max_size_mb * 1024 * 1024),
+        )
+    except PromptError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    freed = _format_size(sum(e.total_size for e in evicted))
+    typer.echo(f"Evicted {_pluralize(len(evicted), 'entry', 'entries')} ({freed})")
+
+
+@cache_app.command("pack")
+def cache_pack(
+    min_idle_days: float = typer.Option(
+        0, "--min-idle-days", help="Only pack entries unused for this many days"
+    ),
+) -> None:
+    """Pack idle cache entries into compressed archives (cold tier)."""
+    try:
+        plugin_cache = _make_plugin_cache(Path.cwd())
+        plugin_cache.reconcile()
+        packed = plugin_cache.pack_idle(min_idle_seconds=min_idle_days * 86400)
+    except PromptError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Packed {_pluralize(len(packed), 'entry', 'entries')}")
+
+
+@cache_app.command("unpack")
+def cache_unpack() -> None:
+    """Unpack all packed cache entries back into directories (hot tier)."""
+    try:
+        plugin_cache = _make_plugin_cache(Path.cwd())
+        plugin_cache.reconcile()
+        unpacked = plugin_cache.unpack_all()
+    except PromptError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    if not unpacked:
+        # Builds unpack the packed entries they use, so this is often a no-op.
+        typer.echo("Nothing to unpack: no cache entries are packed")
+        return
+    typer.echo(f"Unpacked {_pluralize(len(unpacked), 'entry', 'entries')}")
+
+
+@cache_app.command("export")
+def cache_export(
+    output_dir: Annotated[
+        Path,
+        typer.Option("--output-dir", help="Directory to write the archive to"),
+    ] = Path("."),
+) -> None:
+    """Archive the cache entries promptkit.lock needs, named by the lock's hash."""
+    from promptkit.app.cache import ExportCache
+    from promptkit.infra.config.lock_file import LockFile
+    from promptkit.infra.file_system.local import FileSystem
+
+    try:
+        cwd = Path.cwd()
+        fs = FileSystem()
+        result = ExportCache(
+            file_system=fs,
+            lock_file=LockFile(),
+            plugin_cache=_make_plugin_cache(cwd),
+        ).execute(cwd, output_dir)
+        entries = _pluralize(result.entry_count, "entry", "entries")
+        typer.echo(f"Exported {entries} to {result.archive_path}")
+    except PromptError as e:
+        typer.echo(f"Error exporting cache: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+@cache_app.command("import")
+def cache_import(
+    archive: Annotated[
+        Path, typer.Argument(help="Archive written by 'promptkit cache export'")
+    ],
+) -> None:
+    """Restore and verify cache entries from an exported archive."""
+    from promptkit.app.cache import ImportCache
+    from promptkit.infra.config.lock_file import LockFile
+    from promptkit.infra.file_system.local import FileSystem
+
+    try:
+        cwd = Path.cwd()
+        fs = FileSystem()
+        result = ImportCache(
+            file_system=fs,
+            lock_file=LockFile(),
+            plugin_cache=_make_plugin_cache(cwd),
+        ).execute(cwd, archive)
+        typer.echo(f"Imported {_pluralize(result.imported_count, 'entry', 'entries')}")
+        for name in result.missing:
+            typer.echo(f"Warning: locked plugin '{name}' is still not cached")
+    except PromptError as e:
+        typer.echo(f"Error importing cache: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+@cache_app.command("serve")
+def cache_serve(
+    root: Annotated[
+        Path, typer.Option("--root", help="Directory to store entries")
+    ] = Path(".promptkit/remote-cache"),
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8787, "--port", help="Port to listen on"),
+) -> None:
+    """Run a reference remote cache server for PROMPTKIT_REMOTE_CACHE_URL."""
+    from promptkit.infra.storage.remote_cache_server import make_server
+
+    server = make_server(root, host, port)
+    bound_host, bound_port = server.server_address[:2]
+    typer.echo(f"Serving remote cache from {root} on http://{bound_host}:{bound_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def _echo_issue(issue: "ValidationIssue") -> None:
     """Print a validation issue with appropriate prefix and stream."""
+    from promptkit.domain.validation import LEVEL_ERROR
+
     is_error = issue.level == LEVEL_ERROR
-    prefix = "Error" if is_error else "Warning"
+    prefix = issue.level.capitalize()
     typer.echo(f"{prefix}: {issue.message}", err=is_error)
 
 
@@ -0,0 +1,59 @@
+"""Domain layer: FileFilter value object for pruning plugin files at fetch time."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+
+CACHE_KEY_SEPARATOR = "-"
+DIGEST_LENGTH = 12
+
+
+@dataclass(frozen=True)
+class FileFilter:
+    """Immutable selection of the plugin files worth fetching.
+
+    A file is kept if it matches at least one include glob (or there are
+    none), matches no exclude glob, and lives under one of the given
+    top-level categories (when categories is set). Globs are matched against
+    the path relative to the plugin root and support '**'.
+
+    A filtered fetch produces different content for the same commit, so the
+    filter's digest is folded into the cache key.
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    categories: frozenset[str] | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.include and not self.exclude and self.categories is None
+
+    @property
+    def digest(self) -> str:
+        """A short, order-independent hash of the filter."""
+        data = {
+            "include": sorted(self.include),
+            "exclude": sorted(self.exclude),
+            "categories": None if self.categories is None else sorted(self.categories),
+        }
+        encoded = json.dumps(data, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()[:DIGEST_LENGTH]
+
+    def cache_key(self, commit_sha: str, /) -> str:
+        """Return the cache key for this filter applied at commit_sha."""
+        if self.is_empty:
+            return commit_sha
+        return f"{commit_sha}{CACHE_KEY_SEPARATOR}{self.digest}"
+
+    def matches(self, path: str, /) -> bool:
+        """Whether a plugin-relative path passes the filter."""
+        pure = PurePosixPath(path)
+        if self.categories is not None and (
+            len(pure.parts) < 2 or pure.parts[0] not in self.categories
+        ):
+            return False
+        if self.include and not any(pure.full_match(p) for p in self.include):
+            return False
+        return not any(pure.full_match(p) for p in self.exclude)
@@ -1,7 +1,7 @@
 """Domain layer: File system abstraction (protocol)."""
 
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Protocol
 
 
 class FileSystem(Protocol):
@@ -23,6 +23,10 @@ class FileSystem(Protocol):
         """Check if file exists."""
         ...
 
+    def is_dir(self, path: Path, /) -> bool:
+        """Check if path is an existing directory."""
+        ...
+
     def append_to_file(self, path: Path, content: str, /) -> None:
         """Append content to existing file."""
         ...
@@ -35,6 +39,14 @@ class FileSystem(Protocol):
         """
         ...
 
+    def open_binary(self, path: Path, /) -> BinaryIO:
+        """Open a file for reading raw bytes.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+        """
+        ...
+
     def list_directory(self, path: Path, /) -> list[Path]:
         """List immediate children of a directory.
 
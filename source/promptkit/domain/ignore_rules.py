@@ -0,0 +1,139 @@
+"""Domain layer: IgnoreRules value object for .promptkitignore files."""
+
+import re
+from dataclasses import dataclass
+
+IGNORE_FILENAME = ".promptkitignore"
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One compiled pattern from an ignore file, scoped to the file's directory."""
+
+    base: str
+    regex: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+@dataclass(frozen=True)
+class IgnoreRules:
+    """Immutable, precompiled set of gitignore-style rules.
+
+    Supports the common gitignore syntax: '#' comments, '!' negation, a
+    trailing '/' for directories only, a leading or inner '/' to anchor a
+    pattern to the ignore file's directory, and '*', '?', '[...]' and '**'
+    wildcards. The last matching rule wins. Paths are POSIX-style and
+    relative to the root the rules were parsed for.
+
+    Each pattern is compiled once when parsed; walkers check directories
+    with is_ignored() and skip ignored ones without descending into them.
+    """
+
+    rules: tuple[IgnoreRule, ...] = ()
+
+    @classmethod
+    def parse(cls, text: str, /, *, base: str = "") -> "IgnoreRules":
+        """Compile the rules of an ignore file located in directory base."""
+        rules: list[IgnoreRule] = []
+        for line in text.splitlines():
+            rule = _compile(line, base.strip("/"))
+            if rule is not None:
+                rules.append(rule)
+        return cls(tuple(rules))
+
+    def extend(self, other: "IgnoreRules", /) -> "IgnoreRules":
+        """Return rules with other's appended; other's rules take precedence."""
+        if not other.rules:
+            return self
+        return IgnoreRules(self.rules + other.rules)
+
+    def is_ignored(self, path: str, /, *, is_dir: bool = False) -> bool:
+        """Whether path itself is ignored (its parent directories are not checked)."""
+        for rule in reversed(self.rules):
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.base:
+                if not path.startswith(rule.base + "/"):
+                    continue
+                relative = path[len(rule.base) + 1 :]
+            else:
+                relative = path
+            if rule.regex.fullmatch(relative):
+                return not rule.negated
+        return False
+
+    def excludes(self, path: str, /) -> bool:
+        """Whether a file is ignored, directly or through an ignored parent."""
+        if not self.rules:
+            return False
+        parts = path.split("/")
+        for depth in range(1, len(parts)):
+            if self.is_ignored("/".join(parts[:depth]), is_dir=True):
+                return True
+        return self.is_ignored(path)
+
+
+def _compile(line: str, base: str, /) -> IgnoreRule | None:
+    pattern = line.rstrip()
+    if not pattern or pattern.startswith("#"):
+        return None
+    negated = pattern.startswith("!")
+    if negated or pattern.startswith("\\"):
+        pattern = pattern[1:]
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    regex = _translate(pattern)
+    if not anchored:
+        regex = f"(?:.*/)?{regex}"
+    return IgnoreRule(
+        base=base, regex=re.compile(regex), negated=negated, dir_only=dir_only
+    )
+
+
+def _translate(pattern: str, /) -> str:
+    """Translate a slash-separated glob into a regex matching whole paths."""
+    segments = pattern.split("/")
+    regex = ""
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == "**":
+            regex += ".*" if last else "(?:[^/]+/)*"
+            continue
+        regex += _translate_segment(segment)
+        if not last:
+            regex += "/"
+    return regex
+
+
+def _translate_segment(segment: str, /) -> str:
+    """Translate one path segment's wildcards; none of them match '/'."""
+    out: list[str] = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "\\" and i < len(segment):
+            out.append(re.escape(segment[i]))
+            i += 1
+        elif char == "[":
+            end = segment.find("]", i + 1 if segment[i : i + 1] in ("!", "]") else i)
+            if end == -1:
+                out.append(re.escape(char))
+                continue
+            body = segment[i:end]
+            i = end + 1
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+        else:
+            out.append(re.escape(char))
+    return "".join(out)
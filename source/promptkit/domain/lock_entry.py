@@ -4,13 +4,29 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class LockedFile:
+    """One file of a locked plugin: its path, size in bytes and hex SHA-256.
+
+    The path is relative to the directory the plugin's files are listed
+    from (prompts/ for local plugins).
+    """
+
+    path: str
+    size: int
+    sha256: str
+
+
+@dataclass(frozen=True, slots=True)
 class LockEntry:
     """Immutable lock entry recording the exact state of a synced plugin.
 
     Stored in promptkit.lock to ensure reproducible builds.
-    For registry plugins: commit_sha is set, content_hash is "".
-    For local plugins: commit_sha is None, content_hash is sha256 hash.
+    For registry plugins: commit_sha is set, content_hash is "", and tree_id
+    is the git tree of the plugin directory when it has one.
+    For local plugins: commit_sha is None, content_hash is sha256 hash, and
+    files lists the plugin's files sorted by path, so a build need not walk
+    the plugin's directory. Locks written by older versions have no files.
     """
 
     name: str
@@ -18,6 +34,8 @@ class LockEntry:
     content_hash: str
     fetched_at: datetime
     commit_sha: str | None = None
+    tree_id: str | None = None
+    files: tuple[LockedFile, ...] | None = None
 
     def has_content_changed(self, new_hash: str, /) -> bool:
         """Whether the content has changed compared to a new hash."""
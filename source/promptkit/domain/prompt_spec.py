@@ -12,11 +12,15 @@ class PromptSpec:
     Declares which prompt to fetch and where to build it.
     The source format is 'registry/name' (e.g., 'claude-plugins-official/code-review').
     Name defaults to the part after '/' in the source if not explicitly set.
+    include/exclude are globs (relative to the plugin root) selecting which
+    of the plugin's files are fetched.
     """
 
     source: str
     name: str = ""
     platforms: tuple[PlatformTarget, ...] = field(default_factory=tuple)
+    include: tuple[str, ...] = field(default_factory=tuple)
+    exclude: tuple[str, ...] = field(default_factory=tuple)
 
     def __post_init__(self) -> None:
         if not self.name:
@@ -3,22 +3,36 @@
 from pathlib import Path
 from typing import Protocol
 
+from promptkit.domain.file_filter import FileFilter
 from promptkit.domain.platform_target import PlatformTarget
 from promptkit.domain.plugin import Plugin
 from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.domain.resolved_plugin import ResolvedPlugin
 
 
 class PluginFetcher(Protocol):
-    """Protocol for fetching plugins from a source.
+    """Protocol for fetching plugins from a registry in two phases.
 
-    Implementations: LocalPluginFetcher, ClaudeMarketplaceFetcher.
+    Implementations: ClaudeMarketplaceFetcher.
     cache_dir and other configuration are injected at construction time.
     """
 
-    def fetch(self, spec: PromptSpec, /) -> Plugin:
-        """Fetch plugin files for the given spec.
+    def resolve(self, spec: PromptSpec, /) -> ResolvedPlugin:
+        """Pin the spec to an exact version without copying any files."""
+        ...
+
+    def materialize(
+        self,
+        spec: PromptSpec,
+        commit_sha: str,
+        /,
+        *,
+        file_filter: FileFilter | None = None,
+    ) -> Plugin:
+        """Make the plugin's files at commit_sha available on disk.
 
-        Returns a Plugin manifest pointing to files on disk.
+        Only files passing file_filter are fetched. Returns a Plugin manifest
+        pointing to files on disk.
         """
         ...
 
@@ -34,6 +48,15 @@ class ArtifactBuilder(Protocol):
         """The platform this builder targets."""
         ...
 
+    @property
+    def routable_categories(self) -> frozenset[str]:
+        """Top-level plugin directories this builder copies to its output.
+
+        Files outside these categories never reach an artifact, so fetchers
+        can skip them.
+        """
+        ...
+
     def build(
         self, plugins: list[Plugin], output_dir: Path, project_dir: Path, /
     ) -> list[Path]:
@@ -0,0 +1,27 @@
+"""Domain layer: ResolvedPlugin value object for a version-pinned registry plugin."""
+
+from dataclasses import dataclass
+
+from promptkit.domain.prompt_spec import PromptSpec
+
+
+@dataclass(frozen=True)
+class ResolvedPlugin:
+    """Immutable result of resolving a registry plugin to an exact version.
+
+    Resolution records which commit (and, where the plugin is a single
+    directory, which git tree) a spec points at without copying any files.
+    Files are materialised later, only when a build needs them.
+    """
+
+    spec: PromptSpec
+    commit_sha: str
+    tree_id: str | None = None
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    @property
+    def source(self) -> str:
+        return self.spec.source
@@ -5,8 +5,9 @@ from typing import Literal
 
 LEVEL_ERROR: Literal["error"] = "error"
 LEVEL_WARNING: Literal["warning"] = "warning"
+LEVEL_INFO: Literal["info"] = "info"
 
-ValidationLevel = Literal["error", "warning"]
+ValidationLevel = Literal["error", "warning", "info"]
 
 
 @dataclass(frozen=True)
@@ -37,3 +38,8 @@ class ValidationResult:
     def warnings(self) -> list[ValidationIssue]:
         """All warning-level issues."""
         return [i for i in self.issues if i.level == LEVEL_WARNING]
+
+    @property
+    def infos(self) -> list[ValidationIssue]:
+        """All info-level issues (reports, not problems)."""
+        return [i for i in self.issues if i.level == LEVEL_INFO]
@@ -1,14 +1,14 @@
 """Infrastructure layer: Claude Code platform artifact builder."""
 
-import shutil
 from pathlib import Path
 
 from promptkit.domain.file_system import FileSystem
 from promptkit.domain.platform_target import PlatformTarget
 from promptkit.domain.plugin import Plugin
 from promptkit.infra.builders.manifest import (
-    cleanup_managed_files,
+    install_file,
     read_manifest,
+    remove_stale_files,
     write_manifest,
 )
 
@@ -21,7 +21,8 @@ class ClaudeBuilder:
 
     Implements the ArtifactBuilder protocol. Copies all files from each
     plugin's source_dir to the output directory, preserving structure.
-    Uses manifest-based cleanup to preserve non-promptkit files.
+    Uses manifest-based cleanup to preserve non-promptkit files; files
+    whose content is unchanged are not rewritten.
     """
 
     def __init__(self, file_system: FileSystem, /) -> None:
@@ -31,12 +32,15 @@ class ClaudeBuilder:
     def platform(self) -> PlatformTarget:
         return PlatformTarget.CLAUDE_CODE
 
+    @property
+    def routable_categories(self) -> frozenset[str]:
+        return frozenset(ALLOWED_CATEGORIES)
+
     def build(
         self, plugins: list[Plugin], output_dir: Path, project_dir: Path, /
     ) -> list[Path]:
         """Copy plugin file trees to the Claude Code output directory."""
         previous = read_manifest(project_dir, PLATFORM_NAME)
-        cleanup_managed_files(output_dir, previous)
 
         generated: list[Path] = []
         relative_paths: list[str] = []
@@ -47,16 +51,15 @@ class ClaudeBuilder:
                     continue
                 src = plugin.source_dir / file_path
                 dst = output_dir / file_path
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
+                install_file(src, dst)
                 generated.append(dst)
                 relative_paths.append(file_path)
 
+        remove_stale_files(output_dir, previous, relative_paths)
         write_manifest(project_dir, PLATFORM_NAME, relative_paths)
         return generated
 
 
-
 def _is_allowed(file_path: str, /) -> bool:
     """Only copy files under allowed category directories."""
     if "/" not in file_path:
@@ -1,14 +1,14 @@
 """Infrastructure layer: Cursor platform artifact builder."""
 
-import shutil
 from pathlib import Path
 
 from promptkit.domain.file_system import FileSystem
 from promptkit.domain.platform_target import PlatformTarget
 from promptkit.domain.plugin import Plugin
 from promptkit.infra.builders.manifest import (
-    cleanup_managed_files,
+    install_file,
     read_manifest,
+    remove_stale_files,
     write_manifest,
 )
 
@@ -21,7 +21,8 @@ class CursorBuilder:
     """Builds .cursor/ artifacts by copying plugin file trees.
 
     Implements the ArtifactBuilder protocol. Filters to allowed categories
-    and uses manifest-based cleanup to preserve non-promptkit files.
+    and uses manifest-based cleanup to preserve non-promptkit files. Files
+    whose content is unchanged are not rewritten.
     """
 
     def __init__(self, file_system: FileSystem, /) -> None:
@@ -31,12 +32,15 @@ class CursorBuilder:
     def platform(self) -> PlatformTarget:
         return PlatformTarget.CURSOR
 
+    @property
+    def routable_categories(self) -> frozenset[str]:
+        return frozenset(ALLOWED_CATEGORIES)
+
     def build(
         self, plugins: list[Plugin], output_dir: Path, project_dir: Path, /
     ) -> list[Path]:
         """Copy plugin file trees to the Cursor output directory."""
         previous = read_manifest(project_dir, PLATFORM_NAME)
-        cleanup_managed_files(output_dir, previous)
 
         generated: list[Path] = []
         relative_paths: list[str] = []
@@ -48,11 +52,11 @@ class CursorBuilder:
                     continue
                 src = plugin.source_dir / file_path
                 dst = output_dir / mapped
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
+                install_file(src, dst)
                 generated.append(dst)
                 relative_paths.append(mapped)
 
+        remove_stale_files(output_dir, previous, relative_paths)
         write_manifest(project_dir, PLATFORM_NAME, relative_paths)
         return generated
 
@@ -1,5 +1,7 @@
 """Infrastructure layer: Manifest-based tracking of generated build artifacts."""
 
+import filecmp
+import shutil
 from pathlib import Path
 
 MANAGED_DIR = ".promptkit/managed"
@@ -22,11 +24,37 @@ def read_manifest(project_dir: Path, platform_name: str, /) -> list[str]:
 
 
 def write_manifest(project_dir: Path, platform_name: str, paths: list[str], /) -> None:
-    """Write a sorted manifest of generated file paths for a platform."""
+    """Write a sorted manifest of generated file paths for a platform.
+
+    An unchanged manifest is left untouched.
+    """
     manifest_path = project_dir / MANAGED_DIR / f"{platform_name}.txt"
-    manifest_path.parent.mkdir(parents=True, exist_ok=True)
     lines = [MANIFEST_HEADER] + sorted(paths)
-    manifest_path.write_text("\n".join(lines) + "\n")
+    content = "\n".join(lines) + "\n"
+    if manifest_path.is_file() and manifest_path.read_text() == content:
+        return
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(content)
+
+
+def install_file(src: Path, dst: Path, /) -> None:
+    """Copy src to dst, unless dst already holds the same bytes.
+
+    Skipping identical files keeps their mtimes, so a rebuild that changes
+    nothing does not wake file watchers or IDE indexers.
+    """
+    if dst.is_file() and filecmp.cmp(src, dst, shallow=False):
+        return
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(src, dst)
+
+
+def remove_stale_files(
+    output_dir: Path, previous: list[str], current: list[str], /
+) -> None:
+    """Remove files the previous build managed that this build did not write."""
+    kept = set(current)
+    cleanup_managed_files(output_dir, [path for path in previous if path not in kept])
 
 
 def cleanup_managed_files(output_dir: Path, manifest_paths: list[str], /) -> None:
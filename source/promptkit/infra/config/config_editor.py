@@ -0,0 +1,116 @@
+"""Infrastructure layer: Edit promptkit.yaml text in place, keeping comments."""
+
+from collections.abc import Sequence
+
+import yaml
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+from promptkit.domain.errors import ValidationError
+from promptkit.infra.config.yaml_codec import compose_yaml, dump_yaml
+
+PROMPTS_KEY = "prompts"
+DEFAULT_ITEM_INDENT = "  "
+
+
+def append_prompt_sources(content: str, sources: Sequence[str], /) -> str:
+    """Return content with sources appended to its prompts list.
+
+    Only the lines the new entries go on are touched, so comments, blank
+    lines and the formatting of every other entry are kept. Entries go
+    after the last existing one, indented like the first, and a flow list
+    (`[a, b]`) stays one; a bare `prompts:` or a missing key becomes a
+    block list.
+
+    Raises:
+        ValidationError: If content is not a YAML mapping, or its prompts
+            value is not a list.
+    """
+    if not sources:
+        return content
+    try:
+        root = compose_yaml(content)
+    except yaml.YAMLError as e:
+        raise ValidationError(f"Invalid YAML: {e}") from e
+    if not isinstance(root, MappingNode):
+        raise ValidationError("Config must be a YAML mapping, not a list or scalar")
+
+    lines = content.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    items = [_scalar_text(source) for source in sources]
+
+    value = _prompts_value(root)
+    if value is None:
+        lines.append(f"{PROMPTS_KEY}:\n")
+        lines.extend(f"{DEFAULT_ITEM_INDENT}- {item}\n" for item in items)
+    elif isinstance(value, ScalarNode) and value.value == "":
+        # `prompts:` with nothing after it, possibly followed by comments
+        line = value.start_mark.line
+        indent = _key_indent(lines[line]) + DEFAULT_ITEM_INDENT
+        lines[line + 1 : line + 1] = [f"{indent}- {item}\n" for item in items]
+    elif isinstance(value, SequenceNode) and value.flow_style:
+        lines = _append_to_flow_list(lines, value, items)
+    elif isinstance(value, SequenceNode):
+        lines = _append_to_block_list(lines, value, items)
+    else:
+        raise ValidationError(f"'{PROMPTS_KEY}' must be a list")
+    return "".join(lines)
+
+
+def _prompts_value(root: MappingNode, /) -> Node | None:
+    for key, value in root.value:
+        if isinstance(key, ScalarNode) and key.value == PROMPTS_KEY:
+            return value
+    return None
+
+
+def _append_to_block_list(
+    lines: list[str], sequence: SequenceNode, items: list[str], /
+) -> list[str]:
+    first_line = lines[sequence.value[0].start_mark.line]
+    dash = first_line[: sequence.value[0].start_mark.column].rstrip()
+    indent = dash.removesuffix("-")
+    after = _last_content_line(sequence.value[-1]) + 1
+    lines[after:after] = [f"{indent}- {item}\n" for item in items]
+    return lines
+
+
+def _append_to_flow_list(
+    lines: list[str], sequence: SequenceNode, items: list[str], /
+) -> list[str]:
+    # end_mark is just past the closing bracket
+    line, column = sequence.end_mark.line, sequence.end_mark.column - 1
+    text = lines[line]
+    separator = ", " if sequence.value else ""
+    lines[line] = text[:column] + separator + ", ".join(items) + text[column:]
+    return lines
+
+
+def _last_content_line(node: Node, /) -> int:
+    """Return the last line holding part of node, ignoring trailing comments.
+
+    Block collections end where the next token starts, which may be past
+    comments and blank lines, so the end is taken from their last child.
+    """
+    if isinstance(node, (MappingNode, SequenceNode)) and not node.flow_style:
+        last = node.value[-1] if node.value else None
+        if isinstance(last, tuple):
+            last = last[1]
+        if last is not None:
+            return _last_content_line(last)
+    end = node.end_mark
+    # Block scalars end at the start of the line after their last line
+    return (
+        end.line - 1
+        if end.column == 0 and end.line > node.start_mark.line
+        else end.line
+    )
+
+
+def _key_indent(line: str, /) -> str:
+    return line[: len(line) - len(line.lstrip())]
+
+
+def _scalar_text(value: str, /) -> str:
+    """Return value written as a YAML scalar, quoted only if it must be."""
+    return dump_yaml([value]).removeprefix("- ").rstrip("\n")
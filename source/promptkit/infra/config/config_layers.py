@@ -0,0 +1,276 @@
+"""Infrastructure layer: Resolve promptkit.yaml's extends: chain, memoised."""
+
+import hashlib
+import json
+import os
+import posixpath
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from promptkit.domain.errors import ValidationError
+from promptkit.domain.file_system import FileSystem
+from promptkit.domain.registry import Registry, RegistryType
+from promptkit.infra.config.yaml_loader import LoadedConfig, YamlLoader
+
+MEMO_VERSION = 1
+REGISTRY_SEPARATOR = ":"
+
+RegistryFiles = Callable[[Registry, str], str | None]
+"""Returns a file's text from a registry clone, or None if it has none."""
+
+
+@dataclass(frozen=True)
+class _Location:
+    """Where a config layer lives: a local file or a file in a registry."""
+
+    label: str
+    path: Path | None = None
+    registry: Registry | None = None
+    file: str = ""
+
+
+class ConfigLayers:
+    """Loads promptkit.yaml together with the configs it extends.
+
+    extends: names one base config or a list of them. A base is a path
+    relative to the file naming it, or 'registry:path' for a file in a
+    registry that file defines, read from the registry's clone. Bases may
+    extend further bases; relative paths in a registry file stay within
+    that registry.
+
+    Layers are merged by YamlLoader.merge, each file's bases (depth-first,
+    in listed order) before the file itself. A file reached twice is merged
+    once, where it is first reached; a cycle is an error.
+
+    With a memo_path, the resolved config is stored as JSON together with
+    the SHA-256 of promptkit.yaml and of every base. While all of them
+    match, loading reads the bases to hash them but neither parses nor
+    merges them. The memo is derived data; a stale or unreadable one is
+    ignored.
+    """
+
+    def __init__(
+        self,
+        file_system: FileSystem,
+        yaml_loader: YamlLoader,
+        /,
+        *,
+        memo_path: Path | None = None,
+        registry_files: RegistryFiles | None = None,
+    ) -> None:
+        self._fs = file_system
+        self._yaml_loader = yaml_loader
+        self._memo_path = memo_path
+        self._registry_files = registry_files
+
+    def load(self, config_path: Path, content: str, /) -> LoadedConfig:
+        """Return the config in content, read from config_path, with its bases.
+
+        Raises:
+            ValidationError: If a layer is invalid or missing, extends form a
+                cycle, or the merged config is invalid.
+        """
+        raw = self._yaml_loader.parse(content)
+        if not self._yaml_loader.extends(raw):
+            return self._yaml_loader.from_mapping(raw)
+
+        key = _digest(content)
+        memoised = self._load_memo(key)
+        if memoised is not None:
+            return memoised
+
+        root = _Location(label=config_path.name, path=config_path)
+        layers: list[tuple[str, Mapping[str, Any]]] = []
+        inputs: list[dict[str, Any]] = []
+        self._collect(root, raw, config_path.parent, layers, inputs, [], set())
+        merged, origins = self._yaml_loader.merge(layers)
+        base_files = tuple(Path(i["path"]) for i in inputs if "path" in i)
+        config = self._yaml_loader.from_mapping(
+            merged,
+            layers=tuple(label for label, _ in layers),
+            origins=origins,
+            base_files=base_files,
+        )
+        self._save_memo(key, inputs, merged, config)
+        return config
+
+    def _collect(
+        self,
+        location: _Location,
+        raw: Mapping[str, Any],
+        project_dir: Path,
+        layers: list[tuple[str, Mapping[str, Any]]],
+        inputs: list[dict[str, Any]],
+        stack: list[str],
+        done: set[str],
+        /,
+    ) -> None:
+        """Append location's bases, then location itself, to layers."""
+        stack.append(location.label)
+        for ref in self._yaml_loader.extends(raw):
+            base = self._locate(location, raw, ref, project_dir)
+            if base.label in stack:
+                chain = " -> ".join([*stack[stack.index(base.label) :], base.label])
+                raise ValidationError(f"Config extends itself: {chain}")
+            if base.label in done:
+                continue
+            content = self._read(base, location)
+            inputs.append(_input_record(base, content))
+            self._collect(
+                base,
+                self._yaml_loader.parse(content),
+                project_dir,
+                layers,
+                inputs,
+                stack,
+                done,
+            )
+        stack.pop()
+        done.add(location.label)
+        layers.append((location.label, raw))
+
+    def _locate(
+        self,
+        parent: _Location,
+        raw: Mapping[str, Any],
+        ref: str,
+        project_dir: Path,
+        /,
+    ) -> _Location:
+        """Resolve a reference made in parent's extends."""
+        name, separator, file = ref.partition(REGISTRY_SEPARATOR)
+        if separator:
+            registry = _registry_in(raw, name)
+            if registry is None:
+                raise ValidationError(
+                    f"{parent.label}: extends '{ref}' from undefined registry '{name}'"
+                )
+            return _registry_location(registry, posixpath.normpath(file), ref)
+        if parent.registry is not None:
+            file = posixpath.normpath(
+                posixpath.join(posixpath.dirname(parent.file), ref)
+            )
+            return _registry_location(parent.registry, file, ref)
+        assert parent.path is not None
+        path = Path(os.path.normpath(parent.path.parent / ref))
+        label = Path(os.path.relpath(path, project_dir)).as_posix()
+        return _Location(label=label, path=path)
+
+    def _read(self, location: _Location, parent: _Location, /) -> str:
+        if location.path is not None:
+            try:
+                return self._fs.read_file(location.path)
+            except FileNotFoundError:
+                content = None
+        elif self._registry_files is None:
+            raise ValidationError(
+                f"{parent.label}: cannot read '{location.label}' without registry access"
+            )
+        else:
+            assert location.registry is not None
+            content = self._registry_files(location.registry, location.file)
+        if content is None:
+            raise ValidationError(
+                f"{parent.label}: base config not found: {location.label}"
+            )
+        return content
+
+    def _load_memo(self, key: str, /) -> LoadedConfig | None:
+        if self._memo_path is None:
+            return None
+        try:
+            memo = json.loads(self._memo_path.read_text())
+            if memo["version"] != MEMO_VERSION or memo["key"] != key:
+                return None
+            inputs = memo["inputs"]
+            for record in inputs:
+                if self._current_digest(record) != record["sha256"]:
+                    return None
+            return self._yaml_loader.from_mapping(
+                memo["config"],
+                layers=tuple(memo["layers"]),
+                origins=memo["origins"],
+                base_files=tuple(Path(i["path"]) for i in inputs if "path" in i),
+            )
+        except (OSError, ValueError, KeyError, TypeError, ValidationError):
+            return None
+
+    def _current_digest(self, record: Mapping[str, Any], /) -> str | None:
+        if "path" in record:
+            try:
+                return _digest(self._fs.read_file(Path(record["path"])))
+            except FileNotFoundError:
+                return None
+        if self._registry_files is None:
+            return None
+        registry = Registry(
+            name=record["registry"],
+            url=record["url"],
+            registry_type=RegistryType.CLAUDE_MARKETPLACE,
+        )
+        content = self._registry_files(registry, record["file"])
+        return None if content is None else _digest(content)
+
+    def _save_memo(
+        self,
+        key: str,
+        inputs: list[dict[str, Any]],
+        merged: Mapping[str, Any],
+        config: LoadedConfig,
+        /,
+    ) -> None:
+        if self._memo_path is None:
+            return
+        memo = {
+            "version": MEMO_VERSION,
+            "key": key,
+            "inputs": inputs,
+            "layers": list(config.layers),
+            "origins": dict(config.origins),
+            "config": merged,
+        }
+        temp_path = self._memo_path.with_name(self._memo_path.name + ".tmp")
+        try:
+            text = json.dumps(memo)
+            self._memo_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(text)
+            os.replace(temp_path, self._memo_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+
+def _registry_in(raw: Mapping[str, Any], name: str, /) -> Registry | None:
+    """Return the registry a raw layer defines under name, if any."""
+    registries = raw.get("registries")
+    value = registries.get(name) if isinstance(registries, dict) else None
+    url = value.get("url") if isinstance(value, dict) else value
+    if not isinstance(url, str):
+        return None
+    return Registry(name=name, url=url, registry_type=RegistryType.CLAUDE_MARKETPLACE)
+
+
+def _registry_location(registry: Registry, file: str, ref: str, /) -> _Location:
+    if file.startswith("../") or file in ("..", ".") or posixpath.isabs(file):
+        raise ValidationError(f"Base config '{ref}' is outside its registry")
+    return _Location(
+        label=f"{registry.name}{REGISTRY_SEPARATOR}{file}",
+        registry=registry,
+        file=file,
+    )
+
+
+def _input_record(location: _Location, content: str, /) -> dict[str, Any]:
+    if location.registry is not None:
+        return {
+            "registry": location.registry.name,
+            "url": location.registry.url,
+            "file": location.file,
+            "sha256": _digest(content),
+        }
+    return {"path": str(location.path), "sha256": _digest(content)}
+
+
+def _digest(content: str, /) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
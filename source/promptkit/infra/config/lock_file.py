@@ -1,39 +1,59 @@
 """Infrastructure layer: Read/write promptkit.lock files."""
 
+import sys
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 
 import yaml
+from yaml.events import (
+    AliasEvent,
+    CollectionStartEvent,
+    DocumentEndEvent,
+    DocumentStartEvent,
+    Event,
+    MappingEndEvent,
+    MappingStartEvent,
+    NodeEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+    StreamStartEvent,
+)
 
 from promptkit.domain.errors import ValidationError
-from promptkit.domain.lock_entry import LockEntry
+from promptkit.domain.lock_entry import LockedFile, LockEntry
+from promptkit.infra.config.yaml_codec import (
+    emit_yaml,
+    load_yaml,
+    parse_yaml,
+    scalar_event,
+)
 
 LOCK_VERSION = 1
 
+_NULLS = frozenset({"", "~", "null", "Null", "NULL"})
+_KEYS = {
+    key: scalar_event(key)
+    for key in ("version", "prompts", "name", "source", "hash", "fetched_at")
+    + ("commit_sha", "tree_id", "files", "path", "size", "sha256")
+}
+_INTERNED_KEYS = ("name", "source", "commit_sha")
+
 
 class LockFile:
-    """Serializes and deserializes promptkit.lock content."""
+    """Serializes and deserializes promptkit.lock content.
+
+    Both directions stream YAML events instead of building the document
+    tree, so a lock with tens of thousands of entries costs little more
+    than its text and its LockEntry objects.
+    """
 
     @staticmethod
     def serialize(entries: list[LockEntry], /) -> str:
         """Serialize lock entries to YAML string."""
-        prompts_data: list[dict[str, Any]] = []
-        for entry in entries:
-            entry_data: dict[str, Any] = {
-                "name": entry.name,
-                "source": entry.source,
-                "hash": entry.content_hash,
-                "fetched_at": entry.fetched_at.isoformat(),
-            }
-            if entry.commit_sha is not None:
-                entry_data["commit_sha"] = entry.commit_sha
-            prompts_data.append(entry_data)
-
-        data: dict[str, Any] = {
-            "version": LOCK_VERSION,
-            "prompts": prompts_data,
-        }
-        return yaml.dump(data, sort_keys=False, default_flow_style=False)
+        return emit_yaml(_lock_events(entries))
 
     @staticmethod
     def deserialize(yaml_content: str, /) -> list[LockEntry]:
@@ -43,21 +63,188 @@ class LockFile:
             ValidationError: If YAML is invalid or missing required fields.
         """
         try:
-            data = yaml.safe_load(yaml_content)
+            return _read_lock(parse_yaml(yaml_content))
+        except _IrregularLock:
+            pass
         except yaml.YAMLError as e:
             raise ValidationError(f"Invalid lock file YAML: {e}") from e
+        # Anchors, explicit tags or an unexpected shape: let the full loader
+        # interpret (or reject) the document.
+        return _read_lock_tree(yaml_content)
+
+
+def _lock_events(entries: list[LockEntry]) -> Iterator[Event]:
+    yield StreamStartEvent()
+    yield DocumentStartEvent()
+    yield MappingStartEvent(None, None, True, flow_style=False)
+    yield _KEYS["version"]
+    yield scalar_event(LOCK_VERSION)
+    yield _KEYS["prompts"]
+    yield SequenceStartEvent(None, None, True, flow_style=False)
+    for entry in entries:
+        yield MappingStartEvent(None, None, True, flow_style=False)
+        yield _KEYS["name"]
+        yield scalar_event(entry.name)
+        yield _KEYS["source"]
+        yield scalar_event(entry.source)
+        yield _KEYS["hash"]
+        yield scalar_event(entry.content_hash)
+        yield _KEYS["fetched_at"]
+        yield scalar_event(entry.fetched_at.isoformat())
+        if entry.commit_sha is not None:
+            yield _KEYS["commit_sha"]
+            yield scalar_event(entry.commit_sha)
+        if entry.tree_id is not None:
+            yield _KEYS["tree_id"]
+            yield scalar_event(entry.tree_id)
+        if entry.files is not None:
+            yield _KEYS["files"]
+            yield SequenceStartEvent(None, None, True, flow_style=False)
+            for locked in entry.files:
+                yield MappingStartEvent(None, None, True, flow_style=False)
+                yield _KEYS["path"]
+                yield scalar_event(locked.path)
+                yield _KEYS["size"]
+                yield scalar_event(locked.size)
+                yield _KEYS["sha256"]
+                yield scalar_event(locked.sha256)
+                yield MappingEndEvent()
+            yield SequenceEndEvent()
+        yield MappingEndEvent()
+    yield SequenceEndEvent()
+    yield MappingEndEvent()
+    yield DocumentEndEvent()
+    yield StreamEndEvent()
+
+
+class _IrregularLock(Exception):
+    """The event stream is not a plain lock document."""
+
+
+def _read_lock(events: Iterator[Event]) -> list[LockEntry]:
+    _expect(events, StreamStartEvent)
+    _expect(events, DocumentStartEvent)
+    _expect(events, MappingStartEvent)
+    entries: list[LockEntry] | None = None
+    while not isinstance(event := next(events), MappingEndEvent):
+        if _scalar(event) == "prompts":
+            entries = _read_prompts(events)
+        else:
+            _skip_node(events)
+    _expect(events, DocumentEndEvent)
+    _expect(events, StreamEndEvent)
+
+    if entries is None:
+        raise ValidationError("Lock file missing required field: 'prompts'")
+    return entries
+
+
+def _read_prompts(events: Iterator[Event]) -> list[LockEntry]:
+    event = next(events)
+    if isinstance(event, ScalarEvent) and _value(event) is None:
+        return []
+    if not isinstance(event, SequenceStartEvent) or event.anchor is not None:
+        raise _IrregularLock
+
+    # Entries locked in one run share a timestamp; parse it once.
+    datetimes: dict[str, datetime] = {}
+    entries: list[LockEntry] = []
+    while not isinstance(event := next(events), SequenceEndEvent):
+        fields = _read_mapping(event, events)
+        fetched_at = fields.get("fetched_at")
+        if isinstance(fetched_at, str):
+            if fetched_at not in datetimes:
+                datetimes[fetched_at] = _parse_datetime(fetched_at)
+            fields["fetched_at"] = datetimes[fetched_at]
+        # Plugins of one registry share a commit and often names, so keep
+        # one copy of each string.
+        for key in _INTERNED_KEYS:
+            if isinstance(text := fields.get(key), str):
+                fields[key] = sys.intern(text)
+        entries.append(_parse_lock_entry(fields))
+    return entries
+
+
+def _read_mapping(event: Event, events: Iterator[Event]) -> dict[str, Any]:
+    """Read a mapping of scalars whose "files" value may be a list of them."""
+    if not isinstance(event, MappingStartEvent) or event.anchor is not None:
+        raise _IrregularLock
+    fields: dict[str, Any] = {}
+    while not isinstance(event := next(events), MappingEndEvent):
+        key = _scalar(event)
+        value = next(events)
+        if key == "files" and isinstance(value, SequenceStartEvent):
+            if value.anchor is not None:
+                raise _IrregularLock
+            files: list[dict[str, Any]] = []
+            while not isinstance(item := next(events), SequenceEndEvent):
+                files.append(_read_mapping(item, events))
+            fields[key] = files
+        else:
+            fields[key] = _value(value)
+    return fields
+
 
-        if not isinstance(data, dict):
-            raise ValidationError("Lock file must be a YAML mapping")
+def _expect(events: Iterator[Event], event_type: type[Event]) -> None:
+    if not isinstance(next(events), event_type):
+        raise _IrregularLock
 
-        if "prompts" not in data:
-            raise ValidationError("Lock file missing required field: 'prompts'")
 
-        prompts_raw = data["prompts"]
-        if not prompts_raw:
-            return []
+def _scalar(event: Event) -> str:
+    return _plain_scalar(event).value
 
-        return [_parse_lock_entry(entry_raw) for entry_raw in prompts_raw]
+
+def _value(event: Event) -> str | None:
+    """The scalar's text, or None for a plain null."""
+    scalar = _plain_scalar(event)
+    if scalar.implicit[0] and scalar.value in _NULLS:
+        return None
+    return scalar.value
+
+
+def _plain_scalar(event: Event) -> ScalarEvent:
+    if (
+        not isinstance(event, ScalarEvent)
+        or event.anchor is not None
+        or event.tag is not None
+    ):
+        raise _IrregularLock
+    return event
+
+
+def _skip_node(events: Iterator[Event]) -> None:
+    depth = 0
+    while True:
+        event = next(events)
+        if isinstance(event, AliasEvent):
+            raise _IrregularLock
+        if isinstance(event, NodeEvent) and event.anchor is not None:
+            raise _IrregularLock
+        if isinstance(event, CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, (SequenceEndEvent, MappingEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+def _read_lock_tree(yaml_content: str) -> list[LockEntry]:
+    try:
+        data = load_yaml(yaml_content)
+    except yaml.YAMLError as e:
+        raise ValidationError(f"Invalid lock file YAML: {e}") from e
+
+    if not isinstance(data, dict):
+        raise ValidationError("Lock file must be a YAML mapping")
+
+    if "prompts" not in data:
+        raise ValidationError("Lock file missing required field: 'prompts'")
+
+    prompts_raw = data["prompts"]
+    if not prompts_raw:
+        return []
+
+    return [_parse_lock_entry(entry_raw) for entry_raw in prompts_raw]
 
 
 _REQUIRED_LOCK_FIELDS = ("name", "source", "hash", "fetched_at")
@@ -69,6 +256,7 @@ def _parse_lock_entry(entry: dict[str, Any]) -> LockEntry:
             raise ValidationError(f"Lock entry missing required field: '{field}'")
 
     fetched_at = _parse_datetime(entry["fetched_at"])
+    files = entry.get("files")
 
     return LockEntry(
         name=entry["name"],
@@ -76,9 +264,27 @@ def _parse_lock_entry(entry: dict[str, Any]) -> LockEntry:
         content_hash=entry["hash"],
         fetched_at=fetched_at,
         commit_sha=entry.get("commit_sha"),
+        tree_id=entry.get("tree_id"),
+        files=None if files is None else tuple(map(_parse_locked_file, files)),
     )
 
 
+_REQUIRED_FILE_FIELDS = ("path", "size", "sha256")
+
+
+def _parse_locked_file(file: Any) -> LockedFile:
+    if not isinstance(file, dict):
+        raise ValidationError("Lock entry files must be mappings")
+    for field in _REQUIRED_FILE_FIELDS:
+        if field not in file:
+            raise ValidationError(f"Locked file missing required field: '{field}'")
+    try:
+        size = int(file["size"])
+    except (TypeError, ValueError) as e:
+        raise ValidationError(f"Invalid file size: '{file['size']}'") from e
+    return LockedFile(path=file["path"], size=size, sha256=file["sha256"])
+
+
 def _parse_datetime(value: str | datetime) -> datetime:
     if isinstance(value, datetime):
         dt = value
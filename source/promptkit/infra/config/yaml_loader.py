@@ -1,6 +1,8 @@
 """Infrastructure layer: Load promptkit.yaml into domain objects."""
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import yaml
@@ -10,6 +12,11 @@ from promptkit.domain.platform_config import PlatformConfig
 from promptkit.domain.platform_target import PlatformTarget
 from promptkit.domain.prompt_spec import PromptSpec
 from promptkit.domain.registry import Registry, RegistryType
+from promptkit.infra.config.yaml_codec import load_yaml
+
+EXTENDS_KEY = "extends"
+# Sections merged by key, and what origins calls one of their entries
+MERGED_MAPPINGS = {"registries": "registry", "platforms": "platform"}
 
 DEFAULT_OUTPUT_DIRS: dict[PlatformTarget, str] = {
     PlatformTarget.CURSOR: ".cursor",
@@ -32,12 +39,21 @@ DEFAULT_PLATFORM_CONFIGS: list[PlatformConfig] = [
 
 @dataclass(frozen=True)
 class LoadedConfig:
-    """Result of loading and parsing a promptkit.yaml file."""
+    """Result of loading and parsing a promptkit.yaml file.
+
+    For a config built from several layers (see YamlLoader.merge), layers
+    lists them base first, origins maps "registry:<name>", "prompt:<source>"
+    and "platform:<name>" to the layer that contributed the entry, and
+    base_files lists the local files the config extends.
+    """
 
     version: int
     registries: list[Registry] = field(default_factory=list)
     prompt_specs: list[PromptSpec] = field(default_factory=list)
     platform_configs: list[PlatformConfig] = field(default_factory=list)
+    layers: tuple[str, ...] = ()
+    origins: Mapping[str, str] = field(default_factory=dict)
+    base_files: tuple[Path, ...] = ()
 
 
 class YamlLoader:
@@ -48,9 +64,93 @@ class YamlLoader:
         """Parse YAML content into a LoadedConfig.
 
         Raises:
-            ValidationError: If YAML is invalid or missing required fields.
+            ValidationError: If YAML is invalid or missing required fields,
+                or it extends other configs (see ConfigLayers).
+        """
+        raw = YamlLoader.parse(yaml_content)
+        if raw.get(EXTENDS_KEY):
+            raise ValidationError(
+                f"Config uses '{EXTENDS_KEY}'; it must be loaded with its base configs"
+            )
+        return YamlLoader.from_mapping(raw)
+
+    @staticmethod
+    def parse(yaml_content: str, /) -> dict[str, Any]:
+        """Parse YAML content into the raw config mapping, without checking it.
+
+        Raises:
+            ValidationError: If the YAML is invalid or not a mapping.
         """
-        raw = _parse_yaml(yaml_content)
+        return _parse_yaml(yaml_content)
+
+    @staticmethod
+    def extends(raw: Mapping[str, Any], /) -> list[str]:
+        """Return the configs a raw config extends, in the order listed.
+
+        Raises:
+            ValidationError: If extends is not a path or a list of paths.
+        """
+        value = raw.get(EXTENDS_KEY)
+        if not value:
+            return []
+        if isinstance(value, str):
+            return [value]
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise ValidationError(f"'{EXTENDS_KEY}' must be a path or a list of paths")
+        return list(value)
+
+    @staticmethod
+    def merge(
+        layers: Sequence[tuple[str, Mapping[str, Any]]], /
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Merge raw configs, base first, into one raw config and its origins.
+
+        registries and platforms are merged by key and prompts by source;
+        a later layer's entry replaces an earlier one, keeping its position.
+        Other keys (such as version) are taken from the last layer setting
+        them. The merge depends only on the layers and their order.
+        """
+        merged: dict[str, Any] = {}
+        origins: dict[str, str] = {}
+        prompts: dict[str, Any] = {}
+        for label, raw in layers:
+            for key, value in raw.items():
+                if key == EXTENDS_KEY:
+                    continue
+                if key in MERGED_MAPPINGS:
+                    if not isinstance(value or {}, dict):
+                        raise ValidationError(f"{label}: '{key}' must be a mapping")
+                    section = merged.setdefault(key, {})
+                    for name, entry in (value or {}).items():
+                        section[name] = entry
+                        origins[f"{MERGED_MAPPINGS[key]}:{name}"] = label
+                elif key == "prompts":
+                    if not isinstance(value or [], list):
+                        raise ValidationError(f"{label}: '{key}' must be a list")
+                    for entry in value or []:
+                        source = _prompt_source(entry)
+                        prompts[source] = entry
+                        origins[f"prompt:{source}"] = label
+                    merged[key] = list(prompts.values())
+                else:
+                    merged[key] = value
+        return merged, origins
+
+    @staticmethod
+    def from_mapping(
+        raw: Mapping[str, Any],
+        /,
+        *,
+        layers: tuple[str, ...] = (),
+        origins: Mapping[str, str] | None = None,
+        base_files: tuple[Path, ...] = (),
+    ) -> LoadedConfig:
+        """Build a LoadedConfig from a raw config mapping.
+
+        Raises:
+            ValidationError: If required fields are missing or invalid.
+        """
+        raw = dict(raw)
         version = _extract_version(raw)
         registries = _extract_registries(raw)
         prompt_specs = _extract_prompt_specs(raw)
@@ -61,12 +161,15 @@ class YamlLoader:
             registries=registries,
             prompt_specs=prompt_specs,
             platform_configs=platform_configs,
+            layers=layers,
+            origins=dict(origins or {}),
+            base_files=base_files,
         )
 
 
 def _parse_yaml(yaml_content: str) -> dict[str, Any]:
     try:
-        data = yaml.safe_load(yaml_content)
+        data = load_yaml(yaml_content)
     except yaml.YAMLError as e:
         raise ValidationError(f"Invalid YAML: {e}") from e
 
@@ -75,6 +178,13 @@ def _parse_yaml(yaml_content: str) -> dict[str, Any]:
     return data
 
 
+def _prompt_source(entry: Any) -> str:
+    """Return the source a raw prompt entry declares, for merging by source."""
+    if isinstance(entry, dict) and isinstance(entry.get("source"), str):
+        return entry["source"]
+    return entry if isinstance(entry, str) else repr(entry)
+
+
 def _extract_version(raw: dict[str, Any]) -> int:
     if "version" not in raw:
         raise ValidationError("Missing required field: 'version'")
@@ -137,7 +247,7 @@ def _parse_prompt_entry(entry: Any) -> PromptSpec:
     if isinstance(entry, str):
         return PromptSpec(source=entry)
 
-    # Object form: {source: ..., name: ..., platforms: ...}
+    # Object form: {source: ..., name: ..., platforms: ..., include: ..., exclude: ...}
     if isinstance(entry, dict):
         if "source" not in entry:
             raise ValidationError("Prompt entry missing required field: 'source'")
@@ -149,11 +259,26 @@ def _parse_prompt_entry(entry: Any) -> PromptSpec:
             source=entry["source"],
             name=name,
             platforms=tuple(platforms),
+            include=_parse_globs(entry, "include"),
+            exclude=_parse_globs(entry, "exclude"),
         )
 
     raise ValidationError(f"Invalid prompt entry: {entry}")
 
 
+def _parse_globs(entry: dict[str, Any], key: str) -> tuple[str, ...]:
+    globs = entry.get(key)
+    if not globs:
+        return ()
+    if isinstance(globs, str):
+        globs = [globs]
+    if not isinstance(globs, list) or not all(isinstance(g, str) for g in globs):
+        raise ValidationError(
+            f"Prompt entry '{entry['source']}': '{key}' must be a list of globs"
+        )
+    return tuple(globs)
+
+
 def _parse_platforms(platforms_raw: list[str] | None) -> list[PlatformTarget]:
     if not platforms_raw:
         return []
@@ -1,8 +1,7 @@
 """Infrastructure layer: YAML serialization for ProjectConfig."""
 
-import yaml
-
 from promptkit.domain.project_config import ProjectConfig
+from promptkit.infra.config.yaml_codec import dump_yaml
 
 PROMPT_EXAMPLE_COMMENT = """\
   # Example prompt entry - uncomment and edit
@@ -17,7 +16,7 @@ def serialize_config_to_yaml(config: ProjectConfig, /) -> str:
     When the prompts list is empty, includes a commented-out example
     to guide users.
     """
-    yaml_output = yaml.dump(config.to_dict(), sort_keys=False, default_flow_style=False)
+    yaml_output = dump_yaml(config.to_dict())
 
     if not config.prompts:
         yaml_output = yaml_output.replace(
@@ -3,14 +3,21 @@
 import json
 import re
 import shutil
-from pathlib import Path
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path, PurePosixPath
 from typing import Any, Protocol
 
 from promptkit.domain.errors import SyncError
+from promptkit.domain.file_filter import FileFilter
+from promptkit.domain.ignore_rules import IGNORE_FILENAME, IgnoreRules
 from promptkit.domain.plugin import Plugin
 from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.domain.resolved_plugin import ResolvedPlugin
 from promptkit.infra.fetchers.git_registry_clone import GitRegistryClone
+from promptkit.infra.run_stats import RunStats
 from promptkit.infra.storage.plugin_cache import PluginCache
+from promptkit.infra.storage.skill_archive import ZIP_SUFFIX, SkillArchiveCache
 
 
 class RegistryClone(Protocol):
@@ -20,6 +27,20 @@ class RegistryClone(Protocol):
     def clone_dir(self) -> Path: ...
     def ensure_up_to_date(self) -> None: ...
     def get_commit_sha(self) -> str: ...
+    def ensure_commit(self, sha: str, /) -> None: ...
+    def read_file(self, sha: str, path: str, /) -> str | None: ...
+    def blob_id(self, sha: str, path: str, /) -> str | None: ...
+    def write_blob(self, object_id: str, target: Path, /) -> None: ...
+    def tree_id(self, sha: str, path: str, /) -> str | None: ...
+    def export_tree(
+        self,
+        sha: str,
+        path: str,
+        target_dir: Path,
+        /,
+        *,
+        keep: Callable[[str], bool] | None = None,
+    ) -> tuple[int, int]: ...
 
 
 MARKETPLACE_PATH = ".claude-plugin/marketplace.json"
@@ -29,8 +50,14 @@ GITHUB_URL_PATTERN = re.compile(r"https://github\.com/([^/]+)/([^/]+)")
 class ClaudeMarketplaceFetcher:
     """Fetches plugins from a GitHub-hosted Claude marketplace registry.
 
-    Implements the PluginFetcher protocol. Reads plugin files from a local
-    shallow git clone and copies them to the cache by commit SHA.
+    Implements the PluginFetcher protocol. resolve() pins a spec to the
+    registry's current commit and the plugin's tree without copying files;
+    materialize() exports the plugin's files at a locked commit from the
+    clone's object store into the cache. Skills shipped as .zip files are
+    extracted through a SkillArchiveCache keyed by the archive's blob ID.
+
+    With offline=True the clone is never pulled: resolve() pins to the
+    clone's current HEAD, as left by a previous 'promptkit fetch'.
     """
 
     def __init__(
@@ -41,9 +68,17 @@ class ClaudeMarketplaceFetcher:
         cache: PluginCache,
         registries_dir: Path | None = None,
         clone: RegistryClone | None = None,
+        stats: RunStats | None = None,
+        archives: SkillArchiveCache | None = None,
+        offline: bool = False,
     ) -> None:
         self._registry_name = registry_name
+        self._offline = offline
         self._cache = cache
+        self._stats = stats or RunStats(command="fetch")
+        self._archives = archives or SkillArchiveCache(
+            cache.cache_dir.parent / "archives"
+        )
         self._owner, self._repo = self._parse_github_url(registry_url)
         default_registries_dir = cache.cache_dir.parent.parent / "registries"
         self._clone = clone or GitRegistryClone(
@@ -51,39 +86,114 @@ class ClaudeMarketplaceFetcher:
             registry_url=registry_url,
             registries_dir=registries_dir or default_registries_dir,
         )
+        self._head_sha: str | None = None
 
-    def fetch(self, spec: PromptSpec, /) -> Plugin:
-        """Fetch a plugin from the marketplace.
+    def resolve(self, spec: PromptSpec, /) -> ResolvedPlugin:
+        """Pin a plugin to the registry's latest commit without copying files.
 
-        Ensures the local clone is up to date, looks up the plugin in
-        marketplace.json, copies files to cache, and returns a Plugin manifest.
+        The clone is brought up to date once per fetcher, so resolving many
+        plugins from the same registry costs a single pull.
         """
         try:
-            return self._fetch_and_cache(spec)
+            sha = self._current_sha()
+            marketplace = self._read_marketplace_json(sha)
+            entry = self._find_plugin_entry(marketplace, spec.prompt_name)
+            self._reject_external_source(entry)
+            return ResolvedPlugin(
+                spec=spec,
+                commit_sha=sha,
+                tree_id=self._plugin_tree_id(entry, marketplace, sha),
+            )
+        except SyncError:
+            raise
+        except Exception as e:
+            raise SyncError(
+                f"Failed to resolve plugin '{spec.prompt_name}': {e}"
+            ) from e
+
+    def materialize(
+        self,
+        spec: PromptSpec,
+        commit_sha: str,
+        /,
+        *,
+        file_filter: FileFilter | None = None,
+    ) -> Plugin:
+        """Make a plugin's files at commit_sha available in the cache.
+
+        Uses the local or remote cache when possible; otherwise exports the
+        files from the clone, fetching the commit if the clone lacks it.
+        Only files passing file_filter are exported, and the filter is part
+        of the cache key, so each filter gets its own cache entry.
+        """
+        try:
+            return self._materialize(spec, commit_sha, file_filter or FileFilter())
         except SyncError:
             raise
         except Exception as e:
             raise SyncError(f"Failed to fetch plugin '{spec.prompt_name}': {e}") from e
 
-    def _fetch_and_cache(self, spec: PromptSpec, /) -> Plugin:
-        self._clone.ensure_up_to_date()
-        marketplace = self._read_marketplace_json()
-        entry = self._find_plugin_entry(marketplace, spec.prompt_name)
-        self._reject_external_source(entry)
-        sha = self._clone.get_commit_sha()
-        cache_dir = self._cache.plugin_dir(self._registry_name, spec.prompt_name, sha)
+    def fetch(self, spec: PromptSpec, /) -> Plugin:
+        """Resolve a plugin to the latest commit and materialise it."""
+        return self.materialize(spec, self.resolve(spec).commit_sha)
+
+    def _current_sha(self) -> str:
+        if self._head_sha is None:
+            with self._stats.timed(self._registry_name, "git"):
+                if not self._offline:
+                    self._clone.ensure_up_to_date()
+                elif not self._clone.clone_dir.is_dir():
+                    raise SyncError(
+                        f"Registry '{self._registry_name}' has not been fetched. "
+                        "Run 'promptkit fetch' before locking offline."
+                    )
+                self._head_sha = self._clone.get_commit_sha()
+        return self._head_sha
 
-        if not self._cache.has(self._registry_name, spec.prompt_name, sha):
-            self._copy_plugin(entry, marketplace, cache_dir)
+    def _materialize(
+        self, spec: PromptSpec, sha: str, file_filter: FileFilter, /
+    ) -> Plugin:
+        registry, plugin_name = self._registry_name, spec.prompt_name
+        key = file_filter.cache_key(sha)
+        if self._cache.has_local(registry, plugin_name, key):
+            self._stats.record_hit(registry)
+        elif self._cache.has(registry, plugin_name, key):
+            self._stats.record_hit(registry, remote=True)
+        else:
+            self._stats.record_miss(
+                registry, spec.source, self._refetch_reason(plugin_name, sha)
+            )
+            with self._stats.timed(registry, "git"):
+                self._clone.ensure_commit(sha)
+            marketplace = self._read_marketplace_json(sha)
+            entry = self._find_plugin_entry(marketplace, plugin_name)
+            self._reject_external_source(entry)
+            with self._stats.timed(registry, "copy"):
+                self._export_plugin(entry, marketplace, spec, sha, file_filter)
+            self._cache.publish(registry, plugin_name, key)
 
-        files = self._cache.list_files(self._registry_name, spec.prompt_name, sha)
+        files = self._cache.list_files(registry, plugin_name, key)
         return Plugin(
             spec=spec,
             files=tuple(files),
-            source_dir=cache_dir,
+            source_dir=self._cache.unpacked_dir(registry, plugin_name, key),
             commit_sha=sha,
         )
 
+    def _refetch_reason(self, plugin_name: str, sha: str, /) -> str:
+        """Explain a cache miss: first fetch, or a new commit of a cached plugin."""
+        cached = [
+            e
+            for e in self._cache.catalog.entries()
+            if e.registry == self._registry_name and e.plugin == plugin_name
+        ]
+        if not cached:
+            return "not cached"
+        if any(e.sha.startswith(sha) for e in cached):
+            return "new file filter"
+        previous = max(cached, key=lambda e: e.last_used_at)
+        return f"new commit {sha[:7]} (cached: {previous.sha[:7]})"
+
     @staticmethod
     def _reject_external_source(entry: dict[str, Any], /) -> None:
         """Raise if the plugin source is an external URL dict, not a relative path."""
@@ -94,15 +204,15 @@ class ClaudeMarketplaceFetcher:
                 "Only relative-path plugins are supported in this version."
             )
 
-    def _read_marketplace_json(self) -> dict[str, Any]:
-        """Read marketplace.json from the local clone."""
-        manifest_path = self._clone.clone_dir / MARKETPLACE_PATH
-        if not manifest_path.is_file():
+    def _read_marketplace_json(self, sha: str, /) -> dict[str, Any]:
+        """Read marketplace.json at the given commit of the local clone."""
+        content = self._clone.read_file(sha, MARKETPLACE_PATH)
+        if content is None:
             raise SyncError(
-                f"marketplace.json not found in clone at {manifest_path}. "
+                f"marketplace.json not found in clone at {sha[:7]}. "
                 f"Registry {self._owner}/{self._repo} may not be a valid marketplace."
             )
-        return json.loads(manifest_path.read_text())
+        return json.loads(content)
 
     def _find_plugin_entry(
         self, marketplace: dict[str, Any], plugin_name: str, /
@@ -129,45 +239,94 @@ class ClaudeMarketplaceFetcher:
             return plugin_root
         return f"{plugin_root}/{path}"
 
-    def _copy_plugin(
+    def _plugin_tree_id(
+        self, entry: dict[str, Any], marketplace: dict[str, Any], sha: str, /
+    ) -> str | None:
+        """Return the tree ID of a directory plugin; skills plugins have none."""
+        if entry.get("skills"):
+            return None
+        source_path = self._resolve_source_path(entry, marketplace)
+        tree_id = self._clone.tree_id(sha, source_path)
+        if tree_id is None:
+            raise SyncError(f"Plugin directory not found in clone: {source_path}")
+        return tree_id
+
+    def _export_plugin(
         self,
         entry: dict[str, Any],
         marketplace: dict[str, Any],
-        cache_dir: Path,
+        spec: PromptSpec,
+        sha: str,
+        file_filter: FileFilter,
         /,
     ) -> None:
-        """Copy plugin files from the local clone to the cache directory."""
+        """Export plugin files at sha into a staging dir, then move into the cache."""
+        registry, plugin_name = self._registry_name, spec.prompt_name
+        key = file_filter.cache_key(sha)
+        staging = self._cache.staging_dir(registry, plugin_name, key)
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+
         skills = entry.get("skills")
         if skills:
-            self._copy_skills(skills, cache_dir)
+            for skill_path in skills:
+                self._export_skill(sha, skill_path.lstrip("./"), staging, file_filter)
         else:
             source_path = self._resolve_source_path(entry, marketplace)
-            source_dir = self._clone.clone_dir / source_path
-            if not source_dir.is_dir():
-                raise SyncError(
-                    f"Plugin directory not found in clone: {source_path}"
-                )
-            self._copy_directory(source_dir, cache_dir)
+            if self._clone.tree_id(sha, source_path) is None:
+                raise SyncError(f"Plugin directory not found in clone: {source_path}")
+            files, size = self._clone.export_tree(
+                sha,
+                source_path,
+                staging,
+                keep=_ignoring(
+                    self._read_ignore_rules(sha, source_path), file_filter.matches
+                ),
+            )
+            self._stats.record_copy(registry, files, size)
 
-    def _copy_skills(self, skills: list[str], cache_dir: Path, /) -> None:
-        """Copy skill directories from the clone to the cache."""
-        for skill_path in skills:
-            clean_path = skill_path.lstrip("./")
-            source_dir = self._clone.clone_dir / clean_path
-            target_dir = cache_dir / clean_path
-            if source_dir.is_dir():
-                self._copy_directory(source_dir, target_dir)
+        staging.rename(self._cache.plugin_dir(registry, plugin_name, key))
+        self._cache.register(registry, plugin_name, key)
 
-    @staticmethod
-    def _copy_directory(source_dir: Path, target_dir: Path, /) -> None:
-        """Copy all files from source to target, preserving structure."""
-        for source_file in source_dir.rglob("*"):
-            if not source_file.is_file():
-                continue
-            relative = source_file.relative_to(source_dir)
-            target_file = target_dir / relative
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_file, target_file)
+    def _export_skill(
+        self, sha: str, skill_path: str, staging: Path, file_filter: FileFilter, /
+    ) -> None:
+        """Export one skill directory, or extract it from a .zip of the same name.
+
+        Skills missing from the commit are skipped.
+        """
+        if not skill_path.endswith(ZIP_SUFFIX):
+            if self._clone.tree_id(sha, skill_path) is not None:
+                files, size = self._clone.export_tree(
+                    sha,
+                    skill_path,
+                    staging / skill_path,
+                    keep=_ignoring(
+                        self._read_ignore_rules(sha, skill_path),
+                        _under(skill_path, file_filter),
+                    ),
+                )
+                self._stats.record_copy(self._registry_name, files, size)
+                return
+            skill_path += ZIP_SUFFIX
+        blob_id = self._clone.blob_id(sha, skill_path)
+        if blob_id is None:
+            return
+        target_path = skill_path.removesuffix(ZIP_SUFFIX)
+        files, size = self._archives.materialize(
+            blob_id,
+            partial(self._clone.write_blob, blob_id),
+            staging / target_path,
+            strip_root=PurePosixPath(target_path).name,
+            keep=_under(target_path, file_filter),
+        )
+        self._stats.record_copy(self._registry_name, files, size)
+
+    def _read_ignore_rules(self, sha: str, tree_path: str, /) -> IgnoreRules:
+        """Read the .promptkitignore at the root of a plugin or skill tree."""
+        path = f"{tree_path}/{IGNORE_FILENAME}" if tree_path else IGNORE_FILENAME
+        content = self._clone.read_file(sha, path)
+        return IgnoreRules.parse(content) if content else IgnoreRules()
 
     @staticmethod
     def _parse_github_url(url: str, /) -> tuple[str, str]:
@@ -178,3 +337,17 @@ class ClaudeMarketplaceFetcher:
                 "Expected format: https://github.com/owner/repo"
             )
         return match.group(1), match.group(2)
+
+
+def _under(prefix: str, file_filter: FileFilter, /) -> Callable[[str], bool]:
+    """Adapt a plugin-relative filter to paths relative to prefix."""
+    return lambda relative: file_filter.matches(f"{prefix}/{relative}")
+
+
+def _ignoring(
+    rules: IgnoreRules, keep: Callable[[str], bool], /
+) -> Callable[[str], bool]:
+    """Wrap keep to drop the ignore file itself and every path it ignores."""
+    return lambda relative: (
+        relative != IGNORE_FILENAME and not rules.excludes(relative) and keep(relative)
+    )
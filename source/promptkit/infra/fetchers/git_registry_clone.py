@@ -1,18 +1,25 @@
 """Infrastructure layer: Shallow git clone management for marketplace registries."""
 
+import os
 import shutil
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 from promptkit.domain.errors import SyncError
 
 GIT_CLONE_DEPTH = 1
+REGULAR_FILE_MODE = "100644"
+EXECUTABLE_FILE_MODE = "100755"
+BLOB_CHUNK_SIZE = 1024 * 1024
 
 
 class GitRegistryClone:
     """Manages a shallow git clone of a marketplace registry.
 
-    Provides clone/pull/rev-parse operations for a single registry repo.
+    Provides clone/pull/rev-parse operations for a single registry repo, and
+    reads files and trees at a given commit straight from the object store so
+    any locked SHA can be materialised without checking it out.
     Clones are stored at {registries_dir}/{registry_name}/.
     """
 
@@ -51,6 +58,175 @@ class GitRegistryClone:
         result = self._run_git("rev-parse", "HEAD", cwd=self._clone_dir)
         return result.stdout.strip()
 
+    def ensure_commit(self, sha: str, /) -> None:
+        """Make sure the commit's objects are present, fetching it if needed.
+
+        Raises:
+            SyncError: If the commit cannot be fetched from the remote.
+        """
+        if not self._is_valid_clone():
+            self._fresh_clone()
+        if self._has_commit(sha):
+            return
+        self._run_git(
+            "fetch",
+            "--depth",
+            str(GIT_CLONE_DEPTH),
+            "origin",
+            sha,
+            cwd=self._clone_dir,
+        )
+        if not self._has_commit(sha):
+            raise SyncError(f"Commit {sha} not found in registry {self._registry_name}")
+
+    def read_file(self, sha: str, path: str, /) -> str | None:
+        """Return a file's text at the given commit, or None if it does not exist."""
+        described = self._describe(f"{sha}:{path}")
+        if described is None or described[1] != "blob":
+            return None
+        result = self._run_git("cat-file", "blob", described[0], cwd=self._clone_dir)
+        return result.stdout
+
+    def blob_id(self, sha: str, path: str, /) -> str | None:
+        """Return the object ID of a file at the given commit, or None."""
+        described = self._describe(f"{sha}:{path}")
+        if described is None or described[1] != "blob":
+            return None
+        return described[0]
+
+    def write_blob(self, object_id: str, target: Path, /) -> None:
+        """Stream a blob's bytes into target without holding them in memory."""
+        try:
+            with target.open("wb") as out:
+                subprocess.run(
+                    ["git", "cat-file", "blob", object_id],
+                    cwd=self._clone_dir,
+                    stdout=out,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                )
+        except subprocess.CalledProcessError as e:
+            raise SyncError(
+                f"Git command failed: git cat-file blob {object_id}\n"
+                f"{e.stderr.decode().strip()}"
+            ) from e
+
+    def tree_id(self, sha: str, path: str, /) -> str | None:
+        """Return the tree ID of a directory at the given commit, or None."""
+        described = self._describe(f"{sha}:{path}")
+        if described is None or described[1] != "tree":
+            return None
+        return described[0]
+
+    def export_tree(
+        self,
+        sha: str,
+        path: str,
+        target_dir: Path,
+        /,
+        *,
+        keep: Callable[[str], bool] | None = None,
+    ) -> tuple[int, int]:
+        """Write the files under path at the given commit into target_dir.
+
+        Symlinks and submodules are skipped. A missing path exports nothing.
+        If keep is given, only files whose path relative to path it accepts
+        are read and written.
+
+        Returns:
+            Number of files written and their total size in bytes.
+        """
+        if self.tree_id(sha, path) is None:
+            return 0, 0
+        listing = self._run_git(
+            "ls-tree", "-r", "-z", f"{sha}:{path}", cwd=self._clone_dir
+        ).stdout
+        blobs: list[tuple[str, str, str]] = []
+        for record in filter(None, listing.split("\0")):
+            meta, relative = record.split("\t", 1)
+            mode, _, object_id = meta.split()
+            if mode not in (REGULAR_FILE_MODE, EXECUTABLE_FILE_MODE):
+                continue
+            if keep is None or keep(relative):
+                blobs.append((mode, object_id, relative))
+        if not blobs:
+            return 0, 0
+
+        targets: list[tuple[str, Path]] = []
+        for _, object_id, relative in blobs:
+            target = target_dir / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            targets.append((object_id, target))
+        total = self._write_blobs(targets)
+        for (mode, _, _), (_, target) in zip(blobs, targets, strict=True):
+            if mode == EXECUTABLE_FILE_MODE:
+                os.chmod(target, 0o755)
+        return len(blobs), total
+
+    def _write_blobs(self, blobs: list[tuple[str, Path]], /) -> int:
+        """Stream many blobs into their targets through one 'git cat-file --batch'.
+
+        Each object is requested once the previous one has been copied, so
+        only one chunk of one blob is in memory at a time.
+
+        Returns:
+            Total size of the blobs in bytes.
+        """
+        with subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=self._clone_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as process:
+            try:
+                return self._copy_batch(process, blobs)
+            except BaseException:
+                process.kill()
+                raise
+
+    @staticmethod
+    def _copy_batch(
+        process: subprocess.Popen[bytes], blobs: list[tuple[str, Path]], /
+    ) -> int:
+        stdin, stdout, stderr = process.stdin, process.stdout, process.stderr
+        assert stdin is not None and stdout is not None and stderr is not None
+        total = 0
+        for object_id, target in blobs:
+            stdin.write(f"{object_id}\n".encode())
+            stdin.flush()
+            header = stdout.readline().split()
+            if len(header) != 3:
+                stdin.close()
+                detail = stderr.read().decode().strip() or b" ".join(header).decode()
+                raise SyncError(f"Git command failed: git cat-file --batch\n{detail}")
+            remaining = int(header[2])
+            with target.open("wb") as out:
+                while remaining:
+                    chunk = stdout.read(min(remaining, BLOB_CHUNK_SIZE))
+                    if not chunk:
+                        raise SyncError(
+                            f"git cat-file --batch ended inside blob {object_id}"
+                        )
+                    out.write(chunk)
+                    remaining -= len(chunk)
+            stdout.read(1)  # the newline after each object
+            total += int(header[2])
+        return total
+
+    def _has_commit(self, sha: str, /) -> bool:
+        return self._describe(f"{sha}^{{commit}}") is not None
+
+    def _describe(self, spec: str, /) -> tuple[str, str] | None:
+        """Return (object ID, type) for a revision spec, or None if missing."""
+        result = self._run_git(
+            "cat-file", "--batch-check", cwd=self._clone_dir, input=f"{spec}\n"
+        )
+        fields = result.stdout.split()
+        if len(fields) != 3:
+            return None
+        return fields[0], fields[1]
+
     def _is_valid_clone(self) -> bool:
         """Check if the clone directory exists and has a .git subdirectory."""
         return (self._clone_dir / ".git").is_dir()
@@ -68,7 +244,9 @@ class GitRegistryClone:
             str(self._clone_dir),
         )
 
-    def _run_git(self, *args: str, cwd: Path | None = None) -> subprocess.CompletedProcess[str]:
+    def _run_git(
+        self, *args: str, cwd: Path | None = None, input: str | None = None
+    ) -> subprocess.CompletedProcess[str]:
         """Run a git command, raising SyncError on failure."""
         try:
             return subprocess.run(
@@ -77,6 +255,7 @@ class GitRegistryClone:
                 capture_output=True,
                 text=True,
                 check=True,
+                input=input,
             )
         except subprocess.CalledProcessError as e:
             raise SyncError(
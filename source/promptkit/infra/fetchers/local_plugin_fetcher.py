@@ -1,27 +1,41 @@
 """Infrastructure layer: Fetch plugins from local prompts/ directory."""
 
+import time
 from pathlib import Path
 
 from promptkit.domain.errors import SyncError
 from promptkit.domain.file_system import FileSystem
+from promptkit.domain.ignore_rules import IGNORE_FILENAME, IgnoreRules
 from promptkit.domain.plugin import Plugin
 from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.infra.file_system.tree_walker import walk_files
 
 LOCAL_SOURCE_PREFIX = "local/"
 PROMPT_EXTENSION = ".md"
 CATEGORY_DIRS = {"rules", "skills", "agents", "commands", "subagents", "hooks"}
+RACY_WINDOW_NS = 2_000_000_000
+
+ListingStamps = tuple[tuple[str, int | None], ...]
 
 
 class LocalPluginFetcher:
     """Fetches plugins from the local prompts/ directory.
 
-    Implements the PluginFetcher protocol. Supports both single .md files
-    and multi-file directories. Files stay in prompts/ — no cache needed.
+    Supports both single .md files and multi-file directories.
+    Files stay in prompts/ — no cache needed.
+
+    Paths matched by prompts/.promptkitignore, or by a .promptkitignore in
+    any directory below it, are left out; ignored directories are pruned
+    without being listed. The ignore files themselves are never plugin files.
+    Directory listings are stamped so a later run can tell whether one still
+    holds without listing again (see listing_stamps).
     """
 
     def __init__(self, file_system: FileSystem, prompts_dir: Path, /) -> None:
         self._fs = file_system
         self._prompts_dir = prompts_dir
+        self._root_rules: IgnoreRules | None = None
+        self._listings: dict[str, ListingStamps] = {}
 
     def fetch(self, spec: PromptSpec, /) -> Plugin:
         """Fetch a local plugin by spec.
@@ -40,8 +54,8 @@ class LocalPluginFetcher:
                 source_dir=self._prompts_dir,
             )
 
-        if dir_path.is_dir():
-            files = self._list_files_recursive(dir_path)
+        if self._fs.is_dir(dir_path):
+            files = self._list_files_recursive(dir_path, spec.source)
             return Plugin(
                 spec=spec,
                 files=tuple(sorted(files)),
@@ -50,34 +64,130 @@ class LocalPluginFetcher:
 
         raise SyncError(f"Local plugin not found: {relative}")
 
+    def listing_stamps(self, source: str, /) -> ListingStamps | None:
+        """Return what the last listing of a directory plugin depended on.
+
+        That is the mtime_ns of every directory the listing read and of
+        every ignore file that applied to it, or None where there was none,
+        by path relative to prompts_dir. Adding, removing or renaming a file
+        changes its directory's mtime and editing an ignore file changes its
+        own, so while all of them are unchanged (see is_unchanged) so is the
+        listing; ignored directories are not part of it. None if source was
+        not listed, or if something changed too recently to tell.
+        """
+        return self._listings.get(source)
+
+    def is_unchanged(self, stamps: ListingStamps, /) -> bool:
+        """Check that every path in stamps still has its recorded mtime."""
+        root = self._prompts_dir
+        return all(_mtime_ns(root / path) == mtime for path, mtime in stamps)
+
     def discover(self) -> list[PromptSpec]:
         """Discover all plugins in the prompts directory."""
-        if not self._prompts_dir.is_dir():
+        if not self._fs.is_dir(self._prompts_dir):
             return []
         return sorted(
-            self._scan_directory(self._prompts_dir),
+            self._scan_directory(self._prompts_dir, self._rules_for_root()),
             key=lambda s: s.source,
         )
 
-    def _scan_directory(self, directory: Path, /) -> list[PromptSpec]:
+    def _scan_directory(
+        self, directory: Path, rules: IgnoreRules, /
+    ) -> list[PromptSpec]:
         specs: list[PromptSpec] = []
         for entry in self._fs.list_directory(directory):
-            if entry.is_dir():
+            relative = entry.relative_to(self._prompts_dir).as_posix()
+            is_dir = self._fs.is_dir(entry)
+            if rules.is_ignored(relative, is_dir=is_dir):
+                continue
+            if is_dir:
                 if entry.name in CATEGORY_DIRS:
-                    specs.extend(self._scan_directory(entry))
+                    nested = rules.extend(self._read_rules(entry, relative))
+                    specs.extend(self._scan_directory(entry, nested))
                 else:
-                    relative = str(entry.relative_to(self._prompts_dir))
                     specs.append(PromptSpec(source=f"{LOCAL_SOURCE_PREFIX}{relative}"))
             elif entry.suffix == PROMPT_EXTENSION:
-                relative = entry.relative_to(self._prompts_dir)
-                name = str(relative).removesuffix(PROMPT_EXTENSION)
+                name = relative.removesuffix(PROMPT_EXTENSION)
                 specs.append(PromptSpec(source=f"{LOCAL_SOURCE_PREFIX}{name}"))
         return specs
 
-    def _list_files_recursive(self, directory: Path, /) -> list[str]:
-        """List all files in a directory recursively, as paths relative to prompts_dir."""
-        return [
-            str(child.relative_to(self._prompts_dir))
-            for child in sorted(directory.rglob("*"))
-            if child.is_file()
+    def _list_files_recursive(self, directory: Path, source: str, /) -> list[str]:
+        """List all files in a directory recursively, as paths relative to prompts_dir.
+
+        Ignored directories are pruned before they are read. Rules from each
+        directory's ignore file apply to that directory's subtree only. Each
+        directory and ignore file is stamped before it is read; the stamps
+        are kept for listing_stamps() unless one is too recent to trust.
+        """
+        root = self._prompts_dir
+        prefix = directory.relative_to(root).as_posix()
+        started_ns = time.time_ns()
+        stamps: dict[str, int | None] = {}
+
+        def stamp(path: str) -> None:
+            stamps[path] = _mtime_ns(root / path)
+
+        def read_rules(relative_dir: str) -> IgnoreRules:
+            stamp(f"{relative_dir}/{IGNORE_FILENAME}")
+            return self._read_rules(root / relative_dir, relative_dir)
+
+        stamp(IGNORE_FILENAME)
+        stamp(f"{prefix}{PROMPT_EXTENSION}")
+        stamp(prefix)
+        rules = self._rules_for_root()
+        for ancestor in _ancestors(prefix):
+            rules = rules.extend(read_rules(ancestor))
+        rules_by_dir = {prefix: rules}
+
+        def rules_for(relative_dir: str) -> IgnoreRules:
+            rules = rules_by_dir.get(relative_dir)
+            if rules is None:
+                parent = relative_dir.rpartition("/")[0]
+                own = read_rules(relative_dir)
+                rules = rules_by_dir[relative_dir] = rules_for(parent).extend(own)
+            return rules
+
+        def prune(relative: str, is_dir: bool) -> bool:
+            path = f"{prefix}/{relative}"
+            parent, _, name = path.rpartition("/")
+            if not is_dir and name == IGNORE_FILENAME:
+                return True
+            if rules_for(parent).is_ignored(path, is_dir=is_dir):
+                return True
+            if is_dir:
+                stamp(path)
+            return False
+
+        files = [
+            f"{prefix}/{entry.relative}" for entry in walk_files(directory, prune=prune)
         ]
+        # A change in the same timestamp tick as a stamp would go unnoticed.
+        if all(m is None or m < started_ns - RACY_WINDOW_NS for m in stamps.values()):
+            self._listings[source] = tuple(sorted(stamps.items()))
+        else:
+            self._listings.pop(source, None)
+        return files
+
+    def _rules_for_root(self) -> IgnoreRules:
+        if self._root_rules is None:
+            self._root_rules = self._read_rules(self._prompts_dir, "")
+        return self._root_rules
+
+    def _read_rules(self, directory: Path, base: str, /) -> IgnoreRules:
+        path = directory / IGNORE_FILENAME
+        if not self._fs.file_exists(path):
+            return IgnoreRules()
+        return IgnoreRules.parse(self._fs.read_file(path), base=base)
+
+
+def _ancestors(relative: str, /) -> list[str]:
+    """Return 'a', 'a/b', ... up to and including a relative POSIX path."""
+    parts = relative.split("/")
+    return ["/".join(parts[:depth]) for depth in range(1, len(parts) + 1)]
+
+
+def _mtime_ns(path: Path, /) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
@@ -0,0 +1,89 @@
+"""Infrastructure layer: metadata-caching FileSystem decorator."""
+
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+from promptkit.domain.file_system import FileSystem
+
+
+class CachingFileSystem:
+    """FileSystem decorator that memoises metadata for one command.
+
+    file_exists(), is_dir() and list_directory() results are cached per path,
+    so lock and build checking the same config, lock file and prompts/ tree
+    stat each path once per process. Writes made through this object drop the
+    affected entries: the written path, its ancestors (which may have been
+    created) and, for remove_directory, everything below it.
+
+    Changes made behind its back (by other processes, or by code writing
+    with pathlib or shutil directly) are not seen, so create one per command
+    and only query paths that the command writes through it. File contents
+    are never cached. Safe to use from several threads.
+    """
+
+    def __init__(self, inner: FileSystem, /) -> None:
+        self._inner = inner
+        self._exists: dict[Path, bool] = {}
+        self._is_dir: dict[Path, bool] = {}
+        self._listings: dict[Path, list[Path]] = {}
+        self._lock = threading.Lock()
+
+    def create_directory(self, path: Path, /) -> None:
+        """Create directory, including parent directories if needed."""
+        self._inner.create_directory(path)
+        self._invalidate(path)
+
+    def write_file(self, path: Path, content: str, /) -> None:
+        """Write content to file, creating parent directories if needed."""
+        self._inner.write_file(path, content)
+        self._invalidate(path)
+
+    def file_exists(self, path: Path, /) -> bool:
+        """Check if file exists."""
+        cached = self._exists.get(path)
+        if cached is None:
+            cached = self._exists[path] = self._inner.file_exists(path)
+        return cached
+
+    def is_dir(self, path: Path, /) -> bool:
+        """Check if path is an existing directory."""
+        cached = self._is_dir.get(path)
+        if cached is None:
+            cached = self._is_dir[path] = self._inner.is_dir(path)
+        return cached
+
+    def append_to_file(self, path: Path, content: str, /) -> None:
+        """Append content to existing file."""
+        self._inner.append_to_file(path, content)
+        self._invalidate(path)
+
+    def read_file(self, path: Path, /) -> str:
+        """Read file content as string."""
+        return self._inner.read_file(path)
+
+    def open_binary(self, path: Path, /) -> BinaryIO:
+        """Open a file for reading raw bytes."""
+        return self._inner.open_binary(path)
+
+    def list_directory(self, path: Path, /) -> list[Path]:
+        """List immediate children of a directory."""
+        cached = self._listings.get(path)
+        if cached is None:
+            cached = self._listings[path] = self._inner.list_directory(path)
+        return list(cached)
+
+    def remove_directory(self, path: Path, /) -> None:
+        """Remove a directory and all its contents."""
+        self._inner.remove_directory(path)
+        self._invalidate(path, subtree=True)
+
+    def _invalidate(self, path: Path, /, *, subtree: bool = False) -> None:
+        with self._lock:
+            for cache in (self._exists, self._is_dir, self._listings):
+                cache.pop(path, None)
+                for parent in path.parents:
+                    cache.pop(parent, None)
+                if subtree:
+                    for key in [k for k in list(cache) if k.is_relative_to(path)]:
+                        del cache[key]
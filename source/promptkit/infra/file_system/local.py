@@ -2,6 +2,7 @@
 
 import shutil
 from pathlib import Path
+from typing import BinaryIO
 
 
 class FileSystem:
@@ -23,6 +24,10 @@ class FileSystem:
         """Check if file exists."""
         return path.exists()
 
+    def is_dir(self, path: Path, /) -> bool:
+        """Check if path is an existing directory."""
+        return path.is_dir()
+
     def append_to_file(self, path: Path, content: str, /) -> None:
         """Append content to existing file."""
         with path.open("a") as f:
@@ -32,11 +37,16 @@ class FileSystem:
         """Read file content as string."""
         return path.read_text()
 
+    def open_binary(self, path: Path, /) -> BinaryIO:
+        """Open a file for reading raw bytes."""
+        return path.open("rb")
+
     def list_directory(self, path: Path, /) -> list[Path]:
         """List immediate children of a directory."""
-        if not path.is_dir():
+        try:
+            return list(path.iterdir())
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        return list(path.iterdir())
 
     def remove_directory(self, path: Path, /) -> None:
         """Remove a directory and all its contents."""
@@ -0,0 +1,69 @@
+"""Infrastructure layer: scandir-based file tree walker."""
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+
+class WalkEntry:
+    """A regular file found by walk_files.
+
+    The type of every entry comes from the directory read itself, so listing
+    a tree costs one scandir per directory and no per-file stat. size and
+    mtime_ns stat the file on first access only (once per entry).
+    """
+
+    __slots__ = ("_entry", "relative")
+
+    def __init__(self, relative: str, entry: os.DirEntry[str], /) -> None:
+        self.relative = relative
+        self._entry = entry
+
+    @property
+    def path(self) -> Path:
+        """Absolute path of the file."""
+        return Path(self._entry.path)
+
+    @property
+    def size(self) -> int:
+        return self._entry.stat().st_size
+
+    @property
+    def mtime_ns(self) -> int:
+        return self._entry.stat().st_mtime_ns
+
+    def __repr__(self) -> str:
+        return f"WalkEntry({self.relative!r})"
+
+
+def walk_files(
+    root: Path,
+    /,
+    *,
+    prune: Callable[[str, bool], bool] | None = None,
+) -> list[WalkEntry]:
+    """List the regular files under root, sorted by relative POSIX path.
+
+    prune(relative, is_dir) is called for every directory and file below
+    root; returning True drops a file, or skips a directory without reading
+    it. Like Path.rglob(), symlinked files are listed but symlinked
+    directories are not descended into. A missing root lists nothing.
+    """
+    entries: list[WalkEntry] = []
+    pending: list[tuple[str, str]] = [(os.fspath(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            scanner = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with scanner:
+            for entry in scanner:
+                relative = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if prune is None or not prune(relative, True):
+                        pending.append((entry.path, relative + "/"))
+                elif entry.is_file() and (prune is None or not prune(relative, False)):
+                    entries.append(WalkEntry(relative, entry))
+    entries.sort(key=lambda e: e.relative)
+    return entries
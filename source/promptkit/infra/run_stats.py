@@ -0,0 +1,106 @@
+"""Infrastructure layer: Per-run cache and cost accounting."""
+
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal
+
+Phase = Literal["git", "copy"]
+
+
+@dataclass
+class RegistryStats:
+    """Counters for one registry over a single run."""
+
+    hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+    files_copied: int = 0
+    bytes_copied: int = 0
+    git_seconds: float = 0.0
+    copy_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class Refetch:
+    """A plugin that had to be copied from its registry, and why."""
+
+    source: str
+    reason: str
+
+
+@dataclass
+class RunStats:
+    """Accounting for one promptkit command invocation.
+
+    Fetchers record cache hits and misses, copy volume and time spent in git
+    versus copying. The CLI prints a summary with --stats and appends every
+    run to a JSONL history so cache regressions show up over time.
+    """
+
+    command: str
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    registries: dict[str, RegistryStats] = field(default_factory=dict)
+    refetches: list[Refetch] = field(default_factory=list)
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def registry(self, name: str, /) -> RegistryStats:
+        """Return the (created on demand) counters for a registry."""
+        return self.registries.setdefault(name, RegistryStats())
+
+    def record_hit(self, registry: str, /, *, remote: bool = False) -> None:
+        stats = self.registry(registry)
+        if remote:
+            stats.remote_hits += 1
+        else:
+            stats.hits += 1
+
+    def record_miss(self, registry: str, source: str, reason: str, /) -> None:
+        self.registry(registry).misses += 1
+        self.refetches.append(Refetch(source=source, reason=reason))
+
+    def record_copy(self, registry: str, files: int, size: int, /) -> None:
+        stats = self.registry(registry)
+        stats.files_copied += files
+        stats.bytes_copied += size
+
+    @contextmanager
+    def timed(self, registry: str, phase: Phase, /) -> Iterator[None]:
+        """Add the time spent in the block to a registry's git or copy total."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.registry(registry)
+            if phase == "git":
+                stats.git_seconds += elapsed
+            else:
+                stats.copy_seconds += elapsed
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self._started
+
+    def to_dict(self, *, success: bool) -> dict[str, Any]:
+        """Return a JSON-serialisable record of the run."""
+        return {
+            "command": self.command,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": round(self.elapsed_seconds, 4),
+            "success": success,
+            "registries": {
+                name: asdict(stats) for name, stats in sorted(self.registries.items())
+            },
+            "refetches": [asdict(r) for r in self.refetches],
+        }
+
+    def append_to(self, history_path: Path, /, *, success: bool) -> None:
+        """Append this run as one JSON line to the history file."""
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with history_path.open("a") as f:
+            f.write(json.dumps(self.to_dict(success=success), sort_keys=True) + "\n")
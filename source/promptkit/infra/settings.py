@@ -0,0 +1,19 @@
+"""Infrastructure layer: Environment-driven settings."""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Machine-level settings read from PROMPTKIT_* environment variables.
+
+    Unlike promptkit.yaml, these describe the environment a command runs in
+    (e.g. a CI fleet's shared cache), not the project.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="PROMPTKIT_")
+
+    remote_cache_url: str | None = None
+    # Opt-in: a sync with unchanged inputs and outputs is skipped, without
+    # pulling, while the registries were pulled less than this many seconds
+    # ago. The default 0 always pulls registries.
+    sync_registry_max_age: float = 0.0
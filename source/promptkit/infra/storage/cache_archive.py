@@ -0,0 +1,213 @@
+"""Infrastructure layer: Portable archives of plugin cache entries."""
+
+import hashlib
+import io
+import json
+import shutil
+import tarfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO, TYPE_CHECKING, Any
+
+from promptkit.domain.errors import SyncError
+from promptkit.infra.storage.cache_catalog import CachedFile
+
+if TYPE_CHECKING:
+    from promptkit.infra.storage.plugin_cache import PluginCache
+
+ARCHIVE_PREFIX = "promptkit-cache-"
+ARCHIVE_SUFFIX = ".tar.gz"
+ARCHIVE_VERSION = 1
+MANIFEST_NAME = "promptkit-cache.json"
+LOCK_HASH_LENGTH = 16
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class EntryKey:
+    """Identifies one cached plugin version."""
+
+    registry: str
+    plugin: str
+    sha: str
+
+    @property
+    def prefix(self) -> str:
+        return f"{self.registry}/{self.plugin}/{self.sha}"
+
+
+def lock_hash(lock_content: str, /) -> str:
+    """Return the content hash that names an archive for a lock file."""
+    return hashlib.sha256(lock_content.encode()).hexdigest()[:LOCK_HASH_LENGTH]
+
+
+def archive_name(lock_content: str, /) -> str:
+    """Return the archive filename for a lock file: promptkit-cache-<hash>.tar.gz."""
+    return f"{ARCHIVE_PREFIX}{lock_hash(lock_content)}{ARCHIVE_SUFFIX}"
+
+
+def export_entries(
+    cache: "PluginCache",
+    keys: list[EntryKey],
+    output: IO[bytes],
+    /,
+    *,
+    lock_content: str | None = None,
+) -> None:
+    """Stream the given cache entries into a gzipped tar archive.
+
+    The archive starts with a JSON manifest listing every file with its size
+    and SHA-256, followed by the files as {registry}/{plugin}/{sha}/{path}.
+    Files are read through the cache, so packed entries are exported without
+    being unpacked.
+    """
+    listed = [
+        (key, cache.catalog.files(key.registry, key.plugin, key.sha)) for key in keys
+    ]
+    manifest = {
+        "version": ARCHIVE_VERSION,
+        "lock_hash": None if lock_content is None else lock_hash(lock_content),
+        "entries": [
+            {
+                "registry": key.registry,
+                "plugin": key.plugin,
+                "sha": key.sha,
+                "files": [
+                    {"path": f.path, "size": f.size, "sha256": f.sha256} for f in files
+                ],
+            }
+            for key, files in listed
+        ],
+    }
+    manifest_bytes = json.dumps(manifest, indent=2, sort_keys=True).encode()
+
+    with tarfile.open(fileobj=output, mode="w|gz") as archive:
+        info = tarfile.TarInfo(MANIFEST_NAME)
+        info.size = len(manifest_bytes)
+        archive.addfile(info, io.BytesIO(manifest_bytes))
+        for key, files in listed:
+            for cached in files:
+                info = tarfile.TarInfo(f"{key.prefix}/{cached.path}")
+                info.size = cached.size
+                with cache.open_file(
+                    key.registry, key.plugin, key.sha, cached.path
+                ) as f:
+                    archive.addfile(info, f)
+
+
+def import_archive(cache: "PluginCache", source: IO[bytes], /) -> list[EntryKey]:
+    """Restore cache entries from an archive written by export_entries().
+
+    Every file is checked against the manifest's size and SHA-256 before the
+    entry is moved into place. Entries already in the cache are left alone.
+
+    Raises:
+        SyncError: If the archive is malformed or any file fails verification.
+    """
+    try:
+        with tarfile.open(fileobj=source, mode="r|gz") as archive:
+            return _import_members(cache, archive)
+    except (tarfile.TarError, OSError, ValueError, KeyError, TypeError) as e:
+        raise SyncError(f"Invalid cache archive: {e}") from e
+
+
+def _import_members(
+    cache: "PluginCache", archive: tarfile.TarFile, /
+) -> list[EntryKey]:
+    members = iter(archive)
+    first = next(members, None)
+    if first is None or first.name != MANIFEST_NAME:
+        raise SyncError(f"Invalid cache archive: missing {MANIFEST_NAME}")
+    expected = _read_manifest(archive, first)
+
+    received: dict[str, set[str]] = {prefix: set() for prefix in expected}
+    for member in members:
+        prefix, path = _split_member_name(member.name)
+        entry = expected.get(prefix)
+        if entry is None or path not in entry[1] or not member.isfile():
+            raise SyncError(f"Unexpected file in cache archive: {member.name}")
+        key, files = entry
+        staging = cache.staging_dir(key.registry, key.plugin, key.sha)
+        if not received[prefix]:
+            shutil.rmtree(staging, ignore_errors=True)
+        _extract_verified(archive, member, staging / path, files[path])
+        received[prefix].add(path)
+
+    imported: list[EntryKey] = []
+    for prefix, (key, files) in expected.items():
+        missing = set(files) - received[prefix]
+        if missing:
+            raise SyncError(
+                f"Cache archive is incomplete for {prefix}: "
+                f"missing {', '.join(sorted(missing))}"
+            )
+        entry_dir = cache.plugin_dir(key.registry, key.plugin, key.sha)
+        staging = cache.staging_dir(key.registry, key.plugin, key.sha)
+        if cache.has_local(key.registry, key.plugin, key.sha):
+            shutil.rmtree(staging, ignore_errors=True)
+            continue
+        staging.mkdir(parents=True, exist_ok=True)
+        staging.rename(entry_dir)
+        cache.register(key.registry, key.plugin, key.sha)
+        imported.append(key)
+    return imported
+
+
+def _read_manifest(
+    archive: tarfile.TarFile, member: tarfile.TarInfo, /
+) -> dict[str, tuple[EntryKey, dict[str, CachedFile]]]:
+    """Parse the manifest into {prefix: (key, {path: CachedFile})}."""
+    reader = archive.extractfile(member)
+    if reader is None:
+        raise SyncError(f"Invalid cache archive: unreadable {MANIFEST_NAME}")
+    data: dict[str, Any] = json.loads(reader.read())
+    if data.get("version") != ARCHIVE_VERSION:
+        raise SyncError(f"Unsupported cache archive version: {data.get('version')!r}")
+    expected: dict[str, tuple[EntryKey, dict[str, CachedFile]]] = {}
+    for raw in data["entries"]:
+        key = EntryKey(raw["registry"], raw["plugin"], raw["sha"])
+        for part in (key.registry, key.plugin, key.sha):
+            _check_safe_path(part)
+            if "/" in part:
+                raise SyncError(f"Unsafe path in cache archive: {part!r}")
+        files: dict[str, CachedFile] = {}
+        for f in raw["files"]:
+            _check_safe_path(f["path"])
+            files[f["path"]] = CachedFile(f["path"], f["size"], f["sha256"])
+        expected[key.prefix] = (key, files)
+    return expected
+
+
+def _extract_verified(
+    archive: tarfile.TarFile,
+    member: tarfile.TarInfo,
+    target: Path,
+    cached: CachedFile,
+    /,
+) -> None:
+    """Write one archive member to target, verifying size and SHA-256."""
+    reader = archive.extractfile(member)
+    if reader is None or member.size != cached.size:
+        raise SyncError(f"Size mismatch in cache archive: {member.name}")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    hasher = hashlib.sha256()
+    with target.open("wb") as out:
+        while chunk := reader.read(COPY_CHUNK_SIZE):
+            hasher.update(chunk)
+            out.write(chunk)
+    if hasher.hexdigest() != cached.sha256:
+        raise SyncError(f"Hash mismatch in cache archive: {member.name}")
+
+
+def _split_member_name(name: str, /) -> tuple[str, str]:
+    """Split 'registry/plugin/sha/path' into ('registry/plugin/sha', 'path')."""
+    parts = name.split("/", 3)
+    if len(parts) != 4:
+        return name, ""
+    return "/".join(parts[:3]), parts[3]
+
+
+def _check_safe_path(path: str, /) -> None:
+    pure = PurePosixPath(path)
+    if not path or pure.is_absolute() or ".." in pure.parts or "\\" in path:
+        raise SyncError(f"Unsafe path in cache archive: {path!r}")
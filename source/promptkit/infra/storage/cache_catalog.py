@@ -0,0 +1,273 @@
+"""Infrastructure layer: SQLite catalog indexing the plugin cache."""
+
+import functools
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Concatenate
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS entries (
+    registry TEXT NOT NULL,
+    plugin TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    total_size INTEGER NOT NULL,
+    packed INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (registry, plugin, sha)
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used_at);
+CREATE TABLE IF NOT EXISTS files (
+    registry TEXT NOT NULL,
+    plugin TEXT NOT NULL,
+    sha TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (registry, plugin, sha, path)
+);
+"""
+
+
+_ENTRY_COLUMNS = "registry, plugin, sha, file_count, total_size, last_used_at, packed"
+
+
+@dataclass(frozen=True)
+class CachedFile:
+    """A single file recorded for a cache entry."""
+
+    path: str
+    size: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """A cached plugin version as recorded in the catalog."""
+
+    registry: str
+    plugin: str
+    sha: str
+    file_count: int
+    total_size: int
+    last_used_at: float
+    packed: bool = False
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Aggregate size of the plugin cache."""
+
+    entry_count: int
+    file_count: int
+    total_size: int
+    packed_count: int = 0
+
+
+def _synchronized[**P, R](
+    method: Callable[Concatenate["CacheCatalog", P], R], /
+) -> Callable[Concatenate["CacheCatalog", P], R]:
+    """Run a catalog method while holding the catalog's lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: "CacheCatalog", *args: P.args, **kwargs: P.kwargs) -> R:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class CacheCatalog:
+    """Index of cached plugin versions backed by a SQLite database.
+
+    Records every cache entry with its file list, sizes, hashes and
+    last-used timestamp so lookups and GC are queries, not directory walks.
+    One connection is shared by all threads; calls are serialised by a lock.
+    The database is created on first write; reads against a missing
+    database behave as an empty catalog. The catalog is derived data:
+    an unknown schema version is dropped and rebuilt from disk on demand.
+    """
+
+    def __init__(self, db_path: Path, /) -> None:
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    @_synchronized
+    def get(self, registry: str, plugin: str, sha: str, /) -> CatalogEntry | None:
+        """Return the catalog row for an entry, or None if not recorded."""
+        conn = self._connect(create=False)
+        if conn is None:
+            return None
+        row = conn.execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM entries "
+            "WHERE registry = ? AND plugin = ? AND sha = ?",
+            (registry, plugin, sha),
+        ).fetchone()
+        return _entry_from_row(row) if row else None
+
+    @_synchronized
+    def variants(self, registry: str, plugin: str, sha: str, /) -> list[str]:
+        """Return the cache keys stored for a commit: sha itself and sha-<filter>."""
+        conn = self._connect(create=False)
+        if conn is None:
+            return []
+        rows = conn.execute(
+            "SELECT sha FROM entries WHERE registry = ? AND plugin = ? "
+            "AND (sha = ? OR substr(sha, 1, ?) = ?) ORDER BY sha",
+            (registry, plugin, sha, len(sha) + 1, f"{sha}-"),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    @_synchronized
+    def add(
+        self,
+        registry: str,
+        plugin: str,
+        sha: str,
+        files: list[CachedFile],
+        /,
+        *,
+        packed: bool = False,
+    ) -> None:
+        """Record an entry and its files, replacing any previous record."""
+        conn = self._require_connection()
+        now = time.time()
+        key = (registry, plugin, sha)
+        with conn:
+            self._delete(conn, key)
+            conn.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, len(files), sum(f.size for f in files), packed, now, now),
+            )
+            conn.executemany(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                [(*key, f.path, f.size, f.sha256) for f in files],
+            )
+
+    @_synchronized
+    def remove(self, registry: str, plugin: str, sha: str, /) -> None:
+        """Forget an entry and its files."""
+        conn = self._connect(create=False)
+        if conn is None:
+            return
+        with conn:
+            self._delete(conn, (registry, plugin, sha))
+
+    @_synchronized
+    def files(self, registry: str, plugin: str, sha: str, /) -> list[CachedFile]:
+        """Return the recorded files of an entry, sorted by path."""
+        conn = self._connect(create=False)
+        if conn is None:
+            return []
+        rows = conn.execute(
+            "SELECT path, size, sha256 FROM files "
+            "WHERE registry = ? AND plugin = ? AND sha = ? ORDER BY path",
+            (registry, plugin, sha),
+        ).fetchall()
+        return [CachedFile(*row) for row in rows]
+
+    @_synchronized
+    def touch(
+        self, registry: str, plugin: str, sha: str, /, *, now: float | None = None
+    ) -> None:
+        """Update the last-used timestamp of an entry."""
+        conn = self._connect(create=False)
+        if conn is None:
+            return
+        with conn:
+            conn.execute(
+                "UPDATE entries SET last_used_at = ? "
+                "WHERE registry = ? AND plugin = ? AND sha = ?",
+                (time.time() if now is None else now, registry, plugin, sha),
+            )
+
+    @_synchronized
+    def set_packed(self, registry: str, plugin: str, sha: str, packed: bool, /) -> None:
+        """Record which storage tier an entry lives in."""
+        conn = self._require_connection()
+        with conn:
+            conn.execute(
+                "UPDATE entries SET packed = ? "
+                "WHERE registry = ? AND plugin = ? AND sha = ?",
+                (packed, registry, plugin, sha),
+            )
+
+    @_synchronized
+    def entries(self) -> list[CatalogEntry]:
+        """Return all entries, least recently used first."""
+        conn = self._connect(create=False)
+        if conn is None:
+            return []
+        rows = conn.execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM entries "
+            "ORDER BY last_used_at, registry, plugin, sha"
+        ).fetchall()
+        return [_entry_from_row(row) for row in rows]
+
+    @_synchronized
+    def stats(self) -> CacheStats:
+        """Return entry count, file count and total size across the cache."""
+        conn = self._connect(create=False)
+        if conn is None:
+            return CacheStats(entry_count=0, file_count=0, total_size=0)
+        count, files, size, packed = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(file_count), 0), "
+            "COALESCE(SUM(total_size), 0), COALESCE(SUM(packed), 0) FROM entries"
+        ).fetchone()
+        return CacheStats(
+            entry_count=count,
+            file_count=files,
+            total_size=size,
+            packed_count=packed,
+        )
+
+    @_synchronized
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, key: tuple[str, str, str], /) -> None:
+        where = "WHERE registry = ? AND plugin = ? AND sha = ?"
+        conn.execute(f"DELETE FROM files {where}", key)
+        conn.execute(f"DELETE FROM entries {where}", key)
+
+    def _require_connection(self) -> sqlite3.Connection:
+        conn = self._connect(create=True)
+        assert conn is not None
+        return conn
+
+    def _connect(self, *, create: bool) -> sqlite3.Connection | None:
+        if self._conn is not None:
+            return self._conn
+        if not create and not self._db_path.is_file():
+            return None
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=30, check_same_thread=False)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute("DROP TABLE IF EXISTS entries")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn = conn
+        return conn
+
+
+def _entry_from_row(row: tuple[Any, ...], /) -> CatalogEntry:
+    *fields, packed = row
+    return CatalogEntry(*fields, packed=bool(packed))
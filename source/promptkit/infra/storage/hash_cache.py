@@ -0,0 +1,147 @@
+"""Infrastructure layer: Persistent stat-keyed hash cache for local prompts."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+CACHE_VERSION = 2
+RACY_WINDOW_NS = 2_000_000_000
+
+FileDigests = tuple[tuple[str, str], ...]
+PathStamps = tuple[tuple[str, int | None], ...]
+
+
+class HashCache:
+    """Per-file SHA-256 digests keyed by stat, plus the plugin hashes built on them.
+
+    A file is re-read only when its size, mtime_ns or inode changed since the
+    last run. A plugin's content hash is reused as long as its files and their
+    digests are unchanged, so a lock that changes nothing reads no files.
+    Files modified within the last RACY_WINDOW_NS are not cached: a write in
+    the same timestamp tick as the hash would otherwise go unnoticed. It also
+    keeps each local plugin's file list with the stamps of what its listing
+    depended on, so build can reuse the list without walking the plugin.
+
+    The cache is derived data stored as JSON; a missing, unreadable or
+    outdated file reads as empty. save() keeps only the entries looked up
+    since loading, so deleted files and plugins drop out, unless asked to
+    keep the rest. Lookups are safe
+    to make from several threads; each touches only its own keys.
+    """
+
+    def __init__(self, path: Path, /) -> None:
+        self._path = path
+        self._files: dict[str, list[Any]] | None = None
+        self._plugins: dict[str, dict[str, Any]] = {}
+        self._listings: dict[str, dict[str, Any]] = {}
+        self._seen_files: dict[str, list[Any]] = {}
+        self._seen_plugins: dict[str, dict[str, Any]] = {}
+        self._seen_listings: dict[str, dict[str, Any]] = {}
+        self._load_lock = threading.Lock()
+
+    def file_digest(self, path: Path, /) -> str:
+        """Return the hex SHA-256 of a file, reading it only if its stat changed."""
+        return self.file_record(path)[1]
+
+    def file_record(self, path: Path, /) -> tuple[int, str]:
+        """Return the size and hex SHA-256 of a file, as file_digest() does."""
+        files = self._load()
+        key = str(path)
+        st = path.stat()
+        stamp = [st.st_size, st.st_mtime_ns, st.st_ino]
+        cached = files.get(key)
+        if cached is not None and cached[:3] == stamp:
+            digest = cached[3]
+        else:
+            digest = _sha256_file(path)
+        if st.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS:
+            self._seen_files[key] = [*stamp, digest]
+        return st.st_size, digest
+
+    def plugin_hash(
+        self, source: str, digests: FileDigests, compute: Callable[[], str], /
+    ) -> str:
+        """Return the cached hash of a plugin with these file digests, or compute it."""
+        self._load()
+        record = [list(pair) for pair in digests]
+        cached = self._plugins.get(source)
+        if cached is not None and cached["files"] == record:
+            content_hash = cached["hash"]
+        else:
+            content_hash = compute()
+        self._seen_plugins[source] = {"files": record, "hash": content_hash}
+        return content_hash
+
+    def record_listing(
+        self, source: str, files: Iterable[str], stamps: PathStamps, /
+    ) -> None:
+        """Remember a local plugin's file list and the stamps it was listed at."""
+        self._seen_listings[source] = {
+            "files": list(files),
+            "stamps": [list(stamp) for stamp in stamps],
+        }
+
+    def listing(self, source: str, /) -> tuple[tuple[str, ...], PathStamps] | None:
+        """Return the file list and stamps last recorded for a local plugin."""
+        self._load()
+        record = self._listings.get(source)
+        if record is None:
+            return None
+        stamps = tuple((path, mtime) for path, mtime in record["stamps"])
+        return tuple(record["files"]), stamps
+
+    def save(self, *, keep_unseen: bool = False) -> None:
+        """Write the entries used since loading; failures are ignored.
+
+        With keep_unseen, loaded entries not looked up are kept as well, for
+        runs that only look at part of the project (e.g. 'lock --only').
+        """
+        files, plugins = self._seen_files, self._seen_plugins
+        listings = self._seen_listings
+        if keep_unseen:
+            files = {**self._load(), **files}
+            plugins = {**self._plugins, **plugins}
+            listings = {**self._listings, **listings}
+        data = {
+            "version": CACHE_VERSION,
+            "files": files,
+            "plugins": plugins,
+            "listings": listings,
+        }
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(data, sort_keys=True))
+            os.replace(temp_path, self._path)
+        except OSError:
+            pass
+
+    def _load(self) -> dict[str, list[Any]]:
+        with self._load_lock:
+            if self._files is not None:
+                return self._files
+            data = _read_json(self._path)
+            if data.get("version") != CACHE_VERSION:
+                data = {}
+            self._plugins = data.get("plugins", {})
+            self._listings = data.get("listings", {})
+            self._files = files = data.get("files", {})
+            return files
+
+
+def _read_json(path: Path, /) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _sha256_file(path: Path, /) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -0,0 +1,99 @@
+"""Infrastructure layer: On-disk journal of lock entries resolved so far."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from promptkit.domain.lock_entry import LockEntry
+
+JOURNAL_VERSION = 1
+
+
+class LockJournal:
+    """Append-only record of the registry entries a lock run has resolved.
+
+    The first line names the config the run locked (by fingerprint); each
+    later line is one LockEntry, written as soon as it is resolved, so a
+    run that fails partway leaves its completed work behind. A rerun for
+    the same config reads those entries back; one for a different config
+    starts a new journal. Lines cut short by a crash are ignored.
+
+    The journal is derived data stored as JSON lines; discard() removes it
+    once the lock file is written.
+    """
+
+    def __init__(self, path: Path, /) -> None:
+        self._path = path
+
+    def start(self, config_key: str, /) -> dict[str, LockEntry]:
+        """Begin a run for a config, returning the entries journaled for it.
+
+        Entries are keyed by source. A journal for another config is
+        replaced by an empty one.
+        """
+        entries: dict[str, LockEntry] = {}
+        header = {"version": JOURNAL_VERSION, "config": config_key}
+        text = _read_text(self._path)
+        lines = _parse_lines(text)
+        if lines and lines[0] == header:
+            for line in lines[1:]:
+                entry = _parse_entry(line)
+                if entry is not None:
+                    entries[entry.source] = entry
+            if not text.endswith("\n"):
+                # Keep the next record off the line a crash cut short
+                with self._path.open("a") as f:
+                    f.write("\n")
+            return entries
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_text(json.dumps(header) + "\n")
+        return entries
+
+    def record(self, entry: LockEntry, /) -> None:
+        """Append a resolved entry to the journal."""
+        data = {
+            "name": entry.name,
+            "source": entry.source,
+            "hash": entry.content_hash,
+            "fetched_at": entry.fetched_at.isoformat(),
+            "commit_sha": entry.commit_sha,
+            "tree_id": entry.tree_id,
+        }
+        with self._path.open("a") as f:
+            f.write(json.dumps(data) + "\n")
+
+    def discard(self) -> None:
+        """Remove the journal after a completed run."""
+        self._path.unlink(missing_ok=True)
+
+
+def _read_text(path: Path, /) -> str:
+    try:
+        return path.read_text()
+    except OSError:
+        return ""
+
+
+def _parse_lines(text: str, /) -> list[Any]:
+    lines: list[Any] = []
+    for line in text.splitlines():
+        try:
+            lines.append(json.loads(line))
+        except ValueError:
+            continue
+    return lines
+
+
+def _parse_entry(data: Any, /) -> LockEntry | None:
+    try:
+        return LockEntry(
+            name=data["name"],
+            source=data["source"],
+            content_hash=data["hash"],
+            fetched_at=datetime.fromisoformat(data["fetched_at"]),
+            commit_sha=data["commit_sha"],
+            tree_id=data["tree_id"],
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
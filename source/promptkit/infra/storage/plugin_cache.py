@@ -1,36 +1,334 @@
 """Infrastructure layer: Directory-based plugin cache for registry plugins."""
 
+import hashlib
+import http.client
+import os
+import shutil
+import tempfile
+import time
+import zipfile
 from pathlib import Path
+from typing import IO
+
+from promptkit.domain.errors import SyncError
+from promptkit.infra.file_system.tree_walker import WalkEntry, walk_files
+from promptkit.infra.storage.cache_archive import (
+    EntryKey,
+    export_entries,
+    import_archive,
+)
+from promptkit.infra.storage.cache_catalog import (
+    CacheCatalog,
+    CachedFile,
+    CacheStats,
+    CatalogEntry,
+)
+from promptkit.infra.storage.remote_cache import RemoteCache
+
+CATALOG_FILENAME = ".catalog.sqlite3"
+PACK_SUFFIX = ".zip"
+TEMP_SUFFIX = ".tmp"
+HASH_CHUNK_SIZE = 1024 * 1024
+UPLOAD_SPOOL_SIZE = 8 * 1024 * 1024
 
 
 class PluginCache:
     """Directory-based cache for registry plugin file trees.
 
-    Cache structure: {cache_dir}/{registry}/{plugin}/{commit_sha}/
-    Fetchers write directly to the directory returned by plugin_dir().
-    This class provides path resolution and existence checks.
+    Cache structure: {cache_dir}/{registry}/{plugin}/{key}/, where key is the
+    commit SHA, or {commit_sha}-{filter digest} for a filtered fetch (see
+    FileFilter.cache_key).
+    Fetchers write directly to the directory returned by plugin_dir() and
+    then call register() to record the entry in the catalog. Lookups go
+    through the catalog; entries found on disk but missing from the catalog
+    (e.g. written by an older version) are indexed on first access.
+
+    Entries live in one of two tiers. Hot entries are plain directories.
+    Cold entries are packed into a single compressed zip per entry at
+    {cache_dir}/{registry}/{plugin}/{commit_sha}.zip, whose central
+    directory gives random access to individual files. unpacked_dir()
+    moves a cold entry back to the hot tier on first use.
+
+    An optional RemoteCache sits behind the local tiers: has() checks the
+    local cache first, then downloads the entry from the remote, and only
+    then reports a miss so the caller fetches from the registry. Fetchers
+    call publish() after populating an entry to share it with other machines.
     """
 
-    def __init__(self, cache_dir: Path, /) -> None:
+    def __init__(
+        self, cache_dir: Path, /, *, remote: RemoteCache | None = None
+    ) -> None:
         self._cache_dir = cache_dir
+        self._catalog = CacheCatalog(cache_dir / CATALOG_FILENAME)
+        self._remote = remote
 
     @property
     def cache_dir(self) -> Path:
         return self._cache_dir
 
+    @property
+    def catalog(self) -> CacheCatalog:
+        return self._catalog
+
     def has(self, registry: str, plugin: str, sha: str, /) -> bool:
-        """Check if a plugin version is cached."""
-        return self.plugin_dir(registry, plugin, sha).is_dir()
+        """Check if a plugin version is cached locally or in the remote cache.
+
+        A remote hit is downloaded, verified and stored locally before
+        returning True.
+        """
+        return self.has_local(registry, plugin, sha) or self._pull(
+            registry, plugin, sha
+        )
+
+    def has_local(self, registry: str, plugin: str, sha: str, /) -> bool:
+        """Check if a plugin version is cached locally (in either tier)."""
+        entry = self._catalog.get(registry, plugin, sha)
+        if entry is not None:
+            if self._stored_path(entry).exists():
+                return True
+            self._catalog.remove(registry, plugin, sha)
+            return False
+        if self.plugin_dir(registry, plugin, sha).is_dir():
+            self.register(registry, plugin, sha)
+            return True
+        if self.pack_path(registry, plugin, sha).is_file():
+            self._register_pack(registry, plugin, sha)
+            return True
+        return False
 
     def plugin_dir(self, registry: str, plugin: str, sha: str, /) -> Path:
         """Return the cache path for a plugin version."""
         return self._cache_dir / registry / plugin / sha
 
+    def staging_dir(self, registry: str, plugin: str, sha: str, /) -> Path:
+        """Return the scratch directory used to assemble an entry before use."""
+        entry_dir = self.plugin_dir(registry, plugin, sha)
+        return entry_dir.with_name(entry_dir.name + TEMP_SUFFIX)
+
+    def pack_path(self, registry: str, plugin: str, sha: str, /) -> Path:
+        """Return the packed (cold tier) archive path for a plugin version."""
+        return self._cache_dir / registry / plugin / f"{sha}{PACK_SUFFIX}"
+
+    def register(self, registry: str, plugin: str, sha: str, /) -> None:
+        """Index a populated plugin directory in the catalog."""
+        entry_dir = self.plugin_dir(registry, plugin, sha)
+        files = [_describe_file(entry) for entry in walk_files(entry_dir)]
+        self._catalog.add(registry, plugin, sha, files)
+
+    def publish(self, registry: str, plugin: str, sha: str, /) -> bool:
+        """Upload an entry to the remote cache, if one is configured.
+
+        Returns True if the entry was uploaded. Remote failures are ignored:
+        the remote is an optimisation, never a requirement.
+        """
+        if self._remote is None or not self.has_local(registry, plugin, sha):
+            return False
+        with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE) as body:
+            export_entries(self, [EntryKey(registry, plugin, sha)], body)
+            size = body.tell()
+            body.seek(0)
+            try:
+                self._remote.put(registry, plugin, sha, body, size)
+            except (OSError, http.client.HTTPException):
+                return False
+        return True
+
     def list_files(self, registry: str, plugin: str, sha: str, /) -> list[str]:
         """List all files in a cached plugin directory as relative paths."""
-        cache_dir = self.plugin_dir(registry, plugin, sha)
-        if not cache_dir.is_dir():
+        if not self.has(registry, plugin, sha):
             return []
-        return sorted(
-            str(f.relative_to(cache_dir)) for f in cache_dir.rglob("*") if f.is_file()
-        )
+        self._catalog.touch(registry, plugin, sha)
+        return [f.path for f in self._catalog.files(registry, plugin, sha)]
+
+    def open_file(
+        self, registry: str, plugin: str, sha: str, path: str, /
+    ) -> IO[bytes]:
+        """Open one cached file for reading, from either tier."""
+        if self._is_packed(registry, plugin, sha):
+            # The member keeps the archive's file handle alive after close()
+            with zipfile.ZipFile(self.pack_path(registry, plugin, sha)) as archive:
+                return archive.open(path)
+        return (self.plugin_dir(registry, plugin, sha) / path).open("rb")
+
+    def unpacked_dir(self, registry: str, plugin: str, sha: str, /) -> Path:
+        """Return the hot directory for an entry, unpacking it if it is cold."""
+        if self._is_packed(registry, plugin, sha):
+            self.unpack(registry, plugin, sha)
+        return self.plugin_dir(registry, plugin, sha)
+
+    def pack(self, registry: str, plugin: str, sha: str, /) -> None:
+        """Move a hot entry to the cold tier as a single compressed archive."""
+        if not self.has_local(registry, plugin, sha):
+            raise SyncError(f"Cannot pack {registry}/{plugin}@{sha}: not cached")
+        if self._is_packed(registry, plugin, sha):
+            return
+        entry_dir = self.plugin_dir(registry, plugin, sha)
+        pack_path = self.pack_path(registry, plugin, sha)
+        temp_path = pack_path.with_name(pack_path.name + TEMP_SUFFIX)
+        with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for cached in self._catalog.files(registry, plugin, sha):
+                archive.write(entry_dir / cached.path, cached.path)
+        os.replace(temp_path, pack_path)
+        self._catalog.set_packed(registry, plugin, sha, True)
+        shutil.rmtree(entry_dir)
+
+    def unpack(self, registry: str, plugin: str, sha: str, /) -> None:
+        """Move a cold entry back to the hot tier as a plain directory."""
+        if not self.has_local(registry, plugin, sha):
+            raise SyncError(f"Cannot unpack {registry}/{plugin}@{sha}: not cached")
+        if not self._is_packed(registry, plugin, sha):
+            return
+        entry_dir = self.plugin_dir(registry, plugin, sha)
+        pack_path = self.pack_path(registry, plugin, sha)
+        temp_dir = self.staging_dir(registry, plugin, sha)
+        if temp_dir.exists():
+            shutil.rmtree(temp_dir)
+        with zipfile.ZipFile(pack_path) as archive:
+            for cached in self._catalog.files(registry, plugin, sha):
+                target = temp_dir / cached.path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with archive.open(cached.path) as src, target.open("wb") as dst:
+                    shutil.copyfileobj(src, dst)
+        if entry_dir.exists():
+            shutil.rmtree(entry_dir)
+        temp_dir.rename(entry_dir)
+        self._catalog.set_packed(registry, plugin, sha, False)
+        pack_path.unlink()
+
+    def pack_idle(self, *, min_idle_seconds: float = 0) -> list[CatalogEntry]:
+        """Pack every hot entry unused for at least min_idle_seconds."""
+        cutoff = time.time() - min_idle_seconds
+        packed: list[CatalogEntry] = []
+        for entry in self._catalog.entries():
+            if entry.packed or entry.last_used_at > cutoff:
+                continue
+            self.pack(entry.registry, entry.plugin, entry.sha)
+            packed.append(entry)
+        return packed
+
+    def unpack_all(self) -> list[CatalogEntry]:
+        """Unpack every cold entry."""
+        unpacked: list[CatalogEntry] = []
+        for entry in self._catalog.entries():
+            if entry.packed:
+                self.unpack(entry.registry, entry.plugin, entry.sha)
+                unpacked.append(entry)
+        return unpacked
+
+    def reconcile(self) -> None:
+        """Bring the catalog in line with the entries on disk.
+
+        Indexes entries the catalog does not know about and drops catalog
+        rows whose directory or archive has been deleted.
+        """
+        on_disk = set(self._scan_entries())
+        recorded = {(e.registry, e.plugin, e.sha) for e in self._catalog.entries()}
+        for key in sorted(on_disk - recorded):
+            self.has_local(*key)
+        for key in sorted(recorded - on_disk):
+            self._catalog.remove(*key)
+
+    def stats(self) -> CacheStats:
+        """Return entry count, file count and total size of the cache."""
+        return self._catalog.stats()
+
+    def gc(
+        self,
+        *,
+        max_age_seconds: float | None = None,
+        max_size: int | None = None,
+    ) -> list[CatalogEntry]:
+        """Evict least recently used entries.
+
+        Removes entries unused for longer than max_age_seconds, then keeps
+        removing the least recently used until the cache fits in max_size
+        bytes. Returns the evicted entries.
+        """
+        entries = self._catalog.entries()
+        total = sum(e.total_size for e in entries)
+        cutoff = None if max_age_seconds is None else time.time() - max_age_seconds
+        evicted: list[CatalogEntry] = []
+        for entry in entries:
+            too_old = cutoff is not None and entry.last_used_at < cutoff
+            too_big = max_size is not None and total > max_size
+            if not (too_old or too_big):
+                continue
+            self.evict(entry.registry, entry.plugin, entry.sha)
+            total -= entry.total_size
+            evicted.append(entry)
+        return evicted
+
+    def evict(self, registry: str, plugin: str, sha: str, /) -> None:
+        """Remove a plugin version (both tiers) from disk and from the catalog."""
+        entry_dir = self.plugin_dir(registry, plugin, sha)
+        if entry_dir.is_dir():
+            shutil.rmtree(entry_dir)
+        self.pack_path(registry, plugin, sha).unlink(missing_ok=True)
+        self._catalog.remove(registry, plugin, sha)
+        for parent in (entry_dir.parent, entry_dir.parent.parent):
+            if parent.is_dir() and not any(parent.iterdir()):
+                parent.rmdir()
+
+    def _pull(self, registry: str, plugin: str, sha: str, /) -> bool:
+        """Download an entry from the remote cache into the local cache."""
+        if self._remote is None:
+            return False
+        try:
+            response = self._remote.open(registry, plugin, sha)
+            if response is None:
+                return False
+            with response:
+                import_archive(self, response)
+        except (OSError, http.client.HTTPException, SyncError):
+            # A truncated or garbled response is a miss, not a failed build
+            return False
+        return self.has_local(registry, plugin, sha)
+
+    def _is_packed(self, registry: str, plugin: str, sha: str, /) -> bool:
+        entry = self._catalog.get(registry, plugin, sha)
+        return entry is not None and entry.packed
+
+    def _stored_path(self, entry: CatalogEntry, /) -> Path:
+        if entry.packed:
+            return self.pack_path(entry.registry, entry.plugin, entry.sha)
+        return self.plugin_dir(entry.registry, entry.plugin, entry.sha)
+
+    def _register_pack(self, registry: str, plugin: str, sha: str, /) -> None:
+        """Index a packed entry in the catalog from its archive."""
+        files: list[CachedFile] = []
+        with zipfile.ZipFile(self.pack_path(registry, plugin, sha)) as archive:
+            for info in sorted(archive.infolist(), key=lambda i: i.filename):
+                if info.is_dir():
+                    continue
+                hasher = hashlib.sha256()
+                with archive.open(info) as f:
+                    while chunk := f.read(HASH_CHUNK_SIZE):
+                        hasher.update(chunk)
+                files.append(
+                    CachedFile(info.filename, info.file_size, hasher.hexdigest())
+                )
+        self._catalog.add(registry, plugin, sha, files, packed=True)
+
+    def _scan_entries(self) -> list[tuple[str, str, str]]:
+        """List (registry, plugin, sha) for every entry on disk, in either tier."""
+        if not self._cache_dir.is_dir():
+            return []
+        keys: list[tuple[str, str, str]] = []
+        for registry_dir in self._cache_dir.iterdir():
+            if not registry_dir.is_dir():
+                continue
+            for plugin_dir in registry_dir.iterdir():
+                if not plugin_dir.is_dir():
+                    continue
+                for stored in plugin_dir.iterdir():
+                    if stored.is_dir() and not stored.name.endswith(TEMP_SUFFIX):
+                        keys.append((registry_dir.name, plugin_dir.name, stored.name))
+                    elif stored.suffix == PACK_SUFFIX:
+                        keys.append((registry_dir.name, plugin_dir.name, stored.stem))
+        return keys
+
+
+def _describe_file(entry: WalkEntry, /) -> CachedFile:
+    with entry.path.open("rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    return CachedFile(path=entry.relative, size=entry.size, sha256=digest)
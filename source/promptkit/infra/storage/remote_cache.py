@@ -0,0 +1,63 @@
+"""Infrastructure layer: HTTP client for a shared remote plugin cache."""
+
+import urllib.error
+import urllib.request
+from typing import IO
+
+ENTRY_PATH = "v1/entries"
+ENTRY_SUFFIX = ".tar.gz"
+DEFAULT_TIMEOUT = 30.0
+
+
+def entry_path(registry: str, plugin: str, sha: str, /) -> str:
+    """Return the URL path of an entry, relative to the server root."""
+    return f"{ENTRY_PATH}/{registry}/{plugin}/{sha}{ENTRY_SUFFIX}"
+
+
+class RemoteCache:
+    """Content-addressed GET/PUT of plugin cache entries over HTTP.
+
+    Each entry is one archive in the cache export format (see
+    cache_archive), stored at {base_url}/v1/entries/{registry}/{plugin}/{sha}.tar.gz.
+    A commit SHA pins the content, so entries are immutable once written.
+    Network errors surface as OSError or http.client.HTTPException; callers
+    treat the remote as best-effort.
+    """
+
+    def __init__(self, base_url: str, /, *, timeout: float = DEFAULT_TIMEOUT) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    def open(self, registry: str, plugin: str, sha: str, /) -> IO[bytes] | None:
+        """Open a streaming download of an entry, or return None if absent."""
+        try:
+            return urllib.request.urlopen(
+                self._url(registry, plugin, sha), timeout=self._timeout
+            )
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    def put(
+        self, registry: str, plugin: str, sha: str, body: IO[bytes], size: int, /
+    ) -> None:
+        """Upload an entry archive of the given size."""
+        request = urllib.request.Request(
+            self._url(registry, plugin, sha),
+            data=body,
+            method="PUT",
+            headers={
+                "Content-Length": str(size),
+                "Content-Type": "application/gzip",
+            },
+        )
+        with urllib.request.urlopen(request, timeout=self._timeout):
+            pass
+
+    def _url(self, registry: str, plugin: str, sha: str, /) -> str:
+        return f"{self._base_url}/{entry_path(registry, plugin, sha)}"
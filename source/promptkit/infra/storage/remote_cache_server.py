@@ -0,0 +1,116 @@
+"""Infrastructure layer: Reference HTTP server for the remote plugin cache."""
+
+import os
+import shutil
+import tempfile
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from promptkit.infra.storage.remote_cache import ENTRY_PATH, ENTRY_SUFFIX
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class RemoteCacheHandler(BaseHTTPRequestHandler):
+    """Serves GET/HEAD/PUT of entry archives from a directory.
+
+    Stores /v1/entries/{registry}/{plugin}/{sha}.tar.gz as the same relative
+    path under root. PUT writes atomically and never overwrites an existing
+    entry, since entries are addressed by commit SHA and immutable.
+    """
+
+    def __init__(self, *args: object, root: Path, **kwargs: object) -> None:
+        self._root = root
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+
+    def do_HEAD(self) -> None:
+        self._serve(send_body=False)
+
+    def do_GET(self) -> None:
+        self._serve(send_body=True)
+
+    def do_PUT(self) -> None:
+        target = self._resolve()
+        length = self._content_length()
+        if target is None or length is None:
+            self.send_error(HTTPStatus.BAD_REQUEST)
+            return
+        if target.is_file():
+            self._drain(length)
+            self._reply(HTTPStatus.OK)
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as out:
+            remaining = length
+            while remaining > 0:
+                chunk = self.rfile.read(min(COPY_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                out.write(chunk)
+                remaining -= len(chunk)
+        if remaining:
+            os.unlink(temp_name)
+            self._reply(HTTPStatus.BAD_REQUEST)
+            return
+        os.replace(temp_name, target)
+        self._reply(HTTPStatus.CREATED)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence per-request logging; the server is used in tests and CI."""
+
+    def _serve(self, *, send_body: bool) -> None:
+        target = self._resolve()
+        if target is None or not target.is_file():
+            self._reply(HTTPStatus.NOT_FOUND)
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/gzip")
+        self.send_header("Content-Length", str(target.stat().st_size))
+        self.end_headers()
+        if send_body:
+            with target.open("rb") as f:
+                shutil.copyfileobj(f, self.wfile, COPY_CHUNK_SIZE)
+
+    def _resolve(self) -> Path | None:
+        """Map the request path to a file under root, rejecting anything else."""
+        parts = self.path.split("?", 1)[0].strip("/").split("/")
+        if len(parts) != 5 or "/".join(parts[:2]) != ENTRY_PATH:
+            return None
+        registry, plugin, filename = parts[2:]
+        if not filename.endswith(ENTRY_SUFFIX):
+            return None
+        for part in (registry, plugin, filename):
+            if part in ("", ".", "..") or part.startswith("."):
+                return None
+        return self._root.joinpath(*parts)
+
+    def _content_length(self) -> int | None:
+        """Return the request's Content-Length, or None if missing or malformed."""
+        value = self.headers.get("Content-Length", "")
+        if not (value.isascii() and value.isdigit()):
+            return None
+        return int(value)
+
+    def _drain(self, length: int) -> None:
+        while length > 0:
+            chunk = self.rfile.read(min(COPY_CHUNK_SIZE, length))
+            if not chunk:
+                return
+            length -= len(chunk)
+
+    def _reply(self, status: HTTPStatus) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def make_server(root: Path, host: str, port: int, /) -> ThreadingHTTPServer:
+    """Create a remote cache server storing entries under root.
+
+    Pass port 0 to bind an ephemeral port (see server.server_address).
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    return ThreadingHTTPServer((host, port), partial(RemoteCacheHandler, root=root))
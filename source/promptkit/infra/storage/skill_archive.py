@@ -0,0 +1,200 @@
+"""Infrastructure layer: Guarded extraction of zip-packaged skills."""
+
+import os
+import shutil
+import stat
+import threading
+import zipfile
+from collections.abc import Callable
+from pathlib import Path, PurePosixPath
+
+from promptkit.domain.errors import SyncError
+from promptkit.infra.file_system.tree_walker import walk_files
+
+ZIP_SUFFIX = ".zip"
+TEMP_SUFFIX = ".tmp"
+DONE_SUFFIX = ".done"
+COPY_CHUNK_SIZE = 1024 * 1024
+MAX_MEMBER_COUNT = 10_000
+MAX_MEMBER_SIZE = 64 * 1024 * 1024
+MAX_TOTAL_SIZE = 256 * 1024 * 1024
+MAX_COMPRESSION_RATIO = 200
+
+
+def extract_zip(archive_path: Path, target_dir: Path, /) -> tuple[int, int]:
+    """Stream every file in the zip archive at archive_path into target_dir.
+
+    The archive is read from disk and each member is copied chunk by chunk
+    straight to its place under target_dir. Before anything is written,
+    member names are checked for path traversal and the declared sizes
+    against per-file, total and compression-ratio limits; while copying, a
+    member that inflates past its declared size aborts the extraction.
+
+    Returns:
+        Number of files written and their total size in bytes.
+
+    Raises:
+        SyncError: If the archive is malformed, unsafe or over the limits.
+    """
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            members = _checked_members(archive)
+            total = 0
+            for info in members:
+                target = target_dir / info.filename
+                target.parent.mkdir(parents=True, exist_ok=True)
+                total += _copy_member(archive, info, target)
+            return len(members), total
+    except zipfile.BadZipFile as e:
+        raise SyncError(f"Invalid skill archive: {e}") from e
+
+
+class SkillArchiveCache:
+    """Extracted skill archives keyed by the archive's content hash.
+
+    Cache structure: {root}/{digest}/, complete once {root}/{digest}.done
+    exists. An archive is extracted once, in place; later materialisations
+    of any plugin version that ships the same zip link the already-extracted
+    files into place without reading the archive again.
+    """
+
+    _extract_lock = threading.Lock()
+
+    def __init__(self, root: Path, /) -> None:
+        self._root = root
+
+    def entry_dir(self, digest: str, /) -> Path:
+        return self._root / digest
+
+    def has(self, digest: str, /) -> bool:
+        return self._done_marker(digest).is_file()
+
+    def materialize(
+        self,
+        digest: str,
+        write_archive: Callable[[Path], None],
+        target_dir: Path,
+        /,
+        *,
+        strip_root: str = "",
+        keep: Callable[[str], bool] | None = None,
+    ) -> tuple[int, int]:
+        """Place the archive's files in target_dir, extracting only on a miss.
+
+        On a miss, write_archive is called with a path to write the zip to.
+        If the archive holds a single top-level directory named strip_root
+        (e.g. xlsx.zip containing xlsx/SKILL.md), its contents are placed
+        directly in target_dir. If keep is given, only files whose path
+        relative to target_dir it accepts are placed.
+
+        Returns:
+            Number of files placed and their total size in bytes.
+        """
+        if not self.has(digest):
+            with self._extract_lock:
+                if not self.has(digest):
+                    self._extract(digest, write_archive)
+        entry_dir = self.entry_dir(digest)
+        root = entry_dir / strip_root
+        if strip_root and list(entry_dir.iterdir()) == [root] and root.is_dir():
+            return _link_tree(root, target_dir, keep)
+        return _link_tree(entry_dir, target_dir, keep)
+
+    def _extract(self, digest: str, write_archive: Callable[[Path], None], /) -> None:
+        """Extract into the entry dir, removing it again if extraction fails.
+
+        A partial entry left by an interrupted run has no marker and is
+        cleared first.
+        """
+        entry_dir = self.entry_dir(digest)
+        archive_path = self._root / f"{digest}{ZIP_SUFFIX}{TEMP_SUFFIX}"
+        if entry_dir.exists():
+            shutil.rmtree(entry_dir)
+        entry_dir.mkdir(parents=True)
+        try:
+            write_archive(archive_path)
+            extract_zip(archive_path, entry_dir)
+        except BaseException:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            raise
+        finally:
+            archive_path.unlink(missing_ok=True)
+        self._done_marker(digest).touch()
+
+    def _done_marker(self, digest: str, /) -> Path:
+        return self._root / f"{digest}{DONE_SUFFIX}"
+
+
+def _checked_members(archive: zipfile.ZipFile, /) -> list[zipfile.ZipInfo]:
+    """Return the archive's file members after safety and size checks."""
+    infos = archive.infolist()
+    if len(infos) > MAX_MEMBER_COUNT:
+        raise SyncError(f"Skill archive has too many entries ({len(infos)})")
+    members: list[zipfile.ZipInfo] = []
+    total = 0
+    for info in infos:
+        _check_safe_name(info.filename)
+        if info.is_dir():
+            continue
+        if stat.S_ISLNK(info.external_attr >> 16):
+            raise SyncError(f"Symlink in skill archive: {info.filename!r}")
+        if info.file_size > MAX_MEMBER_SIZE:
+            raise SyncError(f"Skill archive entry too large: {info.filename!r}")
+        if info.file_size > MAX_COMPRESSION_RATIO * max(info.compress_size, 1):
+            raise SyncError(
+                f"Suspicious compression ratio in skill archive: {info.filename!r}"
+            )
+        total += info.file_size
+        if total > MAX_TOTAL_SIZE:
+            raise SyncError("Skill archive exceeds the maximum extracted size")
+        members.append(info)
+    return members
+
+
+def _check_safe_name(name: str, /) -> None:
+    pure = PurePosixPath(name)
+    if (
+        not name
+        or pure.is_absolute()
+        or ".." in pure.parts
+        or "\\" in name
+        or ":" in pure.parts[0]
+    ):
+        raise SyncError(f"Unsafe path in skill archive: {name!r}")
+
+
+def _copy_member(
+    archive: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path, /
+) -> int:
+    """Stream one member to target, refusing to write past its declared size."""
+    written = 0
+    with archive.open(info) as source, target.open("wb") as out:
+        while chunk := source.read(COPY_CHUNK_SIZE):
+            written += len(chunk)
+            if written > info.file_size:
+                raise SyncError(
+                    f"Skill archive entry larger than declared: {info.filename!r}"
+                )
+            out.write(chunk)
+    if info.external_attr >> 16 & 0o111:
+        os.chmod(target, 0o755)
+    return written
+
+
+def _link_tree(
+    source_dir: Path, target_dir: Path, keep: Callable[[str], bool] | None, /
+) -> tuple[int, int]:
+    """Hard-link (or copy, across devices) the kept files of source into target."""
+    count = total = 0
+    for entry in walk_files(source_dir):
+        if keep is not None and not keep(entry.relative):
+            continue
+        target = target_dir / entry.relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(entry.path, target)
+        except OSError:
+            shutil.copy2(entry.path, target)
+        count += 1
+        total += entry.size
+    return count, total
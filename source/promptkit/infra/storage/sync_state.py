@@ -0,0 +1,142 @@
+"""Infrastructure layer: Fingerprint of the last successful sync."""
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from promptkit.infra.file_system.tree_walker import walk_files
+
+STATE_VERSION = 1
+RACY_WINDOW_NS = 2_000_000_000
+CONFIG_FILENAME = "promptkit.yaml"
+LOCK_FILENAME = "promptkit.lock"
+PROMPTS_DIR = "prompts"
+MANAGED_DIR = ".promptkit/managed"
+
+
+class SyncState:
+    """Remembers what the last successful sync read and wrote.
+
+    The fingerprint covers promptkit.yaml, the local configs it extends and
+    promptkit.lock byte for byte, the path, size and mtime of every file
+    under prompts/, the HEAD commit of each registry clone and the build
+    manifests. The artifacts the sync wrote are remembered by size and
+    mtime. While all of these match and the registries were pulled less
+    than max_registry_age seconds ago, another sync would change nothing.
+
+    Computing the fingerprint stats the local prompts and reads two small
+    files and the manifests; it never hashes prompt contents. A sync that
+    saw a prompt file modified within RACY_WINDOW_NS is not recorded, since
+    a later write in the same timestamp tick would go unnoticed.
+
+    The state is derived data stored as JSON; a missing, unreadable or
+    outdated file never matches.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        project_dir: Path,
+        /,
+        *,
+        registry_heads: Callable[[], Mapping[str, str]],
+        base_configs: Callable[[], Iterable[Path]] = tuple,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = path
+        self._project_dir = project_dir
+        self._registry_heads = registry_heads
+        self._base_configs = base_configs
+        self._clock = clock
+
+    def is_current(self, *, max_registry_age: float) -> bool:
+        """Whether nothing a sync reads or writes changed since it last ran."""
+        state = _read_json(self._path)
+        if state.get("version") != STATE_VERSION:
+            return False
+        try:
+            synced_at = float(state["synced_at"])
+            fingerprint = str(state["fingerprint"])
+            artifacts = dict(state["artifacts"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        heads = self._registry_heads()
+        if heads and self._clock() - synced_at >= max_registry_age:
+            return False
+        if fingerprint != self._fingerprint(heads)[0]:
+            return False
+        return all(_stamp(Path(path)) == stamp for path, stamp in artifacts.items())
+
+    def record(self, artifacts: Iterable[Path], /) -> None:
+        """Remember the current fingerprint and artifacts; failures are ignored."""
+        fingerprint, newest_ns = self._fingerprint(self._registry_heads())
+        now = self._clock()
+        if newest_ns >= int(now * 1e9) - RACY_WINDOW_NS:
+            self.clear()
+            return
+        data = {
+            "version": STATE_VERSION,
+            "fingerprint": fingerprint,
+            "synced_at": now,
+            "artifacts": {str(path): _stamp(path) for path in artifacts},
+        }
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(data, sort_keys=True))
+            os.replace(temp_path, self._path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Forget the last sync, so the next one runs in full."""
+        self._path.unlink(missing_ok=True)
+
+    def _fingerprint(self, heads: Mapping[str, str], /) -> tuple[str, int]:
+        """Return the fingerprint and the newest prompt file mtime_ns."""
+        hasher = hashlib.sha256()
+        for filename in (CONFIG_FILENAME, LOCK_FILENAME):
+            hasher.update(f"{filename}\n".encode())
+            hasher.update(_read_bytes(self._project_dir / filename))
+        for base in self._base_configs():
+            hasher.update(f"base {base}\n".encode())
+            hasher.update(_read_bytes(base))
+        newest_ns = 0
+        for entry in walk_files(self._project_dir / PROMPTS_DIR):
+            hasher.update(
+                f"{entry.relative}\0{entry.size}\0{entry.mtime_ns}\n".encode()
+            )
+            newest_ns = max(newest_ns, entry.mtime_ns)
+        for name, sha in sorted(heads.items()):
+            hasher.update(f"registry {name}\0{sha}\n".encode())
+        for entry in walk_files(self._project_dir / MANAGED_DIR):
+            hasher.update(f"manifest {entry.relative}\n".encode())
+            hasher.update(_read_bytes(entry.path))
+        return hasher.hexdigest(), newest_ns
+
+
+def _stamp(path: Path, /) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _read_bytes(path: Path, /) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b"\0missing"
+
+
+def _read_json(path: Path, /) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
@@ -0,0 +1,76 @@
+"""Tests for AddPrompts use case."""
+
+from pathlib import Path
+
+import pytest
+
+from promptkit.app.add import AddPrompts
+from promptkit.app.project_context import ProjectContext
+from promptkit.domain.errors import ValidationError
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_loader import YamlLoader
+from promptkit.infra.file_system.local import FileSystem
+
+CONFIG = """\
+version: 1
+registries:
+  my-registry: https://example.com/registry
+# Prompts shared by the team
+prompts:
+  - my-registry/one  # keep first
+"""
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    (tmp_path / "promptkit.yaml").write_text(CONFIG)
+    return tmp_path
+
+
+def _add(project_dir: Path, *sources: str) -> list[str]:
+    context = ProjectContext(
+        file_system=FileSystem(), yaml_loader=YamlLoader(), lock_file=LockFile()
+    )
+    return AddPrompts(project_context=context).execute(project_dir, sources)
+
+
+class TestAddPrompts:
+    def test_appends_new_sources(self, project_dir: Path) -> None:
+        added = _add(project_dir, "my-registry/two", "my-registry/three")
+
+        assert added == ["my-registry/two", "my-registry/three"]
+        assert (project_dir / "promptkit.yaml").read_text() == (
+            CONFIG + "  - my-registry/two\n  - my-registry/three\n"
+        )
+
+    def test_skips_configured_sources(self, project_dir: Path) -> None:
+        added = _add(
+            project_dir, "my-registry/one", "my-registry/two", "my-registry/two"
+        )
+
+        assert added == ["my-registry/two"]
+        assert (project_dir / "promptkit.yaml").read_text().count("two") == 1
+
+    def test_nothing_new_leaves_config_untouched(self, project_dir: Path) -> None:
+        assert _add(project_dir, "my-registry/one") == []
+        assert (project_dir / "promptkit.yaml").read_text() == CONFIG
+
+    @pytest.mark.parametrize(
+        ("source", "message"),
+        [
+            ("no-slash", "expected 'registry/name'"),
+            ("local/rules/my-rule", "included automatically"),
+            ("other-registry/one", "undefined registry 'other-registry'"),
+        ],
+    )
+    def test_rejects_invalid_sources(
+        self, project_dir: Path, source: str, message: str
+    ) -> None:
+        with pytest.raises(ValidationError, match=message):
+            _add(project_dir, "my-registry/two", source)
+
+        assert (project_dir / "promptkit.yaml").read_text() == CONFIG
+
+    def test_missing_config_fails(self, tmp_path: Path) -> None:
+        with pytest.raises(ValidationError, match="promptkit init"):
+            _add(tmp_path, "my-registry/one")
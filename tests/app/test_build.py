@@ -1,19 +1,30 @@
 """Tests for BuildArtifacts use case."""
 
+import os
+from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from promptkit.app.build import BuildArtifacts
 from promptkit.domain.errors import BuildError
+from promptkit.domain.file_filter import FileFilter
+from promptkit.domain.lock_entry import LockedFile, LockEntry
 from promptkit.domain.platform_target import PlatformTarget
 from promptkit.domain.plugin import Plugin
-from promptkit.domain.protocols import ArtifactBuilder
+from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.domain.protocols import ArtifactBuilder, PluginFetcher
+from promptkit.domain.resolved_plugin import ResolvedPlugin
 from promptkit.infra.builders.claude_builder import ClaudeBuilder
 from promptkit.infra.builders.cursor_builder import CursorBuilder
 from promptkit.infra.config.lock_file import LockFile
 from promptkit.infra.config.yaml_loader import YamlLoader
+from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
 from promptkit.infra.file_system.local import FileSystem
+from promptkit.infra.file_system.tree_walker import walk_files
+from promptkit.infra.run_stats import RunStats
+from promptkit.infra.storage.hash_cache import HashCache
 from promptkit.infra.storage.plugin_cache import PluginCache
 
 CONFIG_BOTH_PLATFORMS = """\
@@ -44,6 +55,10 @@ class FakeBuilder:
     def platform(self) -> PlatformTarget:
         return self._platform
 
+    @property
+    def routable_categories(self) -> frozenset[str]:
+        return frozenset({"rules", "agents"})
+
     def build(
         self, plugins: list[Plugin], output_dir: Path, project_dir: Path, /
     ) -> list[Path]:
@@ -61,9 +76,46 @@ def project_dir(tmp_path: Path) -> Path:
     return d
 
 
+class FakeMaterializer:
+    """Test double for PluginFetcher that writes plugin files on materialise."""
+
+    def __init__(self, cache: PluginCache, files: dict[str, str]) -> None:
+        self._cache = cache
+        self._files = files
+        self.materialized: list[tuple[str, str]] = []
+
+    def resolve(self, spec: PromptSpec, /) -> ResolvedPlugin:
+        raise AssertionError("build must not resolve")
+
+    def materialize(
+        self,
+        spec: PromptSpec,
+        commit_sha: str,
+        /,
+        *,
+        file_filter: FileFilter | None = None,
+    ) -> Plugin:
+        self.materialized.append((spec.source, commit_sha))
+        self.file_filter = file_filter
+        registry, name = spec.source.split("/", 1)
+        target = self._cache.plugin_dir(registry, name, commit_sha)
+        for path, content in self._files.items():
+            (target / path).parent.mkdir(parents=True, exist_ok=True)
+            (target / path).write_text(content)
+        return Plugin(
+            spec=spec,
+            files=tuple(sorted(self._files)),
+            source_dir=target,
+            commit_sha=commit_sha,
+        )
+
+
 def _make_build(
     project_dir: Path,
     builders: dict[PlatformTarget, ArtifactBuilder] | None = None,
+    fetchers: dict[str, PluginFetcher] | None = None,
+    stats: RunStats | None = None,
+    hash_cache: HashCache | None = None,
 ) -> BuildArtifacts:
     fs = FileSystem()
     if builders is None:
@@ -77,6 +129,9 @@ def _make_build(
         lock_file=LockFile(),
         plugin_cache=PluginCache(project_dir / ".promptkit" / "cache" / "plugins"),
         builders=builders,
+        fetchers=fetchers,
+        stats=stats,
+        hash_cache=hash_cache,
     )
 
 
@@ -153,6 +208,167 @@ class TestBuildLocalPlugin:
             project_dir / ".claude" / "skills" / "my-skill" / "scripts" / "check.sh"
         ).read_text() == "#!/bin/bash"
 
+    def test_skips_files_matched_by_promptkitignore(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_BOTH_PLATFORMS)
+        skill_dir = project_dir / "prompts" / "skills" / "my-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / ".promptkitignore").write_text("*.tmp\n")
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "scratch.tmp").write_text("scratch")
+        _write_lock(
+            project_dir,
+            [
+                {
+                    "name": "my-skill",
+                    "source": "local/skills/my-skill",
+                    "hash": "sha256:abc",
+                },
+            ],
+        )
+
+        _make_build(project_dir).execute(project_dir)
+
+        built = project_dir / ".claude" / "skills" / "my-skill"
+        assert sorted(p.name for p in built.iterdir()) == ["SKILL.md"]
+
+
+HASH_CACHE_FILE = ".promptkit/hashes.json"
+WALK_FILES = "promptkit.infra.fetchers.local_plugin_fetcher.walk_files"
+OLD_MTIME_NS = 1_700_000_000_000_000_000
+
+
+def _backdate(root: Path) -> None:
+    """Move every mtime under root well out of the racy window."""
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+class TestBuildFromLockedFiles:
+    def _write_skill(self, project_dir: Path) -> Path:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_BOTH_PLATFORMS)
+        skill_dir = project_dir / "prompts" / "skills" / "my-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "notes.md").write_text("notes")
+        return skill_dir
+
+    def _lock_skill(self, project_dir: Path) -> None:
+        """Lock the skill as lock does: its file list, plus its listing's stamps."""
+        prompts_dir = project_dir / "prompts"
+        _backdate(prompts_dir)
+        fetcher = LocalPluginFetcher(FileSystem(), prompts_dir)
+        plugin = fetcher.fetch(PromptSpec(source="local/skills/my-skill"))
+        stamps = fetcher.listing_stamps(plugin.source)
+        assert stamps is not None
+        hash_cache = HashCache(project_dir / HASH_CACHE_FILE)
+        hash_cache.record_listing(plugin.source, plugin.files, stamps)
+        hash_cache.save()
+        entry = LockEntry(
+            name="my-skill",
+            source=plugin.source,
+            content_hash="sha256:abc",
+            fetched_at=datetime(2026, 2, 9, 12, 0, tzinfo=timezone.utc),
+            files=tuple(LockedFile(path, 0, "") for path in plugin.files),
+        )
+        (project_dir / "promptkit.lock").write_text(LockFile.serialize([entry]))
+
+    def _build(self, project_dir: Path) -> list[str]:
+        """Build with the project's hash cache; return the built skill's files."""
+        hash_cache = HashCache(project_dir / HASH_CACHE_FILE)
+        _make_build(project_dir, hash_cache=hash_cache).execute(project_dir)
+        built = project_dir / ".claude" / "skills" / "my-skill"
+        return sorted(p.relative_to(built).as_posix() for p in built.rglob("*.*"))
+
+    def test_builds_listed_files_without_listing_again(self, project_dir: Path) -> None:
+        self._write_skill(project_dir)
+        self._lock_skill(project_dir)
+
+        with (
+            patch(WALK_FILES) as walk,
+            patch.object(LocalPluginFetcher, "fetch") as fetch,
+        ):
+            built = self._build(project_dir)
+
+        walk.assert_not_called()
+        fetch.assert_not_called()
+        assert built == ["SKILL.md", "notes.md"]
+
+    def test_lists_plugin_when_a_file_was_added_after_lock(
+        self, project_dir: Path
+    ) -> None:
+        skill_dir = self._write_skill(project_dir)
+        self._lock_skill(project_dir)
+        (skill_dir / "extra.md").write_text("extra")
+
+        assert self._build(project_dir) == ["SKILL.md", "extra.md", "notes.md"]
+
+    def test_lists_plugin_when_a_file_was_removed_after_lock(
+        self, project_dir: Path
+    ) -> None:
+        skill_dir = self._write_skill(project_dir)
+        self._lock_skill(project_dir)
+        (skill_dir / "notes.md").unlink()
+
+        assert self._build(project_dir) == ["SKILL.md"]
+
+    def test_reports_a_listed_file_missing_when_copied(self, project_dir: Path) -> None:
+        skill_dir = self._write_skill(project_dir)
+        self._lock_skill(project_dir)
+        (skill_dir / "notes.md").unlink()
+        os.utime(skill_dir, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+        with pytest.raises(BuildError, match="notes.md"):
+            self._build(project_dir)
+
+    def test_copies_a_resized_file_without_listing_again(
+        self, project_dir: Path
+    ) -> None:
+        skill_dir = self._write_skill(project_dir)
+        self._lock_skill(project_dir)
+        (skill_dir / "notes.md").write_text("longer notes")
+
+        with patch(WALK_FILES) as walk:
+            self._build(project_dir)
+
+        walk.assert_not_called()
+        built = project_dir / ".claude" / "skills" / "my-skill" / "notes.md"
+        assert built.read_text() == "longer notes"
+
+    def test_changes_in_ignored_directories_keep_the_list(
+        self, project_dir: Path
+    ) -> None:
+        skill_dir = self._write_skill(project_dir)
+        (skill_dir / ".promptkitignore").write_text("node_modules/\n")
+        (skill_dir / "node_modules" / "dep").mkdir(parents=True)
+        self._lock_skill(project_dir)
+        (skill_dir / "node_modules" / "dep" / "index.js").write_text("x")
+
+        with patch(WALK_FILES) as walk:
+            built = self._build(project_dir)
+
+        walk.assert_not_called()
+        assert built == ["SKILL.md", "notes.md"]
+
+    def test_lists_plugin_when_an_ignore_file_changed(self, project_dir: Path) -> None:
+        skill_dir = self._write_skill(project_dir)
+        (skill_dir / ".promptkitignore").write_text("*.tmp\n")
+        (skill_dir / "scratch.tmp").write_text("scratch")
+        self._lock_skill(project_dir)
+        (skill_dir / ".promptkitignore").write_text("")
+
+        assert self._build(project_dir) == ["SKILL.md", "notes.md", "scratch.tmp"]
+
+    def test_lists_plugin_without_a_recorded_listing(self, project_dir: Path) -> None:
+        self._write_skill(project_dir)
+        self._lock_skill(project_dir)
+        (project_dir / HASH_CACHE_FILE).unlink()
+
+        with patch(WALK_FILES, wraps=walk_files) as walk:
+            built = self._build(project_dir)
+
+        walk.assert_called_once()
+        assert built == ["SKILL.md", "notes.md"]
+
 
 class TestBuildRegistryPlugin:
     def test_builds_from_cache(self, project_dir: Path) -> None:
@@ -189,6 +405,56 @@ class TestBuildRegistryPlugin:
             project_dir / ".claude" / "agents" / "reviewer.md"
         ).read_text() == "# Reviewer"
 
+    def test_builds_from_packed_cache_entry(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_BOTH_PLATFORMS)
+        cache = PluginCache(project_dir / ".promptkit" / "cache" / "plugins")
+        cache_dir = cache.plugin_dir("my-registry", "code-review", "sha123")
+        (cache_dir / "agents").mkdir(parents=True)
+        (cache_dir / "agents" / "reviewer.md").write_text("# Reviewer")
+        cache.pack("my-registry", "code-review", "sha123")
+        _write_lock(
+            project_dir,
+            [
+                {
+                    "name": "code-review",
+                    "source": "my-registry/code-review",
+                    "hash": "",
+                    "commit_sha": "sha123",
+                },
+            ],
+        )
+        use_case = _make_build(project_dir)
+
+        use_case.execute(project_dir)
+
+        assert (
+            project_dir / ".claude" / "agents" / "reviewer.md"
+        ).read_text() == "# Reviewer"
+
+    def test_records_cache_hits(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_BOTH_PLATFORMS)
+        cache = PluginCache(project_dir / ".promptkit" / "cache" / "plugins")
+        cache_dir = cache.plugin_dir("my-registry", "code-review", "sha123")
+        (cache_dir / "agents").mkdir(parents=True)
+        (cache_dir / "agents" / "reviewer.md").write_text("# Reviewer")
+        _write_lock(
+            project_dir,
+            [
+                {
+                    "name": "code-review",
+                    "source": "my-registry/code-review",
+                    "hash": "",
+                    "commit_sha": "sha123",
+                },
+            ],
+        )
+        stats = RunStats(command="build")
+
+        _make_build(project_dir, stats=stats).execute(project_dir)
+
+        counters = stats.registry("my-registry")
+        assert (counters.hits, counters.remote_hits, counters.misses) == (1, 0, 0)
+
     def test_raises_when_cache_missing(self, project_dir: Path) -> None:
         (project_dir / "promptkit.yaml").write_text(CONFIG_BOTH_PLATFORMS)
         _write_lock(
@@ -208,6 +474,143 @@ class TestBuildRegistryPlugin:
             use_case.execute(project_dir)
 
 
+class TestMaterializeOnDemand:
+    def test_materializes_uncached_plugin_at_locked_sha(
+        self, project_dir: Path
+    ) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_BOTH_PLATFORMS)
+        _write_lock(
+            project_dir,
+            [
+                {
+                    "name": "code-review",
+                    "source": "my-registry/code-review",
+                    "hash": "",
+                    "commit_sha": "sha123",
+                },
+            ],
+        )
+        cache = PluginCache(project_dir / ".promptkit" / "cache" / "plugins")
+        fetcher = FakeMaterializer(cache, {"agents/reviewer.md": "# Reviewer"})
+        use_case = _make_build(project_dir, fetchers={"my-registry": fetcher})
+
+        use_case.execute(project_dir)
+
+        assert fetcher.materialized == [("my-registry/code-review", "sha123")]
+        assert (
+            project_dir / ".claude" / "agents" / "reviewer.md"
+        ).read_text() == "# Reviewer"
+
+    def test_skips_plugins_no_configured_builder_targets(
+        self, project_dir: Path
+    ) -> None:
+        config = """\
+version: 1
+prompts:
+  - source: my-registry/claude-only
+    platforms:
+      - claude-code
+platforms:
+  cursor:
+"""
+        (project_dir / "promptkit.yaml").write_text(config)
+        _write_lock(
+            project_dir,
+            [
+                {
+                    "name": "claude-only",
+                    "source": "my-registry/claude-only",
+                    "hash": "",
+                    "commit_sha": "sha1",
+                },
+            ],
+        )
+        cache = PluginCache(project_dir / ".promptkit" / "cache" / "plugins")
+        fetcher = FakeMaterializer(cache, {"rules/rule.md": "# Rule"})
+        use_case = _make_build(project_dir, fetchers={"my-registry": fetcher})
+
+        result = use_case.execute(project_dir)
+
+        assert fetcher.materialized == []
+        assert result.plugin_count == 0
+
+    def test_passes_prompt_globs_and_builder_categories_to_fetcher(
+        self, project_dir: Path
+    ) -> None:
+        config = """\
+version: 1
+prompts:
+  - source: my-registry/code-review
+    exclude: "**/draft-*"
+platforms:
+  cursor:
+"""
+        (project_dir / "promptkit.yaml").write_text(config)
+        _write_lock(
+            project_dir,
+            [
+                {
+                    "name": "code-review",
+                    "source": "my-registry/code-review",
+                    "hash": "",
+                    "commit_sha": "sha123",
+                },
+            ],
+        )
+        cache = PluginCache(project_dir / ".promptkit" / "cache" / "plugins")
+        fetcher = FakeMaterializer(cache, {"agents/reviewer.md": "# Reviewer"})
+        builder = FakeBuilder(PlatformTarget.CURSOR)
+        use_case = _make_build(
+            project_dir,
+            builders={PlatformTarget.CURSOR: builder},
+            fetchers={"my-registry": fetcher},
+        )
+
+        use_case.execute(project_dir)
+
+        assert fetcher.file_filter == FileFilter(
+            exclude=("**/draft-*",), categories=frozenset({"rules", "agents"})
+        )
+
+
+class TestFileFilters:
+    def test_unfiltered_cache_entry_is_filtered_at_build(
+        self, project_dir: Path
+    ) -> None:
+        config = """\
+version: 1
+prompts:
+  - source: my-registry/code-review
+    exclude: "agents/draft-*"
+platforms:
+  claude-code:
+"""
+        (project_dir / "promptkit.yaml").write_text(config)
+        cache = PluginCache(project_dir / ".promptkit" / "cache" / "plugins")
+        cache_dir = cache.plugin_dir("my-registry", "code-review", "sha123")
+        (cache_dir / "agents").mkdir(parents=True)
+        (cache_dir / "agents" / "reviewer.md").write_text("# Reviewer")
+        (cache_dir / "agents" / "draft-reviewer.md").write_text("# Draft")
+        _write_lock(
+            project_dir,
+            [
+                {
+                    "name": "code-review",
+                    "source": "my-registry/code-review",
+                    "hash": "",
+                    "commit_sha": "sha123",
+                },
+            ],
+        )
+        use_case = _make_build(project_dir)
+
+        use_case.execute(project_dir)
+
+        agents = project_dir / ".claude" / "agents"
+        assert (agents / "reviewer.md").is_file()
+        assert not (agents / "draft-reviewer.md").exists()
+
+
 class TestMissingConfig:
     def test_raises_build_error_for_missing_config(self, project_dir: Path) -> None:
         use_case = _make_build(project_dir)
@@ -0,0 +1,139 @@
+"""Tests for ExportCache and ImportCache use cases."""
+
+from pathlib import Path
+
+import pytest
+
+from promptkit.app.cache import ExportCache, ImportCache
+from promptkit.domain.errors import SyncError
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.file_system.local import FileSystem
+from promptkit.infra.storage.plugin_cache import PluginCache
+
+LOCK_WITH_REGISTRY_AND_LOCAL = """\
+version: 1
+prompts:
+  - name: code-review
+    source: my-registry/code-review
+    hash: ''
+    fetched_at: '2026-02-09T12:00:00+00:00'
+    commit_sha: sha123
+  - name: my-rule
+    source: local/rules/my-rule
+    hash: sha256:abc
+    fetched_at: '2026-02-09T12:00:00+00:00'
+"""
+
+
+def _cache(project_dir: Path) -> PluginCache:
+    return PluginCache(project_dir / ".promptkit" / "cache" / "plugins")
+
+
+def _populate(cache: PluginCache) -> None:
+    entry_dir = cache.plugin_dir("my-registry", "code-review", "sha123")
+    (entry_dir / "agents").mkdir(parents=True)
+    (entry_dir / "agents" / "reviewer.md").write_text("# Reviewer")
+
+
+def _exporter(project_dir: Path) -> ExportCache:
+    return ExportCache(
+        file_system=FileSystem(),
+        lock_file=LockFile(),
+        plugin_cache=_cache(project_dir),
+    )
+
+
+def _importer(project_dir: Path) -> ImportCache:
+    return ImportCache(
+        file_system=FileSystem(),
+        lock_file=LockFile(),
+        plugin_cache=_cache(project_dir),
+    )
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    d = tmp_path / "project"
+    d.mkdir()
+    (d / "promptkit.lock").write_text(LOCK_WITH_REGISTRY_AND_LOCAL)
+    return d
+
+
+class TestExportCache:
+    def test_exports_only_locked_registry_entries(
+        self, project_dir: Path, tmp_path: Path
+    ) -> None:
+        cache = _cache(project_dir)
+        _populate(cache)
+        unrelated = cache.plugin_dir("my-registry", "other", "sha999")
+        unrelated.mkdir(parents=True)
+        (unrelated / "x.md").write_text("x")
+
+        result = _exporter(project_dir).execute(project_dir, tmp_path / "out")
+
+        assert result.entry_count == 1
+        assert result.archive_path.parent == tmp_path / "out"
+        assert result.archive_path.name.startswith("promptkit-cache-")
+        assert result.archive_path.is_file()
+
+    def test_exports_filtered_variants_of_locked_commit(
+        self, project_dir: Path, tmp_path: Path
+    ) -> None:
+        cache = _cache(project_dir)
+        variant = cache.plugin_dir("my-registry", "code-review", "sha123-0123456789ab")
+        (variant / "agents").mkdir(parents=True)
+        (variant / "agents" / "reviewer.md").write_text("# Reviewer")
+
+        result = _exporter(project_dir).execute(project_dir, tmp_path / "out")
+
+        assert result.entry_count == 1
+
+    def test_raises_when_locked_plugin_not_cached(
+        self, project_dir: Path, tmp_path: Path
+    ) -> None:
+        with pytest.raises(SyncError, match="Cached plugin missing"):
+            _exporter(project_dir).execute(project_dir, tmp_path)
+
+    def test_raises_without_lock_file(self, project_dir: Path, tmp_path: Path) -> None:
+        (project_dir / "promptkit.lock").unlink()
+
+        with pytest.raises(SyncError, match="Lock file not found"):
+            _exporter(project_dir).execute(project_dir, tmp_path)
+
+
+class TestImportCache:
+    def test_restores_into_fresh_project(
+        self, project_dir: Path, tmp_path: Path
+    ) -> None:
+        _populate(_cache(project_dir))
+        exported = _exporter(project_dir).execute(project_dir, tmp_path)
+        fresh = tmp_path / "fresh"
+        fresh.mkdir()
+        (fresh / "promptkit.lock").write_text(LOCK_WITH_REGISTRY_AND_LOCAL)
+
+        result = _importer(fresh).execute(fresh, exported.archive_path)
+
+        assert result.imported_count == 1
+        assert result.missing == ()
+        assert _cache(fresh).has("my-registry", "code-review", "sha123")
+
+    def test_reports_locked_plugins_still_missing(
+        self, project_dir: Path, tmp_path: Path
+    ) -> None:
+        _populate(_cache(project_dir))
+        exported = _exporter(project_dir).execute(project_dir, tmp_path)
+        fresh = tmp_path / "fresh"
+        fresh.mkdir()
+        (fresh / "promptkit.lock").write_text(
+            LOCK_WITH_REGISTRY_AND_LOCAL.replace("sha123", "sha456")
+        )
+
+        result = _importer(fresh).execute(fresh, exported.archive_path)
+
+        assert result.missing == ("code-review",)
+
+    def test_raises_for_missing_archive(
+        self, project_dir: Path, tmp_path: Path
+    ) -> None:
+        with pytest.raises(SyncError, match="not found"):
+            _importer(project_dir).execute(project_dir, tmp_path / "nope")
@@ -0,0 +1,185 @@
+"""Tests for FetchPlugins use case."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from promptkit.app.fetch import FetchPlugins
+from promptkit.domain.errors import SyncError
+from promptkit.domain.file_filter import FileFilter
+from promptkit.domain.platform_target import PlatformTarget
+from promptkit.domain.plugin import Plugin
+from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.domain.protocols import PluginFetcher
+from promptkit.domain.resolved_plugin import ResolvedPlugin
+from promptkit.infra.builders.claude_builder import ClaudeBuilder
+from promptkit.infra.builders.cursor_builder import CursorBuilder
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_loader import YamlLoader
+from promptkit.infra.file_system.local import FileSystem
+
+CONFIG = """\
+version: 1
+registries:
+  reg-a: https://example.com/a
+  reg-b: https://example.com/b
+prompts:
+  - reg-a/prompt-one
+  - source: reg-b/prompt-two
+    exclude: "**/*.png"
+  - source: reg-b/claude-only
+    platforms:
+      - claude-code
+platforms:
+  cursor:
+"""
+
+LOCK = """\
+version: 1
+prompts:
+  - name: prompt-one
+    source: reg-a/prompt-one
+    hash: ''
+    fetched_at: '2026-02-09T12:00:00+00:00'
+    commit_sha: locked-a
+  - name: my-rule
+    source: local/rules/my-rule
+    hash: sha256:abc
+    fetched_at: '2026-02-09T12:00:00+00:00'
+"""
+
+
+class RecordingFetcher:
+    """Test double for PluginFetcher that records resolves and materialisations."""
+
+    def __init__(self, head_sha: str) -> None:
+        self._head_sha = head_sha
+        self.resolved: list[str] = []
+        self.materialized: list[tuple[str, str, FileFilter | None]] = []
+        self.threads: set[str] = set()
+
+    def resolve(self, spec: PromptSpec, /) -> ResolvedPlugin:
+        self.threads.add(threading.current_thread().name)
+        self.resolved.append(spec.source)
+        return ResolvedPlugin(spec=spec, commit_sha=self._head_sha)
+
+    def materialize(
+        self,
+        spec: PromptSpec,
+        commit_sha: str,
+        /,
+        *,
+        file_filter: FileFilter | None = None,
+    ) -> Plugin:
+        self.threads.add(threading.current_thread().name)
+        self.materialized.append((spec.source, commit_sha, file_filter))
+        return Plugin(
+            spec=spec, files=(), source_dir=Path("/fake"), commit_sha=commit_sha
+        )
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    d = tmp_path / "project"
+    d.mkdir()
+    (d / "promptkit.yaml").write_text(CONFIG)
+    return d
+
+
+def _make_fetch(fetchers: dict[str, PluginFetcher]) -> FetchPlugins:
+    fs = FileSystem()
+    return FetchPlugins(
+        file_system=fs,
+        yaml_loader=YamlLoader(),
+        lock_file=LockFile(),
+        builders={
+            PlatformTarget.CURSOR: CursorBuilder(fs),
+            PlatformTarget.CLAUDE_CODE: ClaudeBuilder(fs),
+        },
+        fetchers=fetchers,
+    )
+
+
+class TestFetchLatest:
+    def test_resolves_all_and_materializes_built_plugins(
+        self, project_dir: Path
+    ) -> None:
+        reg_a, reg_b = RecordingFetcher("head-a"), RecordingFetcher("head-b")
+
+        result = _make_fetch({"reg-a": reg_a, "reg-b": reg_b}).execute(project_dir)
+
+        assert reg_b.resolved == ["reg-b/prompt-two", "reg-b/claude-only"]
+        assert [(s, sha) for s, sha, _ in reg_a.materialized] == [
+            ("reg-a/prompt-one", "head-a")
+        ]
+        assert [(s, sha) for s, sha, _ in reg_b.materialized] == [
+            ("reg-b/prompt-two", "head-b")
+        ]
+        assert result.plugin_count == 2
+        assert result.registry_count == 2
+
+    def test_uses_the_file_filter_build_would_use(self, project_dir: Path) -> None:
+        reg_a, reg_b = RecordingFetcher("head-a"), RecordingFetcher("head-b")
+
+        _make_fetch({"reg-a": reg_a, "reg-b": reg_b}).execute(project_dir)
+
+        file_filter = reg_b.materialized[0][2]
+        assert file_filter is not None
+        assert file_filter.exclude == ("**/*.png",)
+        assert file_filter.categories == CursorBuilder(FileSystem()).routable_categories
+
+    def test_fetches_registries_on_separate_workers(self, project_dir: Path) -> None:
+        reg_a, reg_b = RecordingFetcher("head-a"), RecordingFetcher("head-b")
+
+        _make_fetch({"reg-a": reg_a, "reg-b": reg_b}).execute(project_dir)
+
+        assert threading.current_thread().name not in reg_a.threads | reg_b.threads
+
+    def test_writes_no_lock_file(self, project_dir: Path) -> None:
+        fetchers: dict[str, PluginFetcher] = {
+            "reg-a": RecordingFetcher("head-a"),
+            "reg-b": RecordingFetcher("head-b"),
+        }
+
+        _make_fetch(fetchers).execute(project_dir)
+
+        assert sorted(p.name for p in project_dir.iterdir()) == ["promptkit.yaml"]
+
+    def test_raises_for_unconfigured_registry(self, project_dir: Path) -> None:
+        with pytest.raises(SyncError, match="reg-b"):
+            _make_fetch({"reg-a": RecordingFetcher("head-a")}).execute(project_dir)
+
+    def test_propagates_fetch_errors(self, project_dir: Path) -> None:
+        class FailingFetcher(RecordingFetcher):
+            def resolve(self, spec: PromptSpec, /) -> ResolvedPlugin:
+                raise SyncError("network down")
+
+        fetchers: dict[str, PluginFetcher] = {
+            "reg-a": RecordingFetcher("head-a"),
+            "reg-b": FailingFetcher("head-b"),
+        }
+
+        with pytest.raises(SyncError, match="network down"):
+            _make_fetch(fetchers).execute(project_dir)
+
+
+class TestFetchLocked:
+    def test_materializes_locked_commits_without_resolving(
+        self, project_dir: Path
+    ) -> None:
+        (project_dir / "promptkit.lock").write_text(LOCK)
+        reg_a = RecordingFetcher("head-a")
+
+        result = _make_fetch({"reg-a": reg_a}).execute(project_dir, locked=True)
+
+        assert reg_a.resolved == []
+        assert [(s, sha) for s, sha, _ in reg_a.materialized] == [
+            ("reg-a/prompt-one", "locked-a")
+        ]
+        assert result.plugin_count == 1
+        assert result.registry_count == 1
+
+    def test_raises_without_lock_file(self, project_dir: Path) -> None:
+        with pytest.raises(SyncError, match="promptkit.lock not found"):
+            _make_fetch({}).execute(project_dir, locked=True)
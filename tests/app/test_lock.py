@@ -1,20 +1,27 @@
 """Tests for LockPrompts use case."""
 
+import hashlib
+import os
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO
 from unittest.mock import patch
 
 import pytest
 
 from promptkit.app.lock import LockPrompts
 from promptkit.domain.errors import SyncError
-from promptkit.domain.lock_entry import LockEntry
+from promptkit.domain.file_filter import FileFilter
+from promptkit.domain.lock_entry import LockedFile, LockEntry
 from promptkit.domain.plugin import Plugin
 from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.domain.resolved_plugin import ResolvedPlugin
 from promptkit.infra.config.lock_file import LockFile
 from promptkit.infra.config.yaml_loader import YamlLoader
 from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
 from promptkit.infra.file_system.local import FileSystem
+from promptkit.infra.storage.hash_cache import HashCache
+from promptkit.infra.storage.lock_journal import LockJournal
 
 CONFIG_WITH_ONE_REMOTE = """\
 version: 1
@@ -38,6 +45,18 @@ platforms:
   cursor:
 """
 
+CONFIG_WITH_THREE_REMOTES = """\
+version: 1
+registries:
+  my-registry: https://example.com/registry
+prompts:
+  - my-registry/one
+  - my-registry/two
+  - my-registry/three
+platforms:
+  cursor:
+"""
+
 CONFIG_WITH_NO_PROMPTS = """\
 version: 1
 prompts: []
@@ -46,6 +65,7 @@ platforms:
 """
 
 FIXED_TIME = datetime(2026, 2, 9, 12, 0, 0, tzinfo=timezone.utc)
+OLD_MTIME_NS = 1_700_000_000_000_000_000
 
 
 class FakePluginFetcher:
@@ -54,17 +74,32 @@ class FakePluginFetcher:
     def __init__(self, plugins: dict[str, tuple[tuple[str, ...], str]]) -> None:
         """plugins: {prompt_name: (files, commit_sha)}"""
         self._plugins = plugins
+        self.materialized: list[str] = []
+        self.resolved: list[str] = []
 
-    def fetch(self, spec: PromptSpec, /) -> Plugin:
+    def resolve(self, spec: PromptSpec, /) -> ResolvedPlugin:
         key = spec.prompt_name
+        self.resolved.append(key)
         if key not in self._plugins:
             raise SyncError(f"Plugin not found: {key}")
-        files, sha = self._plugins[key]
+        _, sha = self._plugins[key]
+        return ResolvedPlugin(spec=spec, commit_sha=sha, tree_id=f"tree-{sha}")
+
+    def materialize(
+        self,
+        spec: PromptSpec,
+        commit_sha: str,
+        /,
+        *,
+        file_filter: FileFilter | None = None,
+    ) -> Plugin:
+        files, _ = self._plugins[spec.prompt_name]
+        self.materialized.append(spec.source)
         return Plugin(
             spec=spec,
             files=files,
             source_dir=Path("/fake/cache"),
-            commit_sha=sha,
+            commit_sha=commit_sha,
         )
 
 
@@ -79,14 +114,21 @@ def project_dir(tmp_path: Path) -> Path:
 def _make_lock_prompts(
     project_dir: Path,
     fetchers: dict[str, FakePluginFetcher] | None = None,
+    hash_cache: HashCache | None = None,
+    file_system: FileSystem | None = None,
+    max_workers: int | None = None,
+    journal: LockJournal | None = None,
 ) -> LockPrompts:
-    fs = FileSystem()
+    fs = file_system or FileSystem()
     return LockPrompts(
         file_system=fs,
         yaml_loader=YamlLoader(),
         lock_file=LockFile(),
         local_fetcher=LocalPluginFetcher(fs, project_dir / "prompts"),
         fetchers=fetchers or {},
+        hash_cache=hash_cache,
+        max_workers=max_workers,
+        journal=journal,
     )
 
 
@@ -111,6 +153,8 @@ class TestLockRemotePlugins:
         assert entries[0].source == "my-registry/code-review"
         assert entries[0].content_hash == ""
         assert entries[0].commit_sha == "sha123"
+        assert entries[0].tree_id == "tree-sha123"
+        assert fetcher.materialized == []
 
     def test_lock_multiple_registry_plugins(self, project_dir: Path) -> None:
         (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_MULTIPLE_REMOTES)
@@ -171,6 +215,25 @@ class TestLockLocalPlugins:
         assert entries[0].content_hash.startswith("sha256:")
         assert entries[0].commit_sha is None
 
+    def test_lock_records_local_files(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
+        skill_dir = project_dir / "prompts" / "my-skill"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "scripts" / "check.sh").write_bytes(b"#!/bin/bash\r\n")
+        use_case = _make_lock_prompts(project_dir)
+
+        use_case.execute(project_dir)
+
+        assert _read_lock_entries(project_dir)[0].files == (
+            LockedFile("my-skill/SKILL.md", 7, hashlib.sha256(b"# Skill").hexdigest()),
+            LockedFile(
+                "my-skill/scripts/check.sh",
+                13,
+                hashlib.sha256(b"#!/bin/bash\r\n").hexdigest(),
+            ),
+        )
+
     def test_lock_no_local_plugins(self, project_dir: Path) -> None:
         (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
         use_case = _make_lock_prompts(project_dir)
@@ -182,6 +245,159 @@ class TestLockLocalPlugins:
         assert len(entries) == 0
 
 
+class TestParallelLocalLock:
+    def test_parallel_lock_matches_sequential_lock(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
+        for i in range(12):
+            (project_dir / "prompts" / f"rule-{i:02}.md").write_text(f"# Rule {i}")
+            skill_dir = project_dir / "prompts" / "skills" / f"skill-{i:02}"
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"# Skill {i}")
+        with patch("promptkit.app.lock._now", return_value=FIXED_TIME):
+            _make_lock_prompts(project_dir, max_workers=1).execute(project_dir)
+        sequential = (project_dir / "promptkit.lock").read_text()
+
+        with patch("promptkit.app.lock._now", return_value=FIXED_TIME):
+            _make_lock_prompts(project_dir, max_workers=4).execute(project_dir)
+
+        assert (project_dir / "promptkit.lock").read_text() == sequential
+        assert len(_read_lock_entries(project_dir)) == 24
+
+
+class CountingFileSystem(FileSystem):
+    """Local file system that counts file reads."""
+
+    def __init__(self) -> None:
+        self.reads: list[Path] = []
+
+    def read_file(self, path: Path, /) -> str:
+        self.reads.append(path)
+        return super().read_file(path)
+
+    def open_binary(self, path: Path, /) -> BinaryIO:
+        self.reads.append(path)
+        return super().open_binary(path)
+
+
+class TestHashCache:
+    def _write_skill(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
+        skill_dir = project_dir / "prompts" / "my-skill"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "scripts" / "check.sh").write_text("#!/bin/bash")
+        for path in [skill_dir, *skill_dir.rglob("*")]:
+            os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+    def test_produces_the_same_hash_as_uncached_lock(self, project_dir: Path) -> None:
+        self._write_skill(project_dir)
+        _make_lock_prompts(project_dir).execute(project_dir)
+        uncached = _read_lock_entries(project_dir)[0].content_hash
+        hash_cache = HashCache(project_dir / ".promptkit" / "hashes.json")
+
+        _make_lock_prompts(project_dir, hash_cache=hash_cache).execute(project_dir)
+
+        assert _read_lock_entries(project_dir)[0].content_hash == uncached
+
+    def test_records_the_same_files_as_uncached_lock(self, project_dir: Path) -> None:
+        self._write_skill(project_dir)
+        _make_lock_prompts(project_dir).execute(project_dir)
+        uncached = _read_lock_entries(project_dir)[0].files
+        hash_cache = HashCache(project_dir / ".promptkit" / "hashes.json")
+
+        _make_lock_prompts(project_dir, hash_cache=hash_cache).execute(project_dir)
+
+        assert _read_lock_entries(project_dir)[0].files == uncached
+
+    def test_records_the_listing_for_build(self, project_dir: Path) -> None:
+        self._write_skill(project_dir)
+        cache_path = project_dir / ".promptkit" / "hashes.json"
+        _make_lock_prompts(project_dir, hash_cache=HashCache(cache_path)).execute(
+            project_dir
+        )
+
+        listing = HashCache(cache_path).listing("local/my-skill")
+
+        locked_files = _read_lock_entries(project_dir)[0].files
+        assert listing is not None
+        assert locked_files is not None
+        assert listing[0] == tuple(f.path for f in locked_files)
+
+    def test_unchanged_lock_reads_no_prompt_files(self, project_dir: Path) -> None:
+        self._write_skill(project_dir)
+        cache_path = project_dir / ".promptkit" / "hashes.json"
+        _make_lock_prompts(project_dir, hash_cache=HashCache(cache_path)).execute(
+            project_dir
+        )
+        fs = CountingFileSystem()
+
+        _make_lock_prompts(
+            project_dir, hash_cache=HashCache(cache_path), file_system=fs
+        ).execute(project_dir)
+
+        assert [p for p in fs.reads if "prompts" in p.parts] == []
+
+
+class TestContentHash:
+    def test_matches_legacy_hash_for_utf8_text(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
+        (project_dir / "prompts" / "my-rule.md").write_text("# Règle\n")
+
+        _make_lock_prompts(project_dir).execute(project_dir)
+
+        legacy = hashlib.sha256("my-rule.md\n# Règle\n".encode()).hexdigest()
+        assert _read_lock_entries(project_dir)[0].content_hash == f"sha256:{legacy}"
+
+    def test_hashes_non_utf8_files(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
+        skill_dir = project_dir / "prompts" / "my-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\xff\xfe")
+
+        _make_lock_prompts(project_dir).execute(project_dir)
+
+        expected = hashlib.sha256(
+            b"my-skill/SKILL.md\n# Skill"
+            + b"my-skill/logo.png\n\x89PNG\r\n\x1a\n\xff\xfe"
+        ).hexdigest()
+        assert _read_lock_entries(project_dir)[0].content_hash == f"sha256:{expected}"
+
+    def test_legacy_hash_of_crlf_file_keeps_timestamp(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
+        (project_dir / "prompts" / "my-rule.md").write_bytes(b"# Rule\r\n")
+        legacy = hashlib.sha256(b"my-rule.md\n# Rule\n").hexdigest()
+        old_time = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        legacy_entry = LockEntry(
+            name="my-rule",
+            source="local/my-rule",
+            content_hash=f"sha256:{legacy}",
+            fetched_at=old_time,
+        )
+        (project_dir / "promptkit.lock").write_text(LockFile.serialize([legacy_entry]))
+
+        with patch("promptkit.app.lock._now", return_value=FIXED_TIME):
+            _make_lock_prompts(project_dir).execute(project_dir)
+
+        entry = _read_lock_entries(project_dir)[0]
+        assert entry.fetched_at == old_time
+        assert entry.content_hash != legacy_entry.content_hash
+
+    def test_changed_plugin_with_listed_files_is_read_once(
+        self, project_dir: Path
+    ) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
+        rule = project_dir / "prompts" / "my-rule.md"
+        rule.write_text("# Version 1")
+        _make_lock_prompts(project_dir).execute(project_dir)
+        rule.write_text("# Version 2")
+        fs = CountingFileSystem()
+
+        _make_lock_prompts(project_dir, file_system=fs).execute(project_dir)
+
+        assert fs.reads.count(rule) == 1
+
+
 class TestTimestampPreservation:
     def test_preserves_timestamp_for_local_when_unchanged(
         self, project_dir: Path
@@ -267,6 +483,131 @@ class TestTimestampPreservation:
         assert entries[0].fetched_at == new_time
 
 
+class TestLockJournal:
+    def _run(
+        self, project_dir: Path, plugins: dict[str, tuple[tuple[str, ...], str]]
+    ) -> FakePluginFetcher:
+        fetcher = FakePluginFetcher(plugins)
+        journal = LockJournal(project_dir / ".promptkit" / "lock-journal.jsonl")
+        use_case = _make_lock_prompts(
+            project_dir, {"my-registry": fetcher}, journal=journal
+        )
+        with patch("promptkit.app.lock._now", return_value=FIXED_TIME):
+            use_case.execute(project_dir)
+        return fetcher
+
+    def test_rerun_skips_specs_resolved_before_a_failure(
+        self, project_dir: Path
+    ) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_THREE_REMOTES)
+        with pytest.raises(SyncError, match="three"):
+            self._run(project_dir, {"one": ((), "sha-1"), "two": ((), "sha-1")})
+
+        fetcher = self._run(
+            project_dir,
+            {"one": ((), "sha-1"), "two": ((), "sha-1"), "three": ((), "sha-1")},
+        )
+
+        assert fetcher.resolved == ["one", "three"]
+        assert not (project_dir / ".promptkit" / "lock-journal.jsonl").exists()
+        resumed = (project_dir / "promptkit.lock").read_text()
+        (project_dir / "promptkit.lock").unlink()
+        self._run(
+            project_dir,
+            {"one": ((), "sha-1"), "two": ((), "sha-1"), "three": ((), "sha-1")},
+        )
+        assert (project_dir / "promptkit.lock").read_text() == resumed
+
+    def test_moved_registry_resolves_everything_again(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_THREE_REMOTES)
+        with pytest.raises(SyncError):
+            self._run(project_dir, {"one": ((), "sha-1"), "two": ((), "sha-1")})
+
+        fetcher = self._run(
+            project_dir,
+            {"one": ((), "sha-2"), "two": ((), "sha-2"), "three": ((), "sha-2")},
+        )
+
+        assert fetcher.resolved == ["one", "two", "three"]
+        assert {e.commit_sha for e in _read_lock_entries(project_dir)} == {"sha-2"}
+
+
+class TestLockOnly:
+    def _lock_all(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_THREE_REMOTES)
+        (project_dir / "prompts" / "my-rule.md").write_text("# My Rule")
+        fetcher = FakePluginFetcher(
+            {"one": ((), "sha-1"), "two": ((), "sha-1"), "three": ((), "sha-1")}
+        )
+        with patch("promptkit.app.lock._now", return_value=FIXED_TIME):
+            _make_lock_prompts(project_dir, {"my-registry": fetcher}).execute(
+                project_dir
+            )
+
+    def test_resolves_only_named_sources(self, project_dir: Path) -> None:
+        self._lock_all(project_dir)
+        before = {e.source: e for e in _read_lock_entries(project_dir)}
+        fetcher = FakePluginFetcher({"two": ((), "sha-2")})
+
+        count = _make_lock_prompts(project_dir, {"my-registry": fetcher}).execute(
+            project_dir, only=["my-registry/two"]
+        )
+
+        assert count == 1
+        assert fetcher.resolved == ["two"]
+        after = {e.source: e for e in _read_lock_entries(project_dir)}
+        assert after["my-registry/two"].commit_sha == "sha-2"
+        del before["my-registry/two"], after["my-registry/two"]
+        assert after == before
+
+    def test_locks_a_local_source(self, project_dir: Path) -> None:
+        self._lock_all(project_dir)
+        (project_dir / "prompts" / "my-rule.md").write_text("# Changed")
+        (project_dir / "prompts" / "other.md").write_text("# Other")
+
+        count = _make_lock_prompts(project_dir).execute(
+            project_dir, only=["local/my-rule"]
+        )
+
+        assert count == 1
+        entries = {e.source: e for e in _read_lock_entries(project_dir)}
+        assert "local/other" not in entries
+        assert entries["local/my-rule"].fetched_at != FIXED_TIME
+        assert len(entries) == 4
+
+    def test_keeps_hash_cache_entries_of_other_plugins(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_NO_PROMPTS)
+        for name in ("one", "two"):
+            rule = project_dir / "prompts" / f"{name}.md"
+            rule.write_text(f"# {name}")
+            os.utime(rule, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+        cache_path = project_dir / ".promptkit" / "hashes.json"
+        _make_lock_prompts(project_dir, hash_cache=HashCache(cache_path)).execute(
+            project_dir
+        )
+        _make_lock_prompts(project_dir, hash_cache=HashCache(cache_path)).execute(
+            project_dir, only=["local/one"]
+        )
+        fs = CountingFileSystem()
+
+        _make_lock_prompts(
+            project_dir, hash_cache=HashCache(cache_path), file_system=fs
+        ).execute(project_dir)
+
+        assert [p for p in fs.reads if "prompts" in p.parts] == []
+
+    def test_unconfigured_source_fails(self, project_dir: Path) -> None:
+        self._lock_all(project_dir)
+        lock = (project_dir / "promptkit.lock").read_text()
+
+        with pytest.raises(SyncError, match="my-registry/four"):
+            _make_lock_prompts(project_dir).execute(
+                project_dir, only=["my-registry/four"]
+            )
+
+        assert (project_dir / "promptkit.lock").read_text() == lock
+
+
 class TestStaleEntryRemoval:
     def test_removes_stale_entries(self, project_dir: Path) -> None:
         (project_dir / "promptkit.yaml").write_text(CONFIG_WITH_ONE_REMOTE)
@@ -0,0 +1,155 @@
+"""Tests for ProjectContext per-command config and lock loading."""
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from promptkit.app.build import BuildArtifacts
+from promptkit.app.lock import LockPrompts
+from promptkit.app.project_context import ProjectContext
+from promptkit.domain.lock_entry import LockEntry
+from promptkit.domain.platform_target import PlatformTarget
+from promptkit.infra.builders.claude_builder import ClaudeBuilder
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_loader import YamlLoader
+from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
+from promptkit.infra.file_system.local import FileSystem
+from promptkit.infra.storage.plugin_cache import PluginCache
+
+CONFIG = """\
+version: 1
+prompts: []
+platforms:
+  claude-code:
+"""
+
+ENTRY = LockEntry(
+    name="my-rule",
+    source="local/rules/my-rule",
+    content_hash="sha256:abc",
+    fetched_at=datetime(2026, 2, 9, 12, 0, tzinfo=timezone.utc),
+)
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    (tmp_path / "promptkit.yaml").write_text(CONFIG)
+    return tmp_path
+
+
+@pytest.fixture
+def context() -> ProjectContext:
+    return ProjectContext(
+        file_system=FileSystem(), yaml_loader=YamlLoader(), lock_file=LockFile()
+    )
+
+
+class TestLoadConfig:
+    def test_parses_unchanged_config_once(
+        self, project_dir: Path, context: ProjectContext
+    ) -> None:
+        with patch.object(YamlLoader, "parse", wraps=YamlLoader.parse) as load:
+            first = context.load_config(project_dir)
+            second = context.load_config(project_dir)
+
+        assert load.call_count == 1
+        assert second is first
+
+    def test_reparses_changed_config(
+        self, project_dir: Path, context: ProjectContext
+    ) -> None:
+        context.load_config(project_dir)
+        (project_dir / "promptkit.yaml").write_text(CONFIG + "  cursor:\n")
+
+        config = context.load_config(project_dir)
+
+        assert len(config.platform_configs) == 2
+
+    def test_missing_config_raises_file_not_found(
+        self, tmp_path: Path, context: ProjectContext
+    ) -> None:
+        with pytest.raises(FileNotFoundError):
+            context.load_config(tmp_path)
+
+
+class TestLoadLock:
+    def test_missing_lock_is_none(
+        self, project_dir: Path, context: ProjectContext
+    ) -> None:
+        assert context.load_lock(project_dir) is None
+
+    def test_written_lock_is_not_parsed_again(
+        self, project_dir: Path, context: ProjectContext
+    ) -> None:
+        context.write_lock(project_dir, [ENTRY])
+
+        with patch.object(LockFile, "deserialize") as deserialize:
+            entries = context.load_lock(project_dir)
+
+        deserialize.assert_not_called()
+        assert entries == [ENTRY]
+        assert LockFile.deserialize((project_dir / "promptkit.lock").read_text()) == [
+            ENTRY
+        ]
+
+    def test_unchanged_lock_is_not_rewritten(
+        self, project_dir: Path, context: ProjectContext
+    ) -> None:
+        context.write_lock(project_dir, [ENTRY])
+        lock_path = project_dir / "promptkit.lock"
+        os.utime(lock_path, ns=(0, 0))
+
+        context.write_lock(project_dir, [ENTRY])
+
+        assert lock_path.stat().st_mtime_ns == 0
+
+    def test_lock_changed_on_disk_is_parsed_again(
+        self, project_dir: Path, context: ProjectContext
+    ) -> None:
+        context.write_lock(project_dir, [ENTRY])
+        (project_dir / "promptkit.lock").write_text(LockFile.serialize([]))
+
+        assert context.load_lock(project_dir) == []
+
+
+class TestSharedBetweenStages:
+    def test_lock_then_build_parses_each_file_once(
+        self, project_dir: Path, context: ProjectContext
+    ) -> None:
+        rules_dir = project_dir / "prompts" / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "my-rule.md").write_text("# My Rule")
+        fs = context.file_system
+        lock = LockPrompts(
+            file_system=fs,
+            yaml_loader=YamlLoader(),
+            lock_file=LockFile(),
+            local_fetcher=LocalPluginFetcher(fs, project_dir / "prompts"),
+            fetchers={},
+            project_context=context,
+        )
+        build = BuildArtifacts(
+            file_system=fs,
+            yaml_loader=YamlLoader(),
+            lock_file=LockFile(),
+            plugin_cache=PluginCache(project_dir / ".promptkit" / "cache"),
+            builders={PlatformTarget.CLAUDE_CODE: ClaudeBuilder(fs)},
+            project_context=context,
+        )
+
+        with (
+            patch.object(YamlLoader, "parse", wraps=YamlLoader.parse) as load,
+            patch.object(
+                LockFile, "deserialize", wraps=LockFile.deserialize
+            ) as deserialize,
+        ):
+            lock.execute(project_dir)
+            result = build.execute(project_dir)
+
+        assert load.call_count == 1
+        assert deserialize.call_count == 0
+        assert result.plugin_count == 1
+        assert (project_dir / ".claude" / "rules" / "my-rule.md").is_file()
@@ -0,0 +1,145 @@
+"""Tests for UpdatePrompts use case."""
+
+from pathlib import Path
+
+import pytest
+
+from promptkit.app.lock import LockPrompts
+from promptkit.app.project_context import ProjectContext
+from promptkit.app.update import UpdatePrompts
+from promptkit.domain.errors import SyncError
+from promptkit.domain.file_filter import FileFilter
+from promptkit.domain.lock_entry import LockEntry
+from promptkit.domain.plugin import Plugin
+from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.domain.resolved_plugin import ResolvedPlugin
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_loader import YamlLoader
+from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
+from promptkit.infra.file_system.local import FileSystem
+
+CONFIG = """\
+version: 1
+registries:
+  my-registry: https://example.com/registry
+  other-registry: https://example.com/other
+prompts:
+  - my-registry/code-review
+  - my-registry/docs
+  - other-registry/docs
+"""
+
+
+class HeadFetcher:
+    """Resolves every plugin to the registry's current head."""
+
+    def __init__(self, head: str) -> None:
+        self.head = head
+        self.resolved: list[str] = []
+
+    def resolve(self, spec: PromptSpec, /) -> ResolvedPlugin:
+        self.resolved.append(spec.source)
+        return ResolvedPlugin(spec=spec, commit_sha=self.head, tree_id="tree")
+
+    def materialize(
+        self,
+        spec: PromptSpec,
+        commit_sha: str,
+        /,
+        *,
+        file_filter: FileFilter | None = None,
+    ) -> Plugin:
+        raise AssertionError("update must not materialise plugins")
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    (tmp_path / "promptkit.yaml").write_text(CONFIG)
+    (tmp_path / "prompts").mkdir()
+    (tmp_path / "prompts" / "my-rule.md").write_text("# My Rule")
+    return tmp_path
+
+
+@pytest.fixture
+def fetchers() -> dict[str, HeadFetcher]:
+    return {"my-registry": HeadFetcher("sha-1"), "other-registry": HeadFetcher("sha-1")}
+
+
+def _update(project_dir: Path, fetchers: dict[str, HeadFetcher], *plugins: str) -> int:
+    fs = FileSystem()
+    context = ProjectContext(
+        file_system=fs, yaml_loader=YamlLoader(), lock_file=LockFile()
+    )
+    lock = LockPrompts(
+        file_system=fs,
+        yaml_loader=YamlLoader(),
+        lock_file=LockFile(),
+        local_fetcher=LocalPluginFetcher(fs, project_dir / "prompts"),
+        fetchers=fetchers,
+        project_context=context,
+    )
+    if not plugins:
+        return lock.execute(project_dir)
+    return UpdatePrompts(lock_prompts=lock, project_context=context).execute(
+        project_dir, plugins
+    )
+
+
+def _locked_shas(project_dir: Path) -> dict[str, str | None]:
+    entries: list[LockEntry] = LockFile.deserialize(
+        (project_dir / "promptkit.lock").read_text()
+    )
+    return {e.source: e.commit_sha for e in entries}
+
+
+class TestUpdatePrompts:
+    def test_advances_only_the_named_plugin(
+        self, project_dir: Path, fetchers: dict[str, HeadFetcher]
+    ) -> None:
+        _update(project_dir, fetchers)
+        fetchers["my-registry"].head = "sha-2"
+        fetchers["my-registry"].resolved.clear()
+
+        count = _update(project_dir, fetchers, "code-review")
+
+        assert count == 1
+        assert fetchers["my-registry"].resolved == ["my-registry/code-review"]
+        assert _locked_shas(project_dir) == {
+            "my-registry/code-review": "sha-2",
+            "my-registry/docs": "sha-1",
+            "other-registry/docs": "sha-1",
+            "local/my-rule": None,
+        }
+
+    def test_accepts_sources(
+        self, project_dir: Path, fetchers: dict[str, HeadFetcher]
+    ) -> None:
+        _update(project_dir, fetchers)
+        fetchers["other-registry"].head = "sha-2"
+
+        _update(project_dir, fetchers, "other-registry/docs")
+
+        assert _locked_shas(project_dir)["other-registry/docs"] == "sha-2"
+        assert _locked_shas(project_dir)["my-registry/docs"] == "sha-1"
+
+    def test_name_shared_by_several_sources_is_ambiguous(
+        self, project_dir: Path, fetchers: dict[str, HeadFetcher]
+    ) -> None:
+        _update(project_dir, fetchers)
+
+        with pytest.raises(SyncError, match="ambiguous.*my-registry/docs"):
+            _update(project_dir, fetchers, "docs")
+
+    def test_unknown_plugin_fails(
+        self, project_dir: Path, fetchers: dict[str, HeadFetcher]
+    ) -> None:
+        _update(project_dir, fetchers)
+
+        with pytest.raises(SyncError, match="Unknown plugin: missing"):
+            _update(project_dir, fetchers, "missing")
+
+    def test_requires_a_lock(
+        self, project_dir: Path, fetchers: dict[str, HeadFetcher]
+    ) -> None:
+        with pytest.raises(SyncError, match="promptkit lock"):
+            _update(project_dir, fetchers, "code-review")
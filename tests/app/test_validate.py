@@ -5,6 +5,9 @@ from pathlib import Path
 import pytest
 
 from promptkit.app.validate import ValidateConfig
+from promptkit.domain.errors import SyncError
+from promptkit.domain.registry import Registry
+from promptkit.infra.config.config_layers import ConfigLayers
 from promptkit.infra.config.lock_file import LockFile
 from promptkit.infra.config.yaml_loader import YamlLoader
 from promptkit.infra.file_system.local import FileSystem
@@ -157,3 +160,49 @@ class TestMultipleIssues:
         assert len(result.issues) >= 2
         assert len(result.errors) >= 1
         assert len(result.warnings) >= 1
+
+
+class TestLayerReport:
+    def test_reports_the_layer_of_each_entry(self, project_dir: Path) -> None:
+        (project_dir / "base.yaml").write_text(VALID_CONFIG)
+        (project_dir / "promptkit.yaml").write_text(
+            "version: 1\nextends: base.yaml\nprompts:\n  - my-registry/docs\n"
+        )
+        use_case = _make_validate()
+
+        result = use_case.execute(project_dir)
+
+        assert result.is_valid
+        assert [i.message for i in result.infos] == [
+            "Config layers (base first): base.yaml, promptkit.yaml",
+            "Platform 'cursor' from base.yaml",
+            "Prompt 'my-registry/code-review' from base.yaml",
+            "Prompt 'my-registry/docs' from promptkit.yaml",
+            "Registry 'my-registry' from base.yaml",
+        ]
+
+    def test_unreachable_registry_base_is_an_error(self, project_dir: Path) -> None:
+        def unreachable(registry: Registry, path: str) -> str | None:
+            raise SyncError(f"Git command failed: git clone {registry.url}")
+
+        (project_dir / "promptkit.yaml").write_text(
+            "version: 1\nregistries:\n  org: https://example.com/org\n"
+            "extends: org:base.yaml\n"
+        )
+        fs = FileSystem()
+        use_case = ValidateConfig(
+            file_system=fs,
+            yaml_loader=YamlLoader(),
+            lock_file=LockFile(),
+            config_layers=ConfigLayers(fs, YamlLoader(), registry_files=unreachable),
+        )
+
+        result = use_case.execute(project_dir)
+
+        assert not result.is_valid
+        assert "git clone" in result.errors[0].message
+
+    def test_plain_config_reports_no_layers(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(VALID_CONFIG)
+
+        assert _make_validate().execute(project_dir).infos == []
@@ -0,0 +1 @@
+"""Benchmarks for promptkit hot paths."""
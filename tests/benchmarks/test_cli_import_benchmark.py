@@ -0,0 +1,49 @@
+"""Benchmark: cold-start cost of importing the CLI, measured with -X importtime.
+
+Run with ``pytest -m benchmark -s`` to see the timings. cli.py imports use
+cases, infrastructure, yaml and pydantic inside the commands that need them,
+so importing it (as `promptkit --help`, completion and editor hooks do)
+must stay within a small budget on top of typer itself. The default suite
+checks which modules the import loads, and a looser budget, in
+tests/test_cli.py.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+RUNS = 5
+MAX_OWN_MS = 50.0
+
+
+def _import_times() -> dict[str, int]:
+    """Return each module's cumulative import time in us, from a fresh process."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import promptkit.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times.setdefault(name.strip(), int(cumulative))
+    return times
+
+
+def test_cli_import_stays_within_budget() -> None:
+    own_ms: list[float] = []
+    for _ in range(RUNS):
+        times = _import_times()
+        own_ms.append((times["promptkit.cli"] - times.get("typer", 0)) / 1000)
+    best = min(own_ms)
+
+    print(f"\nimport promptkit.cli beyond typer: {best:.1f} ms (best of {RUNS})")
+
+    assert best < MAX_OWN_MS
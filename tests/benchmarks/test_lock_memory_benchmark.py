@@ -0,0 +1,118 @@
+"""Benchmark: peak memory of reading and writing large lock files.
+
+Run with ``pytest -m benchmark -s`` to see the numbers. Peak traced memory
+must grow linearly with the entry count, stay within a small per-entry
+budget, and stay well below what loading the whole YAML tree costs. Each
+peak is measured in a fresh interpreter, so results do not depend on which
+tests ran before.
+"""
+
+import gc
+import subprocess
+import sys
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from promptkit.domain.lock_entry import LockEntry
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_codec import load_yaml
+
+pytestmark = pytest.mark.benchmark
+
+SMALL = 2_500
+LARGE = 10_000
+WARM_UP = 100
+MAX_BYTES_PER_ENTRY = 1_000
+FETCHED_AT = datetime(2026, 2, 9, 12, 0, tzinfo=UTC)
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _entries(count: int) -> list[LockEntry]:
+    return [
+        LockEntry(
+            name=f"plugin-{i}",
+            source=f"reg/plugin-{i}",
+            content_hash="",
+            fetched_at=FETCHED_AT,
+            commit_sha=f"{i:040x}",
+            tree_id=f"{i:040x}",
+        )
+        for i in range(count)
+    ]
+
+
+def _peak(operation: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(operation: str, count: int) -> int:
+    """Return the peak traced memory of one operation on count entries.
+
+    Runs a small warm-up first so one-off costs (imports, caches) are paid
+    before tracing, and collects garbage so earlier work cannot skew it.
+    """
+    entries = _entries(count)
+    content = LockFile.serialize(entries)
+    operations: dict[str, Callable[[list[LockEntry], str], object]] = {
+        "deserialize": lambda _, text: LockFile.deserialize(text),
+        "serialize": lambda items, _: LockFile.serialize(items),
+        "load_yaml": lambda _, text: load_yaml(text),
+    }
+    run = operations[operation]
+    warm_up = _entries(WARM_UP)
+    run(warm_up, LockFile.serialize(warm_up))
+    gc.collect()
+    return _peak(lambda: run(entries, content))
+
+
+def _peak_in_subprocess(operation: str, count: int) -> int:
+    """Measure in a fresh interpreter, independent of earlier tests' heap."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"from {__name__} import _measure; print(_measure({operation!r}, {count}))",
+        ],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout)
+
+
+def _check_linear(label: str, operation: str) -> None:
+    small = _peak_in_subprocess(operation, SMALL)
+    large = _peak_in_subprocess(operation, LARGE)
+    slope = (large - small) / (LARGE - SMALL)
+    print(
+        f"\n{label}: {small / 1e6:.1f} MB for {SMALL}, {large / 1e6:.1f} MB for "
+        f"{LARGE} ({large / LARGE:.0f} B/entry, {slope:.0f} B/entry marginal)"
+    )
+    assert large / LARGE <= MAX_BYTES_PER_ENTRY
+    assert slope <= MAX_BYTES_PER_ENTRY
+
+
+def test_deserialize_memory_is_linear() -> None:
+    _check_linear("deserialize", "deserialize")
+
+
+def test_serialize_memory_is_linear() -> None:
+    _check_linear("serialize", "serialize")
+
+
+def test_deserialize_peaks_below_loading_the_tree() -> None:
+    streamed = _peak_in_subprocess("deserialize", LARGE)
+    tree = _peak_in_subprocess("load_yaml", LARGE)
+
+    print(f"\nstreamed {streamed / 1e6:.1f} MB, YAML tree {tree / 1e6:.1f} MB")
+    assert streamed * 4 < tree
@@ -0,0 +1,145 @@
+"""Benchmark: stat calls of walk_files versus rglob + is_file on a large tree.
+
+Run with ``pytest -m benchmark -s`` to see the timings; the assertions only
+check stat counts, which are deterministic.
+"""
+
+import os
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Self
+from unittest.mock import patch
+
+import pytest
+
+from promptkit.infra.file_system.tree_walker import walk_files
+
+pytestmark = pytest.mark.benchmark
+
+DIRECTORIES = 50
+FILES_PER_DIRECTORY = 40
+FILE_COUNT = DIRECTORIES * FILES_PER_DIRECTORY
+
+
+class StatCounter:
+    """Counts os.stat calls and DirEntry.stat calls made through os.scandir."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def stat(self, real: Callable[..., Any]) -> Callable[..., Any]:
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            self.calls += 1
+            return real(*args, **kwargs)
+
+        return counted
+
+    def scandir(self, real: Callable[..., Any]) -> Callable[..., Any]:
+        counter = self
+
+        class CountingEntry:
+            def __init__(self, entry: os.DirEntry[str]) -> None:
+                self._entry = entry
+                self.name = entry.name
+                self.path = entry.path
+
+            def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+                return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+            def is_file(self, *, follow_symlinks: bool = True) -> bool:
+                return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+            def is_symlink(self) -> bool:
+                return self._entry.is_symlink()
+
+            def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+                counter.calls += 1
+                return self._entry.stat(follow_symlinks=follow_symlinks)
+
+        class CountingScandir:
+            def __init__(self, path: Any) -> None:
+                self._iterator = real(path)
+
+            def __enter__(self) -> Self:
+                return self
+
+            def __exit__(self, *exc: object) -> None:
+                self._iterator.close()
+
+            def __iter__(self) -> Iterator[CountingEntry]:
+                return (CountingEntry(entry) for entry in self._iterator)
+
+        return CountingScandir
+
+
+@pytest.fixture(scope="module")
+def large_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("tree")
+    for d in range(DIRECTORIES):
+        directory = root / f"skill-{d:03}" / "scripts"
+        directory.mkdir(parents=True)
+        for f in range(FILES_PER_DIRECTORY):
+            (directory / f"file-{f:03}.md").write_text("x" * f)
+    return root
+
+
+def _rglob_sizes(root: Path) -> list[tuple[str, int]]:
+    """The listing the walker replaced: rglob, is_file, then stat for the size."""
+    return [
+        (path.relative_to(root).as_posix(), path.stat().st_size)
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    ]
+
+
+def _walker_sizes(root: Path) -> list[tuple[str, int]]:
+    return [(entry.relative, entry.size) for entry in walk_files(root)]
+
+
+def _count_stats(list_files: Callable[[Path], object], root: Path) -> int:
+    counter = StatCounter()
+    with (
+        patch("os.stat", counter.stat(os.stat)),
+        patch("os.lstat", counter.stat(os.lstat)),
+        patch("os.scandir", counter.scandir(os.scandir)),
+    ):
+        list_files(root)
+    return counter.calls
+
+
+def _best_time(list_files: Callable[[Path], object], root: Path) -> float:
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        list_files(root)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_walker_lists_without_stat_calls(large_tree: Path) -> None:
+    rglob_stats = _count_stats(
+        lambda root: [p for p in root.rglob("*") if p.is_file()], large_tree
+    )
+    walker_stats = _count_stats(walk_files, large_tree)
+
+    print(f"\nlisting {FILE_COUNT} files: rglob {rglob_stats} stats, walker 0")
+    assert rglob_stats >= FILE_COUNT
+    assert walker_stats == 0
+
+
+def test_walker_halves_stat_calls_when_sizes_are_needed(large_tree: Path) -> None:
+    assert _walker_sizes(large_tree) == _rglob_sizes(large_tree)
+
+    rglob_stats = _count_stats(_rglob_sizes, large_tree)
+    walker_stats = _count_stats(_walker_sizes, large_tree)
+    rglob_time = _best_time(_rglob_sizes, large_tree)
+    walker_time = _best_time(_walker_sizes, large_tree)
+
+    print(
+        f"\nsizes of {FILE_COUNT} files: rglob {rglob_stats} stats "
+        f"{rglob_time * 1000:.1f} ms, walker {walker_stats} stats "
+        f"{walker_time * 1000:.1f} ms"
+    )
+    assert walker_stats == FILE_COUNT
+    assert rglob_stats >= 2 * FILE_COUNT
@@ -0,0 +1,99 @@
+"""Benchmark: parsing and emitting 10k-entry configs and locks, libyaml vs pure Python.
+
+Run with ``pytest -m benchmark -s`` to see the timings. Both backends must
+produce identical results; the libyaml one must stay clearly faster.
+"""
+
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from promptkit.domain.lock_entry import LockEntry
+from promptkit.infra.config import yaml_codec
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_loader import YamlLoader
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML without libyaml"),
+]
+
+ENTRY_COUNT = 10_000
+MIN_SPEEDUP = 2.0
+FETCHED_AT = datetime(2026, 2, 9, 12, 0, tzinfo=UTC)
+
+
+def _pure_python() -> AbstractContextManager[object]:
+    return patch.multiple(yaml_codec, LOADER=yaml.SafeLoader, DUMPER=yaml.SafeDumper)
+
+
+def _config() -> str:
+    lines = ["version: 1", "registries:", "  reg: https://github.com/org/repo"]
+    lines.append("prompts:")
+    for i in range(ENTRY_COUNT):
+        if i % 2:
+            lines.append(f"  - reg/plugin-{i}")
+        else:
+            lines += [f"  - source: reg/plugin-{i}", "    platforms:", "      - cursor"]
+    lines += ["platforms:", "  cursor:", "  claude-code:"]
+    return "\n".join(lines) + "\n"
+
+
+def _lock_entries() -> list[LockEntry]:
+    return [
+        LockEntry(
+            name=f"plugin-{i}",
+            source=f"reg/plugin-{i}",
+            content_hash="",
+            fetched_at=FETCHED_AT,
+            commit_sha=f"{i:040x}",
+        )
+        for i in range(ENTRY_COUNT)
+    ]
+
+
+def _best_time(operation: Callable[[], object], *, pure: bool) -> float:
+    timings = []
+    for _ in range(2):
+        with _pure_python() if pure else nullcontext():
+            start = time.perf_counter()
+            operation()
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _compare(label: str, operation: Callable[[], object]) -> None:
+    with _pure_python():
+        pure_result = operation()
+    assert operation() == pure_result
+
+    accelerated = _best_time(operation, pure=False)
+    pure = _best_time(operation, pure=True)
+    print(
+        f"\n{label}: libyaml {accelerated * 1000:.0f} ms, "
+        f"pure Python {pure * 1000:.0f} ms ({pure / accelerated:.1f}x)"
+    )
+    assert pure / accelerated >= MIN_SPEEDUP
+
+
+def test_config_parsing() -> None:
+    content = _config()
+
+    _compare("load 10k-prompt config", lambda: YamlLoader.load(content))
+
+
+def test_lock_parsing() -> None:
+    content = LockFile.serialize(_lock_entries())
+
+    _compare("load 10k-entry lock", lambda: LockFile.deserialize(content))
+
+
+def test_lock_serializing() -> None:
+    entries = _lock_entries()
+
+    _compare("dump 10k-entry lock", lambda: LockFile.serialize(entries))
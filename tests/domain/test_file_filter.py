@@ -0,0 +1,65 @@
+"""Tests for FileFilter domain value object."""
+
+import pytest
+
+from promptkit.domain.file_filter import FileFilter
+
+
+class TestFileFilterMatches:
+    def test_empty_filter_matches_everything(self) -> None:
+        file_filter = FileFilter()
+
+        assert file_filter.is_empty
+        assert file_filter.matches("README.md")
+        assert file_filter.matches("agents/reviewer.md")
+
+    def test_include_keeps_only_matching_paths(self) -> None:
+        file_filter = FileFilter(include=("agents/**",))
+
+        assert file_filter.matches("agents/reviewer.md")
+        assert file_filter.matches("agents/nested/helper.md")
+        assert not file_filter.matches("commands/review.md")
+
+    def test_exclude_drops_matching_paths(self) -> None:
+        file_filter = FileFilter(exclude=("**/*.png",))
+
+        assert file_filter.matches("skills/xlsx/SKILL.md")
+        assert not file_filter.matches("skills/xlsx/assets/logo.png")
+
+    def test_exclude_wins_over_include(self) -> None:
+        file_filter = FileFilter(include=("agents/**",), exclude=("agents/draft-*",))
+
+        assert not file_filter.matches("agents/draft-reviewer.md")
+
+    def test_categories_keep_only_files_inside_them(self) -> None:
+        file_filter = FileFilter(categories=frozenset({"agents", "skills"}))
+
+        assert file_filter.matches("agents/reviewer.md")
+        assert not file_filter.matches("hooks/hooks.json")
+        assert not file_filter.matches("README.md")
+
+
+class TestFileFilterCacheKey:
+    def test_empty_filter_uses_bare_sha(self) -> None:
+        assert FileFilter().cache_key("abc123") == "abc123"
+
+    def test_filter_digest_is_appended(self) -> None:
+        file_filter = FileFilter(exclude=("**/*.png",))
+
+        assert file_filter.cache_key("abc123") == f"abc123-{file_filter.digest}"
+        assert len(file_filter.digest) == 12
+
+    def test_digest_ignores_glob_order(self) -> None:
+        first = FileFilter(include=("a/**", "b/**"))
+        second = FileFilter(include=("b/**", "a/**"))
+
+        assert first.digest == second.digest
+
+    def test_digest_differs_between_filters(self) -> None:
+        assert (
+            FileFilter(include=("a/**",)).digest != FileFilter(exclude=("a/**",)).digest
+        )
+
+    def test_is_immutable(self) -> None:
+        with pytest.raises(AttributeError):
+            FileFilter().include = ("x",)  # type: ignore[misc]
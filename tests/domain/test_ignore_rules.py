@@ -0,0 +1,84 @@
+"""Tests for IgnoreRules domain value object."""
+
+import pytest
+
+from promptkit.domain.ignore_rules import IgnoreRules
+
+
+class TestIgnoreRulesParse:
+    def test_skips_blank_lines_and_comments(self) -> None:
+        rules = IgnoreRules.parse("\n# drafts\n\n*.tmp\n")
+
+        assert len(rules.rules) == 1
+
+    def test_empty_rules_ignore_nothing(self) -> None:
+        rules = IgnoreRules()
+
+        assert not rules.is_ignored("anything.md")
+        assert not rules.excludes("a/b/c.md")
+
+
+class TestIgnoreRulesMatching:
+    @pytest.mark.parametrize(
+        ("pattern", "path", "ignored"),
+        [
+            ("*.tmp", "notes.tmp", True),
+            ("*.tmp", "skills/x/notes.tmp", True),
+            ("*.tmp", "notes.md", False),
+            ("drafts", "rules/drafts", True),
+            ("/drafts", "drafts", True),
+            ("/drafts", "rules/drafts", False),
+            ("rules/draft-*.md", "rules/draft-one.md", True),
+            ("rules/draft-*.md", "skills/rules/draft-one.md", False),
+            ("**/fixtures", "a/b/fixtures", True),
+            ("a/**/b.md", "a/b.md", True),
+            ("a/**/b.md", "a/x/y/b.md", True),
+            ("logs/**", "logs/x/y.txt", True),
+            ("file?.md", "file1.md", True),
+            ("file?.md", "file10.md", False),
+            ("[ab].md", "a.md", True),
+            ("[!ab].md", "a.md", False),
+            ("[!ab].md", "c.md", True),
+            ("\\#notes", "#notes", True),
+        ],
+    )
+    def test_glob_syntax(self, pattern: str, path: str, ignored: bool) -> None:
+        rules = IgnoreRules.parse(pattern)
+
+        assert rules.is_ignored(path) is ignored
+
+    def test_trailing_slash_matches_directories_only(self) -> None:
+        rules = IgnoreRules.parse("build/")
+
+        assert rules.is_ignored("build", is_dir=True)
+        assert not rules.is_ignored("build")
+
+    def test_last_matching_rule_wins(self) -> None:
+        rules = IgnoreRules.parse("*.md\n!keep.md")
+
+        assert rules.is_ignored("drop.md")
+        assert not rules.is_ignored("keep.md")
+
+    def test_base_scopes_rules_to_their_directory(self) -> None:
+        rules = IgnoreRules.parse("/notes.md", base="skills/x")
+
+        assert rules.is_ignored("skills/x/notes.md")
+        assert not rules.is_ignored("notes.md")
+        assert not rules.is_ignored("skills/y/notes.md")
+
+    def test_extend_gives_later_rules_precedence(self) -> None:
+        root = IgnoreRules.parse("*.sh")
+        nested = IgnoreRules.parse("!run.sh", base="skills/x")
+
+        rules = root.extend(nested)
+
+        assert not rules.is_ignored("skills/x/run.sh")
+        assert rules.is_ignored("skills/y/run.sh")
+
+
+class TestIgnoreRulesExcludes:
+    def test_file_under_ignored_directory_is_excluded(self) -> None:
+        rules = IgnoreRules.parse("node_modules/")
+
+        assert rules.excludes("skills/x/node_modules/pkg/index.js")
+        assert not rules.excludes("skills/x/index.js")
@@ -32,6 +32,15 @@ class TestLockEntry:
         except AttributeError:
             pass
 
+    def test_is_slotted(self) -> None:
+        entry = LockEntry(
+            name="test",
+            source="local/test",
+            content_hash="sha256:abc",
+            fetched_at=datetime.now(tz=timezone.utc),
+        )
+        assert not hasattr(entry, "__dict__")
+
     def test_equality_same_values(self) -> None:
         fetched_at = datetime(2026, 2, 8, 14, 50, 0, tzinfo=timezone.utc)
         e1 = LockEntry(
@@ -0,0 +1,30 @@
+"""Tests for ResolvedPlugin domain value object."""
+
+import pytest
+
+from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.domain.resolved_plugin import ResolvedPlugin
+
+
+class TestResolvedPlugin:
+    def test_exposes_spec_name_and_source(self) -> None:
+        spec = PromptSpec(source="my-registry/code-review", name="review")
+        resolved = ResolvedPlugin(spec=spec, commit_sha="abc123", tree_id="def456")
+
+        assert resolved.name == "review"
+        assert resolved.source == "my-registry/code-review"
+        assert resolved.tree_id == "def456"
+
+    def test_tree_id_defaults_to_none(self) -> None:
+        spec = PromptSpec(source="my-registry/document-skills")
+        resolved = ResolvedPlugin(spec=spec, commit_sha="abc123")
+
+        assert resolved.tree_id is None
+
+    def test_is_immutable(self) -> None:
+        resolved = ResolvedPlugin(
+            spec=PromptSpec(source="my-registry/code-review"), commit_sha="abc123"
+        )
+
+        with pytest.raises(AttributeError):
+            resolved.commit_sha = "other"  # type: ignore[misc]
@@ -1,5 +1,6 @@
 """Tests for ClaudeBuilder."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -133,7 +134,7 @@ class TestCategoryFiltering:
             source_dir,
             {
                 "README.md": "# Readme",
-                ".claude-plugin/plugin.json": '{}',
+                ".claude-plugin/plugin.json": "{}",
                 "commands/run.md": "# Run",
             },
         )
@@ -222,6 +223,26 @@ class TestManifestCleanup:
         assert "skills/b/SKILL.md" in manifest
 
 
+class TestUnchangedRebuild:
+    def test_rebuild_keeps_unchanged_artifacts(
+        self,
+        builder: ClaudeBuilder,
+        source_dir: Path,
+        output_dir: Path,
+        project_dir: Path,
+    ) -> None:
+        plugin = _make_plugin(source_dir, {"agents/a.md": "A", "rules/b.md": "B"})
+        builder.build([plugin], output_dir, project_dir)
+        for path in (output_dir / "agents" / "a.md", output_dir / "rules" / "b.md"):
+            os.utime(path, ns=(0, 0))
+        (source_dir / "rules" / "b.md").write_text("B2")
+
+        builder.build([plugin], output_dir, project_dir)
+
+        assert (output_dir / "agents" / "a.md").stat().st_mtime_ns == 0
+        assert (output_dir / "rules" / "b.md").read_text() == "B2"
+
+
 class TestReturnPaths:
     def test_returns_generated_paths(
         self,
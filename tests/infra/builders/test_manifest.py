@@ -1,5 +1,6 @@
 """Tests for manifest read/write/cleanup helpers."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -8,7 +9,9 @@ from promptkit.infra.builders.manifest import (
     MANAGED_DIR,
     MANIFEST_HEADER,
     cleanup_managed_files,
+    install_file,
     read_manifest,
+    remove_stale_files,
     write_manifest,
 )
 
@@ -85,6 +88,15 @@ class TestWriteManifest:
         result = read_manifest(project_dir, "claude")
         assert result == ["new.md"]
 
+    def test_leaves_unchanged_manifest_untouched(self, project_dir: Path) -> None:
+        write_manifest(project_dir, "claude", ["a.md"])
+        manifest_path = project_dir / MANAGED_DIR / "claude.txt"
+        os.utime(manifest_path, ns=(0, 0))
+
+        write_manifest(project_dir, "claude", ["a.md"])
+
+        assert manifest_path.stat().st_mtime_ns == 0
+
 
 class TestCleanupManagedFiles:
     def test_removes_listed_files(self, output_dir: Path) -> None:
@@ -143,3 +155,46 @@ class TestCleanupManagedFiles:
         cleanup_managed_files(output_dir, [])
 
         assert (output_dir / "keep.md").exists()
+
+
+class TestInstallFile:
+    def test_copies_new_file(self, tmp_path: Path, output_dir: Path) -> None:
+        src = tmp_path / "a.md"
+        src.write_text("A")
+
+        install_file(src, output_dir / "rules" / "a.md")
+
+        assert (output_dir / "rules" / "a.md").read_text() == "A"
+
+    def test_skips_identical_file(self, tmp_path: Path, output_dir: Path) -> None:
+        src = tmp_path / "a.md"
+        src.write_text("A")
+        dst = output_dir / "a.md"
+        dst.write_text("A")
+        os.utime(dst, ns=(0, 0))
+
+        install_file(src, dst)
+
+        assert dst.stat().st_mtime_ns == 0
+
+    def test_replaces_changed_file(self, tmp_path: Path, output_dir: Path) -> None:
+        src = tmp_path / "a.md"
+        src.write_text("B")
+        dst = output_dir / "a.md"
+        dst.write_text("A")
+
+        install_file(src, dst)
+
+        assert dst.read_text() == "B"
+
+
+class TestRemoveStaleFiles:
+    def test_removes_only_files_no_longer_built(self, output_dir: Path) -> None:
+        (output_dir / "kept.md").write_text("kept")
+        (output_dir / "old").mkdir()
+        (output_dir / "old" / "stale.md").write_text("stale")
+
+        remove_stale_files(output_dir, ["kept.md", "old/stale.md"], ["kept.md"])
+
+        assert (output_dir / "kept.md").exists()
+        assert not (output_dir / "old").exists()
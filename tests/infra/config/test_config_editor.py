@@ -0,0 +1,74 @@
+"""Tests for comment-preserving edits to promptkit.yaml."""
+
+import pytest
+
+from promptkit.domain.errors import ValidationError
+from promptkit.infra.config.config_editor import append_prompt_sources
+from promptkit.infra.config.yaml_loader import YamlLoader
+
+
+class TestAppendPromptSources:
+    def test_appends_after_last_entry_keeping_comments(self) -> None:
+        content = """\
+version: 1
+registries:
+  my-registry: https://example.com/registry  # main
+prompts:
+  # reviewed weekly
+  - my-registry/one  # pinned by the team
+  - source: my-registry/two
+    include:
+      - "*.md"
+# end of prompts
+
+platforms:
+  cursor:
+"""
+
+        result = append_prompt_sources(content, ["my-registry/three"])
+
+        assert result == content.replace(
+            '      - "*.md"\n', '      - "*.md"\n  - my-registry/three\n'
+        )
+
+    def test_keeps_the_indentation_of_existing_entries(self) -> None:
+        content = "version: 1\nprompts:\n- my-registry/one\n"
+
+        result = append_prompt_sources(content, ["my-registry/two"])
+
+        assert result == "version: 1\nprompts:\n- my-registry/one\n- my-registry/two\n"
+
+    def test_fills_a_bare_prompts_key_before_its_comments(self) -> None:
+        content = "version: 1\nprompts:\n  # - example/prompt\n\nplatforms:\n"
+
+        result = append_prompt_sources(content, ["my-registry/one"])
+
+        assert result == (
+            "version: 1\nprompts:\n  - my-registry/one\n"
+            "  # - example/prompt\n\nplatforms:\n"
+        )
+
+    def test_extends_a_flow_list(self) -> None:
+        content = "version: 1\nprompts: [my-registry/one]  # inline\n"
+
+        result = append_prompt_sources(content, ["my-registry/two"])
+
+        assert result == (
+            "version: 1\nprompts: [my-registry/one, my-registry/two]  # inline\n"
+        )
+
+    def test_adds_a_missing_prompts_key(self) -> None:
+        result = append_prompt_sources("version: 1", ["my-registry/one"])
+
+        assert result == "version: 1\nprompts:\n  - my-registry/one\n"
+
+    def test_quotes_sources_that_need_it(self) -> None:
+        result = append_prompt_sources(
+            "version: 1\nprompts: []\n", ["my-registry/a: b"]
+        )
+
+        assert YamlLoader.load(result).prompt_specs[0].source == "my-registry/a: b"
+
+    def test_non_list_prompts_fail(self) -> None:
+        with pytest.raises(ValidationError, match="must be a list"):
+            append_prompt_sources("version: 1\nprompts: {}\n", ["my-registry/one"])
@@ -0,0 +1,226 @@
+"""Tests for ConfigLayers - resolving extends: chains in promptkit.yaml."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from promptkit.domain.errors import ValidationError
+from promptkit.domain.registry import Registry
+from promptkit.infra.config.config_layers import ConfigLayers
+from promptkit.infra.config.yaml_loader import LoadedConfig, YamlLoader
+from promptkit.infra.file_system.local import FileSystem
+
+BASE = """\
+version: 1
+registries:
+  shared: https://example.com/shared
+prompts:
+  - shared/code-review
+  - source: shared/docs
+    platforms: [cursor]
+platforms:
+  cursor:
+"""
+
+PROJECT = """\
+version: 1
+extends: ../base/promptkit.yaml
+prompts:
+  - source: shared/docs
+    name: team-docs
+  - shared/testing
+platforms:
+  claude-code:
+"""
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    (tmp_path / "base").mkdir()
+    (tmp_path / "base" / "promptkit.yaml").write_text(BASE)
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "promptkit.yaml").write_text(PROJECT)
+    return project
+
+
+def _load(
+    project_dir: Path,
+    layers: ConfigLayers | None = None,
+) -> LoadedConfig:
+    config_path = project_dir / "promptkit.yaml"
+    layers = layers or ConfigLayers(FileSystem(), YamlLoader())
+    return layers.load(config_path, config_path.read_text())
+
+
+class TestMerge:
+    def test_base_entries_come_first_and_later_layers_win(
+        self, project_dir: Path
+    ) -> None:
+        config = _load(project_dir)
+
+        assert [r.name for r in config.registries] == ["shared"]
+        assert [(s.source, s.name) for s in config.prompt_specs] == [
+            ("shared/code-review", "code-review"),
+            ("shared/docs", "team-docs"),
+            ("shared/testing", "testing"),
+        ]
+        assert config.prompt_specs[1].platforms == ()
+        assert [p.name for p in config.platform_configs] == ["cursor", "claude-code"]
+
+    def test_reports_the_layer_of_each_entry(self, project_dir: Path) -> None:
+        config = _load(project_dir)
+
+        assert config.layers == ("../base/promptkit.yaml", "promptkit.yaml")
+        assert config.origins["registry:shared"] == "../base/promptkit.yaml"
+        assert config.origins["prompt:shared/code-review"] == "../base/promptkit.yaml"
+        assert config.origins["prompt:shared/docs"] == "promptkit.yaml"
+        assert config.origins["platform:claude-code"] == "promptkit.yaml"
+        assert config.base_files == (project_dir.parent / "base" / "promptkit.yaml",)
+
+    def test_config_without_extends_has_no_layers(self, tmp_path: Path) -> None:
+        (tmp_path / "promptkit.yaml").write_text(BASE)
+
+        config = _load(tmp_path)
+
+        assert config.layers == ()
+        assert config.origins == {}
+
+    def test_shared_base_is_merged_once(self, project_dir: Path) -> None:
+        (project_dir / "team.yaml").write_text(
+            "extends: ../base/promptkit.yaml\nprompts: [shared/team]\n"
+        )
+        (project_dir / "promptkit.yaml").write_text(
+            "version: 1\nextends: [../base/promptkit.yaml, team.yaml]\nprompts: []\n"
+        )
+
+        config = _load(project_dir)
+
+        assert config.layers == (
+            "../base/promptkit.yaml",
+            "team.yaml",
+            "promptkit.yaml",
+        )
+
+    def test_cycle_fails(self, project_dir: Path) -> None:
+        (project_dir.parent / "base" / "promptkit.yaml").write_text(
+            BASE + "extends: ../project/promptkit.yaml\n"
+        )
+
+        with pytest.raises(ValidationError, match="extends itself"):
+            _load(project_dir)
+
+    def test_missing_base_fails(self, project_dir: Path) -> None:
+        (project_dir / "promptkit.yaml").write_text(
+            "version: 1\nextends: missing.yaml\nprompts: []\n"
+        )
+
+        with pytest.raises(
+            ValidationError, match="base config not found: missing.yaml"
+        ):
+            _load(project_dir)
+
+
+class TestRegistryBases:
+    CONFIG = """\
+version: 1
+registries:
+  shared: https://example.com/shared
+extends: shared:configs/promptkit.yaml
+prompts: []
+"""
+
+    @pytest.fixture
+    def files(self) -> dict[str, str]:
+        return {
+            "configs/promptkit.yaml": "extends: common.yaml\nprompts: [shared/docs]\n",
+            "configs/common.yaml": "prompts: [shared/code-review]\n",
+        }
+
+    def _layers(self, files: dict[str, str]) -> ConfigLayers:
+        def read(registry: Registry, path: str) -> str | None:
+            assert registry.url == "https://example.com/shared"
+            return files.get(path)
+
+        return ConfigLayers(FileSystem(), YamlLoader(), registry_files=read)
+
+    def test_reads_bases_from_the_registry(
+        self, tmp_path: Path, files: dict[str, str]
+    ) -> None:
+        (tmp_path / "promptkit.yaml").write_text(self.CONFIG)
+
+        config = _load(tmp_path, self._layers(files))
+
+        assert [s.source for s in config.prompt_specs] == [
+            "shared/code-review",
+            "shared/docs",
+        ]
+        assert config.layers == (
+            "shared:configs/common.yaml",
+            "shared:configs/promptkit.yaml",
+            "promptkit.yaml",
+        )
+        assert config.base_files == ()
+
+    def test_undefined_registry_fails(
+        self, tmp_path: Path, files: dict[str, str]
+    ) -> None:
+        (tmp_path / "promptkit.yaml").write_text(
+            "version: 1\nextends: other:promptkit.yaml\nprompts: []\n"
+        )
+
+        with pytest.raises(ValidationError, match="undefined registry 'other'"):
+            _load(tmp_path, self._layers(files))
+
+    def test_paths_outside_the_registry_fail(
+        self, tmp_path: Path, files: dict[str, str]
+    ) -> None:
+        (tmp_path / "promptkit.yaml").write_text(
+            self.CONFIG.replace("configs/promptkit.yaml", "../escape.yaml")
+        )
+
+        with pytest.raises(ValidationError, match="outside its registry"):
+            _load(tmp_path, self._layers(files))
+
+    def test_needs_registry_access(self, tmp_path: Path) -> None:
+        (tmp_path / "promptkit.yaml").write_text(self.CONFIG)
+
+        with pytest.raises(ValidationError, match="without registry access"):
+            _load(tmp_path)
+
+
+class TestMemo:
+    def _layers(self, project_dir: Path) -> ConfigLayers:
+        return ConfigLayers(
+            FileSystem(),
+            YamlLoader(),
+            memo_path=project_dir / ".promptkit" / "resolved-config.json",
+        )
+
+    def test_unchanged_layers_are_not_parsed_again(self, project_dir: Path) -> None:
+        first = _load(project_dir, self._layers(project_dir))
+
+        with patch.object(YamlLoader, "parse", wraps=YamlLoader.parse) as parse:
+            second = _load(project_dir, self._layers(project_dir))
+
+        assert parse.call_count == 1
+        assert second == first
+
+    def test_changed_base_is_resolved_again(self, project_dir: Path) -> None:
+        _load(project_dir, self._layers(project_dir))
+        base = project_dir.parent / "base" / "promptkit.yaml"
+        base.write_text(BASE.replace("shared/code-review", "shared/linting"))
+
+        config = _load(project_dir, self._layers(project_dir))
+
+        assert config.prompt_specs[0].source == "shared/linting"
+
+    def test_corrupt_memo_is_ignored(self, project_dir: Path) -> None:
+        memo = project_dir / ".promptkit" / "resolved-config.json"
+        memo.parent.mkdir()
+        memo.write_text("{not json")
+
+        config = _load(project_dir, self._layers(project_dir))
+
+        assert len(config.prompt_specs) == 3
@@ -1,11 +1,12 @@
 """Tests for LockFile reader/writer."""
 
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
 
 from promptkit.domain.errors import ValidationError
-from promptkit.domain.lock_entry import LockEntry
+from promptkit.domain.lock_entry import LockedFile, LockEntry
 from promptkit.infra.config.lock_file import LockFile
 
 
@@ -130,6 +131,20 @@ class TestLockFileCommitSha:
         assert deserialized[0].commit_sha == "abc123def"
         assert deserialized[0].content_hash == ""
 
+    def test_roundtrip_with_tree_id(self) -> None:
+        entry = LockEntry(
+            name="code-review",
+            source="claude-plugins-official/code-review",
+            content_hash="",
+            fetched_at=datetime(2026, 2, 8, 14, 50, 0, tzinfo=timezone.utc),
+            commit_sha="abc123def",
+            tree_id="0f1e2d3c",
+        )
+        serialized = LockFile.serialize([entry])
+        deserialized = LockFile.deserialize(serialized)
+        assert "tree_id: 0f1e2d3c" in serialized
+        assert deserialized[0].tree_id == "0f1e2d3c"
+
     def test_roundtrip_without_commit_sha(self) -> None:
         entry = LockEntry(
             name="my-rule",
@@ -152,3 +167,121 @@ prompts:
 """
         entries = LockFile.deserialize(yaml_content)
         assert entries[0].commit_sha is None
+
+
+class TestLockFileStreaming:
+    def test_serialize_matches_dumping_the_document_tree(self) -> None:
+        from promptkit.infra.config.yaml_codec import dump_yaml
+
+        awkward = ["123", "true", "null", "", "a: b", "- x", "#c", "2026-01-01", "é"]
+        entries = [
+            LockEntry(
+                name=value,
+                source=f"reg/{value}",
+                content_hash=value,
+                fetched_at=datetime(2026, 2, 8, 14, 50, 0, tzinfo=timezone.utc),
+                commit_sha=value,
+            )
+            for value in awkward
+        ]
+        tree = {
+            "version": 1,
+            "prompts": [
+                {
+                    "name": entry.name,
+                    "source": entry.source,
+                    "hash": entry.content_hash,
+                    "fetched_at": entry.fetched_at.isoformat(),
+                    "commit_sha": entry.commit_sha,
+                }
+                for entry in entries
+            ],
+        }
+
+        serialized = LockFile.serialize(entries)
+
+        assert serialized == dump_yaml(tree)
+        assert LockFile.deserialize(serialized) == entries
+
+    def test_deserialize_null_prompts_is_empty(self) -> None:
+        assert LockFile.deserialize("version: 1\nprompts:\n") == []
+
+    def test_deserialize_unquoted_timestamp(self) -> None:
+        yaml_content = """\
+prompts:
+  - name: a
+    source: local/a
+    hash: sha256:abc
+    fetched_at: 2026-02-08 14:50:00
+"""
+        entries = LockFile.deserialize(yaml_content)
+        assert entries[0].fetched_at == datetime(
+            2026, 2, 8, 14, 50, 0, tzinfo=timezone.utc
+        )
+
+    def test_deserialize_falls_back_for_aliases(self) -> None:
+        yaml_content = """\
+prompts:
+  - &entry {name: a, source: local/a, hash: h, fetched_at: '2026-02-08T14:50:00'}
+  - *entry
+"""
+        entries = LockFile.deserialize(yaml_content)
+        assert [entry.name for entry in entries] == ["a", "a"]
+
+    def test_deserialize_non_mapping_raises(self) -> None:
+        with pytest.raises(ValidationError, match="mapping"):
+            LockFile.deserialize("- a\n")
+
+    def test_deserialize_shares_timestamps_and_interns_strings(self) -> None:
+        entry = replace(SAMPLE_LOCK_ENTRIES[0], commit_sha="abc123")
+        serialized = LockFile.serialize([entry, entry])
+
+        first, second = LockFile.deserialize(serialized)
+
+        assert first.fetched_at is second.fetched_at
+        assert first.name is second.name
+        assert first.source is second.source
+        assert first.commit_sha is second.commit_sha
+
+
+class TestLockFileFiles:
+    ENTRY = LockEntry(
+        name="my-skill",
+        source="local/skills/my-skill",
+        content_hash="sha256:abc",
+        fetched_at=datetime(2026, 2, 8, 14, 50, 0, tzinfo=timezone.utc),
+        files=(
+            LockedFile("skills/my-skill/SKILL.md", 7, "0a1b"),
+            LockedFile("skills/my-skill/run.sh", 0, "123"),
+        ),
+    )
+
+    def test_roundtrip_with_files(self) -> None:
+        serialized = LockFile.serialize([self.ENTRY])
+
+        assert "size: 7" in serialized
+        assert LockFile.deserialize(serialized) == [self.ENTRY]
+
+    def test_entry_without_files_has_none(self) -> None:
+        entries = LockFile.deserialize(LockFile.serialize(SAMPLE_LOCK_ENTRIES))
+        assert entries[0].files is None
+
+    def test_files_read_by_the_full_loader_too(self) -> None:
+        serialized = LockFile.serialize([self.ENTRY])
+        anchored = serialized.replace("version: 1", "version: &v 1")
+
+        assert LockFile.deserialize(anchored) == [self.ENTRY]
+
+    def test_file_missing_field_raises(self) -> None:
+        yaml_content = """\
+prompts:
+  - name: a
+    source: local/a
+    hash: sha256:abc
+    fetched_at: '2026-02-08T14:50:00+00:00'
+    files:
+      - path: a.md
+        size: 1
+"""
+        with pytest.raises(ValidationError, match="sha256"):
+            LockFile.deserialize(yaml_content)
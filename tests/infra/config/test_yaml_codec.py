@@ -0,0 +1,104 @@
+"""Tests for the YAML codec and its pure-Python fallback."""
+
+import importlib
+from contextlib import nullcontext
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from promptkit.infra.config import yaml_codec
+from promptkit.infra.config.lock_file import LockFile
+from promptkit.infra.config.yaml_codec import dump_yaml, load_yaml
+
+libyaml = pytest.mark.skipif(
+    not yaml.__with_libyaml__, reason="PyYAML built without libyaml"
+)
+
+DOCUMENT = {
+    "version": 1,
+    "prompts": [
+        {"name": "a", "source": "reg/a", "hash": "", "fetched_at": "2026-02-09"},
+        {"name": "ünï", "source": "local/rules/ünï", "description": "x: y # z"},
+    ],
+    "platforms": {"cursor": None, "claude-code": {"output_dir": ".claude"}},
+}
+
+
+def _pure_python() -> Any:
+    """Patch the codec onto PyYAML's pure-Python loader and dumper."""
+    return patch.multiple(yaml_codec, LOADER=yaml.SafeLoader, DUMPER=yaml.SafeDumper)
+
+
+class TestYamlCodec:
+    @libyaml
+    def test_uses_libyaml_when_available(self) -> None:
+        assert yaml_codec.LOADER is yaml.CSafeLoader
+        assert yaml_codec.DUMPER is yaml.CSafeDumper
+
+    @pytest.mark.parametrize("with_libyaml", [True, False])
+    def test_picks_libyaml_classes_only_when_present(
+        self, monkeypatch: pytest.MonkeyPatch, with_libyaml: bool
+    ) -> None:
+        class CSafeLoader(yaml.SafeLoader):
+            pass
+
+        class CSafeDumper(yaml.SafeDumper):
+            pass
+
+        if with_libyaml:
+            monkeypatch.setattr(yaml, "CSafeLoader", CSafeLoader, raising=False)
+            monkeypatch.setattr(yaml, "CSafeDumper", CSafeDumper, raising=False)
+        else:
+            monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+            monkeypatch.delattr(yaml, "CSafeDumper", raising=False)
+        try:
+            importlib.reload(yaml_codec)
+            loader, dumper = yaml_codec.LOADER, yaml_codec.DUMPER
+        finally:
+            monkeypatch.undo()
+            importlib.reload(yaml_codec)
+
+        if with_libyaml:
+            assert (loader, dumper) == (CSafeLoader, CSafeDumper)
+        else:
+            assert (loader, dumper) == (yaml.SafeLoader, yaml.SafeDumper)
+
+    def test_round_trips_document(self) -> None:
+        assert load_yaml(dump_yaml(DOCUMENT)) == DOCUMENT
+
+    def test_output_matches_pure_python_dumper(self) -> None:
+        accelerated = dump_yaml(DOCUMENT)
+        with _pure_python():
+            pure = dump_yaml(DOCUMENT)
+
+        assert accelerated == pure
+
+    def test_fallback_parses_like_accelerated_loader(self) -> None:
+        content = dump_yaml(DOCUMENT)
+        with _pure_python():
+            pure = load_yaml(content)
+
+        assert pure == load_yaml(content)
+
+    @pytest.mark.parametrize("pure", [False, True])
+    def test_invalid_yaml_raises_yaml_error(self, pure: bool) -> None:
+        with (
+            _pure_python() if pure else nullcontext(),
+            pytest.raises(yaml.YAMLError),
+        ):
+            load_yaml("key: [unclosed")
+
+    def test_lock_file_bytes_are_unchanged_by_the_backend(self) -> None:
+        entries = LockFile.deserialize(
+            "version: 1\nprompts:\n"
+            "  - name: a\n    source: reg/a\n    hash: ''\n"
+            "    fetched_at: '2026-02-09T12:00:00+00:00'\n    commit_sha: abc\n"
+        )
+        accelerated = LockFile.serialize(entries)
+        with _pure_python():
+            pure = LockFile.serialize(entries)
+
+        assert accelerated == pure
+        assert LockFile.deserialize(accelerated) == entries
@@ -149,6 +149,30 @@ prompts:
         config = YamlLoader.load(MINIMAL_CONFIG)
         assert config.prompt_specs == []
 
+    def test_loads_include_and_exclude_globs(self) -> None:
+        yaml_content = """\
+version: 1
+prompts:
+  - source: anthropic-agent-skills/document-skills
+    include:
+      - skills/xlsx/**
+    exclude: "**/*.png"
+"""
+        config = YamlLoader.load(yaml_content)
+        spec = config.prompt_specs[0]
+        assert spec.include == ("skills/xlsx/**",)
+        assert spec.exclude == ("**/*.png",)
+
+    def test_include_and_exclude_default_to_empty(self) -> None:
+        yaml_content = """\
+version: 1
+prompts:
+  - claude-plugins-official/code-review
+"""
+        config = YamlLoader.load(yaml_content)
+        assert config.prompt_specs[0].include == ()
+        assert config.prompt_specs[0].exclude == ()
+
 
 class TestYamlLoaderPlatforms:
     def test_loads_platform_object_form(self) -> None:
@@ -271,6 +295,17 @@ prompts:
         with pytest.raises(ValidationError, match="source"):
             YamlLoader.load(yaml_content)
 
+    def test_raises_on_non_string_glob(self) -> None:
+        yaml_content = """\
+version: 1
+prompts:
+  - source: claude-plugins-official/test
+    exclude:
+      - 42
+"""
+        with pytest.raises(ValidationError, match="list of globs"):
+            YamlLoader.load(yaml_content)
+
     def test_raises_on_non_dict_yaml(self) -> None:
         with pytest.raises(ValidationError, match="mapping"):
             YamlLoader.load("- item1\n- item2\n")
@@ -285,3 +320,39 @@ platforms:
 """
         with pytest.raises(ValidationError, match="Unknown platform"):
             YamlLoader.load(yaml_content)
+
+
+class TestYamlLoaderMerge:
+    def test_later_layers_replace_entries_in_place(self) -> None:
+        base = YamlLoader.parse(
+            "version: 1\nregistries: {a: https://a}\n"
+            "prompts: [a/one, a/two]\nplatforms: {cursor: null}\n"
+        )
+        child = YamlLoader.parse(
+            "version: 2\nregistries: {a: https://b}\n"
+            "prompts: [a/three, {source: a/one, name: first}]\n"
+        )
+
+        merged, origins = YamlLoader.merge([("base", base), ("child", child)])
+
+        assert merged == {
+            "version": 2,
+            "registries": {"a": "https://b"},
+            "prompts": [{"source": "a/one", "name": "first"}, "a/two", "a/three"],
+            "platforms": {"cursor": None},
+        }
+        assert origins == {
+            "registry:a": "child",
+            "prompt:a/one": "child",
+            "prompt:a/two": "base",
+            "prompt:a/three": "child",
+            "platform:cursor": "base",
+        }
+
+    def test_non_list_prompts_fail(self) -> None:
+        with pytest.raises(ValidationError, match="base: 'prompts' must be a list"):
+            YamlLoader.merge([("base", {"prompts": {"a": 1}})])
+
+    def test_load_rejects_configs_with_extends(self) -> None:
+        with pytest.raises(ValidationError, match="extends"):
+            YamlLoader.load("version: 1\nextends: base.yaml\nprompts: []\n")
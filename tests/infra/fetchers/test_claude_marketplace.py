@@ -1,13 +1,20 @@
 """Tests for ClaudeMarketplaceFetcher."""
 
+import hashlib
+import io
 import json
+import shutil
+import zipfile
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
 from promptkit.domain.errors import SyncError
+from promptkit.domain.file_filter import FileFilter
 from promptkit.domain.prompt_spec import PromptSpec
 from promptkit.infra.fetchers.claude_marketplace import ClaudeMarketplaceFetcher
+from promptkit.infra.run_stats import RunStats
 from promptkit.infra.storage.plugin_cache import PluginCache
 
 FAKE_SHA = "abc123def4567890000000000000000000000000"
@@ -20,6 +27,9 @@ class FakeGitRegistryClone:
         self._clone_dir = clone_dir
         self._sha = sha
         self.ensure_up_to_date_called = False
+        self.pull_count = 0
+        self.ensured_commit: str | None = None
+        self._blobs: dict[str, Path] = {}
 
     @property
     def clone_dir(self) -> Path:
@@ -27,10 +37,58 @@ class FakeGitRegistryClone:
 
     def ensure_up_to_date(self) -> None:
         self.ensure_up_to_date_called = True
+        self.pull_count += 1
 
     def get_commit_sha(self) -> str:
         return self._sha
 
+    def ensure_commit(self, sha: str, /) -> None:
+        self.ensured_commit = sha
+
+    def read_file(self, sha: str, path: str, /) -> str | None:
+        file_path = self._clone_dir / path
+        return file_path.read_text() if file_path.is_file() else None
+
+    def blob_id(self, sha: str, path: str, /) -> str | None:
+        file_path = self._clone_dir / path
+        if not file_path.is_file():
+            return None
+        blob_id = hashlib.sha1(file_path.read_bytes()).hexdigest()
+        self._blobs[blob_id] = file_path
+        return blob_id
+
+    def write_blob(self, object_id: str, target: Path, /) -> None:
+        shutil.copyfile(self._blobs[object_id], target)
+
+    def tree_id(self, sha: str, path: str, /) -> str | None:
+        if not (self._clone_dir / path).is_dir():
+            return None
+        return hashlib.sha1(path.encode()).hexdigest()
+
+    def export_tree(
+        self,
+        sha: str,
+        path: str,
+        target_dir: Path,
+        /,
+        *,
+        keep: Callable[[str], bool] | None = None,
+    ) -> tuple[int, int]:
+        source_dir = self._clone_dir / path
+        if not source_dir.is_dir():
+            return 0, 0
+        files = [
+            f
+            for f in source_dir.rglob("*")
+            if f.is_file()
+            and (keep is None or keep(f.relative_to(source_dir).as_posix()))
+        ]
+        for f in files:
+            target = target_dir / f.relative_to(source_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(f, target)
+        return len(files), sum(f.stat().st_size for f in files)
+
 
 def _write_marketplace_json(clone_dir: Path, marketplace: dict) -> None:
     manifest_dir = clone_dir / ".claude-plugin"
@@ -77,12 +135,14 @@ def _make_fetcher(
     cache: PluginCache,
     clone: FakeGitRegistryClone,
     url: str = "https://github.com/anthropics/claude-plugins-official",
+    stats: RunStats | None = None,
 ) -> ClaudeMarketplaceFetcher:
     return ClaudeMarketplaceFetcher(
         registry_url=url,
         registry_name="claude-plugins-official",
         cache=cache,
         clone=clone,
+        stats=stats,
     )
 
 
@@ -229,6 +289,196 @@ class TestFetchPlugin:
             fetcher.fetch(spec)
 
 
+class TestResolveAndMaterialize:
+    def test_resolve_records_sha_and_tree_without_copying(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/a.md", "# A")
+        fetcher = _make_fetcher(cache, FakeGitRegistryClone(clone_dir))
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+
+        resolved = fetcher.resolve(spec)
+
+        assert resolved.commit_sha == FAKE_SHA
+        assert resolved.tree_id is not None
+        assert not cache.has_local(
+            "claude-plugins-official", "code-simplifier", FAKE_SHA
+        )
+
+    def test_resolve_pulls_once_per_fetcher(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/a.md", "# A")
+        clone = FakeGitRegistryClone(clone_dir)
+        fetcher = _make_fetcher(cache, clone)
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+
+        fetcher.resolve(spec)
+        fetcher.resolve(spec)
+
+        assert clone.pull_count == 1
+
+    def test_offline_resolve_uses_clone_head_without_pulling(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/a.md", "# A")
+        clone = FakeGitRegistryClone(clone_dir)
+        fetcher = ClaudeMarketplaceFetcher(
+            registry_url="https://github.com/anthropics/claude-plugins-official",
+            registry_name="claude-plugins-official",
+            cache=cache,
+            clone=clone,
+            offline=True,
+        )
+
+        resolved = fetcher.resolve(
+            PromptSpec(source="claude-plugins-official/code-simplifier")
+        )
+
+        assert resolved.commit_sha == FAKE_SHA
+        assert clone.pull_count == 0
+
+    def test_offline_resolve_requires_fetched_clone(
+        self, cache: PluginCache, tmp_path: Path
+    ) -> None:
+        fetcher = ClaudeMarketplaceFetcher(
+            registry_url="https://github.com/anthropics/claude-plugins-official",
+            registry_name="claude-plugins-official",
+            cache=cache,
+            clone=FakeGitRegistryClone(tmp_path / "never-cloned"),
+            offline=True,
+        )
+
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+
+        with pytest.raises(SyncError, match="promptkit fetch"):
+            fetcher.resolve(spec)
+
+    def test_resolve_rejects_missing_plugin_directory(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        fetcher = _make_fetcher(cache, FakeGitRegistryClone(clone_dir))
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+
+        with pytest.raises(SyncError, match="Plugin directory not found"):
+            fetcher.resolve(spec)
+
+    def test_materialize_exports_locked_commit_without_pulling(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/a.md", "# A")
+        clone = FakeGitRegistryClone(clone_dir)
+        fetcher = _make_fetcher(cache, clone)
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+        locked_sha = "1" * 40
+
+        plugin = fetcher.materialize(spec, locked_sha)
+
+        assert plugin.commit_sha == locked_sha
+        assert plugin.files == ("a.md",)
+        assert clone.ensured_commit == locked_sha
+        assert clone.pull_count == 0
+        assert not cache.staging_dir(
+            "claude-plugins-official", "code-simplifier", locked_sha
+        ).exists()
+
+    def test_materialize_with_filter_prunes_files_under_own_key(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/agents/a.md", "# A")
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/agents/b.png", "png")
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/hooks/h.json", "{}")
+        fetcher = _make_fetcher(cache, FakeGitRegistryClone(clone_dir))
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+        file_filter = FileFilter(
+            exclude=("**/*.png",), categories=frozenset({"agents"})
+        )
+
+        plugin = fetcher.materialize(spec, FAKE_SHA, file_filter=file_filter)
+
+        assert plugin.files == ("agents/a.md",)
+        assert cache.has_local(
+            "claude-plugins-official",
+            "code-simplifier",
+            file_filter.cache_key(FAKE_SHA),
+        )
+        assert not cache.has_local(
+            "claude-plugins-official", "code-simplifier", FAKE_SHA
+        )
+
+
+    def test_materialize_honours_plugin_ignore_file(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(
+            clone_dir, "plugins/code-simplifier/.promptkitignore", "tests/\n"
+        )
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/agents/a.md", "# A")
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/tests/t.py", "pass")
+        fetcher = _make_fetcher(cache, FakeGitRegistryClone(clone_dir))
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+
+        plugin = fetcher.materialize(spec, FAKE_SHA, file_filter=FileFilter())
+
+        assert plugin.files == ("agents/a.md",)
+
+class TestRunStats:
+    def test_records_miss_with_copy_volume(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(
+            clone_dir, "plugins/code-simplifier/agents/simplifier.md", "# Agent"
+        )
+        stats = RunStats(command="lock")
+        fetcher = _make_fetcher(cache, FakeGitRegistryClone(clone_dir), stats=stats)
+
+        fetcher.fetch(PromptSpec(source="claude-plugins-official/code-simplifier"))
+
+        registry = stats.registry("claude-plugins-official")
+        assert (registry.hits, registry.misses) == (0, 1)
+        assert registry.files_copied == 1
+        assert registry.bytes_copied == len("# Agent")
+        assert stats.refetches[0].source == "claude-plugins-official/code-simplifier"
+        assert stats.refetches[0].reason == "not cached"
+
+    def test_records_hit_on_second_fetch(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/a.md", "# A")
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+        _make_fetcher(cache, FakeGitRegistryClone(clone_dir)).fetch(spec)
+        stats = RunStats(command="lock")
+
+        _make_fetcher(cache, FakeGitRegistryClone(clone_dir), stats=stats).fetch(spec)
+
+        registry = stats.registry("claude-plugins-official")
+        assert (registry.hits, registry.misses) == (1, 0)
+        assert registry.files_copied == 0
+
+    def test_refetch_reason_names_new_commit(
+        self, cache: PluginCache, clone_dir: Path
+    ) -> None:
+        _write_marketplace_json(clone_dir, SAMPLE_MARKETPLACE)
+        _write_plugin_file(clone_dir, "plugins/code-simplifier/a.md", "# A")
+        spec = PromptSpec(source="claude-plugins-official/code-simplifier")
+        _make_fetcher(cache, FakeGitRegistryClone(clone_dir)).fetch(spec)
+        stats = RunStats(command="lock")
+        new_clone = FakeGitRegistryClone(clone_dir, sha="f" * 40)
+
+        _make_fetcher(cache, new_clone, stats=stats).fetch(spec)
+
+        assert stats.refetches[0].reason == "new commit fffffff (cached: abc123d)"
+
+
 class TestSkillsRepoStructure:
     def test_fetches_skills_from_skills_array(
         self, cache: PluginCache, clone_dir: Path
@@ -268,3 +518,35 @@ class TestSkillsRepoStructure:
             "skills/xlsx/SKILL.md",
             "skills/xlsx/scripts/processor.py",
         ]
+
+    def test_extracts_zipped_skills(self, cache: PluginCache, clone_dir: Path) -> None:
+        marketplace = {
+            "name": "skills",
+            "plugins": [
+                {
+                    "name": "document-skills",
+                    "source": "./",
+                    "skills": ["./skills/xlsx.zip", "./skills/docx"],
+                },
+            ],
+        }
+        _write_marketplace_json(clone_dir, marketplace)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("xlsx/SKILL.md", "# XLSX Skill")
+        (clone_dir / "skills").mkdir()
+        (clone_dir / "skills" / "xlsx.zip").write_bytes(buffer.getvalue())
+        # docx is listed as a directory but shipped as docx.zip; its root
+        # folder does not match the skill name, so it is kept
+        (clone_dir / "skills" / "docx.zip").write_bytes(buffer.getvalue())
+
+        fetcher = _make_fetcher(cache, FakeGitRegistryClone(clone_dir))
+        spec = PromptSpec(source="claude-plugins-official/document-skills")
+        plugin = fetcher.fetch(spec)
+
+        assert sorted(plugin.files) == [
+            "skills/docx/xlsx/SKILL.md",
+            "skills/xlsx/SKILL.md",
+        ]
+        archives = cache.cache_dir.parent / "archives"
+        assert len([p for p in archives.iterdir() if p.is_dir()]) == 1
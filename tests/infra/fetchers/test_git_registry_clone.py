@@ -149,6 +149,109 @@ class TestGetCommitSha:
         assert len(sha) == 40
 
 
+def _add_commit(tmp_path: Path, files: dict[str, str], message: str) -> str:
+    """Push a commit with the given files to repo.git and return its SHA."""
+    work_dir = tmp_path / f"work-{message}"
+    subprocess.run(
+        ["git", "clone", str(tmp_path / "repo.git"), str(work_dir)],
+        check=True,
+        capture_output=True,
+    )
+    for path, content in files.items():
+        (work_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (work_dir / path).write_text(content)
+    return _commit_and_push(work_dir, message)
+
+
+class TestReadAtCommit:
+    def test_reads_file_and_tree_at_older_commit(self, tmp_path: Path) -> None:
+        _init_bare_repo(tmp_path / "repo.git")
+        old_sha = _add_commit(tmp_path, {"plugin/a.md": "v1"}, "v1")
+        _add_commit(tmp_path, {"plugin/a.md": "v2"}, "v2")
+        clone = _make_clone(tmp_path, str(tmp_path / "repo.git"))
+        clone.ensure_up_to_date()
+
+        assert clone.read_file(old_sha, "plugin/a.md") == "v1"
+        blob_id = clone.blob_id(old_sha, "plugin/a.md")
+        assert blob_id is not None
+        clone.write_blob(blob_id, tmp_path / "a.md")
+        assert (tmp_path / "a.md").read_bytes() == b"v1"
+        assert clone.read_file(old_sha, "plugin/missing.md") is None
+        assert clone.blob_id(old_sha, "plugin") is None
+        assert clone.tree_id(old_sha, "plugin") is not None
+        assert clone.tree_id(old_sha, "plugin/a.md") is None
+        assert clone.tree_id(old_sha, "") is not None
+
+    def test_export_tree_writes_files_at_commit(self, tmp_path: Path) -> None:
+        _init_bare_repo(tmp_path / "repo.git")
+        sha = _add_commit(
+            tmp_path,
+            {"plugin/a.md": "alpha", "plugin/nested/b.md": "beta"},
+            "plugin",
+        )
+        clone = _make_clone(tmp_path, str(tmp_path / "repo.git"))
+        clone.ensure_up_to_date()
+        target = tmp_path / "out"
+
+        count, size = clone.export_tree(sha, "plugin", target)
+
+        assert (count, size) == (2, len("alpha") + len("beta"))
+        assert (target / "a.md").read_text() == "alpha"
+        assert (target / "nested" / "b.md").read_text() == "beta"
+
+    def test_export_tree_streams_blobs_in_chunks(self, tmp_path: Path) -> None:
+        _init_bare_repo(tmp_path / "repo.git")
+        files = {f"plugin/{i}.md": f"line {i}\n" * i for i in range(1, 40)}
+        sha = _add_commit(tmp_path, files, "plugin")
+        clone = _make_clone(tmp_path, str(tmp_path / "repo.git"))
+        clone.ensure_up_to_date()
+        target = tmp_path / "out"
+
+        with patch("promptkit.infra.fetchers.git_registry_clone.BLOB_CHUNK_SIZE", 4):
+            count, size = clone.export_tree(sha, "plugin", target)
+
+        assert (count, size) == (len(files), sum(map(len, files.values())))
+        for path, content in files.items():
+            assert (target / path.removeprefix("plugin/")).read_text() == content
+
+    def test_export_tree_of_missing_path_is_empty(self, tmp_path: Path) -> None:
+        sha = _init_bare_repo(tmp_path / "repo.git")
+        clone = _make_clone(tmp_path, str(tmp_path / "repo.git"))
+        clone.ensure_up_to_date()
+
+        assert clone.export_tree(sha, "nope", tmp_path / "out") == (0, 0)
+
+
+class TestEnsureCommit:
+    def test_clones_when_missing(self, tmp_path: Path) -> None:
+        sha = _init_bare_repo(tmp_path / "repo.git")
+        clone = _make_clone(tmp_path, str(tmp_path / "repo.git"))
+
+        clone.ensure_commit(sha)
+
+        assert clone.read_file(sha, "README.md") == "# Test"
+
+    def test_fetches_commit_absent_from_shallow_clone(self, tmp_path: Path) -> None:
+        _init_bare_repo(tmp_path / "repo.git")
+        old_sha = _add_commit(tmp_path, {"plugin/a.md": "v1"}, "v1")
+        _add_commit(tmp_path, {"plugin/a.md": "v2"}, "v2")
+        clone = _make_clone(tmp_path, f"file://{tmp_path / 'repo.git'}")
+        clone.ensure_up_to_date()
+        assert clone.read_file(old_sha, "plugin/a.md") is None
+
+        clone.ensure_commit(old_sha)
+
+        assert clone.read_file(old_sha, "plugin/a.md") == "v1"
+
+    def test_unknown_commit_raises(self, tmp_path: Path) -> None:
+        _init_bare_repo(tmp_path / "repo.git")
+        clone = _make_clone(tmp_path, f"file://{tmp_path / 'repo.git'}")
+        clone.ensure_up_to_date()
+
+        with pytest.raises(SyncError):
+            clone.ensure_commit("0" * 40)
+
+
 class TestErrorHandling:
     def test_git_error_wrapped_in_sync_error(self, tmp_path: Path) -> None:
         clone = _make_clone(tmp_path, str(tmp_path / "nonexistent-repo.git"))
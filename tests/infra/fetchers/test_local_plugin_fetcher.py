@@ -1,6 +1,8 @@
 """Tests for LocalPluginFetcher."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -9,6 +11,8 @@ from promptkit.domain.prompt_spec import PromptSpec
 from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
 from promptkit.infra.file_system.local import FileSystem
 
+OLD_MTIME_NS = 1_700_000_000_000_000_000
+
 
 @pytest.fixture
 def prompts_dir(tmp_path: Path) -> Path:
@@ -91,6 +95,117 @@ class TestFetch:
         ]
 
 
+class TestIgnoreFiles:
+    def test_root_ignore_file_filters_plugin_files(
+        self, fetcher: LocalPluginFetcher, prompts_dir: Path
+    ) -> None:
+        (prompts_dir / ".promptkitignore").write_text("*.tmp\n")
+        skill_dir = prompts_dir / "my-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "scratch.tmp").write_text("scratch")
+
+        plugin = fetcher.fetch(PromptSpec(source="local/my-skill"))
+
+        assert plugin.files == ("my-skill/SKILL.md",)
+
+    def test_per_plugin_ignore_file_applies_to_its_subtree(
+        self, fetcher: LocalPluginFetcher, prompts_dir: Path
+    ) -> None:
+        skill_dir = prompts_dir / "skills" / "my-skill"
+        (skill_dir / "tests").mkdir(parents=True)
+        (skill_dir / ".promptkitignore").write_text("/tests/\n")
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "tests" / "test_skill.py").write_text("pass")
+
+        plugin = fetcher.fetch(PromptSpec(source="local/skills/my-skill"))
+
+        assert plugin.files == ("skills/my-skill/SKILL.md",)
+
+    def test_ignored_directory_is_not_descended_into(
+        self, fetcher: LocalPluginFetcher, prompts_dir: Path
+    ) -> None:
+        (prompts_dir / ".promptkitignore").write_text("node_modules/\n")
+        skill_dir = prompts_dir / "my-skill"
+        (skill_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "node_modules" / "pkg" / "index.js").write_text("")
+
+        with patch(
+            "promptkit.infra.file_system.tree_walker.os.scandir", wraps=os.scandir
+        ) as scandir:
+            plugin = fetcher.fetch(PromptSpec(source="local/my-skill"))
+
+        assert plugin.files == ("my-skill/SKILL.md",)
+        assert [c.args[0] for c in scandir.call_args_list] == [str(skill_dir)]
+
+    def test_discover_skips_ignored_plugins(
+        self, fetcher: LocalPluginFetcher, prompts_dir: Path
+    ) -> None:
+        (prompts_dir / "rules").mkdir()
+        (prompts_dir / "rules" / ".promptkitignore").write_text("draft-*\n")
+        (prompts_dir / "rules" / "kept.md").write_text("# Kept")
+        (prompts_dir / "rules" / "draft-idea.md").write_text("# Draft")
+
+        specs = fetcher.discover()
+
+        assert [s.source for s in specs] == ["local/rules/kept"]
+
+
+def _backdate(root: Path) -> None:
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+class TestListingStamps:
+    def test_stamps_listed_directories_and_ignore_files(
+        self, fetcher: LocalPluginFetcher, prompts_dir: Path
+    ) -> None:
+        skill_dir = prompts_dir / "my-skill"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "node_modules").mkdir()
+        (skill_dir / ".promptkitignore").write_text("node_modules/\n")
+        (skill_dir / "SKILL.md").write_text("# Skill")
+        (skill_dir / "scripts" / "check.sh").write_text("")
+        _backdate(prompts_dir)
+
+        fetcher.fetch(PromptSpec(source="local/my-skill"))
+
+        assert fetcher.listing_stamps("local/my-skill") == (
+            (".promptkitignore", None),
+            ("my-skill", OLD_MTIME_NS),
+            ("my-skill.md", None),
+            ("my-skill/.promptkitignore", OLD_MTIME_NS),
+            ("my-skill/scripts", OLD_MTIME_NS),
+            ("my-skill/scripts/.promptkitignore", None),
+        )
+
+    def test_added_file_changes_the_listing(
+        self, fetcher: LocalPluginFetcher, prompts_dir: Path
+    ) -> None:
+        (prompts_dir / "my-skill").mkdir()
+        (prompts_dir / "my-skill" / "SKILL.md").write_text("# Skill")
+        _backdate(prompts_dir)
+        fetcher.fetch(PromptSpec(source="local/my-skill"))
+        stamps = fetcher.listing_stamps("local/my-skill")
+        assert stamps is not None
+        assert fetcher.is_unchanged(stamps)
+
+        (prompts_dir / "my-skill" / "notes.md").write_text("notes")
+
+        assert not fetcher.is_unchanged(stamps)
+
+    def test_recent_changes_leave_no_stamps(
+        self, fetcher: LocalPluginFetcher, prompts_dir: Path
+    ) -> None:
+        (prompts_dir / "my-skill").mkdir()
+        (prompts_dir / "my-skill" / "SKILL.md").write_text("# Skill")
+
+        fetcher.fetch(PromptSpec(source="local/my-skill"))
+
+        assert fetcher.listing_stamps("local/my-skill") is None
+
+
 class TestDiscover:
     def test_discover_single_md_files(
         self, fetcher: LocalPluginFetcher, prompts_dir: Path
@@ -0,0 +1,122 @@
+"""Tests for CachingFileSystem metadata memoisation."""
+
+from collections import Counter
+from pathlib import Path
+
+from promptkit.domain.prompt_spec import PromptSpec
+from promptkit.infra.fetchers.local_plugin_fetcher import LocalPluginFetcher
+from promptkit.infra.file_system.caching import CachingFileSystem
+from promptkit.infra.file_system.local import FileSystem
+
+
+class CountingFileSystem(FileSystem):
+    """Local FileSystem that counts metadata calls."""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+
+    def file_exists(self, path: Path, /) -> bool:
+        self.calls["file_exists"] += 1
+        return super().file_exists(path)
+
+    def is_dir(self, path: Path, /) -> bool:
+        self.calls["is_dir"] += 1
+        return super().is_dir(path)
+
+    def list_directory(self, path: Path, /) -> list[Path]:
+        self.calls["list_directory"] += 1
+        return super().list_directory(path)
+
+
+class TestMemoisation:
+    def test_repeated_metadata_checks_hit_the_disk_once(self, tmp_path: Path) -> None:
+        inner = CountingFileSystem()
+        fs = CachingFileSystem(inner)
+        (tmp_path / "a.md").write_text("a")
+
+        for _ in range(3):
+            assert fs.file_exists(tmp_path / "a.md")
+            assert fs.is_dir(tmp_path)
+            assert fs.list_directory(tmp_path) == [tmp_path / "a.md"]
+
+        assert inner.calls == {"file_exists": 1, "is_dir": 1, "list_directory": 1}
+
+    def test_listing_is_returned_as_a_copy(self, tmp_path: Path) -> None:
+        fs = CachingFileSystem(FileSystem())
+        (tmp_path / "a.md").write_text("a")
+
+        fs.list_directory(tmp_path).clear()
+
+        assert fs.list_directory(tmp_path) == [tmp_path / "a.md"]
+
+    def test_local_fetcher_reuses_metadata_across_fetches(self, tmp_path: Path) -> None:
+        inner = CountingFileSystem()
+        fetcher = LocalPluginFetcher(CachingFileSystem(inner), tmp_path)
+        (tmp_path / "skills" / "my-skill").mkdir(parents=True)
+        (tmp_path / "skills" / "my-skill" / "SKILL.md").write_text("# Skill")
+        spec = PromptSpec(source="local/skills/my-skill")
+
+        fetcher.fetch(spec)
+        first = sum(inner.calls.values())
+        fetcher.fetch(spec)
+
+        assert sum(inner.calls.values()) == first
+
+
+class TestInvalidation:
+    def test_write_file_invalidates_path_and_parent_listing(
+        self, tmp_path: Path
+    ) -> None:
+        fs = CachingFileSystem(FileSystem())
+        path = tmp_path / "sub" / "new.md"
+        assert not fs.file_exists(path)
+        assert not fs.is_dir(tmp_path / "sub")
+        assert fs.list_directory(tmp_path) == []
+
+        fs.write_file(path, "new")
+
+        assert fs.file_exists(path)
+        assert fs.is_dir(tmp_path / "sub")
+        assert fs.list_directory(tmp_path) == [tmp_path / "sub"]
+
+    def test_create_directory_invalidates_ancestors(self, tmp_path: Path) -> None:
+        fs = CachingFileSystem(FileSystem())
+        assert not fs.is_dir(tmp_path / "a")
+
+        fs.create_directory(tmp_path / "a" / "b")
+
+        assert fs.is_dir(tmp_path / "a")
+        assert fs.is_dir(tmp_path / "a" / "b")
+
+    def test_remove_directory_invalidates_subtree(self, tmp_path: Path) -> None:
+        fs = CachingFileSystem(FileSystem())
+        fs.write_file(tmp_path / "a" / "b" / "c.md", "c")
+        assert fs.file_exists(tmp_path / "a" / "b" / "c.md")
+        assert fs.list_directory(tmp_path / "a" / "b") == [
+            tmp_path / "a" / "b" / "c.md"
+        ]
+
+        fs.remove_directory(tmp_path / "a")
+
+        assert not fs.file_exists(tmp_path / "a" / "b" / "c.md")
+        assert fs.list_directory(tmp_path / "a" / "b") == []
+        assert not fs.is_dir(tmp_path / "a")
+
+    def test_append_invalidates_existence(self, tmp_path: Path) -> None:
+        fs = CachingFileSystem(FileSystem())
+        path = tmp_path / "log.txt"
+        assert not fs.file_exists(path)
+
+        fs.append_to_file(path, "line\n")
+
+        assert fs.file_exists(path)
+
+    def test_does_not_cache_file_contents(self, tmp_path: Path) -> None:
+        fs = CachingFileSystem(FileSystem())
+        path = tmp_path / "a.md"
+        path.write_text("one")
+        assert fs.read_file(path) == "one"
+
+        path.write_text("two")
+
+        assert fs.read_file(path) == "two"
@@ -116,3 +116,13 @@ def test_list_directory_returns_empty_for_missing_dir(tmp_path: Path) -> None:
     target = tmp_path / "nonexistent"
 
     assert fs.list_directory(target) == []
+
+
+def test_is_dir_distinguishes_directories_from_files(tmp_path: Path) -> None:
+    """is_dir should be true only for existing directories."""
+    fs = FileSystem()
+    (tmp_path / "file.txt").write_text("a")
+
+    assert fs.is_dir(tmp_path)
+    assert not fs.is_dir(tmp_path / "file.txt")
+    assert not fs.is_dir(tmp_path / "missing")
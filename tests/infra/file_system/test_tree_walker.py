@@ -0,0 +1,69 @@
+"""Tests for the scandir-based tree walker."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from promptkit.infra.file_system.tree_walker import walk_files
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "tree"
+    (root / "a" / "deep").mkdir(parents=True)
+    (root / "a-b").mkdir()
+    (root / "a" / "deep" / "x.md").write_text("xx")
+    (root / "a" / "y.md").write_text("y")
+    (root / "a-b" / "z.md").write_text("zzz")
+    (root / "top.md").write_text("")
+    return root
+
+
+class TestWalkFiles:
+    def test_lists_files_sorted_by_relative_posix_path(self, tree: Path) -> None:
+        entries = walk_files(tree)
+
+        assert [e.relative for e in entries] == [
+            "a-b/z.md",
+            "a/deep/x.md",
+            "a/y.md",
+            "top.md",
+        ]
+
+    def test_entries_expose_path_size_and_mtime(self, tree: Path) -> None:
+        entry = walk_files(tree)[0]
+
+        assert entry.path == tree / "a-b" / "z.md"
+        assert entry.size == 3
+        assert entry.mtime_ns == (tree / "a-b" / "z.md").stat().st_mtime_ns
+
+    def test_pruned_directory_is_not_read(self, tree: Path) -> None:
+        with patch(
+            "promptkit.infra.file_system.tree_walker.os.scandir", wraps=os.scandir
+        ) as scandir:
+            entries = walk_files(tree, prune=lambda rel, is_dir: rel == "a/deep")
+
+        assert [e.relative for e in entries] == ["a-b/z.md", "a/y.md", "top.md"]
+        read = [c.args[0] for c in scandir.call_args_list]
+        assert str(tree / "a" / "deep") not in read
+
+    def test_prune_can_drop_files(self, tree: Path) -> None:
+        entries = walk_files(
+            tree, prune=lambda rel, is_dir: not is_dir and rel.endswith("y.md")
+        )
+
+        assert "a/y.md" not in [e.relative for e in entries]
+
+    def test_symlinked_directories_are_not_followed(self, tree: Path) -> None:
+        (tree / "link").symlink_to(tree / "a", target_is_directory=True)
+        (tree / "file-link.md").symlink_to(tree / "top.md")
+
+        relatives = [e.relative for e in walk_files(tree)]
+
+        assert "file-link.md" in relatives
+        assert not any(r.startswith("link/") for r in relatives)
+
+    def test_missing_root_lists_nothing(self, tmp_path: Path) -> None:
+        assert walk_files(tmp_path / "missing") == []
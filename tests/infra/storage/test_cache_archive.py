@@ -0,0 +1,136 @@
+"""Tests for cache export/import archives."""
+
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from promptkit.domain.errors import SyncError
+from promptkit.infra.storage.cache_archive import (
+    MANIFEST_NAME,
+    EntryKey,
+    archive_name,
+    export_entries,
+    import_archive,
+)
+from promptkit.infra.storage.plugin_cache import PluginCache
+
+LOCK_CONTENT = "version: 1\nprompts: []\n"
+
+
+def _populate(cache: PluginCache, key: EntryKey, files: dict[str, str]) -> None:
+    entry_dir = cache.plugin_dir(key.registry, key.plugin, key.sha)
+    for path, content in files.items():
+        (entry_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (entry_dir / path).write_text(content)
+    cache.register(key.registry, key.plugin, key.sha)
+
+
+def _export(cache: PluginCache, keys: list[EntryKey]) -> bytes:
+    buffer = io.BytesIO()
+    export_entries(cache, keys, buffer, lock_content=LOCK_CONTENT)
+    return buffer.getvalue()
+
+
+def _tamper(archive: bytes, name: str, content: bytes) -> bytes:
+    """Rewrite one member of an archive with different content."""
+    out = io.BytesIO()
+    with (
+        tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as src,
+        tarfile.open(fileobj=out, mode="w:gz") as dst,
+    ):
+        for member in src.getmembers():
+            data = src.extractfile(member)
+            assert data is not None
+            payload = content if member.name == name else data.read()
+            member.size = len(payload)
+            dst.addfile(member, io.BytesIO(payload))
+    return out.getvalue()
+
+
+KEY = EntryKey("reg", "plugin", "sha1")
+
+
+class TestArchiveName:
+    def test_derived_from_lock_content(self) -> None:
+        name = archive_name(LOCK_CONTENT)
+        assert name.startswith("promptkit-cache-")
+        assert name.endswith(".tar.gz")
+        assert archive_name(LOCK_CONTENT) == name
+        assert archive_name(LOCK_CONTENT + "#") != name
+
+
+class TestRoundTrip:
+    def test_restores_entries_into_empty_cache(self, tmp_path: Path) -> None:
+        source = PluginCache(tmp_path / "source")
+        _populate(source, KEY, {"agents/a.md": "# A", "skills/s/SKILL.md": "# S"})
+        target = PluginCache(tmp_path / "target")
+
+        imported = import_archive(target, io.BytesIO(_export(source, [KEY])))
+
+        assert imported == [KEY]
+        assert target.list_files("reg", "plugin", "sha1") == [
+            "agents/a.md",
+            "skills/s/SKILL.md",
+        ]
+        entry_dir = target.plugin_dir("reg", "plugin", "sha1")
+        assert (entry_dir / "agents" / "a.md").read_text() == "# A"
+
+    def test_exports_packed_entries(self, tmp_path: Path) -> None:
+        source = PluginCache(tmp_path / "source")
+        _populate(source, KEY, {"agents/a.md": "# A"})
+        source.pack("reg", "plugin", "sha1")
+        target = PluginCache(tmp_path / "target")
+
+        import_archive(target, io.BytesIO(_export(source, [KEY])))
+
+        assert target.list_files("reg", "plugin", "sha1") == ["agents/a.md"]
+
+    def test_skips_entries_already_cached(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path / "cache")
+        _populate(cache, KEY, {"agents/a.md": "# A"})
+
+        imported = import_archive(cache, io.BytesIO(_export(cache, [KEY])))
+
+        assert imported == []
+
+
+class TestVerification:
+    def test_rejects_tampered_file(self, tmp_path: Path) -> None:
+        source = PluginCache(tmp_path / "source")
+        _populate(source, KEY, {"agents/a.md": "# A"})
+        archive = _tamper(_export(source, [KEY]), "reg/plugin/sha1/agents/a.md", b"# B")
+        target = PluginCache(tmp_path / "target")
+
+        with pytest.raises(SyncError, match="Hash mismatch"):
+            import_archive(target, io.BytesIO(archive))
+        assert not target.has("reg", "plugin", "sha1")
+
+    def test_rejects_path_traversal_in_manifest(self, tmp_path: Path) -> None:
+        manifest = {
+            "version": 1,
+            "lock_hash": "x",
+            "entries": [
+                {
+                    "registry": "reg",
+                    "plugin": "plugin",
+                    "sha": "sha1",
+                    "files": [{"path": "../../evil.md", "size": 0, "sha256": ""}],
+                }
+            ],
+        }
+        buffer = io.BytesIO()
+        payload = json.dumps(manifest).encode()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            info = tarfile.TarInfo(MANIFEST_NAME)
+            info.size = len(payload)
+            archive.addfile(info, io.BytesIO(payload))
+
+        with pytest.raises(SyncError, match="Unsafe path"):
+            import_archive(PluginCache(tmp_path), io.BytesIO(buffer.getvalue()))
+
+    def test_rejects_non_archive(self, tmp_path: Path) -> None:
+        with pytest.raises(SyncError, match="Invalid cache archive"):
+            import_archive(PluginCache(tmp_path), io.BytesIO(b"not a tarball"))
@@ -0,0 +1,121 @@
+"""Tests for CacheCatalog SQLite index."""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from promptkit.infra.storage.cache_catalog import CacheCatalog, CachedFile
+
+FILES = [
+    CachedFile(path="agents/a.md", size=3, sha256="aa"),
+    CachedFile(path="skills/s/SKILL.md", size=5, sha256="bb"),
+]
+
+
+class TestCacheCatalogReads:
+    def test_missing_database_reads_as_empty(self, tmp_path: Path) -> None:
+        catalog = CacheCatalog(tmp_path / "catalog.sqlite3")
+
+        assert catalog.get("reg", "plugin", "sha") is None
+        assert catalog.files("reg", "plugin", "sha") == []
+        assert catalog.entries() == []
+        assert catalog.variants("reg", "plugin", "sha") == []
+        assert catalog.stats().entry_count == 0
+        assert not (tmp_path / "catalog.sqlite3").exists()
+
+
+class TestCacheCatalogAdd:
+    def test_records_entry_and_files(self, tmp_path: Path) -> None:
+        catalog = CacheCatalog(tmp_path / "catalog.sqlite3")
+
+        catalog.add("reg", "plugin", "sha", FILES)
+
+        entry = catalog.get("reg", "plugin", "sha")
+        assert entry is not None
+        assert entry.file_count == 2
+        assert entry.total_size == 8
+        assert catalog.files("reg", "plugin", "sha") == FILES
+
+    def test_replaces_previous_record(self, tmp_path: Path) -> None:
+        catalog = CacheCatalog(tmp_path / "catalog.sqlite3")
+        catalog.add("reg", "plugin", "sha", FILES)
+
+        catalog.add("reg", "plugin", "sha", FILES[:1])
+
+        assert catalog.files("reg", "plugin", "sha") == FILES[:1]
+        assert catalog.stats().file_count == 1
+
+    def test_remove_forgets_entry(self, tmp_path: Path) -> None:
+        catalog = CacheCatalog(tmp_path / "catalog.sqlite3")
+        catalog.add("reg", "plugin", "sha", FILES)
+
+        catalog.remove("reg", "plugin", "sha")
+
+        assert catalog.get("reg", "plugin", "sha") is None
+        assert catalog.files("reg", "plugin", "sha") == []
+
+
+class TestCacheCatalogVariants:
+    def test_lists_bare_and_filtered_keys_of_a_commit(self, tmp_path: Path) -> None:
+        catalog = CacheCatalog(tmp_path / "catalog.sqlite3")
+        catalog.add("reg", "plugin", "sha1", FILES)
+        catalog.add("reg", "plugin", "sha1-0123456789ab", FILES)
+        catalog.add("reg", "plugin", "sha12", FILES)
+        catalog.add("reg", "other", "sha1", FILES)
+
+        assert catalog.variants("reg", "plugin", "sha1") == [
+            "sha1",
+            "sha1-0123456789ab",
+        ]
+
+
+class TestCacheCatalogThreads:
+    def test_shared_catalog_accepts_writes_from_worker_threads(
+        self, tmp_path: Path
+    ) -> None:
+        catalog = CacheCatalog(tmp_path / "catalog.sqlite3")
+        catalog.add("reg", "warmup", "sha", FILES)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(catalog.add, "reg", f"p{i}", "sha", FILES) for i in range(8)
+            ]
+            for future in futures:
+                future.result()
+
+        assert catalog.stats().entry_count == 9
+
+
+class TestCacheCatalogUsage:
+    def test_entries_ordered_least_recently_used_first(self, tmp_path: Path) -> None:
+        catalog = CacheCatalog(tmp_path / "catalog.sqlite3")
+        catalog.add("reg", "old", "sha", FILES)
+        catalog.add("reg", "new", "sha", FILES)
+        catalog.touch("reg", "old", "sha", now=1.0)
+        catalog.touch("reg", "new", "sha", now=2.0)
+
+        assert [e.plugin for e in catalog.entries()] == ["old", "new"]
+
+    def test_stats_sums_all_entries(self, tmp_path: Path) -> None:
+        catalog = CacheCatalog(tmp_path / "catalog.sqlite3")
+        catalog.add("reg", "one", "sha", FILES)
+        catalog.add("reg", "two", "sha", FILES[:1])
+
+        stats = catalog.stats()
+
+        assert (stats.entry_count, stats.file_count, stats.total_size) == (2, 3, 11)
+
+
+class TestCacheCatalogSchema:
+    def test_rebuilds_on_schema_version_mismatch(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "catalog.sqlite3"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE entries (junk TEXT)")
+        conn.execute("PRAGMA user_version = 999")
+        conn.commit()
+        conn.close()
+
+        catalog = CacheCatalog(db_path)
+        catalog.add("reg", "plugin", "sha", FILES)
+
+        assert catalog.get("reg", "plugin", "sha") is not None
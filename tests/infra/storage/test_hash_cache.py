@@ -0,0 +1,173 @@
+"""Tests for HashCache stat-keyed digest cache."""
+
+import hashlib
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from promptkit.infra.storage.hash_cache import HashCache
+
+OLD_MTIME_NS = 1_700_000_000_000_000_000
+
+
+def _write_old(path: Path, content: str) -> Path:
+    """Write a file with an mtime well outside the racy window."""
+    path.write_text(content)
+    os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    return path
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Path:
+    return tmp_path / ".promptkit" / "hashes.json"
+
+
+class TestFileDigest:
+    def test_returns_sha256_of_file_bytes(
+        self, tmp_path: Path, cache_path: Path
+    ) -> None:
+        path = _write_old(tmp_path / "a.md", "# A")
+
+        digest = HashCache(cache_path).file_digest(path)
+
+        assert digest == hashlib.sha256(b"# A").hexdigest()
+
+    def test_record_includes_size(self, tmp_path: Path, cache_path: Path) -> None:
+        path = _write_old(tmp_path / "a.md", "# A")
+
+        record = HashCache(cache_path).file_record(path)
+
+        assert record == (3, hashlib.sha256(b"# A").hexdigest())
+
+    def test_unchanged_file_is_not_reread_after_save(
+        self, tmp_path: Path, cache_path: Path
+    ) -> None:
+        path = _write_old(tmp_path / "a.md", "# A")
+        first = HashCache(cache_path)
+        first.file_digest(path)
+        first.save()
+
+        with patch("promptkit.infra.storage.hash_cache._sha256_file") as sha256_file:
+            digest = HashCache(cache_path).file_digest(path)
+
+        sha256_file.assert_not_called()
+        assert digest == hashlib.sha256(b"# A").hexdigest()
+
+    def test_changed_file_is_reread(self, tmp_path: Path, cache_path: Path) -> None:
+        path = _write_old(tmp_path / "a.md", "# A")
+        first = HashCache(cache_path)
+        first.file_digest(path)
+        first.save()
+        path.write_text("# Changed")
+        os.utime(path, ns=(OLD_MTIME_NS + 1, OLD_MTIME_NS + 1))
+
+        digest = HashCache(cache_path).file_digest(path)
+
+        assert digest == hashlib.sha256(b"# Changed").hexdigest()
+
+    def test_recently_modified_file_is_not_cached(
+        self, tmp_path: Path, cache_path: Path
+    ) -> None:
+        path = tmp_path / "a.md"
+        path.write_text("# A")
+        first = HashCache(cache_path)
+        first.file_digest(path)
+        first.save()
+
+        with patch(
+            "promptkit.infra.storage.hash_cache._sha256_file", return_value="x"
+        ) as sha256_file:
+            HashCache(cache_path).file_digest(path)
+
+        sha256_file.assert_called_once()
+
+
+class TestPluginHash:
+    def test_reuses_hash_while_digests_match(self, cache_path: Path) -> None:
+        first = HashCache(cache_path)
+        first.plugin_hash("local/a", (("a.md", "d1"),), lambda: "sha256:one")
+        first.save()
+
+        result = HashCache(cache_path).plugin_hash(
+            "local/a", (("a.md", "d1"),), lambda: "sha256:two"
+        )
+
+        assert result == "sha256:one"
+
+    def test_recomputes_when_digests_differ(self, cache_path: Path) -> None:
+        first = HashCache(cache_path)
+        first.plugin_hash("local/a", (("a.md", "d1"),), lambda: "sha256:one")
+        first.save()
+
+        result = HashCache(cache_path).plugin_hash(
+            "local/a", (("a.md", "d2"),), lambda: "sha256:two"
+        )
+
+        assert result == "sha256:two"
+
+    def test_save_drops_entries_not_used_since_loading(self, cache_path: Path) -> None:
+        first = HashCache(cache_path)
+        first.plugin_hash("local/gone", (("a.md", "d1"),), lambda: "sha256:one")
+        first.save()
+        second = HashCache(cache_path)
+        second.save()
+
+        result = HashCache(cache_path).plugin_hash(
+            "local/gone", (("a.md", "d1"),), lambda: "sha256:new"
+        )
+
+        assert result == "sha256:new"
+
+    def test_save_keep_unseen_merges_with_loaded_entries(
+        self, cache_path: Path
+    ) -> None:
+        first = HashCache(cache_path)
+        first.plugin_hash("local/a", (("a.md", "d1"),), lambda: "sha256:a")
+        first.save()
+        second = HashCache(cache_path)
+        second.plugin_hash("local/b", (("b.md", "d2"),), lambda: "sha256:b")
+        second.save(keep_unseen=True)
+        third = HashCache(cache_path)
+
+        a = third.plugin_hash("local/a", (("a.md", "d1"),), lambda: "sha256:new")
+        b = third.plugin_hash("local/b", (("b.md", "d2"),), lambda: "sha256:new")
+
+        assert (a, b) == ("sha256:a", "sha256:b")
+
+
+class TestListing:
+    STAMPS = (("my-skill", OLD_MTIME_NS), ("my-skill/.promptkitignore", None))
+
+    def test_round_trips_files_and_stamps(self, cache_path: Path) -> None:
+        first = HashCache(cache_path)
+        first.record_listing("local/my-skill", ("my-skill/SKILL.md",), self.STAMPS)
+        first.save()
+
+        listing = HashCache(cache_path).listing("local/my-skill")
+
+        assert listing == (("my-skill/SKILL.md",), self.STAMPS)
+
+    def test_save_drops_listings_not_recorded_since_loading(
+        self, cache_path: Path
+    ) -> None:
+        first = HashCache(cache_path)
+        first.record_listing("local/my-skill", ("my-skill/SKILL.md",), self.STAMPS)
+        first.save()
+        HashCache(cache_path).save()
+
+        assert HashCache(cache_path).listing("local/my-skill") is None
+
+
+class TestPersistence:
+    def test_corrupt_cache_reads_as_empty(
+        self, tmp_path: Path, cache_path: Path
+    ) -> None:
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text("{not json")
+        path = _write_old(tmp_path / "a.md", "# A")
+
+        digest = HashCache(cache_path).file_digest(path)
+
+        assert digest == hashlib.sha256(b"# A").hexdigest()
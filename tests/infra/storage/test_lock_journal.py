@@ -0,0 +1,65 @@
+"""Tests for LockJournal."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from promptkit.domain.lock_entry import LockEntry
+from promptkit.infra.storage.lock_journal import LockJournal
+
+ENTRY = LockEntry(
+    name="code-review",
+    source="my-registry/code-review",
+    content_hash="",
+    fetched_at=datetime(2026, 2, 9, 12, 0, tzinfo=timezone.utc),
+    commit_sha="sha-1",
+    tree_id="tree-1",
+)
+
+
+@pytest.fixture
+def journal_path(tmp_path: Path) -> Path:
+    return tmp_path / ".promptkit" / "lock-journal.jsonl"
+
+
+class TestLockJournal:
+    def test_new_journal_is_empty(self, journal_path: Path) -> None:
+        assert LockJournal(journal_path).start("config-a") == {}
+
+    def test_recorded_entries_survive_for_the_same_config(
+        self, journal_path: Path
+    ) -> None:
+        journal = LockJournal(journal_path)
+        journal.start("config-a")
+        journal.record(ENTRY)
+
+        assert LockJournal(journal_path).start("config-a") == {ENTRY.source: ENTRY}
+
+    def test_other_config_starts_over(self, journal_path: Path) -> None:
+        journal = LockJournal(journal_path)
+        journal.start("config-a")
+        journal.record(ENTRY)
+
+        assert LockJournal(journal_path).start("config-b") == {}
+        assert LockJournal(journal_path).start("config-a") == {}
+
+    def test_line_cut_short_is_ignored(self, journal_path: Path) -> None:
+        journal = LockJournal(journal_path)
+        journal.start("config-a")
+        with journal_path.open("a") as f:
+            f.write('{"name": "tor')
+
+        resumed = LockJournal(journal_path)
+        assert resumed.start("config-a") == {}
+        resumed.record(ENTRY)
+
+        assert LockJournal(journal_path).start("config-a") == {ENTRY.source: ENTRY}
+
+    def test_discard_removes_the_journal(self, journal_path: Path) -> None:
+        journal = LockJournal(journal_path)
+        journal.start("config-a")
+
+        journal.discard()
+
+        assert not journal_path.exists()
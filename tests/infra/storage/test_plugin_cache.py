@@ -1,5 +1,6 @@
 """Tests for PluginCache directory-based storage."""
 
+import shutil
 from pathlib import Path
 
 from promptkit.infra.storage.plugin_cache import PluginCache
@@ -58,3 +59,148 @@ class TestPluginCacheListFiles:
             "skills/xlsx/SKILL.md",
             "skills/xlsx/scripts/processor.py",
         ]
+
+
+def _populate(cache: PluginCache, registry: str, plugin: str, sha: str) -> Path:
+    cache_dir = cache.plugin_dir(registry, plugin, sha)
+    (cache_dir / "agents").mkdir(parents=True)
+    (cache_dir / "agents" / "reviewer.md").write_text("content")
+    return cache_dir
+
+
+class TestPluginCacheCatalog:
+    def test_register_records_sizes_and_hashes(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        _populate(cache, "reg", "plugin", "sha")
+
+        cache.register("reg", "plugin", "sha")
+
+        [recorded] = cache.catalog.files("reg", "plugin", "sha")
+        assert recorded.path == "agents/reviewer.md"
+        assert recorded.size == len("content")
+        assert len(recorded.sha256) == 64
+
+    def test_list_files_served_from_catalog(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        cache_dir = _populate(cache, "reg", "plugin", "sha")
+        cache.register("reg", "plugin", "sha")
+        # A file added behind the catalog's back is not listed
+        (cache_dir / "agents" / "extra.md").write_text("extra")
+
+        assert cache.list_files("reg", "plugin", "sha") == ["agents/reviewer.md"]
+
+    def test_has_drops_entry_deleted_from_disk(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        cache_dir = _populate(cache, "reg", "plugin", "sha")
+        cache.register("reg", "plugin", "sha")
+        shutil.rmtree(cache_dir)
+
+        assert cache.has("reg", "plugin", "sha") is False
+        assert cache.catalog.get("reg", "plugin", "sha") is None
+
+    def test_reconcile_indexes_unknown_and_drops_missing(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        _populate(cache, "reg", "on-disk", "sha")
+        gone = _populate(cache, "reg", "gone", "sha")
+        cache.register("reg", "gone", "sha")
+        shutil.rmtree(gone)
+
+        cache.reconcile()
+
+        assert [e.plugin for e in cache.catalog.entries()] == ["on-disk"]
+
+
+class TestPluginCacheGc:
+    def test_evicts_entries_older_than_max_age(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        _populate(cache, "reg", "stale", "sha")
+        _populate(cache, "reg", "fresh", "sha")
+        cache.reconcile()
+        cache.catalog.touch("reg", "stale", "sha", now=0.0)
+
+        evicted = cache.gc(max_age_seconds=3600)
+
+        assert [e.plugin for e in evicted] == ["stale"]
+        assert not (tmp_path / "reg" / "stale").exists()
+        assert cache.has("reg", "fresh", "sha")
+
+    def test_evicts_least_recently_used_until_under_max_size(
+        self, tmp_path: Path
+    ) -> None:
+        cache = PluginCache(tmp_path)
+        for name, used_at in (("a", 1.0), ("b", 2.0), ("c", 3.0)):
+            _populate(cache, "reg", name, "sha")
+            cache.register("reg", name, "sha")
+            cache.catalog.touch("reg", name, "sha", now=used_at)
+
+        evicted = cache.gc(max_size=len("content"))
+
+        assert [e.plugin for e in evicted] == ["a", "b"]
+        assert cache.stats().entry_count == 1
+
+
+class TestPluginCachePacking:
+    def test_pack_replaces_directory_with_archive(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        cache_dir = _populate(cache, "reg", "plugin", "sha")
+
+        cache.pack("reg", "plugin", "sha")
+
+        assert not cache_dir.exists()
+        assert cache.pack_path("reg", "plugin", "sha").is_file()
+        assert cache.has("reg", "plugin", "sha")
+        assert cache.list_files("reg", "plugin", "sha") == ["agents/reviewer.md"]
+        assert cache.stats().packed_count == 1
+
+    def test_open_file_reads_from_pack(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        _populate(cache, "reg", "plugin", "sha")
+        cache.pack("reg", "plugin", "sha")
+
+        with cache.open_file("reg", "plugin", "sha", "agents/reviewer.md") as f:
+            assert f.read() == b"content"
+
+    def test_unpacked_dir_restores_hot_tier(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        _populate(cache, "reg", "plugin", "sha")
+        cache.pack("reg", "plugin", "sha")
+
+        hot_dir = cache.unpacked_dir("reg", "plugin", "sha")
+
+        assert (hot_dir / "agents" / "reviewer.md").read_text() == "content"
+        assert not cache.pack_path("reg", "plugin", "sha").exists()
+        assert cache.stats().packed_count == 0
+
+    def test_has_indexes_uncatalogued_pack(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        _populate(cache, "reg", "plugin", "sha")
+        cache.pack("reg", "plugin", "sha")
+        cache.catalog.close()
+        cache.catalog.db_path.unlink()
+
+        fresh = PluginCache(tmp_path)
+
+        assert fresh.has("reg", "plugin", "sha")
+        assert fresh.list_files("reg", "plugin", "sha") == ["agents/reviewer.md"]
+
+    def test_pack_idle_skips_recently_used(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        _populate(cache, "reg", "idle", "sha")
+        _populate(cache, "reg", "busy", "sha")
+        cache.reconcile()
+        cache.catalog.touch("reg", "idle", "sha", now=0.0)
+
+        packed = cache.pack_idle(min_idle_seconds=3600)
+
+        assert [e.plugin for e in packed] == ["idle"]
+        assert cache.plugin_dir("reg", "busy", "sha").is_dir()
+
+    def test_evict_removes_pack(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path)
+        _populate(cache, "reg", "plugin", "sha")
+        cache.pack("reg", "plugin", "sha")
+
+        cache.evict("reg", "plugin", "sha")
+
+        assert not (tmp_path / "reg").exists()
+        assert cache.has("reg", "plugin", "sha") is False
@@ -0,0 +1,113 @@
+"""Tests for the remote plugin cache client and reference server."""
+
+import http.client
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+import pytest
+
+from promptkit.infra.storage.plugin_cache import PluginCache
+from promptkit.infra.storage.remote_cache import RemoteCache
+from promptkit.infra.storage.remote_cache_server import make_server
+
+
+@pytest.fixture
+def remote(tmp_path: Path) -> Iterator[RemoteCache]:
+    """Run a reference server on an ephemeral port for the test."""
+    server = make_server(tmp_path / "server", "127.0.0.1", 0)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    host, port = server.server_address[:2]
+    yield RemoteCache(f"http://{host}:{port}", timeout=5)
+    server.shutdown()
+    server.server_close()
+
+
+def _populate(cache: PluginCache) -> None:
+    entry_dir = cache.plugin_dir("reg", "plugin", "sha1")
+    (entry_dir / "agents").mkdir(parents=True)
+    (entry_dir / "agents" / "a.md").write_text("# A")
+    cache.register("reg", "plugin", "sha1")
+
+
+class TestRemoteCacheClient:
+    def test_open_returns_none_for_missing_entry(self, remote: RemoteCache) -> None:
+        assert remote.open("reg", "plugin", "nope") is None
+
+
+class TestPluginCacheRemoteTier:
+    def test_publish_then_pull_on_another_machine(
+        self, tmp_path: Path, remote: RemoteCache
+    ) -> None:
+        node_a = PluginCache(tmp_path / "a", remote=remote)
+        _populate(node_a)
+        assert node_a.publish("reg", "plugin", "sha1") is True
+
+        node_b = PluginCache(tmp_path / "b", remote=remote)
+
+        assert node_b.has("reg", "plugin", "sha1") is True
+        assert node_b.list_files("reg", "plugin", "sha1") == ["agents/a.md"]
+        entry_dir = node_b.plugin_dir("reg", "plugin", "sha1")
+        assert (entry_dir / "agents" / "a.md").read_text() == "# A"
+
+    def test_remote_miss_is_a_cache_miss(
+        self, tmp_path: Path, remote: RemoteCache
+    ) -> None:
+        cache = PluginCache(tmp_path / "cache", remote=remote)
+        assert cache.has("reg", "plugin", "sha1") is False
+
+    def test_unreachable_remote_is_a_cache_miss(self, tmp_path: Path) -> None:
+        unreachable = RemoteCache("http://127.0.0.1:9", timeout=1)
+        cache = PluginCache(tmp_path / "cache", remote=unreachable)
+        _populate(cache)
+
+        assert cache.publish("reg", "plugin", "sha1") is False
+        assert cache.has("reg", "plugin", "nope") is False
+
+    def test_truncated_download_is_a_cache_miss(
+        self, tmp_path: Path, remote: RemoteCache
+    ) -> None:
+        class TruncatingRemote(RemoteCache):
+            def open(self, registry: str, plugin: str, sha: str, /) -> IO[bytes]:
+                raise http.client.IncompleteRead(b"partial", 100)
+
+        cache = PluginCache(
+            tmp_path / "cache", remote=TruncatingRemote(remote.base_url)
+        )
+
+        assert cache.has("reg", "plugin", "sha1") is False
+
+    def test_publish_without_remote_is_noop(self, tmp_path: Path) -> None:
+        cache = PluginCache(tmp_path / "cache")
+        _populate(cache)
+        assert cache.publish("reg", "plugin", "sha1") is False
+
+
+class TestReferenceServer:
+    def test_rejects_paths_outside_entry_namespace(self, remote: RemoteCache) -> None:
+        request = urllib.request.Request(
+            f"{remote.base_url}/v1/entries/../../etc/passwd.tar.gz",
+            data=b"x",
+            method="PUT",
+        )
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(request, timeout=5)
+        assert excinfo.value.code == 400
+
+    def test_rejects_malformed_content_length(self, remote: RemoteCache) -> None:
+        host, port = remote.base_url.removeprefix("http://").split(":")
+        connection = http.client.HTTPConnection(host, int(port), timeout=5)
+        connection.putrequest("PUT", "/v1/entries/reg/plugin/sha1.tar.gz")
+        connection.putheader("Content-Length", "abc")
+        connection.endheaders()
+
+        response = connection.getresponse()
+        connection.close()
+
+        assert response.status == 400
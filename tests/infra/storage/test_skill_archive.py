@@ -0,0 +1,141 @@
+"""Tests for zip-packaged skill extraction."""
+
+import io
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from promptkit.domain.errors import SyncError
+from promptkit.infra.storage import skill_archive
+from promptkit.infra.storage.skill_archive import SkillArchiveCache, extract_zip
+
+
+def _zip(files: dict[str, bytes | str]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def _write(data: bytes, path: Path) -> Path:
+    path.write_bytes(data)
+    return path
+
+
+def _writer(data: bytes, calls: list[Path] | None = None) -> Callable[[Path], None]:
+    """Return a write_archive callback writing data, as the fetcher's does."""
+
+    def write_archive(path: Path) -> None:
+        if calls is not None:
+            calls.append(path)
+        path.write_bytes(data)
+
+    return write_archive
+
+
+class TestExtractZip:
+    def test_writes_files_and_reports_counts(self, tmp_path: Path) -> None:
+        data = _zip({"SKILL.md": "# Skill", "scripts/run.py": "print()"})
+
+        count, size = extract_zip(_write(data, tmp_path / "a.zip"), tmp_path / "out")
+
+        assert (count, size) == (2, len("# Skill") + len("print()"))
+        assert (tmp_path / "out" / "scripts" / "run.py").read_text() == "print()"
+
+    @pytest.mark.parametrize(
+        "name", ["../evil.md", "/abs.md", "a/../../b.md", "C:x.md"]
+    )
+    def test_rejects_path_traversal(self, tmp_path: Path, name: str) -> None:
+        data = _zip({name: "x"})
+
+        with pytest.raises(SyncError, match="Unsafe path"):
+            extract_zip(_write(data, tmp_path / "a.zip"), tmp_path / "out")
+        assert not (tmp_path / "evil.md").exists()
+
+    def test_rejects_oversized_declared_entry(self, tmp_path: Path) -> None:
+        data = _zip({"big.md": "x" * 100})
+
+        with (
+            patch.object(skill_archive, "MAX_MEMBER_SIZE", 10),
+            pytest.raises(SyncError, match="too large"),
+        ):
+            extract_zip(_write(data, tmp_path / "a.zip"), tmp_path / "out")
+
+    def test_rejects_high_compression_ratio(self, tmp_path: Path) -> None:
+        data = _zip({"bomb.md": b"\0" * 1_000_000})
+
+        with pytest.raises(SyncError, match="compression ratio"):
+            extract_zip(_write(data, tmp_path / "a.zip"), tmp_path / "out")
+        assert not (tmp_path / "out" / "bomb.md").exists()
+
+    def test_rejects_symlinks(self, tmp_path: Path) -> None:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            info = zipfile.ZipInfo("link")
+            info.external_attr = 0o120777 << 16
+            archive.writestr(info, "/etc/passwd")
+
+        with pytest.raises(SyncError, match="Symlink"):
+            extract_zip(_write(buffer.getvalue(), tmp_path / "a.zip"), tmp_path / "out")
+
+    def test_rejects_invalid_archive(self, tmp_path: Path) -> None:
+        with pytest.raises(SyncError, match="Invalid skill archive"):
+            extract_zip(_write(b"not a zip", tmp_path / "a.zip"), tmp_path / "out")
+
+
+class TestSkillArchiveCache:
+    def test_extracts_once_per_archive_hash(self, tmp_path: Path) -> None:
+        cache = SkillArchiveCache(tmp_path / "archives")
+        data = _zip({"SKILL.md": "# Skill"})
+
+        with patch.object(
+            skill_archive, "extract_zip", wraps=skill_archive.extract_zip
+        ) as extract:
+            cache.materialize("digest", _writer(data), tmp_path / "a")
+            cache.materialize("digest", _writer(data), tmp_path / "b")
+
+        assert extract.call_count == 1
+        assert (tmp_path / "b" / "SKILL.md").read_text() == "# Skill"
+        assert cache.has("digest")
+
+    def test_reads_archive_only_on_a_miss_and_removes_it(self, tmp_path: Path) -> None:
+        cache = SkillArchiveCache(tmp_path / "archives")
+        writes: list[Path] = []
+        write_archive = _writer(_zip({"SKILL.md": "# Skill"}), writes)
+
+        cache.materialize("digest", write_archive, tmp_path / "a")
+        cache.materialize("digest", write_archive, tmp_path / "b")
+
+        assert len(writes) == 1
+        assert not writes[0].exists()
+
+    def test_re_extracts_an_interrupted_entry(self, tmp_path: Path) -> None:
+        cache = SkillArchiveCache(tmp_path / "archives")
+        (cache.entry_dir("digest") / "partial").mkdir(parents=True)
+
+        cache.materialize(
+            "digest", _writer(_zip({"SKILL.md": "# S"})), tmp_path / "out"
+        )
+
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["SKILL.md"]
+
+    def test_strips_matching_top_level_directory(self, tmp_path: Path) -> None:
+        cache = SkillArchiveCache(tmp_path / "archives")
+        data = _zip({"xlsx/SKILL.md": "# XLSX"})
+
+        cache.materialize("digest", _writer(data), tmp_path / "out", strip_root="xlsx")
+
+        assert (tmp_path / "out" / "SKILL.md").read_text() == "# XLSX"
+
+    def test_failed_extraction_leaves_no_entry(self, tmp_path: Path) -> None:
+        cache = SkillArchiveCache(tmp_path / "archives")
+
+        with pytest.raises(SyncError):
+            cache.materialize("digest", _writer(_zip({"../x": "x"})), tmp_path / "out")
+
+        assert not cache.has("digest")
+        assert list((tmp_path / "archives").iterdir()) == []
@@ -0,0 +1,143 @@
+"""Tests for SyncState fingerprinting of the last successful sync."""
+
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from promptkit.infra.storage.sync_state import SyncState
+
+OLD_MTIME_NS = 1_600_000_000 * 10**9
+MAX_AGE = 900.0
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    (tmp_path / "promptkit.yaml").write_text("version: 1\n")
+    (tmp_path / "promptkit.lock").write_text("version: 1\nprompts: []\n")
+    rule = tmp_path / "prompts" / "rules" / "a.md"
+    rule.parent.mkdir(parents=True)
+    rule.write_text("# A")
+    os.utime(rule, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    artifact = tmp_path / ".claude" / "rules" / "a.md"
+    artifact.parent.mkdir(parents=True)
+    artifact.write_text("# A")
+    return tmp_path
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _state(
+    project_dir: Path,
+    heads: dict[str, str] | None = None,
+    clock: Clock | None = None,
+) -> SyncState:
+    return SyncState(
+        project_dir / ".promptkit" / "sync-state.json",
+        project_dir,
+        registry_heads=lambda: heads or {},
+        base_configs=lambda: [project_dir.parent / "base.yaml"],
+        clock=clock or time.time,
+    )
+
+
+def _record(state: SyncState, project_dir: Path) -> None:
+    state.record([project_dir / ".claude" / "rules" / "a.md"])
+
+
+class TestIsCurrent:
+    def test_not_current_without_a_recorded_sync(self, project_dir: Path) -> None:
+        assert not _state(project_dir).is_current(max_registry_age=MAX_AGE)
+
+    def test_current_after_recording(self, project_dir: Path) -> None:
+        _record(_state(project_dir), project_dir)
+
+        assert _state(project_dir).is_current(max_registry_age=MAX_AGE)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda d: (d / "promptkit.yaml").write_text("version: 1\nprompts: []\n"),
+            lambda d: (d / "promptkit.lock").unlink(),
+            lambda d: (d.parent / "base.yaml").write_text("prompts: []\n"),
+            lambda d: (d / "prompts" / "rules" / "b.md").write_text("# B"),
+            lambda d: (d / "prompts" / "rules" / "a.md").write_text("# A2"),
+            lambda d: (d / ".claude" / "rules" / "a.md").unlink(),
+            lambda d: (d / ".claude" / "rules" / "a.md").write_text("edited"),
+        ],
+        ids=[
+            "config",
+            "lock",
+            "base-config",
+            "new-prompt",
+            "edited-prompt",
+            "artifact",
+            "edit",
+        ],
+    )
+    def test_any_change_invalidates(
+        self, project_dir: Path, change: Callable[[Path], object]
+    ) -> None:
+        _record(_state(project_dir), project_dir)
+
+        change(project_dir)
+
+        assert not _state(project_dir).is_current(max_registry_age=MAX_AGE)
+
+    def test_moved_registry_head_invalidates(self, project_dir: Path) -> None:
+        _record(_state(project_dir, {"reg": "sha-1"}), project_dir)
+
+        state = _state(project_dir, {"reg": "sha-2"})
+
+        assert not state.is_current(max_registry_age=MAX_AGE)
+
+    def test_registries_expire_after_max_age(self, project_dir: Path) -> None:
+        clock = Clock()
+        heads = {"reg": "sha-1"}
+        _record(_state(project_dir, heads, clock), project_dir)
+        state = _state(project_dir, heads, clock)
+        assert state.is_current(max_registry_age=MAX_AGE)
+
+        clock.now += MAX_AGE
+
+        assert not state.is_current(max_registry_age=MAX_AGE)
+
+    def test_without_registries_age_does_not_matter(self, project_dir: Path) -> None:
+        clock = Clock()
+        _record(_state(project_dir, clock=clock), project_dir)
+
+        clock.now += MAX_AGE * 10
+
+        assert _state(project_dir, clock=clock).is_current(max_registry_age=MAX_AGE)
+
+
+class TestRecord:
+    def test_racy_prompt_file_is_not_recorded(self, project_dir: Path) -> None:
+        (project_dir / "prompts" / "rules" / "b.md").write_text("# B")
+
+        _record(_state(project_dir), project_dir)
+
+        assert not _state(project_dir).is_current(max_registry_age=MAX_AGE)
+
+    def test_clear_forgets_the_sync(self, project_dir: Path) -> None:
+        state = _state(project_dir)
+        _record(state, project_dir)
+
+        state.clear()
+
+        assert not state.is_current(max_registry_age=MAX_AGE)
+
+    def test_corrupt_state_is_not_current(self, project_dir: Path) -> None:
+        path = project_dir / ".promptkit" / "sync-state.json"
+        path.parent.mkdir()
+        path.write_text('{"version": 1}')
+
+        assert not _state(project_dir).is_current(max_registry_age=MAX_AGE)
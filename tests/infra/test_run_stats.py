@@ -0,0 +1,50 @@
+"""Tests for RunStats per-run accounting."""
+
+import json
+from pathlib import Path
+
+from promptkit.infra.run_stats import Refetch, RunStats
+
+
+def test_records_hits_misses_and_copies_per_registry() -> None:
+    """Counters should accumulate separately for each registry."""
+    stats = RunStats(command="lock")
+
+    stats.record_hit("official")
+    stats.record_hit("official", remote=True)
+    stats.record_miss("community", "community/foo", "not cached")
+    stats.record_copy("community", 3, 120)
+
+    assert stats.registry("official").hits == 1
+    assert stats.registry("official").remote_hits == 1
+    assert stats.registry("community").misses == 1
+    assert stats.registry("community").files_copied == 3
+    assert stats.registry("community").bytes_copied == 120
+    assert stats.refetches == [Refetch(source="community/foo", reason="not cached")]
+
+
+def test_timed_adds_to_git_or_copy_phase() -> None:
+    """timed() should attribute elapsed time to the given phase only."""
+    stats = RunStats(command="lock")
+
+    with stats.timed("official", "git"):
+        pass
+
+    assert stats.registry("official").git_seconds >= 0
+    assert stats.registry("official").copy_seconds == 0
+
+
+def test_append_to_writes_one_json_line_per_run(tmp_path: Path) -> None:
+    """append_to() should append a JSON record, creating parent dirs."""
+    history = tmp_path / ".promptkit" / "stats.jsonl"
+    first = RunStats(command="lock")
+    first.record_hit("official")
+    first.append_to(history, success=True)
+    RunStats(command="sync").append_to(history, success=False)
+
+    records = [json.loads(line) for line in history.read_text().splitlines()]
+
+    assert [r["command"] for r in records] == ["lock", "sync"]
+    assert records[0]["success"] is True
+    assert records[0]["registries"]["official"]["hits"] == 1
+    assert records[1]["success"] is False
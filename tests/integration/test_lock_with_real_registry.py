@@ -13,6 +13,7 @@ import pytest
 from promptkit.app.lock import LockPrompts
 from promptkit.domain.errors import SyncError
 from promptkit.domain.lock_entry import LockEntry
+from promptkit.domain.prompt_spec import PromptSpec
 from promptkit.infra.config.lock_file import LockFile
 from promptkit.infra.config.yaml_loader import YamlLoader
 from promptkit.infra.fetchers.claude_marketplace import ClaudeMarketplaceFetcher
@@ -82,10 +83,10 @@ class TestLockWithRealRegistry:
         """Test locking the code-simplifier plugin from claude-plugins-official.
 
         This verifies:
-        1. Real GitHub fetch via ClaudeMarketplaceFetcher works
-        2. Files are cached in plugin cache
-        3. Lock file is created with proper entries
-        4. commit_sha is recorded (full 40-char SHA)
+        1. Real GitHub resolve via ClaudeMarketplaceFetcher works
+        2. Lock file is created with proper entries
+        3. commit_sha and tree_id are recorded (full 40-char SHAs)
+        4. Lock copies nothing; materialising the locked SHA fills the cache
         """
         config_yaml = """\
 version: 1
@@ -118,9 +119,10 @@ platforms:
         assert entry.source == "claude-plugins-official/code-simplifier"
         assert entry.commit_sha is not None
         assert len(entry.commit_sha) == 40
+        assert entry.tree_id is not None
+        assert len(entry.tree_id) == 40
         assert entry.fetched_at == FIXED_TIME
 
-        # Verify files are cached on disk
         cache_dir = (
             project_dir
             / ".promptkit"
@@ -130,6 +132,10 @@ platforms:
             / "code-simplifier"
             / entry.commit_sha
         )
+        assert not cache_dir.exists()
+
+        spec = PromptSpec(source=entry.source)
+        marketplace_fetcher.materialize(spec, entry.commit_sha)
         assert cache_dir.is_dir()
         cached_files = list(cache_dir.rglob("*"))
         assert any(f.is_file() for f in cached_files)
@@ -1,6 +1,9 @@
 """Tests for CLI interface."""
 
+import json
 import os
+import subprocess
+import sys
 from collections.abc import Iterator
 from pathlib import Path
 
@@ -12,6 +15,21 @@ from promptkit.cli import app
 
 runner = CliRunner()
 
+DEFERRED_MODULES = (
+    "yaml",
+    "pydantic",
+    "pydantic_settings",
+    "rich",
+    "sqlite3",
+    "tarfile",
+    "zipfile",
+    "urllib.request",
+    "concurrent.futures",
+)
+DEFERRED_PREFIXES = ("promptkit.app", "promptkit.infra")
+# Generous enough for a loaded CI runner; tests/benchmarks holds the tight one.
+MAX_IMPORT_MS = 250.0
+
 
 @pytest.fixture
 def working_dir(tmp_path: Path) -> Iterator[Path]:
@@ -22,6 +40,48 @@ def working_dir(tmp_path: Path) -> Iterator[Path]:
     os.chdir(original)
 
 
+def test_importing_cli_defers_heavy_modules() -> None:
+    """--help, completion and hooks only pay for typer and cli.py itself."""
+    script = "import sys, promptkit.cli; print('\\n'.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    loaded = result.stdout.split()
+
+    eager = [
+        name
+        for name in loaded
+        if name in DEFERRED_MODULES
+        or name.split(".")[0] in DEFERRED_MODULES
+        or name.startswith(DEFERRED_PREFIXES)
+    ]
+
+    assert eager == []
+
+
+def _cli_import_ms() -> float:
+    """Return the ms importing promptkit.cli takes beyond typer, in a fresh process."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import promptkit.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times.setdefault(name.strip(), int(cumulative))
+    return (times["promptkit.cli"] - times.get("typer", 0)) / 1000
+
+
+def test_importing_cli_stays_within_budget() -> None:
+    """A regression that makes cli.py import heavy again should fail by default."""
+    assert min(_cli_import_ms() for _ in range(3)) < MAX_IMPORT_MS
+
+
 def test_init_command_can_be_invoked() -> None:
     """init command should be invocable via CLI."""
     result = runner.invoke(app, ["--help"])
@@ -177,6 +237,111 @@ def test_lock_succeeds_with_no_prompts(working_dir: Path) -> None:
     assert lock_content["prompts"] == []
 
 
+def test_lock_stats_prints_summary_and_appends_history(working_dir: Path) -> None:
+    """lock --stats should print a cache summary; every run is recorded."""
+    _scaffold_project(working_dir)
+
+    runner.invoke(app, ["lock"])
+    result = runner.invoke(app, ["lock", "--stats"])
+
+    assert result.exit_code == 0
+    assert "Cache: 0 hits (0 remote), 0 misses, hit rate n/a" in result.stdout
+    history = (working_dir / ".promptkit" / "stats.jsonl").read_text().splitlines()
+    assert len(history) == 2
+    assert json.loads(history[-1])["command"] == "lock"
+
+
+def test_lock_without_config_writes_no_history(working_dir: Path) -> None:
+    """A failed lock outside a project should not create .promptkit/."""
+    runner.invoke(app, ["lock", "--stats"])
+
+    assert not (working_dir / ".promptkit").exists()
+
+
+def test_lock_offline_succeeds_with_local_prompts(working_dir: Path) -> None:
+    """lock --offline needs no registry access when only local prompts exist."""
+    _scaffold_project(working_dir)
+
+    result = runner.invoke(app, ["lock", "--offline"])
+
+    assert result.exit_code == 0
+    assert (working_dir / "promptkit.lock").exists()
+
+
+def test_lock_only_relocks_named_local_prompt(working_dir: Path) -> None:
+    """lock --only should lock just the named source and keep the rest."""
+    _scaffold_project(working_dir)
+    (working_dir / "prompts" / "rules").mkdir(parents=True, exist_ok=True)
+    (working_dir / "prompts" / "rules" / "rule-a.md").write_text("# A")
+    runner.invoke(app, ["lock"])
+    (working_dir / "prompts" / "rules" / "rule-b.md").write_text("# B")
+
+    result = runner.invoke(app, ["lock", "--only", "local/rules/rule-b"])
+
+    assert result.exit_code == 0
+    assert "Locked 1 plugin" in result.stdout
+    lock_content = yaml.safe_load((working_dir / "promptkit.lock").read_text())
+    assert len(lock_content["prompts"]) == 2
+
+
+def test_add_rejects_undefined_registry(working_dir: Path) -> None:
+    """add should fail without touching the config for an unknown registry."""
+    _scaffold_project(working_dir)
+    config = (working_dir / "promptkit.yaml").read_text()
+
+    result = runner.invoke(app, ["add", "missing-registry/prompt"])
+
+    assert result.exit_code == 1
+    assert "undefined registry 'missing-registry'" in result.output
+    assert (working_dir / "promptkit.yaml").read_text() == config
+
+
+def test_update_fails_for_unknown_plugin(working_dir: Path) -> None:
+    """update should name a plugin that is neither configured nor locked."""
+    _scaffold_project(working_dir)
+    runner.invoke(app, ["lock"])
+
+    result = runner.invoke(app, ["update", "missing"])
+
+    assert result.exit_code == 1
+    assert "Unknown plugin: missing" in result.output
+
+
+# --- fetch command ---
+
+
+def test_fetch_command_shows_in_help() -> None:
+    """fetch should be listed in the main help."""
+    result = runner.invoke(app, ["--help"])
+
+    assert "fetch" in result.stdout
+
+
+def test_fetch_writes_no_lock_or_artifacts(working_dir: Path) -> None:
+    """fetch only warms clones and cache; it never writes lock or outputs."""
+    _scaffold_project(working_dir)
+    (working_dir / "promptkit.lock").unlink()
+    before = sorted(p for p in working_dir.rglob("*") if ".promptkit" not in p.parts)
+
+    result = runner.invoke(app, ["fetch"])
+
+    assert result.exit_code == 0
+    assert "Fetched 0 plugins from 0 registries" in result.stdout
+    after = sorted(p for p in working_dir.rglob("*") if ".promptkit" not in p.parts)
+    assert after == before
+
+
+def test_fetch_locked_fails_without_lock_file(working_dir: Path) -> None:
+    """fetch --locked should fail when there is no lock file."""
+    _scaffold_project(working_dir)
+    (working_dir / "promptkit.lock").unlink()
+
+    result = runner.invoke(app, ["fetch", "--locked"])
+
+    assert result.exit_code == 1
+    assert "promptkit.lock not found" in result.output
+
+
 # --- build command ---
 
 
@@ -265,6 +430,41 @@ def test_sync_succeeds_with_local_prompts(working_dir: Path) -> None:
     assert (working_dir / ".claude" / "rules" / "my-rule.md").exists()
 
 
+def test_second_sync_without_changes_does_nothing(
+    working_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With the opt-in skip window, sync exits early when nothing changed."""
+    monkeypatch.setenv("PROMPTKIT_SYNC_REGISTRY_MAX_AGE", "900")
+    _scaffold_project(working_dir)
+    rule = working_dir / "prompts" / "rules" / "my-rule.md"
+    rule.parent.mkdir(parents=True, exist_ok=True)
+    rule.write_text("# My Rule")
+    os.utime(rule, ns=(1_600_000_000 * 10**9, 1_600_000_000 * 10**9))
+    assert runner.invoke(app, ["sync"]).exit_code == 0
+    artifact = working_dir / ".claude" / "rules" / "my-rule.md"
+    mtime_ns = artifact.stat().st_mtime_ns
+
+    result = runner.invoke(app, ["sync"])
+    forced = runner.invoke(app, ["sync", "--force"])
+
+    assert result.exit_code == 0
+    assert "Already up to date" in result.output
+    assert "registries not pulled" in result.output
+    assert "Built 1 plugin" in forced.output
+    assert artifact.stat().st_mtime_ns == mtime_ns
+
+
+def test_second_sync_pulls_registries_by_default(working_dir: Path) -> None:
+    """Without PROMPTKIT_SYNC_REGISTRY_MAX_AGE, sync never skips the pull."""
+    _scaffold_project(working_dir)
+    assert runner.invoke(app, ["sync"]).exit_code == 0
+
+    result = runner.invoke(app, ["sync"])
+
+    assert "Already up to date" not in result.output
+    assert "Locked" in result.output
+
+
 def test_sync_fails_without_config(working_dir: Path) -> None:
     """sync command should show friendly error for missing config."""
     result = runner.invoke(app, ["sync"])
@@ -316,6 +516,20 @@ def test_validate_fails_with_invalid_config(working_dir: Path) -> None:
     assert "error" in result.output.lower()
 
 
+def test_validate_reports_uncloned_registry_base(working_dir: Path) -> None:
+    """validate reads registry bases from existing clones, never the network."""
+    (working_dir / "promptkit.yaml").write_text(
+        "version: 1\nregistries:\n  org: https://example.invalid/org\n"
+        "extends: org:base.yaml\n"
+    )
+
+    result = runner.invoke(app, ["validate"])
+
+    assert result.exit_code == 1
+    assert "not cloned" in result.output
+    assert not (working_dir / ".promptkit" / "registries" / "org").exists()
+
+
 def test_validate_fails_without_config(working_dir: Path) -> None:
     """validate command should exit 1 when no config file exists."""
     result = runner.invoke(app, ["validate"])
@@ -386,3 +600,107 @@ def test_validate_shows_warnings_with_exit_zero(working_dir: Path) -> None:
 
     assert result.exit_code == 0
     assert "warning" in result.output.lower()
+
+
+# --- cache command ---
+
+
+def _write_cached_plugin(working_dir: Path, plugin: str) -> None:
+    cache_dir = working_dir / ".promptkit" / "cache" / "plugins"
+    plugin_dir = cache_dir / "reg" / plugin / "sha"
+    (plugin_dir / "agents").mkdir(parents=True)
+    (plugin_dir / "agents" / "a.md").write_text("# Agent")
+
+
+def test_cache_stats_reports_entries(working_dir: Path) -> None:
+    """cache stats should index on-disk entries and report their size."""
+    _write_cached_plugin(working_dir, "one")
+    _write_cached_plugin(working_dir, "two")
+
+    result = runner.invoke(app, ["cache", "stats"])
+
+    assert result.exit_code == 0
+    assert "2 entries (0 packed), 2 files, 14 B" in result.stdout
+
+
+def test_cache_gc_evicts_to_size_budget(working_dir: Path) -> None:
+    """cache gc should evict entries until the cache fits the size budget."""
+    _write_cached_plugin(working_dir, "one")
+
+    result = runner.invoke(app, ["cache", "gc", "--max-size-mb", "0"])
+
+    assert result.exit_code == 0
+    assert "Evicted 1 entry" in result.stdout
+    assert not (working_dir / ".promptkit" / "cache" / "plugins" / "reg").exists()
+
+
+@pytest.mark.parametrize("command", [["stats"], ["gc"], ["pack"], ["unpack"]])
+def test_cache_command_reports_cache_errors(
+    working_dir: Path, monkeypatch: pytest.MonkeyPatch, command: list[str]
+) -> None:
+    """cache commands should print a PromptError and exit 1, not crash."""
+    from promptkit.domain.errors import SyncError
+    from promptkit.infra.storage.plugin_cache import PluginCache
+
+    def fail(self: PluginCache) -> None:
+        raise SyncError("catalog is locked")
+
+    monkeypatch.setattr(PluginCache, "reconcile", fail)
+
+    result = runner.invoke(app, ["cache", *command])
+
+    assert result.exit_code == 1
+    assert "Error: catalog is locked" in result.output
+
+
+def test_cache_pack_and_unpack_round_trip(working_dir: Path) -> None:
+    """cache pack should archive entries and cache unpack should restore them."""
+    _write_cached_plugin(working_dir, "one")
+    entry_dir = working_dir / ".promptkit" / "cache" / "plugins" / "reg" / "one"
+
+    packed = runner.invoke(app, ["cache", "pack"])
+    assert packed.exit_code == 0
+    assert "Packed 1 entry" in packed.stdout
+    assert (entry_dir / "sha.zip").is_file()
+    assert not (entry_dir / "sha").exists()
+
+    unpacked = runner.invoke(app, ["cache", "unpack"])
+    assert unpacked.exit_code == 0
+    assert "Unpacked 1 entry" in unpacked.stdout
+    assert (entry_dir / "sha" / "agents" / "a.md").read_text() == "# Agent"
+
+
+def test_cache_unpack_says_when_nothing_is_packed(working_dir: Path) -> None:
+    """cache unpack should report a no-op once entries are already unpacked."""
+    _write_cached_plugin(working_dir, "one")
+    runner.invoke(app, ["cache", "pack"])
+    runner.invoke(app, ["cache", "unpack"])
+
+    result = runner.invoke(app, ["cache", "unpack"])
+
+    assert result.exit_code == 0
+    assert "Nothing to unpack: no cache entries are packed" in result.stdout
+
+
+def test_cache_export_and_import(working_dir: Path) -> None:
+    """cache export should write a lock-keyed archive that cache import restores."""
+    _scaffold_project(working_dir)
+    _write_cached_plugin(working_dir, "one")
+    (working_dir / "promptkit.lock").write_text(
+        "version: 1\nprompts:\n"
+        "  - name: one\n    source: reg/one\n    hash: ''\n"
+        "    fetched_at: '2026-02-09T12:00:00+00:00'\n    commit_sha: sha\n"
+    )
+
+    exported = runner.invoke(app, ["cache", "export", "--output-dir", "out"])
+    assert exported.exit_code == 0
+    assert "Exported 1 entry" in exported.stdout
+    [archive] = (working_dir / "out").glob("promptkit-cache-*.tar.gz")
+
+    runner.invoke(app, ["clean", "--cache"])
+    imported = runner.invoke(app, ["cache", "import", str(archive)])
+
+    assert imported.exit_code == 0
+    assert "Imported 1 entry" in imported.stdout
+    cached = working_dir / ".promptkit" / "cache" / "plugins" / "reg" / "one" / "sha"
+    assert (cached / "agents" / "a.md").read_text() == "# Agent"